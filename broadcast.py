@@ -18,8 +18,18 @@ Usage:
     python broadcast.py --dj Julie --days 7 --enable-stories
     python broadcast.py --dj "Mr. New Vegas" --hours 24 --validation-mode hybrid
     python broadcast.py --dj Travis --days 2 --segments-per-hour 3
+    python broadcast.py --dj Julie --hours 8 --parallel
+    python broadcast.py --dj all --hours 8 --parallel 4
+    python broadcast.py --dj Julie --days 7 --estimate
+    python broadcast.py --dj Julie --days 7 --stream jsonl
+    python broadcast.py --dj Julie --live --port 8765
+    python broadcast.py --dj Julie --hours 8 --trace output/trace.json
+    python broadcast.py --dj Julie --days 7 --validation-mode hybrid --budget 10h
 """
 
+import time
+_IMPORT_START = time.perf_counter()
+
 import sys
 import io
 
@@ -31,15 +41,28 @@ if sys.stderr.encoding and 'utf' not in sys.stderr.encoding.lower():
 
 import argparse
 import json
+import re
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 
 # Add script-generator and shared tools to path
 sys.path.insert(0, 'tools/script-generator')
 sys.path.insert(0, 'tools/shared')
 
 from broadcast_engine import BroadcastEngine
+from broadcast_farm import BroadcastFarm, dj_slug
+from broadcast_planner import BroadcastPlanner, PlanCostModel, estimate_cost
+from broadcast_scheduler import BroadcastScheduler
+from broadcast_writer import open_writer
+from live_broadcast import LiveBroadcast, start_server, DEFAULT_PORT
 from logging_config import capture_output
+from tools.shared import project_config
+
+# Python import overhead, reported at startup
+IMPORT_SECONDS = time.perf_counter() - _IMPORT_START
+
+# Runs at least this long warm up (ChromaDB, calendar, story pools) before the first segment
+WARMUP_MIN_HOURS = 24
 
 
 # Available DJs
@@ -62,6 +85,57 @@ DJ_SHORTCUTS = {
 }
 
 
+def parse_candidates(value):
+    """Parse --candidates 'story=3,gossip=2' into {'story': 3, 'gossip': 2}."""
+    candidates = {}
+    for item in value.split(','):
+        segment_type, _, count = item.partition('=')
+        try:
+            candidates[segment_type.strip()] = int(count)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"expected TYPE=K, got '{item}'")
+        if candidates[segment_type.strip()] < 1:
+            raise argparse.ArgumentTypeError(f"candidate count must be at least 1: '{item}'")
+    return candidates
+
+
+def parse_duration(value):
+    """Parse --budget '10h', '90m', '1h30m' or plain seconds into seconds."""
+    value = value.strip().lower()
+    if re.fullmatch(r'\d+(\.\d+)?', value):
+        seconds = float(value)
+    else:
+        parts = re.findall(r'(\d+(?:\.\d+)?)([hms])', value)
+        if not parts or ''.join(number + unit for number, unit in parts) != value:
+            raise argparse.ArgumentTypeError(f"expected a duration like 10h, 90m or 1h30m, got '{value}'")
+        seconds = sum(float(number) * {'h': 3600, 'm': 60, 's': 1}[unit] for number, unit in parts)
+    if seconds <= 0:
+        raise argparse.ArgumentTypeError(f"budget must be positive, got '{value}'")
+    return seconds
+
+
+def parse_deadline(value):
+    """Parse --deadline 'HH:MM' into the next such wall-clock time."""
+    try:
+        clock = datetime.strptime(value.strip(), '%H:%M')
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected HH:MM, got '{value}'")
+    now = datetime.now()
+    deadline = now.replace(hour=clock.hour, minute=clock.minute, second=0, microsecond=0)
+    if deadline <= now:
+        deadline += timedelta(days=1)
+    return deadline
+
+
+def time_budget_seconds(args, now=None):
+    """Wall-clock budget from --budget or --deadline (None = unlimited)."""
+    if args.budget:
+        return args.budget
+    if args.deadline:
+        return max(1.0, (args.deadline - (now or datetime.now())).total_seconds())
+    return None
+
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -81,6 +155,13 @@ Examples:
   # Full week with all features
   python broadcast.py --dj Julie --days 7 --enable-stories --enable-validation --validation-mode hybrid --save-state
 
+  # Farm mode: several DJs in one process sharing ChromaDB, embeddings and Ollama
+  python broadcast.py --dj all --hours 8 --parallel 4
+  python broadcast.py --dj julie,vegas --hours 4
+
+  # Live mode: keep 4 segments ready and serve them on http://127.0.0.1:8765/next
+  python broadcast.py --dj julie --live --buffer 4 --port 8765
+
 Available DJs:
   julie, vegas, travis, travis-confident, threedog
         """
@@ -91,7 +172,8 @@ Available DJs:
         '--dj',
         type=str,
         required=True,
-        help='DJ personality (julie, vegas, travis, threedog, or full name)'
+        help=('DJ personality (julie, vegas, travis, threedog, or full name); '
+              '"all" or a comma-separated list runs a multi-DJ farm')
     )
     
     # Duration options (mutually exclusive)
@@ -106,6 +188,11 @@ Available DJs:
         type=int,
         help='Number of hours to generate'
     )
+    duration.add_argument(
+        '--live',
+        action='store_true',
+        help='Run continuously, serving segments over HTTP from a look-ahead buffer (Ctrl+C to stop)'
+    )
     
     # Broadcast configuration
     parser.add_argument(
@@ -157,12 +244,23 @@ Available DJs:
         default='fluffy/l3-8b-stheno-v3.2',
         help='LLM model for validation (default: fluffy/l3-8b-stheno-v3.2). Examples: dolphin-llama3, hermes3'
     )
+    parser.add_argument(
+        '--validation-json',
+        action='store_true',
+        help='Request schema-constrained JSON from the LLM validator (shorter, always parseable replies)'
+    )
     
     # Output options
     parser.add_argument(
         '--output',
         type=str,
-        help='Output file path (default: auto-generated in output/)'
+        help='Output file path (default: auto-generated in output/); farm mode: output directory'
+    )
+    parser.add_argument(
+        '--stream',
+        choices=['jsonl', 'sqlite'],
+        help=('Append each segment to a JSONL file or SQLite database as soon as it is final '
+              '(constant memory, partial runs survive a crash) instead of one JSON file at the end')
     )
     parser.add_argument(
         '--save-state',
@@ -195,6 +293,127 @@ Available DJs:
         help='Save checkpoint every N hours (default: 1)'
     )
     
+    # Performance options
+    parser.add_argument(
+        '--prefetch-hours',
+        type=int,
+        default=0,
+        help='Warm the RAG cache N hours ahead in the background (default: 0 = off)'
+    )
+    parser.add_argument(
+        '--stream-abort',
+        action='store_true',
+        help='Stream generation and cancel it at the first critical lore/temporal violation'
+    )
+    parser.add_argument(
+        '--parallel',
+        type=int,
+        nargs='?',
+        const=project_config.OLLAMA_NUM_PARALLEL,
+        default=1,
+        help=('Pipelined generation with up to N segments in flight '
+              f'(--parallel alone: {project_config.OLLAMA_NUM_PARALLEL}, from OLLAMA_NUM_PARALLEL; default: 1 = sequential). '
+              'Farm mode: LLM slots shared by all DJs (default: OLLAMA_NUM_PARALLEL)')
+    )
+    parser.add_argument(
+        '--model-batch',
+        type=int,
+        default=0,
+        help=('LLM/hybrid validation: generate N segments, then validate them together '
+              'to avoid generator/validator model swaps (default: 0 = per segment)')
+    )
+    parser.add_argument(
+        '--draft-model',
+        type=str,
+        nargs='?',
+        const=project_config.LLM_DRAFT_MODEL,
+        default=None,
+        help=('Draft segments with a small model and regenerate only rejected drafts '
+              f'with the primary model (--draft-model alone: {project_config.LLM_DRAFT_MODEL})')
+    )
+    parser.add_argument(
+        '--draft-threshold',
+        type=float,
+        default=0.05,
+        help='Quality-issue rate tolerated in accepted drafts (default: 0.05)'
+    )
+    parser.add_argument(
+        '--candidates',
+        type=parse_candidates,
+        default=None,
+        metavar='TYPE=K[,TYPE=K...]',
+        help=('Generate K candidates in parallel for these segment types and keep the first valid one '
+              '(e.g. story=3,gossip=2; "story" is story gossip; needs validation)')
+    )
+    
+    parser.add_argument(
+        '--warmup',
+        action='store_true',
+        help=('Load ChromaDB, the embedding model, weather calendar and story pools before the '
+              f'first segment (default for runs of {WARMUP_MIN_HOURS}+ hours; otherwise loaded on first use)')
+    )
+    
+    parser.add_argument(
+        '--precompile',
+        action='store_true',
+        help='Compile the whole schedule (segment types, template vars, RAG queries) up front and execute the plans'
+    )
+    parser.add_argument(
+        '--estimate',
+        action='store_true',
+        help='Print the LLM call / token / wall-time estimate for the compiled schedule and exit (no generation)'
+    )
+    parser.add_argument(
+        '--trace',
+        type=str,
+        default=None,
+        metavar='PATH',
+        help='Write per-stage segment timings as Chrome trace JSON (open in chrome://tracing or Perfetto)'
+    )
+    budget = parser.add_mutually_exclusive_group()
+    budget.add_argument(
+        '--budget',
+        type=parse_duration,
+        default=None,
+        metavar='DURATION',
+        help=('Wall-clock budget for the run (e.g. 10h, 90m, 1h30m); when the projected finish '
+              'overshoots it, hybrid/LLM validation drops to rules, output gets shorter and time '
+              'checks come from templates (recorded in segment metadata)')
+    )
+    budget.add_argument(
+        '--deadline',
+        type=parse_deadline,
+        default=None,
+        metavar='HH:MM',
+        help='Like --budget, but finish by this wall-clock time'
+    )
+    
+    # Live mode options
+    parser.add_argument(
+        '--buffer',
+        type=int,
+        default=4,
+        help='Live mode: segments kept ready ahead of air (default: 4)'
+    )
+    parser.add_argument(
+        '--low-watermark',
+        type=int,
+        default=2,
+        help='Live mode: refill the buffer when fewer than this many segments are ready (default: 2)'
+    )
+    parser.add_argument(
+        '--host',
+        type=str,
+        default='127.0.0.1',
+        help='Live mode: HTTP bind address (default: 127.0.0.1)'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=DEFAULT_PORT,
+        help=f'Live mode: HTTP port (default: {DEFAULT_PORT})'
+    )
+    
     # Display options
     parser.add_argument(
         '--quiet',
@@ -230,7 +449,15 @@ def resolve_dj_name(dj_input):
     sys.exit(1)
 
 
-def generate_output_filename(dj_name, duration_hours, enable_stories):
+def resolve_dj_names(dj_input):
+    """Resolve "all", a comma-separated list or a single DJ to full names."""
+    if dj_input.lower().strip() == 'all':
+        return list(AVAILABLE_DJS)
+    names = [resolve_dj_name(part) for part in dj_input.split(',') if part.strip()]
+    return list(dict.fromkeys(names))
+
+
+def generate_output_filename(dj_name, duration_hours, enable_stories, extension='json'):
     """Generate output filename."""
     # Extract DJ short name
     dj_short = dj_name.split('(')[0].strip().replace(' ', '-')
@@ -246,13 +473,91 @@ def generate_output_filename(dj_name, duration_hours, enable_stories):
     
     # Build filename
     if days > 0:
-        filename = f'broadcast_{dj_short}_{days}day{story_suffix}_{timestamp}.json'
+        filename = f'broadcast_{dj_short}_{days}day{story_suffix}_{timestamp}.{extension}'
     else:
-        filename = f'broadcast_{dj_short}_{duration_hours}hr{story_suffix}_{timestamp}.json'
+        filename = f'broadcast_{dj_short}_{duration_hours}hr{story_suffix}_{timestamp}.{extension}'
     
     return filename
 
 
+def build_output_data(args, dj_name, duration_hours, enable_stories, segments, stats):
+    """Build the saved broadcast document."""
+    return {
+        'metadata': {
+            'dj': dj_name,
+            'duration_hours': duration_hours,
+            'segments_per_hour': args.segments_per_hour,
+            'start_hour': args.start_hour,
+            'story_system_enabled': enable_stories,
+            'validation_enabled': args.enable_validation,
+            'validation_mode': args.validation_mode if args.enable_validation else None,
+            'generation_timestamp': datetime.now().isoformat(),
+            'total_segments': len(segments),
+            'resumed_from_checkpoint': args.resume
+        },
+        'segments': segments,
+        'stats': stats
+    }
+
+
+def build_engine_kwargs(args, enable_validation, enable_stories):
+    """BroadcastEngine options shared by single-DJ and farm mode."""
+    # Build LLM validation config if validation enabled
+    llm_validation_config = None
+    if enable_validation and args.validation_mode in ['llm', 'hybrid']:
+        llm_validation_config = {
+            'model': args.validation_model,
+            'json_mode': args.validation_json
+        }
+    
+    return {
+        'enable_validation': enable_validation,
+        'validation_mode': args.validation_mode if enable_validation else 'rules',
+        'llm_validation_config': llm_validation_config,
+        'enable_story_system': enable_stories,
+        'checkpoint_dir': args.checkpoint_dir.strip(),
+        'checkpoint_interval': args.checkpoint_interval,
+        'rag_prefetch_hours': args.prefetch_hours,
+        'stream_abort': args.stream_abort,
+        'max_parallel_segments': args.parallel,
+        'model_batch_size': args.model_batch,
+        'draft_model': args.draft_model,
+        'draft_quality_threshold': args.draft_threshold,
+        'segment_candidates': args.candidates,
+        'time_budget': time_budget_seconds(args)
+    }
+
+
+def should_warmup(args, duration_hours):
+    """Warm up explicitly, or for long runs."""
+    return args.warmup or duration_hours >= WARMUP_MIN_HOURS
+
+
+def print_startup_report(engine_seconds, warmup_seconds=None, quiet=False):
+    """Print import, engine startup and warmup times."""
+    if quiet:
+        return
+    report = f'⏱️  Startup: imports {IMPORT_SECONDS:.2f}s, engine {engine_seconds:.2f}s'
+    if warmup_seconds is not None:
+        report += f', warmup {warmup_seconds:.1f}s'
+    print(report + '\n')
+
+
+def print_estimate(dj_name, estimate):
+    """Print a compiled schedule's cost estimate."""
+    print(f'📋 Compiled schedule for {dj_name}: {estimate["segments"]} segments over {estimate["hours"]} hours')
+    for seg_type, count in sorted(estimate['segments_by_type'].items()):
+        print(f'  {seg_type:15} {count:5}')
+    print(f'  LLM calls:        {estimate["llm_calls"]}')
+    print(f'  Prompt tokens:    {estimate["prompt_tokens"]:,}')
+    print(f'  Output tokens:    {estimate["completion_tokens"]:,}')
+    print(f'  RAG queries:      {estimate["rag_queries"]} ({estimate["unique_rag_queries"]} unique)')
+    seconds = estimate['estimated_wall_seconds']
+    duration = f'{seconds / 3600:.1f}h' if seconds >= 3600 else f'{seconds / 60:.1f} min'
+    print(f'  Estimated time:   {duration} '
+          f'({estimate["llm_slots"]} LLM slot{"s" if estimate["llm_slots"] != 1 else ""})')
+
+
 def print_header(args, dj_name, duration_hours, enable_validation=False):
     """Print generation header."""
     if args.quiet:
@@ -287,10 +592,17 @@ def print_progress(current, total, quiet=False):
         print(f'Progress: {current}/{total} segments ({percent:.1f}%)')
 
 
-def print_summary(segments, stats, output_file, quiet=False):
-    """Print generation summary."""
+def print_summary(segments, stats, output_file, quiet=False, by_type=None):
+    """Print generation summary (by_type: segment counts when segments were streamed)."""
+    if by_type is None:
+        by_type = {}
+        for seg in segments:
+            seg_type = seg.get('segment_type', 'unknown')
+            by_type[seg_type] = by_type.get(seg_type, 0) + 1
+    total = sum(by_type.values())
+    
     if quiet:
-        print(f'Generated {len(segments)} segments -> {output_file}')
+        print(f'Generated {total} segments -> {output_file}')
         return
     
     print('\n' + '='*70)
@@ -298,11 +610,6 @@ def print_summary(segments, stats, output_file, quiet=False):
     print('='*70)
     
     # Segment breakdown
-    total = len(segments)
-    by_type = {}
-    for seg in segments:
-        seg_type = seg.get('segment_type', 'unknown')
-        by_type[seg_type] = by_type.get(seg_type, 0) + 1
     
     print(f'\nTotal Segments: {total}')
     print(f'\nBreakdown by type:')
@@ -317,17 +624,54 @@ def print_summary(segments, stats, output_file, quiet=False):
         print(f'  Avg per segment: {stats.get("avg_generation_time", 0):.1f}s')
         if stats.get('validation_failures', 0) > 0:
             print(f'  Validation failures: {stats.get("validation_failures", 0)}')
+        print_latency(stats.get('latency'))
     
     print(f'\nSaved to: {output_file}')
     print('='*70)
 
 
+def print_latency(latency, limit=8):
+    """Print the slowest stages by total time (p50/p95 per call)."""
+    stages = {name: entry for name, entry in (latency or {}).get('stages', {}).items() if name != 'segment'}
+    if not stages:
+        return
+    print(f'\nStage latency (top {min(limit, len(stages))} by total time):')
+    ranked = sorted(stages.items(), key=lambda item: item[1]['total_seconds'], reverse=True)
+    for name, entry in ranked[:limit]:
+        print(f'  {name:22} {entry["total_seconds"]:8.1f}s  '
+              f'p50 {entry["p50"]:6.2f}s  p95 {entry["p95"]:6.2f}s  ({entry["count"]} calls)')
+
+
+def export_trace(engine, path, quiet=False):
+    """Write the engine's stage spans to a Chrome trace file."""
+    trace_file = engine.export_trace(path)
+    if not quiet:
+        print(f'⏱️  Stage trace saved: {trace_file}')
+    return trace_file
+
+
 def main():
     """Main CLI entry point with 3-format logging."""
     args = parse_args()
     
-    # Resolve DJ name
-    dj_name = resolve_dj_name(args.dj)
+    # Resolve DJ name (several DJs run as a farm)
+    dj_names = resolve_dj_names(args.dj)
+    if args.live:
+        if len(dj_names) > 1 or args.estimate:
+            print('Error: --live runs a single DJ and cannot be combined with --estimate')
+            return 2
+        if args.budget or args.deadline:
+            print('Error: --budget and --deadline need a fixed duration (--days/--hours), not --live')
+            return 2
+        return run_live(args, dj_names[0])
+    if args.estimate:
+        return run_estimate(args, dj_names)
+    if len(dj_names) > 1:
+        if args.stream or args.trace or args.model_batch:
+            print('Error: --stream, --trace and --model-batch are not supported in farm mode (one DJ per run)')
+            return 2
+        return run_farm(args, dj_names)
+    dj_name = dj_names[0]
     
     # Calculate duration
     if args.days:
@@ -372,22 +716,12 @@ def main():
             if not args.quiet:
                 print('Initializing broadcast engine...\n')
             
-            # Build LLM validation config if validation enabled
-            llm_validation_config = None
-            if enable_validation and args.validation_mode in ['llm', 'hybrid']:
-                llm_validation_config = {
-                    'model': args.validation_model
-                }
-            
+            engine_start = time.perf_counter()
             engine = BroadcastEngine(
                 dj_name=dj_name,
-                enable_validation=enable_validation,
-                validation_mode=args.validation_mode if enable_validation else 'rules',
-                llm_validation_config=llm_validation_config,
-                enable_story_system=enable_stories,
-                checkpoint_dir=args.checkpoint_dir.strip(),
-                checkpoint_interval=args.checkpoint_interval
+                **build_engine_kwargs(args, enable_validation, enable_stories)
             )
+            engine_seconds = time.perf_counter() - engine_start
             
             # Handle resume mode
             start_from_hour = args.start_hour
@@ -406,6 +740,15 @@ def main():
                 else:
                     print("⚠️  No valid checkpoint found, starting fresh\n")
             
+            # Load lazily initialized subsystems up front for long runs
+            warmup_seconds = engine.warmup() if should_warmup(args, duration_hours) else None
+            print_startup_report(engine_seconds, warmup_seconds, args.quiet)
+            session.log_event("STARTUP", {
+                "import_seconds": IMPORT_SECONDS,
+                "engine_seconds": engine_seconds,
+                "warmup_seconds": warmup_seconds
+            })
+            
             # Start broadcast (or continue)
             if not resumed:
                 engine.start_broadcast()
@@ -420,55 +763,72 @@ def main():
                 else:
                     print(f'\nGenerating {duration_hours} hours ({duration_hours * args.segments_per_hour} segments)...\n')
             
-            segments = engine.generate_broadcast_sequence(
-                start_hour=start_from_hour,
-                duration_hours=remaining_hours,
-                segments_per_hour=args.segments_per_hour
-            )
-            
-            # End broadcast
-            stats = engine.end_broadcast(save_state=save_state)
+            plans = None
+            if args.precompile:
+                plans = engine.plan_broadcast(start_from_hour, remaining_hours, args.segments_per_hour)
+                estimate = engine.estimate_broadcast_cost(plans)
+                if not args.quiet:
+                    print_estimate(dj_name, estimate)
+                session.log_event("PLAN_COMPILED", estimate)
             
             # Determine output file
             if args.output:
                 output_file = Path(args.output)
             else:
-                filename = generate_output_filename(dj_name, duration_hours, enable_stories)
+                extension = {'jsonl': 'jsonl', 'sqlite': 'db'}.get(args.stream, 'json')
+                filename = generate_output_filename(dj_name, duration_hours, enable_stories, extension)
                 output_file = Path('output') / filename
             
-            # Create output directory
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Save output
-            output_data = {
-                'metadata': {
-                    'dj': dj_name,
-                    'duration_hours': duration_hours,
-                    'segments_per_hour': args.segments_per_hour,
-                    'start_hour': args.start_hour,
-                    'story_system_enabled': enable_stories,
-                    'validation_enabled': args.enable_validation,
-                    'validation_mode': args.validation_mode if args.enable_validation else None,
-                    'generation_timestamp': datetime.now().isoformat(),
-                    'total_segments': len(segments),
-                    'resumed_from_checkpoint': args.resume
-                },
-                'segments': segments,
-                'stats': stats
-            }
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2)
+            if args.stream:
+                # Each final segment is appended as soon as it commits
+                metadata = build_output_data(args, dj_name, duration_hours, enable_stories, [], None)['metadata']
+                metadata.pop('total_segments')
+                with open_writer(output_file, metadata) as writer:
+                    print(f'💾 Streaming segments to {output_file}')
+                    session.log_event("STREAM_START", {"output_file": str(output_file)})
+                    engine.generate_broadcast_sequence(
+                        start_hour=start_from_hour,
+                        duration_hours=remaining_hours,
+                        segments_per_hour=args.segments_per_hour,
+                        plans=plans,
+                        on_segment=writer.write_segment
+                    )
+                    stats = engine.end_broadcast(save_state=save_state)
+                    writer.finalize(stats)
+                total_segments, by_type = writer.total_segments, writer.segments_by_type
+                segments = []
+            else:
+                segments = engine.generate_broadcast_sequence(
+                    start_hour=start_from_hour,
+                    duration_hours=remaining_hours,
+                    segments_per_hour=args.segments_per_hour,
+                    plans=plans
+                )
+                
+                # End broadcast
+                stats = engine.end_broadcast(save_state=save_state)
+                
+                # Create output directory
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+                
+                # Save output
+                output_data = build_output_data(args, dj_name, duration_hours, enable_stories, segments, stats)
+                
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(output_data, f, indent=2)
+                total_segments, by_type = len(segments), None
             
             # Log completion
             session.log_event("BROADCAST_COMPLETE", {
-                "total_segments": len(segments),
+                "total_segments": total_segments,
                 "output_file": str(output_file),
                 "stats": stats
             })
             
             # Print summary
-            print_summary(segments, stats, output_file, args.quiet)
+            print_summary(segments, stats, output_file, args.quiet, by_type=by_type)
+            if args.trace:
+                export_trace(engine, args.trace, args.quiet)
             
             # Print log locations
             if not args.quiet:
@@ -497,5 +857,197 @@ def main():
             return 1
 
 
+def run_estimate(args, dj_names):
+    """Compile each DJ's schedule and print its cost estimate (no engine, no Ollama)."""
+    duration_hours = args.days * 8 if args.days else args.hours
+    enable_validation = args.enable_validation and not args.no_validation
+    cost_model = PlanCostModel.for_settings(
+        llm_slots=args.parallel,
+        enable_validation=enable_validation,
+        validation_mode=args.validation_mode
+    )
+    for dj_name in dj_names:
+        plans = BroadcastPlanner(dj_name, live_scheduler=BroadcastScheduler()).compile(
+            args.start_hour, duration_hours, args.segments_per_hour
+        )
+        print_estimate(dj_name, estimate_cost(plans, cost_model))
+    return 0
+
+
+def run_live(args, dj_name):
+    """Live mode: generate continuously and serve segments over HTTP until Ctrl+C."""
+    enable_stories = args.enable_stories and not args.disable_stories
+    enable_validation = args.enable_validation and not args.no_validation
+    save_state = args.save_state and not args.no_save_state
+    
+    context = f"Live broadcast for {dj_name} (stories: {enable_stories}, validation: {enable_validation})"
+    with capture_output("broadcast_live", context) as session:
+        session.log_event("LIVE_START", {
+            "dj": dj_name,
+            "segments_per_hour": args.segments_per_hour,
+            "buffer": args.buffer,
+            "low_watermark": args.low_watermark,
+            "port": args.port,
+            "resume_mode": args.resume
+        })
+        
+        server = None
+        live = None
+        engine = None
+        try:
+            engine_start = time.perf_counter()
+            engine = BroadcastEngine(
+                dj_name=dj_name,
+                **build_engine_kwargs(args, enable_validation, enable_stories)
+            )
+            engine_seconds = time.perf_counter() - engine_start
+            
+            start_hour = None  # Current wall-clock hour
+            resumed = args.resume and engine.resume_from_checkpoint(dj_name=dj_name)
+            if resumed:
+                start_hour = (engine.checkpoint_resume_hour + 1) % 24
+                print(f"✅ Resumed from checkpoint, continuing from hour {start_hour}\n")
+            else:
+                engine.start_broadcast()
+            # Lazy startup by default: the first segment goes on air sooner
+            warmup_seconds = engine.warmup() if args.warmup else None
+            print_startup_report(engine_seconds, warmup_seconds, args.quiet)
+            
+            live = LiveBroadcast(
+                engine,
+                buffer_size=args.buffer,
+                low_watermark=args.low_watermark,
+                start_hour=start_hour,
+                segments_per_hour=args.segments_per_hour
+            )
+            live.start()
+            server = start_server(live, args.host, args.port)
+            host, port = server.server_address[:2]
+            print(f"📻 Live: {dj_name} on http://{host}:{port}/next "
+                  f"(buffer {live.buffer_size}, refill below {live.low_watermark}) - Ctrl+C to stop")
+            
+            while True:
+                time.sleep(60)
+                stats = live.get_statistics()
+                if not args.quiet:
+                    print(f"📊 Buffered {stats['buffer_depth']}/{stats['buffer_size']}, "
+                          f"aired {stats['aired']}, produced {stats['produced']}, errors {stats['errors']}")
+        
+        except KeyboardInterrupt:
+            print('\n\nStopping live broadcast...')
+        except Exception as e:
+            session.log_event("BROADCAST_ERROR", {
+                "error": str(e),
+                "error_type": type(e).__name__
+            })
+            print(f'\nError: {e}')
+            if args.verbose:
+                import traceback
+                traceback.print_exc()
+            return 1
+        finally:
+            if server is not None:
+                server.shutdown()
+            if live is not None:
+                live.stop()
+                session.log_event("LIVE_STOP", live.get_statistics())
+            if engine is not None:
+                engine.end_broadcast(save_state=save_state)
+                if args.trace:
+                    export_trace(engine, args.trace, args.quiet)
+        return 0
+
+
+def run_farm(args, dj_names):
+    """Farm mode: several DJs concurrently over one shared generator."""
+    duration_hours = args.days * 8 if args.days else args.hours
+    enable_stories = args.enable_stories and not args.disable_stories
+    enable_validation = args.enable_validation and not args.no_validation
+    save_state = args.save_state and not args.no_save_state
+    
+    context = (f"Generating {duration_hours}hr broadcasts for {len(dj_names)} DJs "
+               f"(stories: {enable_stories}, validation: {enable_validation})")
+    
+    with capture_output("broadcast_farm", context) as session:
+        session.log_event("FARM_START", {
+            "djs": dj_names,
+            "duration_hours": duration_hours,
+            "segments_per_hour": args.segments_per_hour,
+            "story_system_enabled": enable_stories,
+            "validation_enabled": enable_validation,
+            "resume_mode": args.resume
+        })
+        
+        for dj_name in dj_names:
+            print_header(args, dj_name, duration_hours, enable_validation)
+        
+        try:
+            farm = BroadcastFarm(
+                dj_names,
+                engine_kwargs=build_engine_kwargs(args, enable_validation, enable_stories),
+                llm_slots=args.parallel if args.parallel > 1 else None,
+                log_dir=session.log_file.parent / f"{session.log_file.stem}_djs"
+            )
+            results = farm.run(
+                start_hour=args.start_hour,
+                duration_hours=duration_hours,
+                segments_per_hour=args.segments_per_hour,
+                save_state=save_state,
+                resume=args.resume,
+                warmup=should_warmup(args, duration_hours)
+            )
+            
+            # One output file per DJ
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            output_dir = Path(args.output) if args.output else Path('output') / f'farm_{timestamp}'
+            output_dir.mkdir(parents=True, exist_ok=True)
+            
+            failed = 0
+            for dj_name, result in results.items():
+                if result.error:
+                    failed += 1
+                    session.log_event("BROADCAST_ERROR", {"dj": dj_name, "error": result.error})
+                    print(f'\nError ({dj_name}): {result.error}')
+                    continue
+                output_file = output_dir / f'broadcast_{dj_slug(dj_name)}.json'
+                output_data = build_output_data(args, dj_name, duration_hours, enable_stories,
+                                                result.segments, result.stats)
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(output_data, f, indent=2)
+                session.log_event("BROADCAST_COMPLETE", {
+                    "dj": dj_name,
+                    "total_segments": len(result.segments),
+                    "output_file": str(output_file),
+                    "log_file": str(result.log_file)
+                })
+                print_summary(result.segments, result.stats, output_file, args.quiet)
+            
+            farm_stats = farm.get_statistics()
+            session.log_event("FARM_COMPLETE", farm_stats)
+            if not args.quiet:
+                print(f"\n🎛️  {farm_stats['total_segments']} segments from {len(dj_names)} DJs "
+                      f"in {farm_stats['wall_time']:.1f}s ({farm_stats['segments_per_hour']:.0f} segments/hour)")
+                print(f"📝 Per-DJ logs: {farm.log_dir}")
+            
+            return 1 if failed else 0
+            
+        except KeyboardInterrupt:
+            session.log_event("USER_CANCELLED", {
+                "message": "Broadcast farm cancelled by user (Ctrl+C)"
+            })
+            print('\n\nGeneration cancelled by user.')
+            return 130
+        except Exception as e:
+            session.log_event("BROADCAST_ERROR", {
+                "error": str(e),
+                "error_type": type(e).__name__
+            })
+            print(f'\nError: {e}')
+            if args.verbose:
+                import traceback
+                traceback.print_exc()
+            return 1
+
+
 if __name__ == '__main__':
     sys.exit(main())
@@ -117,9 +117,9 @@ def sample_weather_data() -> Dict[str, Any]:
 
 
 @pytest.fixture
-def test_logger():
-    """Test logger with minimal configuration"""
-    return setup_logger("test_logger")
+def test_logger(tmp_path_factory):
+    """Test logger with minimal configuration (logs to the session's tmp dir)"""
+    return setup_logger("test_logger", log_file=tmp_path_factory.getbasetemp() / "test_logger.log")
 
 
 @pytest.fixture
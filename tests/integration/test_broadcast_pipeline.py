@@ -25,7 +25,7 @@ from tools.shared.logging_config import capture_output
 class TestBroadcastPipelineIntegration:
     """Integration tests for complete broadcast pipeline"""
     
-    @patch('generator.ChromaDBIngestor')
+    @patch('tools.wiki_to_chromadb.chromadb_ingest.ChromaDBIngestor')
     @patch('generator.OllamaClient')
     def test_single_segment_generation_workflow(self, mock_ollama, mock_chroma):
         """Test generating a single segment end-to-end with mocks"""
@@ -108,7 +108,7 @@ class TestBroadcastPipelineIntegration:
 class TestRAGPipelineIntegration:
     """Integration tests for RAG retrieval pipeline"""
     
-    @patch('generator.ChromaDBIngestor')
+    @patch('tools.wiki_to_chromadb.chromadb_ingest.ChromaDBIngestor')
     @patch('generator.OllamaClient')
     def test_rag_retrieval_and_generation(self, mock_ollama, mock_chroma):
         """Test RAG retrieval followed by generation"""
@@ -207,7 +207,7 @@ class TestLoggingIntegration:
 class TestErrorHandlingIntegration:
     """Integration tests for error handling across pipeline"""
     
-    @patch('generator.ChromaDBIngestor')
+    @patch('tools.wiki_to_chromadb.chromadb_ingest.ChromaDBIngestor')
     @patch('generator.OllamaClient')
     def test_ollama_failure_recovery(self, mock_ollama, mock_chroma):
         """Test pipeline handles Ollama failures gracefully"""
@@ -234,7 +234,7 @@ class TestErrorHandlingIntegration:
         with pytest.raises(RuntimeError):
             generator.ollama.generate("model", "test 3")
     
-    @patch('generator.ChromaDBIngestor')
+    @patch('tools.wiki_to_chromadb.chromadb_ingest.ChromaDBIngestor')
     @patch('generator.OllamaClient')
     def test_empty_rag_results_handling(self, mock_ollama, mock_chroma):
         """Test handling when RAG returns no results"""
@@ -303,7 +303,7 @@ class TestValidationIntegration:
 class TestPerformanceIntegration:
     """Integration tests for performance and scalability"""
     
-    @patch('generator.ChromaDBIngestor')
+    @patch('tools.wiki_to_chromadb.chromadb_ingest.ChromaDBIngestor')
     @patch('generator.OllamaClient')
     def test_multiple_rapid_generations(self, mock_ollama, mock_chroma):
         """Test rapid successive generations"""
@@ -0,0 +1,87 @@
+"""
+Unit tests for the broadcast generation benchmark.
+
+Tests history bookkeeping, regression detection and one small end-to-end
+scenario against the simulator and fixture ChromaDB.
+"""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+script_gen_path = Path(__file__).parent.parent.parent / "tools" / "script-generator"
+sys.path.insert(0, str(script_gen_path))
+
+from benchmark_broadcast import (
+    append_history,
+    build_fixture_db,
+    compare_runs,
+    find_baseline,
+    load_history,
+    run_scenario
+)
+
+
+def make_run(commit, segments_per_minute=100.0, llm_p95=1.0, days=1):
+    return {
+        'commit': commit, 'dj': "Julie (2102, Appalachia)", 'days': days, 'hours_per_day': 8,
+        'segments_per_hour': 2, 'time_scale': 0.0, 'seed': 42,
+        'scenarios': {
+            'rules/no-stories': {
+                'segments_per_minute': segments_per_minute,
+                'latency': {'llm': {'count': 16, 'mean': llm_p95, 'p50': llm_p95, 'p95': llm_p95}}
+            }
+        }
+    }
+
+
+class TestHistory:
+    def test_append_and_load(self, tmp_path):
+        path = tmp_path / "history" / "broadcast.json"
+        assert load_history(path) == []
+
+        append_history(path, make_run("aaa"))
+        append_history(path, make_run("bbb"))
+
+        assert [run['commit'] for run in load_history(path)] == ["aaa", "bbb"]
+
+    def test_baseline_is_latest_other_commit_with_same_settings(self):
+        runs = [make_run("aaa"), make_run("bbb", days=3), make_run("ccc")]
+        current = make_run("ccc")
+
+        assert find_baseline(runs, current)['commit'] == "aaa"
+        assert find_baseline(runs[:1], make_run("aaa")) is None
+
+
+class TestCompareRuns:
+    def test_flags_throughput_and_latency_regressions(self):
+        regressions = compare_runs(make_run("aaa"), make_run("bbb", segments_per_minute=80.0, llm_p95=1.5))
+
+        assert {(r['metric'], round(r['change'], 2)) for r in regressions} == {
+            ('segments_per_minute', -0.2), ('llm.p95', 0.5)
+        }
+
+    def test_changes_within_threshold_or_improvements_pass(self):
+        assert compare_runs(make_run("aaa"), make_run("bbb", segments_per_minute=95.0, llm_p95=1.05)) == []
+        assert compare_runs(make_run("aaa"), make_run("bbb", segments_per_minute=150.0, llm_p95=0.5)) == []
+
+
+def test_run_scenario(tmp_path):
+    pytest.importorskip("chromadb")
+    fixture_db = build_fixture_db(tmp_path / "chroma")
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = run_scenario("rules", True, fixture_db, workdir, days=2, hours_per_day=1)
+
+    assert result['segments'] == 4
+    assert result['llm']['requests'] >= 4
+    assert {'prepare', 'generate', 'llm', 'validate.rules', 'commit'} <= set(result['latency'])
+    assert {'world_state', 'checkpoint'} <= set(result['state_writes']['by_store'])
+    assert result['state_writes']['bytes'] > 0
+    assert len(result['memory']['rss_mb_by_day']) == 3
+    assert 0.0 <= result['cache']['rag_hit_rate'] <= 1.0
@@ -68,6 +68,21 @@ class TestBroadcastCLI:
             with pytest.raises(SystemExit):
                 broadcast.resolve_dj_name('invalid_dj')
     
+    def test_farm_dj_names(self):
+        """Test resolving "all" and comma-separated DJ lists for farm mode"""
+        with patch.dict('sys.modules', {
+            'broadcast_engine': MagicMock(),
+            'broadcast_farm': MagicMock(),
+            'tools.script-generator': MagicMock()
+        }):
+            import broadcast
+            
+            assert broadcast.resolve_dj_names('all') == broadcast.AVAILABLE_DJS
+            assert broadcast.resolve_dj_names('julie, vegas,julie') == [
+                "Julie (2102, Appalachia)", "Mr. New Vegas (2281, Mojave)"
+            ]
+            assert broadcast.resolve_dj_names('julie') == ["Julie (2102, Appalachia)"]
+    
     def test_output_filename_generation(self):
         """Test generation of output filenames"""
         with patch.dict('sys.modules', {
@@ -127,6 +142,30 @@ class TestBroadcastHelpers:
             for shortcut in expected_shortcuts:
                 assert shortcut in broadcast.DJ_SHORTCUTS
     
+    def test_time_budget_parsing(self):
+        """Test --budget durations and --deadline clock times"""
+        from argparse import ArgumentTypeError, Namespace
+        from datetime import datetime, timedelta
+        with patch.dict('sys.modules', {
+            'broadcast_engine': MagicMock(),
+            'tools.script-generator': MagicMock()
+        }):
+            import broadcast
+            
+            assert broadcast.parse_duration('10h') == 36000
+            assert broadcast.parse_duration('1h30m') == 5400
+            assert broadcast.parse_duration('90') == 90
+            for value in ('10x', '0', 'h'):
+                with pytest.raises(ArgumentTypeError):
+                    broadcast.parse_duration(value)
+            
+            now = datetime.now()
+            deadline = broadcast.parse_deadline('00:00')
+            assert now < deadline <= now + timedelta(days=1)
+            args = Namespace(budget=None, deadline=now + timedelta(hours=2))
+            assert broadcast.time_budget_seconds(args, now=now) == 7200
+            assert broadcast.time_budget_seconds(Namespace(budget=None, deadline=None)) is None
+    
     def test_available_djs_list(self):
         """Test that all available DJs are listed"""
         with patch.dict('sys.modules', {
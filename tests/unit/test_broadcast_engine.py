@@ -14,12 +14,18 @@ import sys
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime
+import asyncio
+import threading
+import time
 
 # Add paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT / "tools" / "script-generator"))
 
 from broadcast_engine import BroadcastEngine
+from llm_validator import LLMValidator, ValidationIssue, ValidationResult, ValidationSeverity
+from model_lifecycle import ModelLifecycleManager
+from weather_simulator import WeatherState
 from tools.shared.mock_ollama_client import MockOllamaClient
 
 
@@ -306,5 +312,551 @@ class TestBroadcastEngineIntegration:
         assert engine.dj_name == "Julie (2102, Appalachia)"
 
 
+class TestPipelinedGeneration:
+    """Tests for pipelined generate_broadcast_sequence()"""
+    
+    def _engine(self, tmp_path, max_parallel_segments, delays=None):
+        """Engine with a slow fake generator; segment i sleeps delays[i] seconds"""
+        state = {'active': 0, 'peak': 0, 'calls': 0}
+        lock = threading.Lock()
+        
+        def generate_script(script_type, **kwargs):
+            with lock:
+                index = state['calls']
+                state['calls'] += 1
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep((delays or {}).get(index, 0.01))
+            with lock:
+                state['active'] -= 1
+            return {'script': f"{script_type} at {kwargs['hour']}", 'metadata': {}}
+        
+        with patch('broadcast_engine.ScriptGenerator') as mock_generator, \
+             patch('broadcast_engine.WorldState'), \
+             patch('broadcast_engine.WEATHER_SYSTEM_AVAILABLE', False):
+            mock_generator.return_value.generate_script.side_effect = generate_script
+            engine = BroadcastEngine(
+                dj_name="Julie (2102, Appalachia)",
+                enable_validation=False,
+                enable_story_system=False,
+                checkpoint_dir=str(tmp_path),
+                checkpoint_interval=100,
+                max_parallel_segments=max_parallel_segments
+            )
+        return engine, state
+    
+    def test_matches_sequential_order_and_state(self, tmp_path):
+        """Pipelined run yields the same schedule and scheduler state"""
+        sequential, _ = self._engine(tmp_path / "seq", 1)
+        pipelined, state = self._engine(tmp_path / "pipe", 4)
+        
+        expected = sequential.generate_broadcast_sequence(5, 3, segments_per_hour=2)
+        segments = pipelined.generate_broadcast_sequence(5, 3, segments_per_hour=2)
+        
+        assert [s['script'] for s in segments] == [s['script'] for s in expected]
+        assert [s['segment_type'] for s in segments] == [
+            'time_check', 'gossip', 'time_check', 'weather', 'time_check', 'gossip'
+        ]
+        assert pipelined.scheduler.get_segments_status() == sequential.scheduler.get_segments_status()
+        assert pipelined.segments_generated == 6
+        assert state['peak'] > 1
+    
+    def test_output_order_independent_of_completion_order(self, tmp_path):
+        """Segments that finish early wait for earlier ones to commit"""
+        engine, _ = self._engine(tmp_path, 3, delays={0: 0.2, 1: 0.1, 2: 0.0})
+        
+        segments = engine.generate_broadcast_sequence(8, 3, segments_per_hour=1)
+        
+        assert [s['metadata']['hour'] for s in segments] == [8, 9, 10]
+        assert [s['metadata']['segment_number'] for s in segments] == [1, 2, 3]
+        assert [entry.content for entry in engine.session_memory.recent_scripts] == [
+            s['script'] for s in segments
+        ]
+    
+    def test_checkpoint_hours_drain_pipeline(self, tmp_path):
+        """Segments never overlap a checkpoint boundary"""
+        engine, state = self._engine(tmp_path, 4)
+        engine.checkpoint_interval = 1
+        
+        segments = engine.generate_broadcast_sequence(10, 3, segments_per_hour=2)
+        
+        assert len(segments) == 6
+        assert state['peak'] <= 2
+    
+    def test_sequential_runs_on_calling_thread(self, tmp_path):
+        """Ctrl-C reaches a sequential run directly (no worker thread)"""
+        engine, _ = self._engine(tmp_path, 1)
+        threads = set()
+        generate = engine.generator.generate_script.side_effect
+        
+        def record_thread(*args, **kwargs):
+            threads.add(threading.current_thread())
+            return generate(*args, **kwargs)
+        
+        engine.generator.generate_script.side_effect = record_thread
+        engine.generate_broadcast_sequence(8, 1, segments_per_hour=2)
+        
+        assert threads == {threading.current_thread()}
+    
+    def test_cancelled_async_sequence_stops_worker(self, tmp_path):
+        """Cancelling agenerate_broadcast_sequence() stops after the current segment"""
+        engine, state = self._engine(tmp_path, 1, delays={0: 0.3})
+        
+        async def cancel_during_first_segment():
+            task = asyncio.create_task(engine.agenerate_broadcast_sequence(8, 2, segments_per_hour=2))
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        
+        asyncio.run(cancel_during_first_segment())  # Waits for the worker thread
+        
+        assert state['calls'] == 1
+        assert engine.segments_generated == 1
+
+
+class TestPlannedGeneration:
+    """Tests for executing precompiled plans (plan_broadcast())"""
+
+    def _engine(self, tmp_path, max_parallel_segments):
+        with patch('broadcast_engine.ScriptGenerator') as mock_generator, \
+             patch('broadcast_engine.WorldState'), \
+             patch('broadcast_engine.WEATHER_SYSTEM_AVAILABLE', False):
+            mock_generator.return_value.generate_script.side_effect = \
+                lambda script_type, **kwargs: {'script': f"{script_type} at {kwargs['hour']}", 'metadata': {}}
+            return BroadcastEngine(
+                dj_name="Julie (2102, Appalachia)",
+                enable_validation=False,
+                enable_story_system=False,
+                checkpoint_dir=str(tmp_path),
+                checkpoint_interval=100,
+                max_parallel_segments=max_parallel_segments
+            )
+
+    @pytest.mark.parametrize("max_parallel_segments", [1, 4])
+    def test_executes_plans_as_compiled(self, tmp_path, max_parallel_segments):
+        """Segments follow the plans' types, template vars and RAG queries"""
+        engine = self._engine(tmp_path, max_parallel_segments)
+        plans = engine.plan_broadcast(5, 3, segments_per_hour=2)
+
+        segments = engine.generate_broadcast_sequence(5, 3, segments_per_hour=2, plans=plans)
+
+        assert [s['segment_type'] for s in segments] == [plan.segment_type.value for plan in plans]
+        assert [s['segment_type'] for s in segments] == [
+            'time_check', 'gossip', 'time_check', 'weather', 'time_check', 'gossip'
+        ]
+        calls = engine.generator.generate_script.call_args_list
+        queries = [call.kwargs['context_query'] for call in calls]
+        if max_parallel_segments == 1:
+            assert queries == [plan.rag_query for plan in plans]
+        else:  # Pipelined generate calls may start out of order
+            assert sorted(queries) == sorted(plan.rag_query for plan in plans)
+        weather_call = next(call for call in calls if call.kwargs['script_type'] == 'weather')
+        assert weather_call.kwargs['weather_type'] == plans[3].template_vars['weather_type']
+
+    def test_estimate_uses_engine_settings(self, tmp_path):
+        engine = self._engine(tmp_path, 4)
+        plans = engine.plan_broadcast(8, 24, segments_per_hour=2)
+
+        estimate = engine.estimate_broadcast_cost(plans)
+
+        assert estimate['segments'] == 48
+        assert estimate['llm_slots'] == 4
+        assert estimate['llm_calls'] == 48  # No validation, no retries
+
+    @pytest.mark.parametrize("max_parallel_segments", [1, 4])
+    def test_streams_segments_in_schedule_order(self, tmp_path, max_parallel_segments):
+        """on_segment receives every final segment in order; nothing is kept"""
+        engine = self._engine(tmp_path, max_parallel_segments)
+        plans = engine.plan_broadcast(5, 3, segments_per_hour=2)
+        streamed = []
+
+        segments = engine.generate_broadcast_sequence(5, 3, segments_per_hour=2, plans=plans,
+                                                      on_segment=streamed.append)
+
+        assert segments == []
+        assert [s['segment_type'] for s in streamed] == [plan.segment_type.value for plan in plans]
+        assert [s['metadata']['hour'] for s in streamed] == [5, 5, 6, 6, 7, 7]
+
+
+class TestParallelCandidates:
+    """Tests for parallel candidate generation (segment_candidates)"""
+
+    def _engine(self, tmp_path, generate_script, candidates=2, **kwargs):
+        kwargs.setdefault('enable_validation', True)
+        with patch('broadcast_engine.ScriptGenerator') as mock_generator, \
+             patch('broadcast_engine.WorldState'), \
+             patch('broadcast_engine.WEATHER_SYSTEM_AVAILABLE', False):
+            mock_generator.return_value.generate_script.side_effect = generate_script
+            engine = BroadcastEngine(
+                dj_name="Julie (2102, Appalachia)",
+                enable_story_system=False,
+                checkpoint_dir=str(tmp_path),
+                checkpoint_interval=100,
+                segment_candidates={'gossip': candidates},
+                **kwargs
+            )
+        engine.validator = Mock()
+        engine.validator.validate.side_effect = lambda script, story_context=None: 'good' in script
+        engine.validator.get_violations.return_value = []
+        engine.validator.get_warnings.return_value = []
+        return engine
+
+    def test_first_valid_candidate_wins(self, tmp_path):
+        """The fast valid candidate is committed; the slow one is cancelled"""
+        from generator import GenerationCancelled
+        cancelled = threading.Event()
+
+        def generate_script(script_type, temperature, seed, cancel_event, **kwargs):
+            if temperature == 0.8:  # Candidate 1: slow, invalid
+                while not cancel_event.wait(0.01):
+                    pass
+                cancelled.set()
+                raise GenerationCancelled("Generation cancelled")
+            return {'script': f"good {script_type} (seed {seed})", 'metadata': {}}
+
+        engine = self._engine(tmp_path, generate_script)
+
+        segment = engine.generate_next_segment(8, force_type='gossip')
+
+        assert segment['script'].startswith("good gossip")
+        assert segment['metadata']['candidates']['winner'] == 1
+        assert segment['metadata']['candidates']['temperature'] == 0.95
+        assert cancelled.wait(1)
+        assert engine.segments_generated == 1
+        assert engine.candidate_stats == {'races': 1, 'launched': 2, 'checked': 1, 'cancelled': 1, 'won': 1}
+
+    def test_no_valid_candidate_falls_back_to_retries(self, tmp_path):
+        """Each retry attempt races again; the segment is skipped when all fail"""
+        calls = []
+
+        def generate_script(script_type, temperature, seed, cancel_event, **kwargs):
+            calls.append(temperature)
+            return {'script': f"bad {script_type}", 'metadata': {}}
+
+        engine = self._engine(tmp_path, generate_script, candidates=3)
+
+        segment = engine.generate_next_segment(8, force_type='gossip')
+
+        assert segment['script'] == ''
+        assert segment['metadata']['status'] == 'skipped'
+        assert len(calls) == 9  # 3 attempts x 3 candidates
+        assert sorted(set(calls)) == [0.7, 0.8, 0.95]
+        assert engine.candidate_stats['races'] == 3
+        assert engine.candidate_stats['won'] == 0
+
+    def test_other_types_generate_once(self, tmp_path):
+        calls = []
+
+        def generate_script(script_type, **kwargs):
+            calls.append(kwargs)
+            return {'script': f"good {script_type}", 'metadata': {}}
+
+        engine = self._engine(tmp_path, generate_script)
+
+        segment = engine.generate_next_segment(8, force_type='news')
+
+        assert 'candidates' not in segment['metadata']
+        assert len(calls) == 1
+        assert 'cancel_event' not in calls[0]
+    
+    def test_pipelined_sequence_races_candidates(self, tmp_path):
+        """The runtime's generate stage races candidates; commits stay in order"""
+        def generate_script(script_type, temperature=None, **kwargs):
+            valid = script_type != 'gossip' or temperature == 0.95
+            return {'script': f"{'good' if valid else 'bad'} {script_type} at {kwargs['hour']}", 'metadata': {}}
+        
+        engine = self._engine(tmp_path, generate_script, max_parallel_segments=3)
+        
+        segments = engine.generate_broadcast_sequence(5, 3, segments_per_hour=2)
+        
+        gossip = [s for s in segments if s['segment_type'] == 'gossip']
+        assert len(gossip) == 2
+        assert all(s['metadata']['candidates']['winner'] == 1 for s in gossip)
+        assert all(s['script'].startswith("good gossip") for s in gossip)
+        assert [s['metadata']['hour'] for s in segments] == [5, 5, 6, 6, 7, 7]
+        assert engine.candidate_stats['races'] == 2
+        assert engine.candidate_stats['won'] == 2
+    
+    def test_warns_when_candidates_cannot_apply(self, tmp_path, capsys):
+        engine = self._engine(tmp_path, lambda script_type, **kwargs: {}, enable_validation=False)
+        
+        assert "Segment candidates ignored" in capsys.readouterr().out
+        assert engine._candidate_count({'segment_type': 'gossip'}) == 1
+    
+    def test_no_candidates_with_model_batching(self, tmp_path):
+        engine = self._engine(tmp_path, lambda script_type, **kwargs: {})
+        job = {'segment_type': 'gossip'}
+        assert engine._candidate_count(job) == 2
+        
+        engine.model_batch_size = 4
+        engine.model_lifecycle = Mock()
+        
+        assert engine._candidate_count(job) == 1
+
+
+class TestLatencyBreakdown:
+    """Tests for per-stage segment timings (stage_timer)"""
+
+    def _engine(self, tmp_path, max_parallel_segments=1):
+        from stage_timer import span
+
+        def generate_script(script_type, **kwargs):
+            with span('llm', model='test'):
+                time.sleep(0.001)
+            return {'script': f"{script_type} at {kwargs['hour']}", 'metadata': {}}
+
+        with patch('broadcast_engine.ScriptGenerator') as mock_generator, \
+             patch('broadcast_engine.WorldState'), \
+             patch('broadcast_engine.WEATHER_SYSTEM_AVAILABLE', False):
+            mock_generator.return_value.generate_script.side_effect = generate_script
+            engine = BroadcastEngine(
+                dj_name="Julie (2102, Appalachia)",
+                enable_validation=True,
+                enable_story_system=False,
+                checkpoint_dir=str(tmp_path),
+                checkpoint_interval=100,
+                max_parallel_segments=max_parallel_segments
+            )
+        engine.validator = Mock()
+        engine.validator.validate.return_value = True
+        engine.validator.get_violations.return_value = []
+        engine.validator.get_warnings.return_value = []
+        return engine
+
+    @pytest.mark.parametrize("max_parallel_segments", [1, 4])
+    def test_segment_metadata_has_stage_timings(self, tmp_path, max_parallel_segments):
+        engine = self._engine(tmp_path, max_parallel_segments)
+
+        segments = engine.generate_broadcast_sequence(8, 2, segments_per_hour=2)
+
+        for segment in segments:
+            timings = segment['metadata']['timings']
+            assert {'prepare', 'generate', 'llm', 'validate.rules', 'commit'} <= set(timings['stages'])
+            assert timings['stages']['llm'] <= timings['stages']['generate'] <= timings['total_seconds']
+            assert next(s for s in timings['spans'] if s['stage'] == 'llm')['attrs'] == {'model': 'test'}
+
+    def test_broadcast_stats_aggregate_percentiles(self, tmp_path):
+        engine = self._engine(tmp_path)
+        engine.generate_broadcast_sequence(8, 2, segments_per_hour=2)
+        engine.save_checkpoint(9, total_hours=2)
+
+        latency = engine.get_broadcast_stats()['latency']
+
+        assert latency['segments'] == 4
+        assert latency['stages']['llm']['count'] == 4
+        assert latency['stages']['llm']['p50'] <= latency['stages']['llm']['p95']
+        assert latency['stages']['checkpoint.write']['count'] >= 1
+        assert engine.end_broadcast(save_state=False)['latency']['segments'] == 4
+
+    def test_export_trace(self, tmp_path):
+        import json
+        engine = self._engine(tmp_path)
+        engine.generate_next_segment(8)
+
+        path = engine.export_trace(tmp_path / "trace.json")
+
+        events = json.loads(path.read_text())['traceEvents']
+        assert {'segment', 'prepare', 'generate', 'llm', 'commit'} <= {e['name'] for e in events}
+        assert all(e['ph'] == 'X' and e['dur'] >= 0 for e in events)
+
+
+class TestTimeBudget:
+    """Tests for budget-driven degradation (budget_scheduler)"""
+
+    def _engine(self, tmp_path, **kwargs):
+        calls = []
+
+        def generate_script(script_type, **kwargs):
+            calls.append(kwargs.get('num_predict'))
+            return {'script': f"{script_type} at {kwargs['hour']}", 'metadata': {}}
+
+        with patch('broadcast_engine.ScriptGenerator') as mock_generator, \
+             patch('broadcast_engine.WorldState'), \
+             patch('broadcast_engine.WEATHER_SYSTEM_AVAILABLE', False):
+            mock_generator.return_value.generate_script.side_effect = generate_script
+            engine = BroadcastEngine(
+                dj_name="Julie (2102, Appalachia)",
+                enable_validation=True,
+                enable_story_system=False,
+                checkpoint_dir=str(tmp_path),
+                checkpoint_interval=100,
+                **kwargs
+            )
+        return engine, calls
+
+    def test_rules_step_skipped_without_llm_validator(self, tmp_path):
+        engine, _ = self._engine(tmp_path, time_budget=3600)
+
+        assert engine.budget.ladder == ('short_output', 'templated_time_check')
+        assert self._engine(tmp_path)[0].budget is None
+
+    def test_overrun_degrades_and_records_steps(self, tmp_path):
+        from budget_scheduler import BudgetScheduler
+        engine, calls = self._engine(tmp_path)
+        engine.validator = Mock(spec=LLMValidator)
+        engine.validator.validate.return_value = ValidationResult(
+            is_valid=True, script='', issues=[], overall_score=0.9
+        )
+        engine._budget_rules_validator = Mock()
+        engine._budget_rules_validator.validate.return_value = True
+        engine._budget_rules_validator.get_violations.return_value = []
+        engine._budget_rules_validator.get_warnings.return_value = []
+        engine.budget = BudgetScheduler(0.001, min_samples=1, cooldown=1)  # Always behind
+
+        segments = engine.generate_broadcast_sequence(8, 3, segments_per_hour=2)
+
+        steps = [[d['step'] for d in s['metadata'].get('degradations', [])] for s in segments]
+        assert steps[:3] == [[], ['rules_validation'], ['rules_validation', 'short_output']]
+        assert calls[:3] == [None, None, 180]
+
+        # Templated time checks skip the LLM and validation
+        templated = [s for s, names in zip(segments, steps) if 'templated_time_check' in names]
+        assert templated and all(s['segment_type'] == 'time_check' for s in templated)
+        assert all(s['script'] and not s['script'].startswith('time at') for s in templated)
+        assert len(calls) == len(segments) - len(templated)
+
+        # Only the first segment went to the LLM validator
+        assert engine.validator.validate.call_count == 1
+        assert engine._budget_rules_validator.validate.call_count == len(segments) - 1 - len(templated)
+
+        budget = engine.end_broadcast(save_state=False)['budget']
+        assert budget['active_steps'] == ['rules_validation', 'short_output', 'templated_time_check']
+        assert [d['action'] for d in budget['decisions']] == ['degrade'] * 3
+        assert budget['completed_segments'] == len(segments)
+
+
+class TestModelBatchedGeneration:
+    """Tests for model-batched generation with an LLM validator"""
+    
+    def _engine(self, tmp_path, model_batch_size, failing_scripts=()):
+        """Engine whose LLM validator rejects each of failing_scripts once"""
+        calls = []
+        rejected = set()
+        
+        def generate_script(script_type, **kwargs):
+            calls.append('gen')
+            return {'script': f"{script_type} at {kwargs['hour']}", 'metadata': {}}
+        
+        def validate(script, character_card, context=None):
+            calls.append('val')
+            issues = []
+            if script in failing_scripts and script not in rejected:
+                rejected.add(script)
+                issues.append(ValidationIssue(ValidationSeverity.CRITICAL, 'lore', 'Anachronism'))
+            return ValidationResult(is_valid=True, script=script, issues=issues, overall_score=0.9)
+        
+        with patch('broadcast_engine.ScriptGenerator') as mock_generator, \
+             patch('broadcast_engine.WorldState'), \
+             patch('broadcast_engine.WEATHER_SYSTEM_AVAILABLE', False):
+            mock_generator.return_value.generate_script.side_effect = generate_script
+            engine = BroadcastEngine(
+                dj_name="Julie (2102, Appalachia)",
+                enable_validation=False,
+                enable_story_system=False,
+                checkpoint_dir=str(tmp_path),
+                checkpoint_interval=100,
+                model_batch_size=model_batch_size
+            )
+        
+        # LLM validation with a fake validator and a mock Ollama server
+        engine.enable_validation = True
+        engine.validation_mode = 'llm'
+        engine.validator = Mock(spec=LLMValidator)
+        engine.validator.model = "validator-model"
+        engine.validator.validate.side_effect = validate
+        engine.model_lifecycle = ModelLifecycleManager(MockOllamaClient())
+        return engine, calls
+    
+    def test_lifecycle_manager_only_for_model_batching(self, tmp_path):
+        with patch('broadcast_engine.ScriptGenerator'), \
+             patch('broadcast_engine.WorldState'), \
+             patch('broadcast_engine.WEATHER_SYSTEM_AVAILABLE', False):
+            engines = [
+                BroadcastEngine(
+                    dj_name="Julie (2102, Appalachia)",
+                    validation_mode='hybrid',
+                    enable_story_system=False,
+                    checkpoint_dir=str(tmp_path),
+                    model_batch_size=model_batch_size
+                )
+                for model_batch_size in (0, 4)
+            ]
+        
+        assert engines[0]._validator_model() and engines[0].model_lifecycle is None
+        assert engines[1].model_lifecycle is not None
+    
+    def test_per_segment_validation_swaps_every_call(self, tmp_path):
+        engine, calls = self._engine(tmp_path, 0)
+        
+        engine.generate_broadcast_sequence(8, 2, segments_per_hour=2)
+        
+        assert calls == ['gen', 'val'] * 4
+        assert engine.get_broadcast_stats()['model_lifecycle']['swaps'] == 7
+    
+    def test_window_validates_together_and_retries_failures(self, tmp_path):
+        engine, calls = self._engine(tmp_path, 4, failing_scripts={"gossip at 8"})
+        
+        segments = engine.generate_broadcast_sequence(8, 2, segments_per_hour=2)
+        
+        assert calls == ['gen'] * 4 + ['val'] * 4 + ['gen', 'val']
+        assert engine.get_broadcast_stats()['model_lifecycle']['swaps'] == 3
+        assert len(segments) == 4
+        assert all(s['metadata']['validation']['is_valid'] for s in segments)
+        assert segments[1]['metadata']['retry']['total_attempts'] == 2
+        assert engine.validation_failures == 1
+
+
+
+class TestLazyStartup:
+    """Tests for lazily initialized weather calendar and story pools"""
+    
+    def _engine(self, tmp_path, enable_story_system=False):
+        with patch('broadcast_engine.ScriptGenerator'), \
+             patch('broadcast_engine.WEATHER_SYSTEM_AVAILABLE', True), \
+             patch('broadcast_engine.WeatherSimulator') as mock_simulator:
+            clear = WeatherState('clear', datetime(2102, 1, 1), 6.0, 'minor', 'stable',
+                                 False, 12.0, 'Appalachia')
+            mock_simulator.return_value.generate_yearly_calendar.return_value = {
+                '2102-01-01': {'morning': clear}
+            }
+            engine = BroadcastEngine(
+                dj_name="Julie (2102, Appalachia)",
+                world_state_path=str(tmp_path / "state.json"),
+                enable_validation=False,
+                enable_story_system=enable_story_system,
+                checkpoint_dir=str(tmp_path)
+            )
+        return engine
+    
+    def test_calendar_generated_on_first_weather_lookup(self, tmp_path):
+        engine = self._engine(tmp_path)
+        
+        assert engine.world_state.weather_calendars == {}
+        assert not (tmp_path / "state.json").exists()
+        
+        engine._get_current_weather_from_simulator(8)
+        engine._get_current_weather_from_simulator(9)
+        
+        assert engine.weather_simulator.generate_yearly_calendar.call_count == 1
+        assert 'Appalachia' in engine.world_state.weather_calendars
+    
+    def test_warmup_loads_everything(self, tmp_path):
+        with patch('broadcast_engine.STORY_SYSTEM_AVAILABLE', True), \
+             patch('broadcast_engine.StoryExtractor') as mock_extractor:
+            mock_extractor.return_value.extract_stories.return_value = []
+            engine = self._engine(tmp_path, enable_story_system=True)
+            mock_extractor.assert_not_called()
+            
+            seconds = engine.warmup()
+            engine.warmup()
+        
+        assert seconds >= 0
+        assert mock_extractor.call_count == 1
+        assert engine.generator.warmup.call_count == 2
+        assert engine.weather_simulator.generate_yearly_calendar.call_count == 1
+        assert engine.end_broadcast(save_state=False)['startup']['warmup_seconds'] is not None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
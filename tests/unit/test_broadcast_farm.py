@@ -0,0 +1,124 @@
+"""
+Unit tests for broadcast_farm.py
+
+Tests running several DJs over one shared (mocked) ScriptGenerator.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+# Add tools/script-generator to path
+script_gen_path = Path(__file__).parent.parent.parent / "tools" / "script-generator"
+sys.path.insert(0, str(script_gen_path))
+
+from broadcast_farm import BroadcastFarm, ThreadLogRouter, dj_slug
+
+
+JULIE = "Julie (2102, Appalachia)"
+THREE_DOG = "Three Dog (2277, Capital Wasteland)"
+
+
+def shared_generator(delay=0.02):
+    """Mock ScriptGenerator that tracks concurrent generate_script calls"""
+    state = {'active': 0, 'peak': 0, 'djs': set()}
+    lock = threading.Lock()
+
+    def generate_script(script_type, **kwargs):
+        with lock:
+            state['active'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+            state['djs'].add(kwargs.get('dj_name'))
+        time.sleep(delay)
+        with lock:
+            state['active'] -= 1
+        return {'script': f"{kwargs.get('dj_name')}: {script_type}", 'metadata': {}}
+
+    generator = Mock()
+    generator.generate_script.side_effect = generate_script
+    return generator, state
+
+
+@pytest.fixture
+def farm_factory(tmp_path):
+    def create(dj_names, llm_slots=2, log_dir=None):
+        generator, state = shared_generator()
+        farm = BroadcastFarm(
+            dj_names,
+            engine_kwargs={
+                'enable_validation': False,
+                'enable_story_system': False,
+                'checkpoint_dir': str(tmp_path / "checkpoints"),
+                'checkpoint_interval': 100
+            },
+            llm_slots=llm_slots,
+            state_dir=str(tmp_path / "state"),
+            log_dir=log_dir,
+            generator=generator
+        )
+        return farm, generator, state
+    with patch('broadcast_engine.WEATHER_SYSTEM_AVAILABLE', False):
+        yield create
+
+
+class TestBroadcastFarm:
+    """Test multi-DJ farm runs"""
+
+    def test_djs_share_generator_with_isolated_state(self, farm_factory, tmp_path):
+        farm, generator, state = farm_factory([JULIE, THREE_DOG])
+
+        results = farm.run(start_hour=8, duration_hours=2, segments_per_hour=2)
+
+        assert list(results) == [JULIE, THREE_DOG]
+        for dj_name, result in results.items():
+            assert result.error is None
+            assert len(result.segments) == 4
+            assert all(s['script'].startswith(dj_name) for s in result.segments)
+            assert farm.engines[dj_name].generator is generator
+            assert (tmp_path / "state" / dj_slug(dj_name) / "broadcast_state.json").exists()
+        assert state['djs'] == {JULIE, THREE_DOG}
+        assert state['peak'] > 1
+        assert farm.get_statistics()['total_segments'] == 8
+
+    def test_model_batching_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            BroadcastFarm([JULIE, THREE_DOG], engine_kwargs={'model_batch_size': 4},
+                          state_dir=str(tmp_path), generator=Mock())
+
+    def test_llm_slots_split_between_djs(self, farm_factory):
+        farm, _, _ = farm_factory([JULIE, THREE_DOG], llm_slots=4)
+        assert farm.slots_per_dj() == 2
+
+        farm, _, _ = farm_factory([JULIE, THREE_DOG], llm_slots=1)
+        assert farm.slots_per_dj() == 1
+
+    def test_failed_dj_does_not_stop_others(self, farm_factory):
+        farm, _, _ = farm_factory([JULIE, THREE_DOG])
+        create_engine = farm.create_engine
+
+        def failing_create(dj_name):
+            if dj_name == THREE_DOG:
+                raise RuntimeError("state file locked")
+            return create_engine(dj_name)
+
+        with patch.object(farm, 'create_engine', side_effect=failing_create):
+            results = farm.run(start_hour=8, duration_hours=1, segments_per_hour=2)
+
+        assert results[JULIE].error is None
+        assert len(results[JULIE].segments) == 2
+        assert results[THREE_DOG].error == "RuntimeError: state file locked"
+        assert farm.get_statistics()['per_dj'][THREE_DOG]['segments'] == 0
+
+    def test_per_dj_logs(self, farm_factory, tmp_path):
+        farm, _, _ = farm_factory([JULIE, THREE_DOG], log_dir=tmp_path / "logs")
+
+        results = farm.run(start_hour=8, duration_hours=1, segments_per_hour=1)
+
+        for dj_name, result in results.items():
+            log_text = result.log_file.read_text(encoding='utf-8')
+            assert f"BroadcastEngine initialized for {dj_name}" in log_text
+        assert not isinstance(sys.stdout, ThreadLogRouter)
@@ -0,0 +1,98 @@
+"""Tests for broadcast window precompilation (broadcast_planner)"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+script_gen_path = Path(__file__).parent.parent.parent / "tools" / "script-generator"
+sys.path.insert(0, str(script_gen_path))
+
+from broadcast_planner import (
+    BroadcastPlanner, PlanCostModel, estimate_cost,
+    parse_dj_name, hour_to_time_of_day, build_context_query
+)
+from broadcast_scheduler import BroadcastScheduler, TimeOfDay
+from segment_plan import SegmentType
+from weather_simulator import WeatherState
+
+
+DJ = "Julie (2102, Appalachia)"
+
+
+def test_parse_dj_name():
+    assert parse_dj_name(DJ) == ("Julie", "2102", "Appalachia")
+    assert parse_dj_name("Mystery DJ") == ("Mystery DJ", "2102", "Appalachia West Virginia")
+
+
+def test_hour_to_time_of_day():
+    assert hour_to_time_of_day(6) == TimeOfDay.MORNING
+    assert hour_to_time_of_day(21) == TimeOfDay.EVENING
+    assert hour_to_time_of_day(23) == TimeOfDay.NIGHT
+
+
+class TestBroadcastPlanner:
+    def test_follows_live_schedule(self):
+        planner = BroadcastPlanner(DJ, live_scheduler=BroadcastScheduler())
+
+        plans = planner.compile(start_hour=5, duration_hours=3, segments_per_hour=2)
+
+        assert [plan.segment_type.value for plan in plans] == [
+            'time_check', 'gossip', 'time_check', 'weather', 'time_check', 'gossip'
+        ]
+        assert [(plan.hour_offset, plan.hour, plan.segment_num) for plan in plans[:3]] == [
+            (0, 5, 0), (0, 5, 1), (1, 6, 0)
+        ]
+
+    def test_plans_are_fully_resolved(self):
+        plans = BroadcastPlanner(DJ).compile(start_hour=6, duration_hours=1, segments_per_hour=3)
+
+        news = next(plan for plan in plans if plan.segment_type == SegmentType.NEWS)
+        assert news.template_vars['news_category'] == news.metadata['category']
+        assert news.rag_query == f"Appalachia 2102 news {news.metadata['category']} events recent"
+        for plan in plans:
+            assert plan.template_vars['dj_name'] == DJ
+            assert plan.template_vars['hour'] == 6
+            assert plan.rag_query == build_context_query(
+                plan.metadata['generator_script_type'], plan.template_vars, DJ
+            )
+
+    def test_daily_schedule_repeats(self):
+        plans = BroadcastPlanner(DJ).compile(start_hour=0, duration_hours=48, segments_per_hour=1)
+
+        assert all(plan.segment_type == SegmentType.TIME_CHECK for plan in plans)
+
+    def test_simulated_weather(self):
+        weather = WeatherState(
+            weather_type="rad_storm", started_at=datetime(2102, 10, 23, 6), duration_hours=4,
+            intensity="severe", transition_state="stable", is_emergency=True,
+            temperature=55.0, region="Appalachia", notable_event=True
+        )
+        planner = BroadcastPlanner(DJ, live_scheduler=BroadcastScheduler(), weather_lookup=lambda hour: weather)
+
+        plans = planner.compile(start_hour=6, duration_hours=1, segments_per_hour=2)
+
+        assert plans[1].segment_type == SegmentType.WEATHER
+        assert plans[1].template_vars['weather_type'] == "rad_storm"
+        assert plans[1].metadata['weather_state']['weather_type'] == "rad_storm"
+        assert "rad_storm" in plans[1].rag_query
+
+
+class TestEstimateCost:
+    def test_scales_with_slots_and_validation(self):
+        plans = BroadcastPlanner(DJ).compile(start_hour=8, duration_hours=24 * 7, segments_per_hour=2)
+
+        serial = estimate_cost(plans, PlanCostModel(retry_rate=0.0))
+        parallel = estimate_cost(plans, PlanCostModel(retry_rate=0.0, llm_slots=4))
+        validated = estimate_cost(plans, PlanCostModel.for_settings(
+            llm_slots=1, enable_validation=True, validation_mode='llm'
+        ))
+
+        assert serial['segments'] == 336
+        assert serial['hours'] == 168
+        assert serial['llm_calls'] == 336
+        assert sum(serial['segments_by_type'].values()) == 336
+        assert serial['unique_rag_queries'] < serial['rag_queries']
+        assert parallel['estimated_wall_seconds'] < serial['estimated_wall_seconds']
+        assert validated['llm_calls'] == pytest.approx(336 * 1.1 * 2, abs=1)
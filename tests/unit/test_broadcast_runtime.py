@@ -0,0 +1,166 @@
+"""Tests for the asyncio broadcast runtime"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+script_gen_path = Path(__file__).parent.parent.parent / "tools" / "script-generator"
+sys.path.insert(0, str(script_gen_path))
+
+from broadcast_runtime import BroadcastRuntime, ResourceLimits, run_sync
+from ollama_governor import CircuitOpenError
+
+
+class FakeEngine:
+    """Minimal engine exposing the stage methods the runtime drives"""
+
+    def __init__(self, delays=None, fail_hours=(), candidates=1):
+        self.dj_name = "Julie (2102, Appalachia)"
+        self.max_parallel_segments = 2
+        self.generator = MagicMock()
+        self.delays = delays or {}
+        self.fail_hours = set(fail_hours)
+        self.candidates = candidates
+        self.raced = []
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.planned = 0
+        self.commits = []
+        self.checkpoints = []
+
+    def _checkpoint_due(self, hour_offset):
+        return hour_offset == 2
+
+    def _start_hour(self, hour_offset, current_hour, duration_hours):
+        self.checkpoints.append((hour_offset, list(self.commits)))
+
+    def _prepare_segment(self, hour, reserve=False):
+        self.planned += 1
+        return {
+            'hour': hour,
+            'index': self.planned,
+            'segment_type': 'gossip',
+            'context_query': f"query {self.planned}",
+            'generator_script_type': 'gossip',
+            'story_context': None
+        }
+
+    def _candidate_count(self, job):
+        return self.candidates
+
+    def _generate_job(self, job, max_candidates=None):
+        calls = min(self.candidates, max_candidates or self.candidates)
+        with self.lock:
+            self.raced.append(calls)
+            self.active += calls
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delays.get(job['index'], 0.02))
+        with self.lock:
+            self.active -= calls
+        if job['hour'] in self.fail_hours:
+            raise CircuitOpenError("open")
+        return {'script': f"script {job['index']}"}
+
+    def _commit_generated(self, job, result, defer_llm_validation=False):
+        self.commits.append(job['index'])
+        return {'script': result['script'], 'hour': job['hour']}
+
+    def _llm_unavailable_segment(self, hour, segment_type, error):
+        return {'script': '', 'hour': hour, 'error': str(error)}
+
+
+def slots(hours, per_hour):
+    return [(offset, offset, n) for offset in range(hours) for n in range(per_hour)]
+
+
+class TestBroadcastRuntime:
+    def test_commit_order_and_llm_limit(self):
+        """Slow early generations do not reorder commits; LLM limit holds"""
+        engine = FakeEngine(delays={1: 0.15, 2: 0.01, 3: 0.01})
+        runtime = BroadcastRuntime(engine, ResourceLimits(llm=2, chroma=1))
+
+        committed = run_sync(runtime.run_slots(slots(2, 2), duration_hours=2))
+
+        assert [job['index'] for job, _ in committed] == [1, 2, 3, 4]
+        assert engine.commits == [1, 2, 3, 4]
+        assert 1 < engine.peak <= 2
+        stats = runtime.get_statistics()
+        assert stats['stages']['generate']['count'] == 4
+        assert stats['stages']['generate']['peak_concurrency'] <= 2
+        assert stats['stages']['retrieve']['peak_concurrency'] <= 1
+        assert stats['limits']['in_flight'] == 3
+
+    def test_candidate_races_take_a_slot_per_candidate(self):
+        """Races never put more LLM calls on the server than the llm limit"""
+        engine = FakeEngine(candidates=2, delays={1: 0.1})
+        runtime = BroadcastRuntime(engine, ResourceLimits(llm=3, chroma=2), lookahead=2)
+
+        run_sync(runtime.run_slots(slots(2, 3), duration_hours=2))
+
+        assert engine.peak <= 3
+        assert 2 in engine.raced
+        assert 1 in engine.raced  # Only one slot left while another race runs
+
+    def test_retrieve_warms_rag_cache(self):
+        engine = FakeEngine()
+        runtime = BroadcastRuntime(engine)
+
+        run_sync(runtime.run_slots(slots(1, 2), duration_hours=1))
+
+        queries = [call.kwargs['query'] for call in engine.generator.rag_cache.prefetch.call_args_list]
+        assert sorted(queries) == ["query 1", "query 2"]
+
+    def test_retrieve_errors_do_not_fail_segment(self):
+        engine = FakeEngine()
+        engine.generator.rag_cache.prefetch.side_effect = RuntimeError("chroma down")
+        runtime = BroadcastRuntime(engine)
+
+        committed = run_sync(runtime.run_slots(slots(1, 2), duration_hours=1))
+
+        assert len(committed) == 2
+
+    def test_drains_before_checkpoint(self):
+        """Earlier hours are committed before a due checkpoint runs"""
+        engine = FakeEngine()
+        runtime = BroadcastRuntime(engine, ResourceLimits(llm=2))
+
+        run_sync(runtime.run_slots(slots(3, 2), duration_hours=3))
+
+        checkpoint_commits = dict(engine.checkpoints)[2]
+        assert checkpoint_commits == [1, 2, 3, 4]
+        assert runtime.get_statistics()['stages']['checkpoint']['count'] == 3
+
+    def test_circuit_open_becomes_unavailable_segment(self):
+        engine = FakeEngine(fail_hours={1})
+        runtime = BroadcastRuntime(engine)
+
+        committed = run_sync(runtime.run_slots(slots(2, 1), duration_hours=2))
+
+        assert 'error' not in committed[0][1]
+        assert committed[1][1]['error'] == "open"
+
+    def test_run_sync_inside_running_loop(self):
+        engine = FakeEngine()
+
+        async def caller():
+            return run_sync(BroadcastRuntime(engine).run_slots(slots(1, 2), duration_hours=1))
+
+        committed = asyncio.run(caller())
+
+        assert len(committed) == 2
+
+    def test_run_sync_propagates_errors(self):
+        async def boom():
+            raise ValueError("bad")
+
+        async def caller():
+            return run_sync(boom())
+
+        with pytest.raises(ValueError):
+            asyncio.run(caller())
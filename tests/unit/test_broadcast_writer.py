@@ -0,0 +1,110 @@
+"""Tests for streaming broadcast output (broadcast_writer)"""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+script_gen_path = Path(__file__).parent.parent.parent / "tools" / "script-generator"
+sys.path.insert(0, str(script_gen_path))
+
+from broadcast_writer import (
+    JsonlBroadcastWriter, SqliteBroadcastWriter, open_writer, read_broadcast
+)
+
+
+METADATA = {'dj': "Julie (2102, Appalachia)", 'duration_hours': 2}
+
+
+def segment(segment_type, hour):
+    return {'segment_type': segment_type, 'script': f"{segment_type} at {hour}", 'metadata': {'hour': hour}}
+
+
+SEGMENTS = [segment('time_check', 8), segment('gossip', 8), segment('weather', 9)]
+
+
+@pytest.mark.parametrize("filename", ["run.jsonl", "run.db"])
+def test_round_trip(tmp_path, filename):
+    path = tmp_path / "output" / filename
+    with open_writer(path, METADATA) as writer:
+        for seg in SEGMENTS:
+            writer.write_segment(seg)
+        writer.finalize({'total_generation_time': 12.5})
+
+    document = read_broadcast(path)
+
+    assert document['finalized']
+    assert document['segments'] == SEGMENTS
+    assert document['metadata']['dj'] == METADATA['dj']
+    assert document['metadata']['total_segments'] == 3
+    assert document['stats'] == {'total_generation_time': 12.5}
+    assert writer.segments_by_type == {'time_check': 1, 'gossip': 1, 'weather': 1}
+
+
+@pytest.mark.parametrize("filename", ["run.jsonl", "run.sqlite"])
+def test_partial_run_is_readable(tmp_path, filename):
+    """Segments written before a crash survive without finalize()"""
+    path = tmp_path / filename
+    writer = open_writer(path, METADATA)
+    writer.write_segment(SEGMENTS[0])
+    writer.write_segment(SEGMENTS[1])
+
+    document = read_broadcast(path)  # Writer still open, as if the run crashed
+    writer.close()
+
+    assert not document['finalized']
+    assert document['stats'] is None
+    assert document['segments'] == SEGMENTS[:2]
+
+
+def test_jsonl_skips_truncated_line(tmp_path):
+    path = tmp_path / "run.jsonl"
+    with JsonlBroadcastWriter(path, METADATA) as writer:
+        writer.write_segment(SEGMENTS[0])
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"record": "segment", "index": 1, "segm')
+
+    document = read_broadcast(path)
+
+    assert document['segments'] == SEGMENTS[:1]
+
+
+def test_jsonl_records(tmp_path):
+    path = tmp_path / "run.jsonl"
+    with JsonlBroadcastWriter(path, METADATA) as writer:
+        writer.write_segment(SEGMENTS[0])
+        writer.finalize(None)
+
+    records = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+
+    assert [record['record'] for record in records] == ['metadata', 'segment', 'summary']
+    assert records[1]['index'] == 0
+    assert records[2]['segments_by_type'] == {'time_check': 1}
+
+
+def test_sqlite_holds_several_runs_with_index(tmp_path):
+    path = tmp_path / "broadcasts.db"
+    for dj in ("Julie (2102, Appalachia)", "Mr. New Vegas (2281, Mojave)"):
+        with SqliteBroadcastWriter(path, {'dj': dj}) as writer:
+            for seg in SEGMENTS:
+                writer.write_segment(seg)
+            writer.finalize({})
+
+    conn = sqlite3.connect(str(path))
+    rows = conn.execute(
+        "SELECT dj, script FROM segments WHERE hour = 9 AND segment_type = 'weather' ORDER BY broadcast_id"
+    ).fetchall()
+    indexes = [row[1] for row in conn.execute("PRAGMA index_list(segments)")]
+    conn.close()
+
+    assert [row[0] for row in rows] == ["Julie (2102, Appalachia)", "Mr. New Vegas (2281, Mojave)"]
+    assert 'idx_segments_dj_hour_type' in indexes
+    assert read_broadcast(path)['metadata']['dj'] == "Mr. New Vegas (2281, Mojave)"
+    assert read_broadcast(path, broadcast_id=1)['metadata']['dj'] == "Julie (2102, Appalachia)"
+
+
+def test_unsupported_extension(tmp_path):
+    with pytest.raises(ValueError):
+        open_writer(tmp_path / "run.json", METADATA)
@@ -0,0 +1,176 @@
+"""
+Unit tests for the wall-clock budget scheduler.
+
+Tests finish-time projection from per-type costs and retry rates, and the
+degrade/restore decisions with hysteresis and cooldown.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+script_gen_path = Path(__file__).parent.parent.parent / "tools" / "script-generator"
+sys.path.insert(0, str(script_gen_path))
+
+from budget_scheduler import BudgetScheduler, DEGRADATION_LADDER
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_scheduler(budget_seconds=100.0, **kwargs):
+    clock = FakeClock()
+    kwargs.setdefault('min_samples', 1)
+    kwargs.setdefault('cooldown', 1)
+    return BudgetScheduler(budget_seconds, clock=clock, **kwargs), clock
+
+
+def run_segment(scheduler, clock, segment_type, seconds, attempts=1):
+    """Observe one segment that took attempts x seconds; returns the last decision"""
+    decision = None
+    for attempt in range(1, attempts + 1):
+        clock.now += seconds
+        decision = scheduler.observe(segment_type, seconds, attempt, scheduler.active_steps())
+    return decision
+
+
+class TestProjection:
+    def test_no_projection_before_first_segment(self):
+        scheduler, _ = make_scheduler()
+        scheduler.add_segments(10)
+
+        assert scheduler.projected_seconds() is None
+        assert scheduler.active_steps() == ()
+
+    def test_retry_rate_raises_segment_cost(self):
+        scheduler, clock = make_scheduler(budget_seconds=1000.0)
+        scheduler.add_segments(4)
+
+        run_segment(scheduler, clock, 'news', 10.0, attempts=3)
+        run_segment(scheduler, clock, 'news', 10.0, attempts=1)
+
+        stats = scheduler.get_statistics()['by_type']['news']
+        assert stats['retry_rate'] == 1.0  # 4 attempts for 2 segments
+        assert stats['seconds_per_segment'] == 20.0
+        # 40s elapsed + 2 remaining segments at 20s each
+        assert scheduler.projected_seconds() == pytest.approx(80.0)
+
+    def test_remaining_segments_follow_type_mix(self):
+        scheduler, clock = make_scheduler(budget_seconds=1000.0)
+        scheduler.add_segments(4)
+
+        run_segment(scheduler, clock, 'time_check', 2.0)
+        run_segment(scheduler, clock, 'gossip', 18.0)
+
+        assert scheduler.projected_seconds() == pytest.approx(20.0 + 2 * 10.0)
+
+    def test_concurrent_segments_use_achieved_parallelism(self):
+        """4 segments of 40s each finish every 10s: on budget, not 4x over"""
+        scheduler, clock = make_scheduler(budget_seconds=250.0, concurrency=4)
+        scheduler.add_segments(20)
+
+        for _ in range(4):
+            clock.now += 10.0
+            assert scheduler.observe('news', 40.0, 1) is None
+
+        assert scheduler.projected_seconds() == pytest.approx(40.0 + 16 * 10.0)
+        assert scheduler.get_statistics()['parallelism'] == 4.0
+        assert scheduler.level == 0
+
+    def test_parallelism_capped_by_concurrency(self):
+        scheduler, clock = make_scheduler(budget_seconds=1000.0, concurrency=2)
+        scheduler.add_segments(4)
+
+        clock.now += 10.0
+        scheduler.observe('news', 40.0, 1)  # Looks like 4 in flight
+
+        assert scheduler.projected_seconds() == pytest.approx(10.0 + 3 * 40.0 / 2)
+
+
+class TestDecisions:
+    def test_degrades_in_ladder_order_when_behind(self):
+        scheduler, clock = make_scheduler(budget_seconds=100.0)
+        scheduler.add_segments(10)
+
+        decisions = [run_segment(scheduler, clock, 'gossip', 30.0) for _ in range(3)]
+
+        assert [d['step'] for d in decisions] == list(DEGRADATION_LADDER)
+        assert all(d['action'] == 'degrade' for d in decisions)
+        assert scheduler.active_steps() == DEGRADATION_LADDER
+        assert decisions[0]['projected_seconds'] == pytest.approx(300.0)
+
+    def test_restores_last_step_first_when_ahead(self):
+        scheduler, clock = make_scheduler(budget_seconds=100.0)
+        scheduler.add_segments(20)
+        run_segment(scheduler, clock, 'gossip', 30.0)
+        run_segment(scheduler, clock, 'gossip', 30.0)
+        assert scheduler.level == 2
+
+        scheduler.planned = scheduler.completed + 1  # Last segment, run fast
+        clock.now = 0.0
+        decision = run_segment(scheduler, clock, 'gossip', 1.0)
+
+        assert decision['action'] == 'restore'
+        assert decision['step'] == 'short_output'
+        assert scheduler.active_steps() == ('rules_validation',)
+
+    def test_within_tolerance_keeps_level(self):
+        scheduler, clock = make_scheduler(budget_seconds=100.0)
+        scheduler.add_segments(10)
+
+        for _ in range(5):
+            assert run_segment(scheduler, clock, 'news', 10.2) is None
+        assert scheduler.level == 0
+
+    def test_cooldown_and_min_samples(self):
+        scheduler, clock = make_scheduler(budget_seconds=10.0, min_samples=2, cooldown=3)
+        scheduler.add_segments(10)
+
+        assert run_segment(scheduler, clock, 'news', 30.0) is None  # Below min_samples
+        assert run_segment(scheduler, clock, 'news', 30.0)['level'] == 1
+        assert run_segment(scheduler, clock, 'news', 30.0) is None
+        assert run_segment(scheduler, clock, 'news', 30.0) is None
+        assert run_segment(scheduler, clock, 'news', 30.0)['level'] == 2
+
+    def test_retries_do_not_count_as_segments(self):
+        scheduler, clock = make_scheduler(budget_seconds=1000.0)
+        scheduler.add_segments(3)
+
+        run_segment(scheduler, clock, 'gossip', 5.0, attempts=4)
+
+        stats = scheduler.get_statistics()
+        assert stats['completed_segments'] == 1
+        assert stats['by_type']['gossip']['attempts'] == 4
+
+
+class TestLadder:
+    def test_skip_step_keeps_active_level(self):
+        scheduler, clock = make_scheduler(budget_seconds=10.0)
+        scheduler.add_segments(10)
+        run_segment(scheduler, clock, 'news', 30.0)
+        run_segment(scheduler, clock, 'news', 30.0)
+
+        scheduler.skip_step('rules_validation')
+
+        assert scheduler.active_steps() == ('short_output',)
+        assert scheduler.ladder == ('short_output', 'templated_time_check')
+
+    def test_degraded_segments_counted_per_step(self):
+        scheduler, clock = make_scheduler(budget_seconds=10.0)
+        scheduler.add_segments(10)
+        for _ in range(3):
+            run_segment(scheduler, clock, 'news', 30.0)
+
+        assert scheduler.get_statistics()['degraded_segments'] == {
+            'rules_validation': 2, 'short_output': 1
+        }
+
+    def test_rejects_non_positive_budget(self):
+        with pytest.raises(ValueError):
+            BudgetScheduler(0)
@@ -0,0 +1,131 @@
+"""
+Unit tests for the persistent completion cache.
+
+Tests keying, the opt-in policy, SQLite persistence and the OllamaClient /
+LLMValidator integration.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add tools/script-generator to path
+script_gen_path = Path(__file__).parent.parent.parent / "tools" / "script-generator"
+sys.path.insert(0, str(script_gen_path))
+
+from completion_cache import CompletionCache, completion_key, should_cache
+from ollama_client import OllamaClient, cache_tag_kwargs
+from llm_validator import LLMValidator
+
+
+def ok_response(text):
+    response = Mock()
+    response.json.return_value = {"response": text}
+    response.raise_for_status.return_value = None
+    return response
+
+
+class TestKeyAndPolicy:
+    """Test content addressing and the opt-in policy"""
+
+    def test_key_ignores_option_order(self):
+        a = completion_key("m", "p", {"temperature": 0, "top_p": 0.9})
+        b = completion_key("m", "p", {"top_p": 0.9, "temperature": 0})
+
+        assert a == b
+        assert a != completion_key("m", "p", {"temperature": 0.1, "top_p": 0.9})
+        assert a != completion_key("other", "p", {"temperature": 0, "top_p": 0.9})
+
+    def test_policy(self):
+        assert should_cache({"temperature": 0})
+        assert not should_cache({"temperature": 0.8})
+        assert not should_cache(None)
+        assert should_cache({"temperature": 0.8}, cache_tag="story_acts")
+
+
+class TestCompletionCache:
+    """Test SQLite storage"""
+
+    def test_persists_across_instances(self, tmp_path):
+        db = tmp_path / "cache" / "completions.sqlite"
+        cache = CompletionCache(db)
+        cache.put("m", "p", {"temperature": 0}, "hello", tag="t")
+        cache.close()
+
+        reopened = CompletionCache(db)
+        assert reopened.get("m", "p", {"temperature": 0}) == "hello"
+        assert reopened.get("m", "other", {"temperature": 0}) is None
+        assert reopened.get_statistics()['hits'] == 1
+        assert reopened.get_statistics()['misses'] == 1
+
+    def test_clear_by_tag(self):
+        cache = CompletionCache()
+        cache.put("m", "a", None, "1", tag="keep")
+        cache.put("m", "b", None, "2", tag="drop")
+
+        assert cache.clear(tag="drop") == 1
+        assert len(cache) == 1
+
+
+class TestOllamaClientCache:
+    """Test OllamaClient with a completion cache"""
+
+    @patch('requests.Session.post')
+    def test_deterministic_calls_hit_cache(self, mock_post):
+        mock_post.return_value = ok_response("cached text")
+        client = OllamaClient(completion_cache=CompletionCache())
+
+        first = client.generate("m", "p", options={"temperature": 0})
+        second = client.generate("m", "p", options={"temperature": 0})
+
+        assert first == second == "cached text"
+        assert mock_post.call_count == 1
+
+    @patch('requests.Session.post')
+    def test_sampling_calls_need_tag(self, mock_post):
+        mock_post.return_value = ok_response("text")
+        client = OllamaClient(completion_cache=CompletionCache())
+
+        client.generate("m", "p", options={"temperature": 0.8})
+        client.generate("m", "p", options={"temperature": 0.8})
+        assert mock_post.call_count == 2
+
+        client.generate("m", "p", options={"temperature": 0.8}, cache_tag="story_acts")
+        client.generate("m", "p", options={"temperature": 0.8}, cache_tag="story_acts")
+        assert mock_post.call_count == 3
+
+    @patch('requests.Session.post')
+    def test_check_connection_bypasses_cache(self, mock_post):
+        mock_post.return_value = ok_response("OK")
+        client = OllamaClient(completion_cache=CompletionCache())
+
+        assert client.check_connection(model="m")
+        assert client.check_connection(model="m")
+        assert mock_post.call_count == 2
+
+
+class TestCallSites:
+    """Test call-site tagging"""
+
+    def test_cache_tag_kwargs_respects_signature(self):
+        def plain_generate(model, prompt, options=None, timeout=None):
+            return ""
+
+        plain = Mock()
+        plain.generate = plain_generate
+
+        assert cache_tag_kwargs(OllamaClient(), "t") == {'cache_tag': "t"}
+        assert cache_tag_kwargs(plain, "t") == {}
+        assert cache_tag_kwargs(OllamaClient(), None) == {}
+
+    @patch('requests.Session.post')
+    def test_revalidation_reuses_verdict(self, mock_post):
+        mock_post.return_value = ok_response('{"is_valid": true, "overall_score": 0.9, "issues": []}')
+        client = OllamaClient(completion_cache=CompletionCache())
+        validator = LLMValidator(ollama_client=client, validate_connection=False)
+        card = {'name': 'Julie', 'tone': 'friendly'}
+
+        validator.validate("Morning, Appalachia!", card)
+        validator.validate("Morning, Appalachia!", card)
+
+        assert mock_post.call_count == 1
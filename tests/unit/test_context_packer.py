@@ -0,0 +1,138 @@
+"""
+Unit tests for ContextPacker.
+
+Tests token-budgeted packing of RAG chunks into lore context.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add tools/script-generator to path
+script_gen_path = Path(__file__).parent.parent.parent / "tools" / "script-generator"
+sys.path.insert(0, str(script_gen_path))
+
+from context_packer import (
+    ContextPacker,
+    PackedContext,
+    split_sentences,
+    estimate_tokens,
+    load_token_counter,
+    TEMPLATE_TOKEN_BUDGETS,
+    DEFAULT_TOKEN_BUDGET
+)
+
+
+def word_counter(text):
+    """Deterministic token counter: one token per word."""
+    return len(text.split())
+
+
+CHUNK_A = (
+    "Vault 76 opened on Reclamation Day in 2102. "
+    "The dwellers emerged to rebuild Appalachia. "
+    "Flatwoods was the first settlement they reached."
+)
+# Overlaps the end of CHUNK_A, as produced by the chunker's token overlap
+CHUNK_B = (
+    "Flatwoods was the first settlement they reached. "
+    "Radstorms sweep across the Ash Heap most weeks. "
+    "The Responders ran a clinic in Flatwoods."
+)
+CHUNK_C = "Nuka-Cola vending machines still dot the roads. Nobody knows why they still hum."
+
+
+class TestHelpers:
+    """Test sentence splitting and token estimation"""
+
+    def test_split_sentences(self):
+        assert split_sentences(CHUNK_A) == [
+            "Vault 76 opened on Reclamation Day in 2102.",
+            "The dwellers emerged to rebuild Appalachia.",
+            "Flatwoods was the first settlement they reached.",
+        ]
+
+    def test_estimate_tokens(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd" * 10) == 10
+
+    def test_missing_tokenizer_falls_back_to_estimate(self):
+        assert load_token_counter(None) is estimate_tokens
+        assert load_token_counter("not-a/real-tokenizer-xyz") is estimate_tokens
+
+
+class TestContextPacker:
+    """Test ContextPacker packing behaviour"""
+
+    @pytest.fixture
+    def packer(self):
+        return ContextPacker(token_counter=word_counter)
+
+    def test_budget_lookup(self, packer):
+        assert packer.get_budget('weather') == TEMPLATE_TOKEN_BUDGETS['weather']
+        assert packer.get_budget('unknown') == DEFAULT_TOKEN_BUDGET
+
+    def test_dedupes_overlapping_chunks(self, packer):
+        packed = packer.pack([CHUNK_A, CHUNK_B], query="Flatwoods", token_budget=500)
+
+        assert packed.duplicates_removed == 1
+        assert packed.text.count("Flatwoods was the first settlement") == 1
+        assert packed.sentences_dropped == 0
+
+    def test_respects_exact_budget(self, packer):
+        packed = packer.pack([CHUNK_A, CHUNK_B, CHUNK_C], query="Flatwoods clinic", token_budget=20)
+
+        assert packed.tokens_used <= 20
+        assert word_counter(packed.text) == packed.tokens_used
+        assert packed.sentences_dropped > 0
+
+    def test_prefers_query_relevant_sentences(self, packer):
+        packed = packer.pack([CHUNK_A, CHUNK_B, CHUNK_C], query="Ash Heap radstorms", token_budget=12)
+
+        assert "Radstorms sweep across the Ash Heap" in packed.text
+        assert "Nuka-Cola" not in packed.text
+
+    def test_keeps_document_order(self, packer):
+        packed = packer.pack([CHUNK_A, CHUNK_B], query="Vault 76 Responders clinic", token_budget=500)
+
+        assert packed.text.index("Vault 76") < packed.text.index("Responders")
+        assert "\n\n" in packed.text
+
+    def test_counts_each_sentence_once(self):
+        calls = []
+
+        def counting(text):
+            calls.append(text)
+            return word_counter(text)
+
+        documents = [f"Sentence number {i} about Flatwoods." for i in range(200)]
+        packed = ContextPacker(token_counter=counting).pack(documents, query="Flatwoods", token_budget=30)
+
+        assert packed.tokens_used <= 30
+        assert len(calls) <= len(documents) + 2  # Per sentence, plus the final measure
+
+    def test_join_costs_stay_within_budget(self):
+        # Separators cost more than the per-sentence estimate allows for
+        def heavy_joins(text):
+            return word_counter(text) + 8 * text.count('\n\n')
+
+        packed = ContextPacker(token_counter=heavy_joins).pack(
+            [CHUNK_A, CHUNK_B, CHUNK_C], query="Flatwoods clinic", token_budget=20)
+
+        assert 0 < packed.tokens_used <= 20
+        assert packed.sentences_kept == 1
+        assert heavy_joins(packed.text) == packed.tokens_used
+
+    def test_trims_single_oversized_sentence(self, packer):
+        packed = packer.pack(["one two three four five six seven eight."], query="one", token_budget=4)
+
+        assert packed.text == "one two three four..."
+        assert packed.tokens_used <= 4
+
+    def test_empty_documents(self, packer):
+        packed = packer.pack([], query="anything", script_type='news')
+
+        assert isinstance(packed, PackedContext)
+        assert packed.text == ''
+        assert packed.token_budget == TEMPLATE_TOKEN_BUDGETS['news']
+        assert packed.to_dict()['tokens_used'] == 0
@@ -0,0 +1,118 @@
+"""
+Unit tests for speculative draft-then-verify generation.
+
+Tests the DraftTier acceptance policy and the ScriptGenerator draft path.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+# Add tools/script-generator to path
+script_gen_path = Path(__file__).parent.parent.parent / "tools" / "script-generator"
+sys.path.insert(0, str(script_gen_path))
+
+from consistency_validator import ValidationSeverity
+from draft_tier import DraftTier
+from generator import ScriptGenerator
+
+
+GOOD_SCRIPT = ("Well, good morning neighbors! I really hope you are all doing okay out there, "
+               "friends. Um, the Responders have fresh water today, so you know, stop by and say hi.")
+BAD_SCRIPT = ("Good morning Appalachia, the Institute and the synths of the Commonwealth "
+              "are on the move in 2287 today folks.")
+
+
+def violation(severity):
+    return {'message': 'x', 'severity': severity, 'category': 'test'}
+
+
+class TestDraftReview:
+    """Test the draft acceptance policy"""
+
+    def test_accepts_clean_draft(self):
+        tier = DraftTier("small")
+
+        assert tier.review(GOOD_SCRIPT, [violation(ValidationSeverity.WARNING)]) is None
+
+    def test_rejections(self):
+        tier = DraftTier("small")
+
+        assert tier.review("Too short.", []) == "too_short"
+        assert tier.review(GOOD_SCRIPT, [], required_catchphrases=["Welcome home, Appalachia."]) \
+            == "missing_catchphrase"
+        assert tier.review(GOOD_SCRIPT, [violation(ValidationSeverity.CRITICAL)]) == "critical_violation"
+
+    def test_quality_threshold(self):
+        strict = DraftTier("small", quality_threshold=0.0)
+        lenient = DraftTier("small", quality_threshold=1.0)
+        quality = [violation(ValidationSeverity.QUALITY)]
+
+        assert strict.review(GOOD_SCRIPT, quality) == "quality_threshold"
+        assert lenient.review(GOOD_SCRIPT, quality) is None
+
+    def test_statistics(self):
+        tier = DraftTier("small")
+        tier.record_draft(1.0, accepted=True)
+        tier.record_draft(1.0, accepted=False, reason="critical_violation")
+        tier.record_primary(4.0)
+
+        stats = tier.get_statistics()
+        assert stats['draft']['pass_rate'] == 50.0
+        assert stats['draft']['rejections'] == {'critical_violation': 1}
+        assert stats['primary']['avg_latency'] == 4.0
+        assert stats['avg_seconds_per_segment'] == 3.0
+
+
+class TestGeneratorDraftPath:
+    """Test ScriptGenerator.generate_script() with a draft model"""
+
+    def _generator(self, draft_text):
+        with patch('tools.wiki_to_chromadb.chromadb_ingest.ChromaDBIngestor') as mock_chroma, \
+             patch('generator.OllamaClient') as mock_ollama:
+            mock_chroma.return_value.get_collection_stats.return_value = {'total_chunks': 1}
+            mock_ollama.return_value.check_connection.return_value = True
+            generator = ScriptGenerator(draft_model="small")
+
+        generator.rag_cache = MagicMock()
+        generator.rag_cache.query_with_cache.return_value = {
+            'documents': [["Vault 76 opened on Reclamation Day."]],
+            'ids': [["chunk1"]], 'metadatas': [[{}]], 'distances': [[0.1]]
+        }
+        generator.rag_cache.get_statistics.return_value = {'cache_hits': 0, 'cache_misses': 1, 'hit_rate': 0.0}
+
+        def chat(messages, model, **kwargs):
+            text = draft_text if model == "small" else GOOD_SCRIPT
+            return {'message': {'content': text}}
+
+        generator.ollama = Mock(spec=['chat', 'generate'])
+        generator.ollama.chat.side_effect = chat
+        return generator
+
+    def _generate(self, generator):
+        return generator.generate_script(
+            script_type='time', dj_name="Julie (2102, Appalachia)", context_query="Vault 76",
+            model="primary", enable_catchphrase_rotation=False, hour=8, time_of_day="morning"
+        )
+
+    def test_accepted_draft_skips_primary(self):
+        generator = self._generator(GOOD_SCRIPT)
+
+        result = self._generate(generator)
+
+        assert result['metadata']['generation_tier'] == 'draft'
+        assert [c.kwargs['model'] for c in generator.ollama.chat.call_args_list] == ["small"]
+        assert generator.get_tier_statistics()['draft']['accepted'] == 1
+
+    def test_rejected_draft_regenerates_with_primary(self):
+        generator = self._generator(BAD_SCRIPT)
+
+        result = self._generate(generator)
+
+        assert result['script'] == GOOD_SCRIPT
+        assert result['metadata']['generation_tier'] == 'primary'
+        assert result['metadata']['draft_rejection'] == 'critical_violation'
+        assert [c.kwargs['model'] for c in generator.ollama.chat.call_args_list] == ["small", "primary"]
+        stats = generator.get_tier_statistics()
+        assert stats['draft']['pass_rate'] == 0.0
+        assert stats['primary']['calls'] == 1
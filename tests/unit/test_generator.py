@@ -27,7 +27,7 @@ from tools.shared.mock_ollama_client import MockOllamaClient
 class TestScriptGeneratorInitialization:
     """Tests for ScriptGenerator initialization"""
     
-    @patch('generator.ChromaDBIngestor')
+    @patch('tools.wiki_to_chromadb.chromadb_ingest.ChromaDBIngestor')
     @patch('generator.OllamaClient')
     def test_basic_initialization(self, mock_ollama, mock_chroma):
         """Test basic generator initialization"""
@@ -44,10 +44,15 @@ class TestScriptGeneratorInitialization:
         generator = ScriptGenerator()
         
         assert generator is not None
-        assert mock_chroma.called
         assert mock_ollama.called
+        
+        # ChromaDB opens on first use, once
+        assert not mock_chroma.called
+        assert generator.rag is mock_chroma_instance
+        assert generator.rag_cache.chromadb is mock_chroma_instance
+        assert mock_chroma.call_count == 1
     
-    @patch('generator.ChromaDBIngestor')
+    @patch('tools.wiki_to_chromadb.chromadb_ingest.ChromaDBIngestor')
     @patch('generator.OllamaClient')
     def test_initialization_with_custom_paths(self, mock_ollama, mock_chroma):
         """Test initialization with custom paths"""
@@ -67,7 +72,7 @@ class TestScriptGeneratorInitialization:
         
         assert generator is not None
     
-    @patch('generator.ChromaDBIngestor')
+    @patch('tools.wiki_to_chromadb.chromadb_ingest.ChromaDBIngestor')
     @patch('generator.OllamaClient')
     def test_initialization_ollama_connection_check(self, mock_ollama, mock_chroma):
         """Test that Ollama connection is checked on init"""
@@ -88,9 +93,9 @@ class TestScriptGeneratorInitialization:
 class TestScriptGeneratorRAGRetrieval:
     """Tests for RAG context retrieval"""
     
-    @patch('generator.ChromaDBIngestor')
+    @patch('tools.wiki_to_chromadb.chromadb_ingest.ChromaDBIngestor')
     @patch('generator.OllamaClient')
-    @patch('generator.query_for_dj')
+    @patch('tools.wiki_to_chromadb.chromadb_ingest.query_for_dj')
     def test_rag_context_retrieval(self, mock_query, mock_ollama, mock_chroma):
         """Test retrieving RAG context for generation"""
         # Setup mocks
@@ -116,7 +121,7 @@ class TestScriptGeneratorRAGRetrieval:
 class TestScriptGeneratorGeneration:
     """Tests for script generation"""
     
-    @patch('generator.ChromaDBIngestor')
+    @patch('tools.wiki_to_chromadb.chromadb_ingest.ChromaDBIngestor')
     @patch('generator.OllamaClient')
     @patch('generator.load_personality')
     def test_generate_script_basic(self, mock_personality, mock_ollama, mock_chroma):
@@ -140,7 +145,7 @@ class TestScriptGeneratorGeneration:
         # Test generate_script exists
         assert hasattr(generator, 'generate_script')
     
-    @patch('generator.ChromaDBIngestor')
+    @patch('tools.wiki_to_chromadb.chromadb_ingest.ChromaDBIngestor')
     @patch('generator.OllamaClient')
     def test_generate_with_template_vars(self, mock_ollama, mock_chroma):
         """Test generation with template variables"""
@@ -160,7 +165,7 @@ class TestScriptGeneratorGeneration:
 class TestScriptGeneratorTemplateRendering:
     """Tests for Jinja2 template rendering"""
     
-    @patch('generator.ChromaDBIngestor')
+    @patch('tools.wiki_to_chromadb.chromadb_ingest.ChromaDBIngestor')
     @patch('generator.OllamaClient')
     def test_template_environment_setup(self, mock_ollama, mock_chroma):
         """Test that Jinja2 environment is set up correctly"""
@@ -181,7 +186,7 @@ class TestScriptGeneratorTemplateRendering:
 class TestScriptGeneratorRAGCache:
     """Tests for RAG caching functionality"""
     
-    @patch('generator.ChromaDBIngestor')
+    @patch('tools.wiki_to_chromadb.chromadb_ingest.ChromaDBIngestor')
     @patch('generator.OllamaClient')
     def test_rag_cache_initialization(self, mock_ollama, mock_chroma):
         """Test that RAG cache is initialized"""
@@ -197,12 +202,24 @@ class TestScriptGeneratorRAGCache:
         
         assert hasattr(generator, 'rag_cache')
         assert generator.rag_cache is not None
+    
+    @patch('tools.wiki_to_chromadb.chromadb_ingest.ChromaDBIngestor')
+    @patch('generator.OllamaClient')
+    def test_warmup_opens_chromadb(self, mock_ollama, mock_chroma):
+        """Test that warmup() opens ChromaDB and runs one query"""
+        mock_chroma.return_value.get_collection_stats.return_value = {'total_chunks': 1000}
+        mock_ollama.return_value.check_connection.return_value = True
+        
+        generator = ScriptGenerator(retrieval_mode="hybrid")
+        generator.warmup()
+        
+        mock_chroma.return_value.query.assert_called_once_with("warmup", n_results=1, mode="hybrid")
 
 
 class TestScriptGeneratorErrorHandling:
     """Tests for error handling"""
     
-    @patch('generator.ChromaDBIngestor')
+    @patch('tools.wiki_to_chromadb.chromadb_ingest.ChromaDBIngestor')
     @patch('generator.OllamaClient')
     def test_ollama_generation_failure(self, mock_ollama, mock_chroma):
         """Test handling of Ollama generation failures"""
@@ -224,7 +241,7 @@ class TestScriptGeneratorErrorHandling:
 class TestScriptGeneratorValidation:
     """Tests for script validation"""
     
-    @patch('generator.ChromaDBIngestor')
+    @patch('tools.wiki_to_chromadb.chromadb_ingest.ChromaDBIngestor')
     @patch('generator.OllamaClient')
     def test_validation_integration(self, mock_ollama, mock_chroma):
         """Test integration with validation system"""
@@ -245,7 +262,7 @@ class TestScriptGeneratorValidation:
 class TestScriptGeneratorSessionState:
     """Tests for session state management"""
     
-    @patch('generator.ChromaDBIngestor')
+    @patch('tools.wiki_to_chromadb.chromadb_ingest.ChromaDBIngestor')
     @patch('generator.OllamaClient')
     def test_session_memory_initialization(self, mock_ollama, mock_chroma):
         """Test session memory initialization"""
@@ -266,7 +283,7 @@ class TestScriptGeneratorSessionState:
 class TestScriptGeneratorIntegration:
     """Integration tests combining multiple features"""
     
-    @patch('generator.ChromaDBIngestor')
+    @patch('tools.wiki_to_chromadb.chromadb_ingest.ChromaDBIngestor')
     @patch('generator.OllamaClient')
     @patch('generator.load_personality')
     def test_complete_generation_workflow(self, mock_personality, mock_ollama, mock_chroma):
@@ -0,0 +1,171 @@
+"""Tests for live broadcast mode (live_broadcast)"""
+
+import json
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+script_gen_path = Path(__file__).parent.parent.parent / "tools" / "script-generator"
+sys.path.insert(0, str(script_gen_path))
+
+from live_broadcast import LiveBroadcast, start_server
+
+
+class FakeEngine:
+    """generate_next_segment() stand-in that records the hours it was asked for"""
+
+    def __init__(self, skip_every=0, delay=0.0):
+        self.hours = []
+        self.skip_every = skip_every
+        self.delay = delay
+        self.checkpoints = []
+        self.last_checkpoint_hour = -1
+        self.scheduler = MagicMock()
+        self.prefetch_upcoming = MagicMock()
+
+    def generate_next_segment(self, hour):
+        time.sleep(self.delay)
+        self.hours.append(hour)
+        if self.skip_every and len(self.hours) % self.skip_every == 0:
+            return {'segment_type': 'news', 'script': '', 'metadata': {'status': 'skipped'}}
+        return {'segment_type': 'gossip', 'script': f"Segment {len(self.hours)}", 'metadata': {}}
+
+    def _checkpoint_due(self, hour_offset):
+        return hour_offset > 0 and hour_offset % 2 == 0
+
+    def save_checkpoint(self, hour, total_hours=0):
+        self.checkpoints.append(hour)
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+class TestLiveBroadcast:
+    def test_fills_buffer_and_stays_bounded(self):
+        engine = FakeEngine()
+        live = LiveBroadcast(engine, buffer_size=3, low_watermark=3, start_hour=8, retry_delay=0)
+        live.start()
+
+        first = live.next_segment(timeout=5)
+        wait_until(lambda: live.get_statistics()['buffer_depth'] == 3)
+        time.sleep(0.05)
+        live.stop(save_checkpoint=False)
+
+        assert first['sequence'] == 0
+        assert first['program_hour'] == 8
+        assert live.first_segment_seconds is not None
+        assert len(engine.hours) == 4  # One aired, three buffered
+
+    def test_refills_only_below_watermark(self):
+        engine = FakeEngine()
+        live = LiveBroadcast(engine, buffer_size=4, low_watermark=2, start_hour=8, retry_delay=0)
+        live.start()
+        wait_until(lambda: len(live.buffered()) == 4)
+
+        live.next_segment(timeout=1)
+        live.next_segment(timeout=1)
+        time.sleep(0.05)
+        assert len(engine.hours) == 4  # Two left, not below the watermark yet
+
+        live.next_segment(timeout=1)
+        wait_until(lambda: len(live.buffered()) == 4)
+        live.stop(save_checkpoint=False)
+
+        assert len(engine.hours) == 7
+        assert live.refills == 1
+        assert [segment['sequence'] for segment in live.buffered()] == [3, 4, 5, 6]
+
+    def test_program_clock_and_checkpoints(self):
+        engine = FakeEngine()
+        live = LiveBroadcast(engine, buffer_size=50, low_watermark=50, start_hour=22,
+                             segments_per_hour=2, retry_delay=0)
+        live.start()
+        wait_until(lambda: len(engine.hours) >= 50)
+        live.stop()
+
+        assert engine.hours[:6] == [22, 22, 23, 23, 0, 0]
+        assert engine.checkpoints[:2] == [0, 2]  # Offsets 2 and 4
+        assert engine.checkpoints[-1] == (22 + 24) % 24  # Final checkpoint at the last hour
+        engine.scheduler.reset.assert_called_once()  # New program day at offset 24
+
+    def test_skipped_segments_are_not_aired(self):
+        engine = FakeEngine(skip_every=2)
+        live = LiveBroadcast(engine, buffer_size=3, low_watermark=3, start_hour=8, retry_delay=0)
+        live.start()
+        wait_until(lambda: len(live.buffered()) == 3)
+        live.stop(save_checkpoint=False)
+
+        assert [segment['sequence'] for segment in live.buffered()] == [0, 2, 4]
+        assert live.skipped == 2
+
+    def test_generation_errors_are_retried(self):
+        engine = FakeEngine()
+        calls = {'n': 0}
+        generate = engine.generate_next_segment
+
+        def flaky(hour):
+            calls['n'] += 1
+            if calls['n'] == 1:
+                raise RuntimeError("Ollama down")
+            return generate(hour)
+
+        engine.generate_next_segment = flaky
+        live = LiveBroadcast(engine, buffer_size=1, low_watermark=1, start_hour=8, retry_delay=0)
+        live.start()
+        segment = live.next_segment(timeout=5)
+        live.stop(save_checkpoint=False)
+
+        assert segment['sequence'] == 0
+        assert live.errors == 1
+
+    def test_next_segment_times_out(self):
+        live = LiveBroadcast(FakeEngine(delay=1.0), buffer_size=1, low_watermark=1, start_hour=8)
+        live.start()
+        assert live.next_segment(timeout=0.05) is None
+        live.stop(save_checkpoint=False)
+
+    def test_invalid_buffer_size(self):
+        with pytest.raises(ValueError):
+            LiveBroadcast(FakeEngine(), buffer_size=0)
+
+
+class TestLiveServer:
+    def test_http_endpoints(self):
+        live = LiveBroadcast(FakeEngine(), buffer_size=2, low_watermark=2, start_hour=8, retry_delay=0)
+        live.start()
+        server = start_server(live, port=0)
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            with urllib.request.urlopen(f"{base}/next?wait=5") as response:
+                segment = json.loads(response.read())
+            wait_until(lambda: len(live.buffered()) == 2)
+            with urllib.request.urlopen(f"{base}/buffer") as response:
+                buffered = json.loads(response.read())
+            with urllib.request.urlopen(f"{base}/status") as response:
+                status = json.loads(response.read())
+        finally:
+            server.shutdown()
+            live.stop(save_checkpoint=False)
+
+        assert segment['script'] == "Segment 1"
+        assert [entry['sequence'] for entry in buffered] == [1, 2]
+        assert 'script' not in buffered[0]
+        assert status['aired'] == 1
+        assert status['recently_aired'][0]['sequence'] == 0
+
+    def test_next_returns_204_when_empty(self):
+        live = LiveBroadcast(FakeEngine(), buffer_size=1, start_hour=8)
+        server = start_server(live, port=0)
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/next") as response:
+                assert response.status == 204
+        finally:
+            server.shutdown()
@@ -30,18 +30,18 @@ from tools.shared.logging_config import (
 class TestSetupLogger:
     """Tests for logger setup"""
     
-    def test_basic_logger_creation(self):
+    def test_basic_logger_creation(self, tmp_path):
         """Test creating a basic logger"""
-        logger = setup_logger("test_logger")
+        logger = setup_logger("test_logger", log_file=tmp_path / "test_logger.log")
         
         assert logger is not None
         assert logger.name == "test_logger"
         assert len(logger.handlers) > 0
     
-    def test_logger_with_custom_level(self):
+    def test_logger_with_custom_level(self, tmp_path):
         """Test logger with custom log level"""
         import logging
-        logger = setup_logger("debug_logger", level=logging.DEBUG)
+        logger = setup_logger("debug_logger", level=logging.DEBUG, log_file=tmp_path / "debug_logger.log")
         
         assert logger.level == logging.DEBUG
     
@@ -72,10 +72,10 @@ class TestSetupLogger:
                 assert "level" in data
                 assert "message" in data
     
-    def test_logger_singleton(self):
+    def test_logger_singleton(self, tmp_path):
         """Test that same logger name returns same instance"""
-        logger1 = setup_logger("singleton_test")
-        logger2 = setup_logger("singleton_test")
+        logger1 = setup_logger("singleton_test", log_file=tmp_path / "singleton_test.log")
+        logger2 = setup_logger("singleton_test", log_file=tmp_path / "singleton_test.log")
         
         assert logger1 is logger2
 
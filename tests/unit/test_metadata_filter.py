@@ -0,0 +1,145 @@
+"""
+Unit tests for the metadata filter algebra.
+
+Tests parsing, simplification, hashing, local matching and the
+DJKnowledgeProfile / RAGCache integration.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add tools/script-generator to path
+script_gen_path = Path(__file__).parent.parent.parent / "tools" / "script-generator"
+sys.path.insert(0, str(script_gen_path))
+
+from metadata_filter import (
+    And, Or, Eq, Ne, Lt, Lte, Gte, In, Nin,
+    parse_filter,
+    compile_filter
+)
+from dj_knowledge_profiles import JulieProfile, ConfidenceTier, query_with_confidence
+from rag_cache import RAGCache
+
+
+class TestParse:
+    """Test parsing ChromaDB where dicts"""
+
+    def test_roundtrip(self):
+        where = {"$and": [{"year_max": {"$lte": 2102}}, {"knowledge_tier": "common"}]}
+        node = parse_filter(where)
+
+        assert node == And(Lte("year_max", 2102), Eq("knowledge_tier", "common"))
+        assert parse_filter(node.to_where()) == node.simplify()
+
+    def test_multi_key_dict_is_implicit_and(self):
+        assert parse_filter({"a": 1, "b": {"$gte": 2}}) == And(Eq("a", 1), Gte("b", 2))
+
+    def test_unknown_operator_raises(self):
+        with pytest.raises(ValueError):
+            parse_filter({"year": {"$near": 5}})
+        with pytest.raises(ValueError):
+            parse_filter({"$not": [{"a": 1}]})
+
+
+class TestSimplify:
+    """Test normalisation and simplification"""
+
+    def test_flattens_and_keeps_tightest_bound(self):
+        node = And(Lte("year_max", 2287), And(Lte("year_max", 2102), Eq("tier", "common")))
+        assert node.simplify() == And(Eq("tier", "common"), Lte("year_max", 2102))
+
+    def test_strict_bound_wins_tie(self):
+        assert And(Lte("y", 5), Lt("y", 5)).simplify() == Lt("y", 5)
+
+    def test_in_and_eq_intersect(self):
+        node = And(In("tier", ["common", "regional"]), Eq("tier", "common"))
+        assert node.simplify() == Eq("tier", "common")
+
+    def test_or_of_eq_collapses_to_in(self):
+        node = Or(Eq("location", "A"), Eq("location", "B"), In("location", ["C"]))
+        assert node.simplify() == In("location", ["A", "B", "C"])
+
+    def test_contradictions_never_match(self):
+        assert And(Eq("a", 1), Eq("a", 2)).simplify().is_never
+        assert And(Gte("a", 5), Lt("a", 5)).simplify().is_never
+        assert And(In("a", [1, 2]), Nin("a", [1, 2])).simplify().is_never
+        with pytest.raises(ValueError):
+            And(Eq("a", 1), Eq("a", 2)).to_where()
+
+    def test_empty_and_is_no_filter(self):
+        assert compile_filter({}) is None
+        assert compile_filter(None) is None
+        assert And().to_where() is None
+
+
+class TestHashing:
+    """Test canonical hashing"""
+
+    def test_equivalent_filters_share_cache_key(self):
+        a = And(Eq("tier", "common"), Lte("year_max", 2102))
+        b = And(Lte("year_max", 2102), Lte("year_max", 2200), Eq("tier", "common"))
+
+        assert a.cache_key == b.cache_key
+        assert a.cache_key != And(Eq("tier", "common"), Lte("year_max", 2287)).cache_key
+
+    def test_nodes_are_hashable(self):
+        assert len({In("a", [2, 1]), In("a", [1, 2])}) == 1
+
+    def test_compile_filter_is_memoised(self):
+        where = {"$and": [{"a": 1}, {"b": {"$lte": 3}}]}
+        assert compile_filter(where) is compile_filter(dict(where))
+
+
+class TestMatches:
+    """Test local evaluation against chunk metadata"""
+
+    def test_matches_like_chroma(self):
+        node = And(Lte("year_max", 2102), Or(Eq("location", "Appalachia"), Eq("knowledge_tier", "common")))
+
+        assert node.matches({"year_max": 2100, "location": "Appalachia"})
+        assert not node.matches({"year_max": 2150, "location": "Appalachia"})
+        assert not node.matches({"location": "Appalachia"})
+
+    def test_negations_match_missing_fields(self):
+        assert Ne("a", 1).matches({})
+        assert Nin("a", [1]).matches({})
+        assert not Lte("a", 1).matches({"a": "text"})
+
+
+class TestProfileIntegration:
+    """Test compiled DJ profile filters"""
+
+    def test_compile_filter_cached_and_equivalent(self):
+        julie = JulieProfile()
+        compiled = julie.compile_filter("low", exclude_subjects=["water"])
+
+        assert julie.compile_filter("low", exclude_subjects=["water"]) is compiled
+        assert compiled == parse_filter(julie.get_enhanced_filter(
+            exclude_subjects=["water"], confidence_tier="low")).simplify()
+
+    def test_query_with_confidence_sends_compiled_where(self):
+        ingestor = Mock()
+        ingestor.query.return_value = {'documents': [[]], 'metadatas': [[]]}
+
+        query_with_confidence(ingestor, "Julie", "Vault 76", ConfidenceTier.MEDIUM)
+
+        where = ingestor.query.call_args.kwargs['where']
+        assert where == JulieProfile().compile_filter("medium").to_where()
+
+
+class TestRAGCacheIntegration:
+    """Test local post-filtering in RAGCache"""
+
+    def test_apply_dj_filters_uses_metadata_filter(self):
+        cache = RAGCache(Mock())
+        chunks = [
+            {'text': 'a', 'metadata': {'year_max': 2100, 'knowledge_tier': 'common'}},
+            {'text': 'b', 'metadata': {'year_max': 2100, 'knowledge_tier': 'classified'}},
+        ]
+        dj_context = {'year': 2102, 'metadata_filter': JulieProfile().compile_filter("medium")}
+
+        filtered = cache._apply_dj_filters(chunks, dj_context)
+
+        assert [c['text'] for c in filtered] == ['a']
@@ -0,0 +1,66 @@
+"""
+Unit tests for the model lifecycle manager.
+
+Tests swap tracking and explicit load/unload around model switches.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add tools/script-generator to path
+script_gen_path = Path(__file__).parent.parent.parent / "tools" / "script-generator"
+sys.path.insert(0, str(script_gen_path))
+
+from model_lifecycle import ModelLifecycleManager
+from tools.shared.mock_ollama_client import MockOllamaClient
+
+
+class TestModelLifecycleManager:
+    """Test activation and swap accounting"""
+
+    def test_first_load_is_not_a_swap(self):
+        client = MockOllamaClient()
+        lifecycle = ModelLifecycleManager(client)
+
+        assert lifecycle.activate("gen")
+        assert not lifecycle.activate("gen")
+
+        stats = lifecycle.get_statistics()
+        assert stats['loads'] == 1
+        assert stats['swaps'] == 0
+        assert stats['activations'] == {'gen': 2}
+        assert client.loaded_models == ["gen"]
+
+    def test_swap_unloads_previous_model(self):
+        client = MockOllamaClient()
+        lifecycle = ModelLifecycleManager(client, keep_alive="30m")
+
+        for model in ["gen", "val", "gen"]:
+            lifecycle.activate(model)
+
+        assert lifecycle.get_statistics()['swaps'] == 2
+        assert client.unloaded_models == ["gen", "val"]
+        assert client.loaded_models == ["gen", "val", "gen"]
+        assert lifecycle.current_model == "gen"
+
+    def test_keep_alive_and_missing_methods(self):
+        client = Mock(spec=['load_model'])
+        lifecycle = ModelLifecycleManager(client, keep_alive="30m")
+
+        lifecycle.activate("gen")
+        lifecycle.activate("val")
+        lifecycle.activate(None)
+
+        client.load_model.assert_called_with("val", keep_alive="30m")
+        assert lifecycle.get_statistics()['swaps'] == 1
+
+    def test_release(self):
+        client = MockOllamaClient()
+        lifecycle = ModelLifecycleManager(client)
+        lifecycle.activate("gen")
+
+        lifecycle.release()
+
+        assert lifecycle.current_model is None
+        assert client.was_model_unloaded("gen")
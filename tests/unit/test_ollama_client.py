@@ -10,7 +10,7 @@ Tests the OllamaClient wrapper including:
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 import requests
 from requests.exceptions import ConnectionError, Timeout, HTTPError
 
@@ -19,7 +19,18 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "tools" / "script-generator"))
 
-from ollama_client import OllamaClient
+import asyncio
+import builtins
+import httpx
+
+from ollama_client import (
+    OllamaClient,
+    AsyncOllamaClient,
+    BlockingOllamaClient,
+    as_sync_client,
+    as_async_client,
+    is_async_client
+)
 from tools.shared.mock_ollama_client import MockOllamaClient, MockOllamaScenarios
 
 
@@ -37,7 +48,7 @@ class TestOllamaClientMocked:
             "model": "test-model"
         }
         
-        with patch('requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             result = client.generate(
                 model="test-model",
                 prompt="Say hello"
@@ -76,7 +87,7 @@ class TestOllamaClientMocked:
                 raise Timeout("Request timeout")
             return mock_success
         
-        with patch('requests.post', side_effect=mock_post):
+        with patch('requests.Session.post', side_effect=mock_post):
             with patch('time.sleep'):  # Speed up test by mocking sleep
                 result = client.generate(
                     model="test-model",
@@ -91,7 +102,7 @@ class TestOllamaClientMocked:
         """Test behavior when max retries are exhausted"""
         client = OllamaClient()
         
-        with patch('requests.post', side_effect=Timeout("Persistent timeout")):
+        with patch('requests.Session.post', side_effect=Timeout("Persistent timeout")):
             with patch('time.sleep'):  # Speed up test
                 with pytest.raises(RuntimeError) as exc_info:
                     client.generate(
@@ -117,7 +128,7 @@ class TestOllamaClientMocked:
             call_count += 1
             return mock_response
         
-        with patch('requests.post', side_effect=mock_post):
+        with patch('requests.Session.post', side_effect=mock_post):
             with pytest.raises(RuntimeError) as exc_info:
                 client.generate(model="nonexistent-model", prompt="test")
         
@@ -132,7 +143,7 @@ class TestOllamaClientMocked:
         mock_response.status_code = 200
         mock_response.json.return_value = {"response": ""}  # Empty response
         
-        with patch('requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             with pytest.raises(RuntimeError) as exc_info:
                 client.generate(model="test-model", prompt="test")
         
@@ -146,7 +157,7 @@ class TestOllamaClientMocked:
         mock_response.status_code = 200
         mock_response.json.return_value = {"status": "success"}
         
-        with patch('requests.post', return_value=mock_response) as mock_post:
+        with patch('requests.Session.post', return_value=mock_response) as mock_post:
             result = client.unload_model("test-model")
         
         assert result is True
@@ -164,7 +175,7 @@ class TestOllamaClientMocked:
         mock_response = Mock()
         mock_response.status_code = 200
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             result = client.check_connection()
         
         assert result is True
@@ -177,7 +188,7 @@ class TestOllamaClientMocked:
         mock_response.status_code = 200
         mock_response.json.return_value = {"response": "OK"}
         
-        with patch('requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             result = client.check_connection(model="test-model")
         
         assert result is True
@@ -190,7 +201,7 @@ class TestOllamaClientMocked:
         mock_response.status_code = 200
         mock_response.json.return_value = {"response": "Custom response"}
         
-        with patch('requests.post', return_value=mock_response) as mock_post:
+        with patch('requests.Session.post', return_value=mock_response) as mock_post:
             result = client.generate(
                 model="test-model",
                 prompt="test",
@@ -390,5 +401,107 @@ class TestOllamaClientCompatibility:
         assert isinstance(result, str)
 
 
+class TestOllamaClientPooling:
+    """Tests for the pooled keep-alive session"""
+    
+    def test_session_is_reused(self):
+        """Test that all calls go through one pooled session"""
+        client = OllamaClient(pool_size=8)
+        
+        assert isinstance(client.session, requests.Session)
+        adapter = client.session.get_adapter("http://localhost:11434")
+        assert adapter._pool_maxsize == 8
+    
+    def test_shared_session(self):
+        """Test that clients can share a session"""
+        session = requests.Session()
+        client = OllamaClient(session=session)
+        assert client.session is session
+
+
+def make_async_client(handler):
+    """AsyncOllamaClient backed by an httpx mock transport"""
+    transport = httpx.MockTransport(handler)
+    return AsyncOllamaClient(client=httpx.AsyncClient(transport=transport))
+
+
+class TestAsyncOllamaClient:
+    """Tests for the httpx-based async client"""
+    
+    def test_successful_generation(self):
+        """Test async generation returns the response text"""
+        def handler(request):
+            assert request.url.path == "/api/generate"
+            return httpx.Response(200, json={"response": " Hello async "})
+        
+        client = make_async_client(handler)
+        assert asyncio.run(client.generate("test-model", "hi")) == "Hello async"
+    
+    def test_timeout_with_retry(self):
+        """Test timeouts retry with backoff like the sync client"""
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ReadTimeout("slow", request=request)
+            return httpx.Response(200, json={"response": "ok"})
+        
+        client = make_async_client(handler)
+        with patch('asyncio.sleep', new=AsyncMock()):
+            assert asyncio.run(client.generate("test-model", "hi", max_retries=3)) == "ok"
+        assert len(calls) == 2
+    
+    def test_http_error_no_retry(self):
+        """Test HTTP errors raise RuntimeError without retry"""
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(404, text="Model not found")
+        
+        client = make_async_client(handler)
+        with pytest.raises(RuntimeError, match="HTTP error"):
+            asyncio.run(client.generate("missing", "hi"))
+        assert len(calls) == 1
+    
+    def test_connection_error(self):
+        """Test connection failures raise ConnectionError"""
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+        
+        client = make_async_client(handler)
+        # builtins.ConnectionError (the module imports requests' ConnectionError)
+        with pytest.raises(builtins.ConnectionError, match="Cannot connect to Ollama"):
+            asyncio.run(client.generate("test-model", "hi"))
+
+
+class TestClientAdapters:
+    """Tests for sync/async client adapters"""
+    
+    def test_sync_client_passes_through(self):
+        """Test blocking clients are used as-is"""
+        client = MockOllamaClient()
+        assert as_sync_client(client) is client
+        assert as_sync_client(None) is None
+        assert not is_async_client(client)
+    
+    def test_async_client_wrapped_for_sync_callers(self):
+        """Test an async client can serve blocking components"""
+        client = make_async_client(lambda request: httpx.Response(200, json={"response": "wrapped"}))
+        blocking = as_sync_client(client)
+        
+        assert isinstance(blocking, BlockingOllamaClient)
+        assert blocking.generate("test-model", "hi") == "wrapped"
+        blocking.close()
+    
+    def test_sync_client_wrapped_for_async_callers(self):
+        """Test a blocking client can serve async components"""
+        wrapped = as_async_client(MockOllamaClient(default_response="threaded", simulate_delay=0))
+        
+        assert is_async_client(wrapped)
+        assert asyncio.run(wrapped.generate("test-model", "anything")) == "threaded"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
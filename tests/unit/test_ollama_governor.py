@@ -0,0 +1,233 @@
+"""
+Unit tests for ollama_governor.py
+
+Tests adaptive timeouts, the shared retry budget, the circuit breaker and
+their use in OllamaClient and ScriptGenerator (against the latency simulator).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add tools/script-generator to path
+script_gen_path = Path(__file__).parent.parent.parent / "tools" / "script-generator"
+sys.path.insert(0, str(script_gen_path))
+
+from ollama_governor import (
+    LatencyTracker, RetryBudget, CircuitBreaker, OllamaGovernor, CircuitOpenError,
+    get_governor, prompt_bucket
+)
+from ollama_simulator import OllamaSimulator, SimulatedSession, LatencyProfile
+from ollama_client import OllamaClient
+from generator import ScriptGenerator
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def governed_client(governor, **simulator_kwargs):
+    simulator = OllamaSimulator(time_scale=0, **simulator_kwargs)
+    return OllamaClient(base_url="http://sim", session=SimulatedSession(simulator), governor=governor)
+
+
+class TestLatencyTracker:
+    """Test percentile-based timeouts"""
+
+    def test_default_until_enough_samples(self):
+        tracker = LatencyTracker(min_samples=3)
+        tracker.record("m", 100, 5.0)
+
+        assert tracker.timeout_for("m", 100, 60) == 60
+
+    def test_num_predict_is_part_of_key(self):
+        tracker = LatencyTracker(min_samples=1, min_timeout=1.0)
+        tracker.record("m", 100, 2.0, num_predict=100)
+
+        assert tracker.timeout_for("m", 100, 60) == 60
+        assert tracker.timeout_for("m", 100, 60, num_predict=100) == 4.0
+        assert tracker.timeout_for("m", 100, 60, num_predict=800) == 60
+        assert 'm|<1000|n100' in tracker.get_statistics()
+
+    def test_timeout_from_percentile(self):
+        tracker = LatencyTracker(min_samples=3, headroom=2.0, min_timeout=1.0)
+        for seconds in [4.0, 5.0, 6.0, 8.0]:
+            tracker.record("m", 100, seconds)
+
+        assert tracker.timeout_for("m", 100, 60) == 16.0
+        # Capped by the caller, separate buckets per model and prompt size
+        assert tracker.timeout_for("m", 100, 10) == 10
+        assert tracker.timeout_for("m", 50000, 60) == 60
+        assert tracker.timeout_for("other", 100, 60) == 60
+        assert prompt_bucket(100) != prompt_bucket(50000)
+
+
+class TestRetryBudget:
+    """Test the token bucket"""
+
+    def test_spend_and_refill(self):
+        budget = RetryBudget(ratio=0.5, reserve=1.0)
+
+        assert budget.try_spend()
+        assert not budget.try_spend()
+        budget.record_request()
+        budget.record_request()
+        assert budget.try_spend()
+        assert budget.denied == 1
+
+
+class TestCircuitBreaker:
+    """Test breaker state transitions"""
+
+    def test_opens_and_probes(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock)
+
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow_request()
+
+        clock.now = 31
+        assert breaker.allow_request()       # Probe
+        assert not breaker.allow_request()   # Only one probe at a time
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_failed_probe_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 11
+
+        assert breaker.allow_request()
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        assert breaker.trips == 2
+
+    def test_released_probe_lets_next_probe_through(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 11
+
+        probe = breaker.admit()
+        assert probe
+        breaker.release_probe(0)             # Non-probe attempts release nothing
+        assert not breaker.allow_request()
+        breaker.release_probe(probe)         # Probe cancelled without a result
+        assert breaker.allow_request()
+
+    def test_stale_probe_times_out(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 11
+
+        first = breaker.admit()
+        assert breaker.retry_in() == 10
+        clock.now = 21
+        second = breaker.admit()
+
+        assert second and second != first
+        breaker.release_probe(first)         # Late release of the stale probe
+        assert not breaker.allow_request()
+
+
+class TestClientIntegration:
+    """Test OllamaClient with a governor"""
+
+    def test_records_latency(self):
+        governor = OllamaGovernor()
+        client = governed_client(governor)
+
+        client.generate("m", "hello")        # Loads the model: not sampled
+        client.generate("m", "hello")
+
+        stats = governor.get_statistics()
+        assert stats['requests'] == 2
+        assert stats['latency']['m|<1000']['samples'] == 1
+
+    def test_timeout_retries_with_full_timeout(self):
+        governor = OllamaGovernor(circuit_breaker=CircuitBreaker(failure_threshold=1),
+                                  latency_tracker=LatencyTracker(min_samples=1, min_timeout=1.0))
+        governor.latency_tracker.record("m", 5, 2.0)
+        # Adaptive 4s times out (model load + decode); the retry gets the full 60s
+        profile = LatencyProfile(decode_tokens_per_second=5)
+        client = governed_client(governor, profile=profile, response_tokens=50)
+
+        assert client.generate("m", "hello", max_retries=2, timeout=60)
+        assert governor.circuit_breaker.state == "closed"
+
+    def test_adaptive_timeout_is_sent(self):
+        governor = OllamaGovernor(latency_tracker=LatencyTracker(min_samples=1, min_timeout=1.0))
+        governor.latency_tracker.record("m", 5, 2.0)
+        # Needs ~4s simulated: times out at the adaptive 4s*... p95=2s * 2 = 4s
+        profile = LatencyProfile(decode_tokens_per_second=5)
+        client = governed_client(governor, profile=profile, response_tokens=50)
+
+        with pytest.raises(RuntimeError, match="after 1 attempts"):
+            client.generate("m", "hello", max_retries=1, timeout=60)
+
+    def test_breaker_fails_fast(self):
+        governor = OllamaGovernor(circuit_breaker=CircuitBreaker(failure_threshold=2))
+        client = governed_client(governor, failure_rate=1.0)
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                client.generate("m", "hello", max_retries=1)
+
+        with pytest.raises(CircuitOpenError):
+            client.generate("m", "hello")
+        assert governor.get_statistics()['rejected'] == 1
+
+    def test_interrupted_probe_is_released(self):
+        clock = FakeClock()
+        governor = OllamaGovernor(circuit_breaker=CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock))
+        client = governed_client(governor)
+        governor.record_failure()
+        clock.now = 11
+
+        def interrupted(*args, **kwargs):
+            raise KeyboardInterrupt
+
+        client.session.post = interrupted
+        with pytest.raises(KeyboardInterrupt):
+            client.generate("m", "hello")
+
+        assert governor.circuit_breaker.state == "half_open"
+        assert governor.circuit_breaker.allow_request()
+
+    def test_budget_stops_client_retries(self):
+        governor = OllamaGovernor(retry_budget=RetryBudget(ratio=0, reserve=0))
+        client = governed_client(governor, timeout_rate=1.0)
+
+        with pytest.raises(RuntimeError, match="after 1 attempts"):
+            client.generate("m", "hello", max_retries=3, timeout=5)
+        assert governor.get_statistics()['retries_denied'] == 1
+
+
+class TestGeneratorBudget:
+    """Test that generate_script retries draw on the shared budget"""
+
+    def test_may_retry_uses_budget(self):
+        generator = ScriptGenerator.__new__(ScriptGenerator)
+        generator.ollama = governed_client(OllamaGovernor(retry_budget=RetryBudget(ratio=0, reserve=1)))
+
+        assert get_governor(generator.ollama) is generator.ollama.governor
+        assert generator._may_retry(0, 5)
+        assert not generator._may_retry(1, 5)
+        assert not generator._may_retry(5, 5)
+
+    def test_without_governor(self):
+        generator = ScriptGenerator.__new__(ScriptGenerator)
+        generator.ollama = object()
+
+        assert generator._may_retry(0, 5)
@@ -0,0 +1,135 @@
+"""
+Unit tests for ollama_simulator.py
+
+Tests the latency model, slots, model swaps, failure/timeout injection and
+both the in-process and HTTP front ends.
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add tools/script-generator to path
+script_gen_path = Path(__file__).parent.parent.parent / "tools" / "script-generator"
+sys.path.insert(0, str(script_gen_path))
+
+from ollama_simulator import OllamaSimulator, LatencyProfile, simulated_client, start_server
+from ollama_client import OllamaClient, response_timings
+
+
+class TestLatencyModel:
+    """Test simulated timings"""
+
+    def test_timings_follow_profile(self):
+        profile = LatencyProfile(prefill_tokens_per_second=100, decode_tokens_per_second=10,
+                                 load_seconds=2.0)
+        sim = OllamaSimulator(profile=profile, response_tokens=20, time_scale=0, prefix_cache=False)
+        client = simulated_client(sim)
+
+        result = client.chat([{"role": "user", "content": "x" * 400}], model="m")
+        timings = response_timings(result)
+
+        assert timings['load_ms'] == pytest.approx(2000)
+        assert timings['prompt_eval_ms'] == pytest.approx(1000)
+        assert timings['eval_ms'] == pytest.approx(result['eval_count'] * 100)
+
+    def test_num_predict_caps_output(self):
+        sim = OllamaSimulator(response_tokens=200, time_scale=0)
+
+        short = simulated_client(sim).generate("m", "p", options={"num_predict": 10})
+
+        assert len(short) < 80
+
+    def test_shared_prefix_is_not_reevaluated(self):
+        sim = OllamaSimulator(time_scale=0)
+        client = simulated_client(sim)
+        prefix = "SYSTEM PERSONA " * 50
+
+        client.generate("m", prefix + "weather")
+        client.generate("m", prefix + "news")
+
+        assert sim.get_statistics()['cached_prefix_tokens'] > 150
+
+    def test_json_format_returns_json(self):
+        client = simulated_client(OllamaSimulator(time_scale=0))
+
+        text = client.generate("m", "validate", format="json")
+
+        assert text.startswith("{") and '"is_valid"' in text
+
+
+class TestScheduling:
+    """Test slots and model swaps"""
+
+    def test_slots_limit_concurrency(self):
+        sim = OllamaSimulator(slots=2, response_tokens=20, time_scale=0.001)
+        client = simulated_client(sim)
+
+        threads = [threading.Thread(target=client.generate, args=("m", f"p{i}")) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = sim.get_statistics()
+        assert stats['completed'] == 6
+        assert stats['max_active'] == 2
+        assert stats['queue_wait'] > 0
+
+    def test_model_swap_penalty(self):
+        sim = OllamaSimulator(time_scale=0)
+        client = simulated_client(sim)
+
+        client.generate("a", "p")
+        client.generate("a", "p")
+        client.generate("b", "p")
+        client.unload_model("b")
+
+        stats = sim.get_statistics()
+        assert stats['swaps'] == 1
+        assert stats['swap_time'] > 0
+        assert stats['loaded_model'] is None
+
+
+class TestInjection:
+    """Test failure and timeout injection"""
+
+    def test_failure_is_http_500(self):
+        client = simulated_client(OllamaSimulator(failure_rate=1.0, time_scale=0))
+
+        with pytest.raises(RuntimeError, match="500"):
+            client.generate("m", "p", max_retries=1)
+
+    def test_injected_timeout(self):
+        sim = OllamaSimulator(timeout_rate=1.0, time_scale=0)
+
+        with pytest.raises(RuntimeError, match="failed after 1 attempts"):
+            simulated_client(sim).generate("m", "p", max_retries=1, timeout=5)
+        assert sim.get_statistics()['timeouts'] == 1
+
+    def test_slow_request_exceeds_client_timeout(self):
+        profile = LatencyProfile(decode_tokens_per_second=1)
+        sim = OllamaSimulator(profile=profile, response_tokens=100, time_scale=0)
+
+        with pytest.raises(RuntimeError):
+            simulated_client(sim).generate("m", "p", max_retries=1, timeout=10)
+
+
+class TestHTTPServer:
+    """Test the /api/generate HTTP stand-in"""
+
+    def test_generate_chat_and_stream(self):
+        sim = OllamaSimulator(response_tokens=20, time_scale=0)
+        server = start_server(sim, port=0)
+        try:
+            client = OllamaClient(base_url=f"http://127.0.0.1:{server.server_address[1]}")
+
+            assert client.check_connection()
+            assert client.generate("m", "hello")
+            assert client.chat([{"role": "user", "content": "hi"}], model="m")['message']['content']
+            assert client.generate_streaming("m", "hello")
+            assert sim.get_statistics()['completed'] == 3
+        finally:
+            server.shutdown()
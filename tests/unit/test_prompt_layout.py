@@ -0,0 +1,155 @@
+"""
+Unit tests for the prefix-stable prompt layout.
+
+Tests the persona system message, template ordering, OllamaClient.chat()
+and the prefix benchmark.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from jinja2 import Environment, FileSystemLoader
+
+# Add tools/script-generator to path
+script_gen_path = Path(__file__).parent.parent.parent / "tools" / "script-generator"
+sys.path.insert(0, str(script_gen_path))
+
+from prompt_layout import PromptLayout, build_persona_prompt
+from personality_loader import load_personality
+from ollama_client import OllamaClient
+from generator import ScriptGenerator
+from benchmark_prompt_prefix import run_benchmark
+
+
+PERSONALITY = {
+    'name': 'Julie',
+    'system_prompt': 'You are a hopeful young DJ.',
+    'tone': 'friendly',
+    'do': ['Be warm'],
+    'dont': ['Be cruel'],
+    'catchphrases': ['Welcome home, Appalachia!'],
+    'examples': []
+}
+
+
+def render(template_name, persona_in_system, **variables):
+    env = Environment(loader=FileSystemLoader(str(script_gen_path / "templates")),
+                      trim_blocks=True, lstrip_blocks=True)
+    return env.get_template(template_name).render(
+        personality=PERSONALITY, persona_in_system=persona_in_system,
+        catchphrase={'should_use': False}, voice_elements={}, lore_context="LORE", **variables
+    )
+
+
+class TestPersonaPrompt:
+    """Test the static system message"""
+
+    def test_contains_static_card_fields(self):
+        system = build_persona_prompt(PERSONALITY)
+
+        assert system.startswith("You are Julie, a radio DJ.")
+        for text in ['hopeful young DJ', 'friendly', 'Be warm', 'Be cruel', 'Welcome home']:
+            assert text in system
+
+    def test_station_from_card(self):
+        system = build_persona_prompt(dict(PERSONALITY, radio_station='Appalachia Radio'))
+        assert system.startswith("You are Julie, the DJ for Appalachia Radio.")
+
+        new_vegas = build_persona_prompt(load_personality("Mr. New Vegas (2281, Mojave)"))
+        assert "the DJ for Radio New Vegas." in new_vegas
+        assert "Appalachia" not in new_vegas.splitlines()[0]
+
+    def test_layout_messages(self):
+        layout = PromptLayout(system="S", user="U")
+
+        assert layout.to_messages() == [{"role": "system", "content": "S"},
+                                        {"role": "user", "content": "U"}]
+        assert layout.flatten() == "S\n\nU"
+
+
+class TestTemplateOrder:
+    """Test canonical section order in the segment templates"""
+
+    def test_persona_skipped_in_chat_mode(self):
+        for name in ['news', 'weather', 'time', 'music_intro', 'gossip', 'emergency_weather']:
+            inline = render(f"{name}.jinja2", False, session_context="CONTINUITY")
+            chat = render(f"{name}.jinja2", True, session_context="CONTINUITY")
+
+            assert "You are Julie" in inline, name
+            assert "You are Julie" not in chat, name
+            # Session context comes before all dynamic content
+            assert chat.strip().startswith("BROADCAST CONTINUITY:"), name
+
+
+class TestChatClient:
+    """Test OllamaClient.chat()"""
+
+    @patch('requests.Session.post')
+    def test_chat_payload(self, mock_post):
+        response = Mock()
+        response.raise_for_status.return_value = None
+        response.json.return_value = {'message': {'role': 'assistant', 'content': 'Hi'}}
+        mock_post.return_value = response
+        client = OllamaClient()
+
+        result = client.chat(messages=[{"role": "user", "content": "x"}], model="m",
+                             temperature=0.5, max_tokens=10, options={"top_p": 0.9},
+                             keep_alive="30m")
+
+        assert result['message']['content'] == 'Hi'
+        assert mock_post.call_args.args[0].endswith("/api/chat")
+        payload = mock_post.call_args.kwargs['json']
+        assert payload['keep_alive'] == "30m"
+        assert payload['options'] == {"temperature": 0.5, "num_predict": 10, "top_p": 0.9}
+
+
+class TestGeneratorChat:
+    """Test ScriptGenerator._generate_text() with a system message"""
+
+    def _generator(self, client):
+        generator = ScriptGenerator.__new__(ScriptGenerator)
+        generator.ollama = client
+        generator.keep_alive = "30m"
+        return generator
+
+    def test_uses_chat_with_stable_system_message(self):
+        client = Mock()
+        client.chat.return_value = {'message': {'content': 'Script'}}
+
+        text = self._generator(client)._generate_text("m", "USER", {}, system="PERSONA")
+
+        assert text == 'Script'
+        messages = client.chat.call_args.kwargs['messages']
+        assert messages[0] == {"role": "system", "content": "PERSONA"}
+        assert client.chat.call_args.kwargs['keep_alive'] == "30m"
+
+    def test_flattens_for_clients_without_chat(self):
+        client = Mock(spec=['generate'])
+        client.generate.return_value = "Script"
+
+        self._generator(client)._generate_text("m", "USER", {}, system="PERSONA")
+
+        assert client.generate.call_args.kwargs['prompt'] == "PERSONA\n\nUSER"
+
+
+class TestBenchmark:
+    """Test the prefix benchmark"""
+
+    def test_prefix_stable_shares_longer_prefix(self):
+        results = run_benchmark(None, PERSONALITY, hours=4)
+
+        legacy = results['layouts']['legacy']['avg_shared_chars']
+        stable = results['layouts']['prefix_stable']['avg_shared_chars']
+        assert stable > legacy
+
+    def test_ttft_reduction_from_server_timings(self):
+        def chat_fn(messages):
+            # Cached prefix: only the user message is evaluated
+            evaluated = messages[-1]['content'] if messages[0]['role'] == 'system' else messages[0]['content']
+            return {'message': {'content': 'ok'}, 'prompt_eval_count': len(evaluated),
+                    'prompt_eval_duration': len(evaluated) * 1_000_000}
+
+        results = run_benchmark(chat_fn, PERSONALITY, hours=2)
+
+        assert results['ttft_reduction_pct'] > 0
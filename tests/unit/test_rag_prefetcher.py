@@ -0,0 +1,166 @@
+"""
+Unit tests for RAGPrefetcher and RAGCache.prefetch.
+
+Tests predictive cache warming for upcoming broadcast hours.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+# Add tools/script-generator to path
+script_gen_path = Path(__file__).parent.parent.parent / "tools" / "script-generator"
+sys.path.insert(0, str(script_gen_path))
+
+from rag_cache import RAGCache
+from rag_prefetcher import RAGPrefetcher, PrefetchTarget
+from broadcast_scheduler import BroadcastScheduler
+from broadcast_scheduler_v2 import BroadcastSchedulerV2
+
+
+DJ_CONTEXT = {'name': 'Julie (2102, Appalachia)', 'year': 2102, 'region': 'Appalachia'}
+
+
+def build_query(segment_type, template_vars):
+    """Simple stand-in for BroadcastEngine._build_context_query."""
+    if segment_type == 'weather':
+        return f"weather {template_vars['weather_type']}"
+    if segment_type == 'news':
+        return f"news {template_vars['news_category']}"
+    if segment_type == 'gossip':
+        return f"gossip {template_vars['rumor_type']}"
+    return "time daily life"
+
+
+@pytest.fixture
+def mock_chromadb():
+    """Mock ChromaDB ingestor returning a single chunk"""
+    mock = Mock()
+    mock.query.return_value = {
+        'ids': [['chunk1']],
+        'documents': [['Test document']],
+        'metadatas': [[{'year': 2102}]],
+        'distances': [[0.1]]
+    }
+    return mock
+
+
+@pytest.fixture
+def rag_cache(mock_chromadb):
+    return RAGCache(chromadb_ingestor=mock_chromadb, max_cache_size=50, default_ttl=60,
+                    enable_semantic_matching=False)
+
+
+class TestRAGCachePrefetch:
+    """Test RAGCache.prefetch"""
+
+    def test_prefetch_stores_without_touching_hit_stats(self, rag_cache):
+        assert rag_cache.prefetch("test query", DJ_CONTEXT, num_chunks=5) is True
+
+        assert len(rag_cache.cache) == 1
+        assert rag_cache.stats.total_queries == 0
+        assert rag_cache.stats.cache_misses == 0
+        assert rag_cache.stats.prefetched_entries == 1
+
+    def test_prefetch_skips_cached_query(self, rag_cache):
+        rag_cache.query_with_cache("test query", DJ_CONTEXT, num_chunks=5)
+
+        assert rag_cache.prefetch("test query", DJ_CONTEXT, num_chunks=5) is False
+        assert rag_cache.chromadb.query.call_count == 1
+
+    def test_foreground_query_hits_prefetched_entry(self, rag_cache):
+        rag_cache.prefetch("test query", DJ_CONTEXT, num_chunks=5, topic='regional_climate')
+
+        results = rag_cache.query_with_cache("test query", DJ_CONTEXT, num_chunks=5)
+
+        assert results['documents'][0] == ['Test document']
+        assert rag_cache.stats.cache_hits == 1
+        assert rag_cache.stats.cache_misses == 0
+        assert rag_cache.stats.prefetch_hits == 1
+        assert rag_cache.chromadb.query.call_count == 1
+        assert 'regional_climate' in rag_cache.topic_index
+
+
+class TestRAGPrefetcher:
+    """Test RAGPrefetcher planning and warming"""
+
+    def make_prefetcher(self, rag_cache, scheduler=None, weather_lookup=None, **kwargs):
+        return RAGPrefetcher(
+            rag_cache=rag_cache,
+            dj_context=DJ_CONTEXT,
+            scheduler=scheduler or BroadcastScheduler(),
+            query_builder=build_query,
+            topic_resolver=lambda t: None if t == 'time' else f"topic_{t}",
+            weather_lookup=weather_lookup,
+            **kwargs
+        )
+
+    def test_predict_segment_types_v1(self, rag_cache):
+        prefetcher = self.make_prefetcher(rag_cache)
+
+        assert prefetcher.predict_segment_types(6) == ['time', 'weather', 'gossip']
+        assert prefetcher.predict_segment_types(8) == ['time', 'gossip']
+
+    def test_predict_segment_types_v2_includes_news(self, rag_cache):
+        prefetcher = self.make_prefetcher(rag_cache, scheduler=BroadcastSchedulerV2())
+
+        assert prefetcher.predict_segment_types(12) == ['time', 'weather', 'news', 'gossip']
+
+    def test_plan_uses_weather_calendar_and_dedupes(self, rag_cache):
+        lookup = Mock(return_value=SimpleNamespace(weather_type='rad_storm'))
+        prefetcher = self.make_prefetcher(rag_cache, weather_lookup=lookup)
+
+        targets = prefetcher.plan(start_hour=5, hours_ahead=3)
+        queries = [t.query for t in targets]
+
+        assert queries == ["time daily life", "gossip wasteland rumors", "weather rad_storm"]
+        assert all(isinstance(t, PrefetchTarget) for t in targets)
+        assert targets[2].hour == 6
+        assert targets[2].topic == 'topic_weather'
+        lookup.assert_called_once_with(6)
+
+    def test_plan_skips_unpredictable_weather(self, rag_cache):
+        prefetcher = self.make_prefetcher(rag_cache, weather_lookup=Mock(return_value=None))
+
+        targets = prefetcher.plan(start_hour=6, hours_ahead=1)
+
+        assert 'weather' not in [t.segment_type for t in targets]
+
+    def test_plan_wraps_midnight_and_respects_max_queries(self, rag_cache):
+        prefetcher = self.make_prefetcher(
+            rag_cache, scheduler=BroadcastSchedulerV2(), max_queries=4
+        )
+
+        targets = prefetcher.plan(start_hour=23, hours_ahead=8)
+
+        assert len(targets) == 4
+        assert targets[0].hour == 23
+
+    def test_prefetch_warms_cache(self, rag_cache):
+        prefetcher = self.make_prefetcher(rag_cache)
+
+        summary = prefetcher.prefetch(start_hour=8, hours_ahead=2)
+        second = prefetcher.prefetch(start_hour=8, hours_ahead=2)
+
+        assert summary['warmed'] == 2
+        assert second['skipped'] == 2
+        assert prefetcher.get_statistics()['queries_warmed'] == 2
+
+    def test_prefetch_errors_are_counted_not_raised(self, rag_cache):
+        rag_cache.chromadb.query.side_effect = RuntimeError("db down")
+        prefetcher = self.make_prefetcher(rag_cache)
+
+        summary = prefetcher.prefetch(start_hour=8, hours_ahead=1)
+
+        assert summary['errors'] == 2
+        assert prefetcher.errors == 2
+
+    def test_background_start_and_wait(self, rag_cache):
+        prefetcher = self.make_prefetcher(rag_cache)
+
+        assert prefetcher.start(start_hour=8, hours_ahead=2) is True
+        assert prefetcher.wait(timeout=5.0) is True
+        assert prefetcher.runs == 1
+        assert len(rag_cache.cache) == 2
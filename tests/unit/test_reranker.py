@@ -0,0 +1,119 @@
+"""
+Unit tests for the RAG reranker stage.
+
+Tests feature scoring, rerank ordering/top-k and the benchmark harness.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add tools/script-generator to path
+script_gen_path = Path(__file__).parent.parent.parent / "tools" / "script-generator"
+sys.path.insert(0, str(script_gen_path))
+
+from reranker import (
+    FeatureReranker,
+    RerankWeights,
+    create_reranker,
+    parse_dj_location,
+    UNKNOWN_FEATURE_SCORE
+)
+from benchmark_reranker import run_benchmark, relevance_proxies
+
+
+def make_chunk(chunk_id, distance, **metadata):
+    return {'id': chunk_id, 'text': f"text about {chunk_id}", 'metadata': metadata, 'distance': distance}
+
+
+# Retrieval order: the stub is nearest, the rich Appalachia chunk is slightly further
+CHUNKS = [
+    make_chunk('stub', 0.30, chunk_quality='stub', freshness_score=0.2, location='Mojave'),
+    make_chunk('rich', 0.35, chunk_quality='rich', freshness_score=1.0,
+               knowledge_tier='common', location='Appalachia'),
+    make_chunk('plain', 0.50),
+]
+
+
+class TestFeatureScores:
+    """Test individual reranker signals"""
+
+    def test_parse_dj_location(self):
+        assert parse_dj_location("Julie (2102, Appalachia)") == "Appalachia"
+        assert parse_dj_location("Julie") is None
+
+    def test_similarity_from_distance(self):
+        assert FeatureReranker.similarity({'distance': 0.25}) == 0.75
+        assert FeatureReranker.similarity({'distance': None}) == UNKNOWN_FEATURE_SCORE
+
+    def test_missing_metadata_is_neutral(self):
+        scores = FeatureReranker().feature_scores(make_chunk('x', 0.0))
+        assert scores['freshness'] == UNKNOWN_FEATURE_SCORE
+        assert scores['chunk_quality'] == UNKNOWN_FEATURE_SCORE
+        assert scores['region'] == UNKNOWN_FEATURE_SCORE
+
+    def test_region_match(self):
+        reranker = FeatureReranker(dj_region="Appalachia")
+        assert reranker.region_match({'location': 'Appalachia'}) == 1.0
+        assert reranker.region_match({'location': 'Mojave'}) == 0.0
+        assert reranker.region_match({'location': 'general'}) == UNKNOWN_FEATURE_SCORE
+
+
+class TestRerank:
+    """Test rerank ordering"""
+
+    def test_metadata_promotes_better_chunk(self):
+        reranked = FeatureReranker(dj_region="Appalachia").rerank("Flatwoods", CHUNKS, top_k=2)
+
+        assert [c['id'] for c in reranked] == ['rich', 'plain']
+        assert all('rerank_score' in c for c in reranked)
+        assert 'rerank_score' not in CHUNKS[0]
+
+    def test_dj_region_override(self):
+        reranker = FeatureReranker(dj_region="Appalachia")
+        rich = CHUNKS[1]
+
+        assert reranker.score("q", rich) > reranker.score("q", rich, dj_region="Mojave")
+
+    def test_similarity_only_keeps_retrieval_order(self):
+        weights = RerankWeights(similarity=1.0, freshness=0.0, knowledge_tier=0.0,
+                                chunk_quality=0.0, region=0.0)
+        reranked = FeatureReranker(weights=weights).rerank("q", CHUNKS)
+        assert [c['id'] for c in reranked] == ['stub', 'rich', 'plain']
+
+    def test_create_reranker(self):
+        assert create_reranker(None) is None
+        assert create_reranker('none') is None
+        assert create_reranker('features', dj_name="Julie (2102, Appalachia)").dj_region == "Appalachia"
+        with pytest.raises(ValueError):
+            create_reranker('bogus')
+
+
+class TestBenchmark:
+    """Test the rerank benchmark harness with a fake retriever"""
+
+    def query_fn(self, dj_name, query, n_results):
+        chunks = CHUNKS[:n_results]
+        return {
+            'ids': [[c['id'] for c in chunks]],
+            'documents': [[c['text'] for c in chunks]],
+            'metadatas': [[c['metadata'] for c in chunks]],
+            'distances': [[c['distance'] for c in chunks]],
+        }
+
+    def test_relevance_proxies(self):
+        proxies = relevance_proxies(CHUNKS[:2], ['rich'], "Appalachia")
+        assert proxies['entity_hit_rate'] == 0.5
+        assert proxies['region_match_rate'] == 0.5
+        assert proxies['quality_rate'] == 0.5
+
+    def test_run_benchmark(self):
+        cases = [{'dj_name': "Julie (2102, Appalachia)", 'query': "Flatwoods", 'entities': ['rich']}]
+        results = run_benchmark(self.query_fn, FeatureReranker(), cases=cases,
+                                candidates=3, top_k=1, repeats=2)
+        summary = results['summary']
+
+        assert summary['cases'] == 1
+        assert summary['cases_changed'] == 1
+        assert summary['rerank_p95_ms'] >= 0.0
+        assert summary['reranked']['entity_hit_rate'] > summary['baseline']['entity_hit_rate']
@@ -0,0 +1,124 @@
+"""Tests for per-stage latency spans (stage_timer)"""
+
+import json
+import sys
+import threading
+from contextvars import copy_context
+from pathlib import Path
+
+script_gen_path = Path(__file__).parent.parent.parent / "tools" / "script-generator"
+sys.path.insert(0, str(script_gen_path))
+
+from stage_timer import (
+    SegmentTrace, LatencyRecorder, current_trace, use_trace, span, record, percentile
+)
+
+
+class TestSegmentTrace:
+    def test_spans_record_into_active_trace(self):
+        trace = SegmentTrace(label="08:00 news")
+        with use_trace(trace):
+            assert current_trace() is trace
+            with span('rag', topic='news') as attrs:
+                attrs['cache'] = 'hit'
+            with span('llm'):
+                pass
+            with span('llm'):
+                pass
+        trace.finish()
+
+        result = trace.to_dict()
+        assert current_trace() is None
+        assert [s['stage'] for s in result['spans']] == ['rag', 'llm', 'llm']
+        assert result['spans'][0]['attrs'] == {'topic': 'news', 'cache': 'hit'}
+        assert set(result['stages']) == {'rag', 'llm'}
+        assert result['total_seconds'] >= result['stages']['llm']
+
+    def test_no_active_trace_is_a_no_op(self):
+        with span('rag') as attrs:
+            attrs['cache'] = 'miss'
+        record('llm.decode', 1.0)
+        assert current_trace() is None
+
+    def test_record_measured_duration(self):
+        trace = SegmentTrace()
+        with use_trace(trace):
+            record('llm.prefill', 0.25, tokens=120)
+        assert trace.stage_seconds() == {'llm.prefill': 0.25}
+        assert trace.spans[0]['attrs'] == {'tokens': 120}
+
+    def test_copied_context_records_from_worker_threads(self):
+        trace = SegmentTrace()
+
+        def work():
+            with span('generate'):
+                pass
+
+        with use_trace(trace):
+            threads = [threading.Thread(target=copy_context().run, args=(work,)) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(trace.spans) == 3
+        assert threading.get_ident() not in {s['thread'] for s in trace.spans}
+
+
+class TestLatencyRecorder:
+    def test_percentiles_per_stage(self):
+        recorder = LatencyRecorder()
+        for seconds in range(1, 101):
+            trace = SegmentTrace()
+            trace.add('llm', trace.start, seconds / 100)
+            recorder.add_trace(trace)
+
+        stats = recorder.get_statistics()
+
+        assert stats['segments'] == 100
+        llm = stats['stages']['llm']
+        assert llm['count'] == 100
+        assert llm['p50'] == 0.51
+        assert llm['p95'] == 0.95
+        assert llm['max'] == 1.0
+        assert llm['total_seconds'] == 50.5
+
+    def test_engine_level_spans(self):
+        recorder = LatencyRecorder()
+        with recorder.span('checkpoint.write', hour=3):
+            pass
+        recorder.add('state.save', 0.5)
+
+        stats = recorder.get_statistics()['stages']
+        assert stats['checkpoint.write']['count'] == 1
+        assert stats['state.save']['p95'] == 0.5
+
+    def test_samples_are_bounded(self):
+        recorder = LatencyRecorder(max_samples=10, max_events=5)
+        for _ in range(50):
+            recorder.add('rag', 0.1)
+
+        assert recorder.get_statistics()['stages']['rag']['count'] == 50
+        assert len(recorder.to_chrome_trace()['traceEvents']) == 5
+
+    def test_chrome_trace_export(self, tmp_path):
+        recorder = LatencyRecorder()
+        trace = SegmentTrace(label="08:00 gossip")
+        with use_trace(trace), span('llm', model='m'):
+            pass
+        recorder.add_trace(trace)
+
+        path = recorder.export_chrome_trace(tmp_path / "out" / "trace.json")
+
+        data = json.loads(path.read_text())
+        events = {event['name']: event for event in data['traceEvents']}
+        assert set(events) == {'segment', 'llm'}
+        assert events['llm']['ph'] == 'X'
+        assert events['llm']['args'] == {'model': 'm', 'segment': "08:00 gossip"}
+        assert events['segment']['ts'] <= events['llm']['ts']
+
+
+def test_percentile():
+    assert percentile([], 0.5) == 0.0
+    assert percentile([1.0, 2.0, 3.0], 0.5) == 2.0
+    assert percentile([1.0, 2.0, 3.0], 0.95) == 3.0
@@ -0,0 +1,157 @@
+"""
+Unit tests for streaming generation with early-abort validation.
+
+Tests the incremental validators, OllamaClient.generate_streaming() and the
+ScriptGenerator fallback for clients without streaming.
+"""
+
+import json
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add tools/script-generator to path
+script_gen_path = Path(__file__).parent.parent.parent / "tools" / "script-generator"
+sys.path.insert(0, str(script_gen_path))
+
+from stream_validators import (
+    settled_text,
+    ForbiddenTermsCheck,
+    TemporalCheck,
+    build_stream_validators
+)
+from ollama_client import OllamaClient, GenerationAborted, check_validators
+from generator import ScriptGenerator
+
+
+JULIE_CARD = {
+    'name': 'Julie',
+    'knowledge_constraints': {
+        'temporal_cutoff_year': 2102,
+        'forbidden_factions': ['NCR'],
+        'forbidden_topics': ['Institute']
+    }
+}
+
+
+def make_stream_response(fragments):
+    """Mock a streaming /api/generate response"""
+    lines = [json.dumps({'response': f, 'done': False}).encode() for f in fragments]
+    lines.append(json.dumps({'response': '', 'done': True}).encode())
+    response = Mock()
+    response.raise_for_status.return_value = None
+    response.iter_lines.return_value = iter(lines)
+    return response
+
+
+class TestIncrementalChecks:
+    """Test settled-text handling and the individual checks"""
+
+    def test_settled_text_drops_partial_word(self):
+        assert settled_text("Welcome to Appa") == "Welcome to "
+        assert settled_text("Year 21") == "Year "
+        assert settled_text("done.") == "done."
+
+    def test_forbidden_terms_wait_for_word_boundary(self):
+        check = ForbiddenTermsCheck(['NCR'])
+
+        assert check("The NCR") is None  # may still become "NCRs..."
+        assert check("The NCR patrol") == "Forbidden knowledge: 'NCR'"
+        assert check("The NCRx patrol") is None
+
+    def test_temporal_check(self):
+        check = TemporalCheck(2102, dj_name="Julie")
+
+        assert check("Back in 2077, ") is None
+        assert check("In 210") is None
+        assert "2105" in check("In 2105, ")
+
+    def test_final_check_sees_last_word(self):
+        validators = [TemporalCheck(2102)]
+
+        assert check_validators("It is 2105", validators) is None
+        assert check_validators("It is 2105", validators, final=True)
+
+
+class TestBuildFromCard:
+    """Test building validators from a character card"""
+
+    def test_card_constraints(self):
+        validators = build_stream_validators(JULIE_CARD, include_anachronisms=False)
+
+        assert check_validators("The Institute rises. ", validators)
+        assert check_validators("NCR rangers everywhere. ", validators)
+        assert check_validators("Listen up, it's 2150 now. ", validators)
+        assert check_validators("Morning, Appalachia! ", validators) is None
+
+    def test_anachronisms_included_by_default(self):
+        validators = build_stream_validators({'name': 'Julie'})
+        assert check_validators("check the internet today ", validators)
+
+
+class TestGenerateStreaming:
+    """Test OllamaClient.generate_streaming()"""
+
+    @patch('requests.Session.post')
+    def test_returns_full_text(self, mock_post):
+        mock_post.return_value = make_stream_response(["Hello ", "Appalachia", "!"])
+        client = OllamaClient()
+
+        text = client.generate_streaming("m", "p", validators=[TemporalCheck(2102)])
+
+        assert text == "Hello Appalachia!"
+        assert mock_post.call_args.kwargs['stream'] is True
+        assert mock_post.call_args.kwargs['json']['stream'] is True
+
+    @patch('requests.Session.post')
+    def test_aborts_early_and_closes_stream(self, mock_post):
+        response = make_stream_response(["The ", "NCR ", "says ", "hello ", "again."])
+        mock_post.return_value = response
+        client = OllamaClient()
+
+        with pytest.raises(GenerationAborted) as exc_info:
+            client.generate_streaming("m", "p", validators=[ForbiddenTermsCheck(['NCR'])])
+
+        assert exc_info.value.partial_text == "The NCR "
+        assert exc_info.value.fragments == 2
+        response.close.assert_called_once()
+        # Aborts are final, not retried
+        assert mock_post.call_count == 1
+
+    @patch('requests.Session.post')
+    def test_stream_error_retries(self, mock_post):
+        bad = Mock()
+        bad.raise_for_status.return_value = None
+        bad.iter_lines.return_value = iter([json.dumps({'error': 'boom'}).encode()])
+        mock_post.side_effect = [bad, make_stream_response(["ok"])]
+        client = OllamaClient()
+
+        with patch('time.sleep'):
+            assert client.generate_streaming("m", "p", validators=[]) == "ok"
+        assert mock_post.call_count == 2
+
+
+class TestGeneratorFallback:
+    """Test ScriptGenerator._generate_text() without a streaming client"""
+
+    def _generator(self, client):
+        generator = ScriptGenerator.__new__(ScriptGenerator)
+        generator.ollama = client
+        return generator
+
+    def test_blocking_client_checks_full_text(self):
+        client = Mock(spec=['generate'])
+        client.generate.return_value = "Greetings from 2150"
+
+        with pytest.raises(GenerationAborted) as exc_info:
+            self._generator(client)._generate_text("m", "p", {}, validators=[TemporalCheck(2102)])
+
+        assert exc_info.value.partial_text == "Greetings from 2150"
+
+    def test_streaming_client_used_when_available(self):
+        client = Mock()
+        client.generate_streaming.return_value = "fine"
+
+        assert self._generator(client)._generate_text("m", "p", {}, validators=[TemporalCheck(2102)]) == "fine"
+        client.generate.assert_not_called()
@@ -0,0 +1,565 @@
+"""
+Broadcast Generation Benchmark
+
+Runs BroadcastEngine.generate_broadcast_sequence() end to end against a
+deterministic LLM stand-in (OllamaSimulator) and a small fixture ChromaDB,
+for each validation mode and story setting, and reports:
+
+- throughput: segments/minute (wall clock) and simulated LLM seconds
+- per-stage latency: p50/p95 from the engine's stage timer
+- memory growth: RSS after each simulated broadcast day
+- state-file write volume: bytes and writes per store (world state,
+  story state, checkpoints)
+- cache hit rates: RAG cache, completion cache, simulated prefix cache
+
+Each run is appended to a JSON history file together with the git commit,
+and compared with the latest run from another commit; segments/minute or
+p95 stage latencies that got worse by more than --threshold are flagged.
+
+The fixture DB uses hashed stand-in embeddings and the lexical (BM25)
+retrieval mode, so no embedding model or GPU is needed. With the default
+--time-scale 0 the simulator answers instantly and the numbers measure the
+engine's own overhead; raise it to include modelled LLM time.
+
+Usage:
+    python benchmark_broadcast.py
+    python benchmark_broadcast.py --days 3 --modes rules,hybrid --stories on
+    python benchmark_broadcast.py --time-scale 0.001 --history benchmarks/broadcast_history.json
+"""
+
+import sys
+import argparse
+import contextlib
+import gc
+import hashlib
+import io
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+VALIDATION_MODES = ("off", "rules", "llm", "hybrid")
+HOURS_PER_DAY = 8  # Same as broadcast.py --days
+DEFAULT_DJ = "Julie (2102, Appalachia)"
+DEFAULT_HISTORY = Path(__file__).parent / "benchmarks" / "broadcast_history.json"
+COLLECTION_NAME = "fallout_wiki"
+EMBEDDING_DIM = 32
+
+# (id, text, metadata) - enough lore for every segment type's RAG query
+FIXTURE_DOCUMENTS = [
+    ("vault76_reclamation", "Vault 76 opened on Reclamation Day in 2102 and its dwellers set out to rebuild Appalachia.",
+     {"location": "Appalachia", "year_max": 2102, "content_type": "event"}),
+    ("vault76_daily", "Daily life around Vault 76 means scavenging, trading caps and checking in with neighbors.",
+     {"location": "Appalachia", "year_max": 2102, "content_type": "location"}),
+    ("responders_flatwoods", "The Responders organized relief for Flatwoods survivors, handing out food and medicine.",
+     {"location": "Appalachia", "year_max": 2096, "content_type": "faction"}),
+    ("foundation_settlers", "Settlers at Foundation trade rumors about raiders and new arrivals from the vault.",
+     {"location": "Appalachia", "year_max": 2103, "content_type": "faction"}),
+    ("crater_raiders", "Raiders at the Crater keep their own counsel and their own gossip about the wasteland.",
+     {"location": "Appalachia", "year_max": 2103, "content_type": "faction"}),
+    ("brotherhood_appalachia", "The Brotherhood of Steel once held Fort Defiance against the Scorched.",
+     {"location": "Appalachia", "year_max": 2096, "content_type": "faction"}),
+    ("scorched_plague", "The Scorched plague spread across the hills, carried by the scorchbeasts from the Mire.",
+     {"location": "Appalachia", "year_max": 2102, "content_type": "event"}),
+    ("rad_storms", "Rad storms roll over the Appalachian hills, and radios warn travelers to find shelter.",
+     {"location": "Appalachia", "year_max": 2102, "content_type": "weather"}),
+    ("weather_fog", "Morning fog settles in the Forest valleys while the Toxic Valley stays dry and grey.",
+     {"location": "Appalachia", "year_max": 2102, "content_type": "weather"}),
+    ("news_trade", "Traders on the road between Charleston and Morgantown report steady business this season.",
+     {"location": "Appalachia", "year_max": 2102, "content_type": "event"}),
+    ("music_radio", "Appalachia Radio plays old country songs and tunes from before the war.",
+     {"location": "Appalachia", "year_max": 2102, "content_type": "lore"}),
+    ("time_routine", "Settlers keep time by the sun and by the radio's hourly check-ins.",
+     {"location": "Appalachia", "year_max": 2102, "content_type": "lore"}),
+]
+
+# Compact stories seeded into the pools when the story system is on
+FIXTURE_STORIES = [
+    ("fixture_missing_caravan", "The Missing Caravan", "daily",
+     ["A caravan bound for Foundation never arrived.",
+      "Settlers find tracks leading toward the Crater.",
+      "The caravan turns up, its crew safe and a little embarrassed."]),
+    ("fixture_responders_drive", "Responders Supply Drive", "weekly",
+     ["The Responders ask listeners for spare medicine.",
+      "Donations pile up at the Flatwoods collection point.",
+      "The supply drive reaches the settlements in the Mire.",
+      "Volunteers celebrate a successful drive."]),
+]
+
+BENCHMARK_SETTINGS = ("dj", "days", "hours_per_day", "segments_per_hour", "time_scale", "seed")
+
+# Reported by the (simulated) server, not measured on the wall clock
+SERVER_TIMED_STAGES = ("llm.prefill", "llm.decode")
+
+
+def fixture_embedding(text: str) -> List[float]:
+    """Deterministic stand-in embedding (hashed, no model needed)"""
+    digest = hashlib.sha256(text.encode("utf-8")).digest()
+    return [byte / 255.0 for byte in digest[:EMBEDDING_DIM]]
+
+
+def build_fixture_db(directory: Path) -> Path:
+    """
+    Create the fixture ChromaDB (documents plus BM25 index) in directory.
+
+    Returns:
+        The database directory
+    """
+    import chromadb
+    from tools.wiki_to_chromadb.lexical_index import LexicalIndex
+
+    directory = Path(directory)
+    client = chromadb.PersistentClient(path=str(directory))
+    collection = client.create_collection(COLLECTION_NAME, embedding_function=None,
+                                          metadata={"hnsw:space": "cosine"})
+    ids = [doc_id for doc_id, _, _ in FIXTURE_DOCUMENTS]
+    texts = [text for _, text, _ in FIXTURE_DOCUMENTS]
+    collection.add(
+        ids=ids,
+        documents=texts,
+        embeddings=[fixture_embedding(text) for text in texts],
+        metadatas=[{**metadata, "wiki_title": doc_id, "chunk_quality": "rich"}
+                   for doc_id, _, metadata in FIXTURE_DOCUMENTS]
+    )
+    index = LexicalIndex()
+    index.add_documents(ids, texts)
+    index.save(directory / f"{COLLECTION_NAME}.bm25.json.gz")
+    return directory
+
+
+def fixture_stories() -> List[Any]:
+    """FIXTURE_STORIES as Story models"""
+    from story_system.story_models import Story, StoryAct, StoryActType, StoryTimeline
+
+    act_types = [StoryActType.SETUP, StoryActType.RISING, StoryActType.CLIMAX,
+                 StoryActType.FALLING, StoryActType.RESOLUTION]
+    stories = []
+    for story_id, title, timeline, beats in FIXTURE_STORIES:
+        acts = [
+            StoryAct(
+                act_number=i + 1,
+                act_type=act_types[-1] if i == len(beats) - 1 else act_types[min(i, 3)],
+                title=f"{title} ({i + 1})",
+                summary=beat
+            )
+            for i, beat in enumerate(beats)
+        ]
+        stories.append(Story(
+            story_id=story_id,
+            title=title,
+            timeline=StoryTimeline(timeline),
+            acts=acts,
+            summary=" ".join(beats),
+            region="Appalachia",
+            year_max=2102
+        ))
+    return stories
+
+
+def dj_responder(personality: Dict[str, Any]):
+    """
+    Simulator responder that opens with the DJ's catchphrase.
+
+    The default filler never uses a catchphrase, so every rules-validated
+    segment would retry; a real model usually follows the instruction.
+    """
+    from ollama_simulator import default_responder
+
+    catchphrase = (personality.get('catchphrases') or [""])[0]
+
+    def respond(model: str, prompt: str, payload: Dict[str, Any], tokens: int) -> str:
+        text = default_responder(model, prompt, payload, tokens)
+        if payload.get("format") is not None or not catchphrase:
+            return text
+        return f"{catchphrase} {text}"
+
+    return respond
+
+
+class StateWriteMeter:
+    """Counts bytes written by an engine's world-state, story-state and checkpoint saves"""
+
+    def __init__(self, engine: Any):
+        self.by_store: Dict[str, Dict[str, int]] = {}
+        self._wrap(engine.world_state, 'save', 'world_state',
+                   lambda result: engine.world_state.persistence_path)
+        if getattr(engine, 'story_state', None) is not None:
+            self._wrap(engine.story_state, 'save', 'story_state',
+                       lambda result: engine.story_state.persistence_path)
+        if getattr(engine, 'checkpoint_manager', None) is not None:
+            self._wrap(engine.checkpoint_manager, 'save_checkpoint', 'checkpoint', lambda result: result)
+
+    def _wrap(self, target: Any, method: str, store: str, path_of) -> None:
+        original = getattr(target, method)
+
+        def metered(*args, **kwargs):
+            result = original(*args, **kwargs)
+            path = path_of(result)
+            entry = self.by_store.setdefault(store, {'writes': 0, 'bytes': 0})
+            entry['writes'] += 1
+            if path and os.path.exists(path):
+                entry['bytes'] += os.path.getsize(path)
+            return result
+
+        setattr(target, method, metered)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            'writes': sum(entry['writes'] for entry in self.by_store.values()),
+            'bytes': sum(entry['bytes'] for entry in self.by_store.values()),
+            'by_store': {store: dict(entry) for store, entry in self.by_store.items()}
+        }
+
+
+def _rss_mb() -> Optional[float]:
+    if not PSUTIL_AVAILABLE:
+        return None
+    gc.collect()
+    return psutil.Process(os.getpid()).memory_info().rss / 1024 / 1024
+
+
+def scenario_name(validation_mode: str, stories: bool) -> str:
+    return f"{validation_mode}/{'stories' if stories else 'no-stories'}"
+
+
+def run_scenario(validation_mode: str,
+                 stories: bool,
+                 fixture_db: Path,
+                 workdir: Path,
+                 dj_name: str = DEFAULT_DJ,
+                 days: int = 1,
+                 hours_per_day: int = HOURS_PER_DAY,
+                 segments_per_hour: int = 2,
+                 time_scale: float = 0.0,
+                 seed: int = 42) -> Dict[str, Any]:
+    """
+    Generate days x hours_per_day hours for one validation mode / story setting.
+
+    Args:
+        validation_mode: 'off', 'rules', 'llm' or 'hybrid'
+        stories: Enable the story system (pools seeded with FIXTURE_STORIES)
+        fixture_db: Directory from build_fixture_db()
+        workdir: Empty directory for state files and checkpoints
+        dj_name: DJ personality
+        days: Simulated broadcast days
+        hours_per_day: Hours per day
+        segments_per_hour: Segments per hour
+        time_scale: Simulator seconds slept per simulated second
+        seed: Seed for the engine's random choices and the simulator
+
+    Returns:
+        Scenario metrics
+    """
+    from broadcast_engine import BroadcastEngine
+    from completion_cache import CompletionCache
+    from generator import ScriptGenerator
+    from ollama_simulator import OllamaSimulator, simulated_client
+    from personality_loader import load_personality
+
+    random.seed(seed)
+    simulator = OllamaSimulator(time_scale=time_scale, seed=seed,
+                                responder=dj_responder(load_personality(dj_name)))
+    completion_cache = CompletionCache()
+    generator = ScriptGenerator(
+        chroma_db_dir=str(fixture_db),
+        retrieval_mode="lexical",
+        ollama_client=simulated_client(simulator, completion_cache=completion_cache)
+    )
+    engine = BroadcastEngine(
+        dj_name=dj_name,
+        generator=generator,
+        world_state_path=str(workdir / "broadcast_state.json"),
+        checkpoint_dir=str(workdir / "checkpoints"),
+        enable_validation=validation_mode != "off",
+        validation_mode=validation_mode if validation_mode != "off" else "rules",
+        # The stand-in answers format requests with a valid JSON verdict
+        llm_validation_config={'json_mode': True} if validation_mode in ("llm", "hybrid") else None,
+        enable_story_system=stories
+    )
+    if stories and engine.story_state is not None:
+        for story in fixture_stories():
+            engine.story_state.add_to_pool(story)
+    meter = StateWriteMeter(engine)
+    # Startup (ChromaDB, lexical index, weather calendar) is not throughput
+    warmup_seconds = engine.warmup()
+
+    rss_by_day = [_rss_mb()]
+    segments = 0
+    engine.start_broadcast()
+    start = time.perf_counter()
+    for _ in range(days):
+        segments += len(engine.generate_broadcast_sequence(
+            start_hour=8, duration_hours=hours_per_day, segments_per_hour=segments_per_hour
+        ))
+        rss_by_day.append(_rss_mb())
+    wall_seconds = time.perf_counter() - start
+    stats = engine.end_broadcast(save_state=True)
+
+    rag = generator.rag_cache.get_statistics()
+    sim = simulator.get_statistics()
+    prompt_tokens = sim['prefill_tokens'] + sim['cached_prefix_tokens']
+    stages = stats.get('latency', {}).get('stages', {})
+    memory = {'rss_mb_by_day': rss_by_day, 'growth_mb': None, 'growth_mb_per_day': None}
+    if rss_by_day[0] is not None:
+        memory['growth_mb'] = rss_by_day[-1] - rss_by_day[0]
+        memory['growth_mb_per_day'] = memory['growth_mb'] / max(1, days)
+
+    return {
+        'validation_mode': validation_mode,
+        'stories': stories,
+        'segments': segments,
+        'wall_seconds': wall_seconds,
+        'warmup_seconds': warmup_seconds,
+        'segments_per_minute': segments / wall_seconds * 60 if wall_seconds > 0 else 0.0,
+        'validation_failures': stats.get('validation_failures', 0),
+        'llm': {
+            'requests': sim['requests'],
+            'simulated_seconds': sim['busy_time'],
+            'decode_tokens': sim['decode_tokens']
+        },
+        'latency': {
+            stage: {key: entry[key] for key in ('count', 'mean', 'p50', 'p95')}
+            for stage, entry in stages.items()
+        },
+        'memory': memory,
+        'state_writes': meter.get_statistics(),
+        'cache': {
+            'rag_hit_rate': rag.get('hit_rate', 0.0),
+            'completion_hit_rate': completion_cache.get_statistics()['hit_rate'] / 100,
+            'prefix_cache_rate': sim['cached_prefix_tokens'] / prompt_tokens if prompt_tokens else 0.0
+        }
+    }
+
+
+def run_benchmark(validation_modes: Tuple[str, ...] = VALIDATION_MODES,
+                  story_settings: Tuple[bool, ...] = (False, True),
+                  dj_name: str = DEFAULT_DJ,
+                  days: int = 1,
+                  hours_per_day: int = HOURS_PER_DAY,
+                  segments_per_hour: int = 2,
+                  time_scale: float = 0.0,
+                  seed: int = 42,
+                  verbose: bool = False) -> Dict[str, Any]:
+    """
+    Run every validation mode / story setting combination.
+
+    Returns:
+        Dict with the settings and per-scenario metrics
+    """
+    for mode in validation_modes:
+        if mode not in VALIDATION_MODES:
+            raise ValueError(f"Unknown validation mode '{mode}'. Available: {list(VALIDATION_MODES)}")
+
+    results: Dict[str, Any] = {
+        'dj': dj_name, 'days': days, 'hours_per_day': hours_per_day,
+        'segments_per_hour': segments_per_hour, 'time_scale': time_scale, 'seed': seed,
+        'scenarios': {}
+    }
+    with tempfile.TemporaryDirectory(prefix="benchmark_broadcast_") as tmp:
+        fixture_db = build_fixture_db(Path(tmp) / "chroma")
+
+        def run_quietly(name: str, *scenario_args) -> Dict[str, Any]:
+            workdir = Path(tmp) / name.replace("/", "_")
+            workdir.mkdir()
+            if not verbose:
+                logging.disable(logging.CRITICAL)
+            try:
+                output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+                with output:
+                    return run_scenario(*scenario_args[:2], fixture_db, workdir, dj_name, *scenario_args[2:])
+            finally:
+                logging.disable(logging.NOTSET)
+
+        # Process-wide lazy loads (tokenizer lookup, templates) would
+        # otherwise all land on the first scenario
+        start = time.perf_counter()
+        run_quietly("process-warmup", "off", False, 1, 1, segments_per_hour, 0.0, seed)
+        results['process_warmup_seconds'] = time.perf_counter() - start
+
+        for stories in story_settings:
+            for mode in validation_modes:
+                name = scenario_name(mode, stories)
+                print(f"▶️  {name} ({days} day(s) x {hours_per_day}h)...", flush=True)
+                scenario = run_quietly(name, mode, stories, days, hours_per_day, segments_per_hour,
+                                       time_scale, seed)
+                results['scenarios'][name] = scenario
+                print(f"   {scenario['segments']} segments, {scenario['segments_per_minute']:.1f} segments/min")
+    return results
+
+
+def git_commit(repo_dir: Optional[Path] = None) -> Optional[str]:
+    """Current git commit (None outside a repository)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=repo_dir or Path(__file__).parent,
+            capture_output=True, text=True, check=True, timeout=10
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def load_history(path: Path) -> List[Dict[str, Any]]:
+    """Runs recorded in a history file (empty if missing)"""
+    path = Path(path)
+    if not path.exists():
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('runs', [])
+
+
+def append_history(path: Path, run: Dict[str, Any]) -> None:
+    """Append a run to the history file"""
+    path = Path(path)
+    runs = load_history(path) + [run]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'runs': runs}, f, indent=2)
+
+
+def find_baseline(runs: List[Dict[str, Any]], run: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Latest earlier run with the same settings from a different commit"""
+    for previous in reversed(runs):
+        if previous is run or previous.get('commit') == run.get('commit'):
+            continue
+        if all(previous.get(key) == run.get(key) for key in BENCHMARK_SETTINGS):
+            return previous
+    return None
+
+
+def compare_runs(baseline: Dict[str, Any],
+                 run: Dict[str, Any],
+                 threshold: float = 0.10) -> List[Dict[str, Any]]:
+    """
+    Find regressions against a baseline run.
+
+    Args:
+        baseline: Earlier run
+        run: Current run
+        threshold: Relative change treated as a regression (0.10 = 10%)
+
+    Returns:
+        List of {'scenario', 'metric', 'before', 'after', 'change'}
+    """
+    regressions = []
+    for name, current in run['scenarios'].items():
+        before = baseline.get('scenarios', {}).get(name)
+        if not before:
+            continue
+        # Lower throughput is worse; higher latency is worse
+        checks = [('segments_per_minute', before['segments_per_minute'], current['segments_per_minute'], -1)]
+        for stage, entry in current['latency'].items():
+            if stage in before.get('latency', {}):
+                checks.append((f"{stage}.p95", before['latency'][stage]['p95'], entry['p95'], 1))
+        for metric, old, new, direction in checks:
+            if old and (new - old) / old * direction > threshold:
+                regressions.append({'scenario': name, 'metric': metric, 'before': old,
+                                    'after': new, 'change': (new - old) / old})
+    return regressions
+
+
+def print_report(run: Dict[str, Any],
+                 baseline: Optional[Dict[str, Any]] = None,
+                 regressions: Optional[List[Dict[str, Any]]] = None) -> None:
+    """Print a human-readable benchmark report"""
+    print("\n" + "=" * 78)
+    print(f"Broadcast Benchmark: {run['dj']}, {run['days']} day(s) x {run['hours_per_day']}h, "
+          f"commit {run.get('commit') or 'unknown'}")
+    print("=" * 78)
+    print(f"{'Scenario':22} {'Seg':>5} {'Seg/min':>9} {'LLM req':>8} {'RAG hit':>8} "
+          f"{'Writes KB':>10} {'RSS +MB':>8}")
+    for name, scenario in run['scenarios'].items():
+        growth = scenario['memory']['growth_mb']
+        print(f"{name:22} {scenario['segments']:5} {scenario['segments_per_minute']:9.1f} "
+              f"{scenario['llm']['requests']:8} {scenario['cache']['rag_hit_rate']:8.1%} "
+              f"{scenario['state_writes']['bytes'] / 1024:10.1f} "
+              f"{growth if growth is not None else float('nan'):8.1f}")
+
+    print("\nSlowest stages by total time (p50 / p95 ms):")
+    for name, scenario in run['scenarios'].items():
+        stages = sorted(((stage, entry) for stage, entry in scenario['latency'].items()
+                         if stage != 'segment' and stage not in SERVER_TIMED_STAGES),
+                        key=lambda item: item[1]['mean'] * item[1]['count'], reverse=True)[:4]
+        summary = ", ".join(f"{stage} {entry['p50'] * 1000:.1f}/{entry['p95'] * 1000:.1f}"
+                            for stage, entry in stages)
+        print(f"  {name:22} {summary}")
+
+    if baseline is not None:
+        print(f"\nCompared with {baseline.get('commit')} ({baseline.get('timestamp')}):")
+        if regressions:
+            for entry in regressions:
+                print(f"  ⚠️  {entry['scenario']} {entry['metric']}: {entry['before']:.4g} -> "
+                      f"{entry['after']:.4g} ({entry['change']:+.0%})")
+        else:
+            print("  ✅ No regressions")
+    print("=" * 78)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark broadcast generation throughput')
+    parser.add_argument('--dj', type=str, default=DEFAULT_DJ)
+    parser.add_argument('--days', type=int, default=1, help='Simulated broadcast days per scenario')
+    parser.add_argument('--hours-per-day', type=int, default=HOURS_PER_DAY)
+    parser.add_argument('--segments-per-hour', type=int, default=2)
+    parser.add_argument('--modes', type=str, default=",".join(VALIDATION_MODES),
+                        help=f'Comma-separated validation modes (default: {",".join(VALIDATION_MODES)})')
+    parser.add_argument('--stories', choices=['on', 'off', 'both'], default='both')
+    parser.add_argument('--time-scale', type=float, default=0.0,
+                        help='Simulator seconds slept per simulated second (default: 0 = engine overhead only)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--history', type=str, default=str(DEFAULT_HISTORY),
+                        help='JSON history file runs are appended to')
+    parser.add_argument('--no-history', action='store_true', help='Do not record this run')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='Relative change flagged as a regression (default: 0.10)')
+    parser.add_argument('--verbose', action='store_true', help='Show engine output')
+    args = parser.parse_args()
+
+    story_settings = {'on': (True,), 'off': (False,), 'both': (False, True)}[args.stories]
+    results = run_benchmark(
+        validation_modes=tuple(mode.strip() for mode in args.modes.split(",") if mode.strip()),
+        story_settings=story_settings,
+        dj_name=args.dj,
+        days=args.days,
+        hours_per_day=args.hours_per_day,
+        segments_per_hour=args.segments_per_hour,
+        time_scale=args.time_scale,
+        seed=args.seed,
+        verbose=args.verbose
+    )
+    run = {
+        'timestamp': datetime.now().isoformat(),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        **results
+    }
+
+    history = Path(args.history)
+    baseline = find_baseline(load_history(history), run)
+    regressions = compare_runs(baseline, run, args.threshold) if baseline else []
+    print_report(run, baseline, regressions)
+
+    if not args.no_history:
+        append_history(history, run)
+        print(f"\nResults appended to: {history}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
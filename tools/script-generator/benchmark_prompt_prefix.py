@@ -0,0 +1,241 @@
+"""
+Prompt Prefix Benchmark
+
+Replays a 24-hour segment schedule against Ollama twice and compares
+time-to-first-token (TTFT):
+
+    legacy         whole template (persona inline) as a single user message
+    prefix_stable  static persona as a stable system message, template
+                   rendered with persona_in_system=True as the user message
+
+TTFT comes from the server timings (load_duration + prompt_eval_duration);
+prompt_eval_count shows how many prompt tokens Ollama actually evaluated,
+which drops when it reuses the cached prefix of the previous request.
+
+--dry-run skips Ollama and only reports the shared-prefix length between
+consecutive prompts.
+
+Usage:
+    python benchmark_prompt_prefix.py --dj "Julie (2102, Appalachia)"
+    python benchmark_prompt_prefix.py --hours 24 --output prefix_results.json
+    python benchmark_prompt_prefix.py --dry-run
+"""
+
+import sys
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from jinja2 import Environment, FileSystemLoader
+
+from prompt_layout import PromptLayout, build_persona_prompt
+from ollama_client import response_timings
+
+
+LAYOUTS = ("legacy", "prefix_stable")
+
+# Segment rotation within an hour (hour -> segment types)
+HOURLY_SEGMENTS = ["time", "weather", "news", "music_intro", "gossip"]
+
+WEATHER_TYPES = ["sunny", "cloudy", "rainy", "foggy", "rad_storm"]
+NEWS_TOPICS = ["Responders supply run", "Foundation expansion", "Crater trade deal",
+               "Vault 76 dwellers", "Scorched sightings"]
+SONGS = [("Country Roads", "John Denver"), ("Ring of Fire", "Johnny Cash"),
+         ("Atom Bomb Baby", "The Five Stars"), ("Butcher Pete", "Roy Brown")]
+
+
+def time_of_day(hour: int) -> str:
+    if 5 <= hour < 12:
+        return "morning"
+    if 12 <= hour < 17:
+        return "afternoon"
+    if 17 <= hour < 21:
+        return "evening"
+    return "night"
+
+
+def build_schedule(hours: int = 24) -> List[Dict[str, Any]]:
+    """
+    Deterministic segment schedule with per-segment template variables.
+
+    Args:
+        hours: Broadcast hours to simulate
+
+    Returns:
+        List of {'hour', 'segment_type', 'vars'} dicts
+    """
+    schedule = []
+    for hour in range(hours):
+        for i, segment_type in enumerate(HOURLY_SEGMENTS[:2 + hour % 4]):
+            song, artist = SONGS[(hour + i) % len(SONGS)]
+            schedule.append({
+                'hour': hour,
+                'segment_type': segment_type,
+                'vars': {
+                    'hour': hour,
+                    'time_of_day': time_of_day(hour),
+                    'weather_type': WEATHER_TYPES[hour % len(WEATHER_TYPES)],
+                    'temperature': 55 + (hour * 7) % 30,
+                    'news_topic': NEWS_TOPICS[(hour + i) % len(NEWS_TOPICS)],
+                    'rumor_type': "strange lights near Watoga",
+                    'song_title': song,
+                    'artist': artist,
+                    'session_context': f"Hour {hour} of today's broadcast.",
+                    'lore_context': (f"Lore note {hour}-{i}: {NEWS_TOPICS[(hour + i) % len(NEWS_TOPICS)]} "
+                                     f"around {time_of_day(hour)} in Appalachia."),
+                    'catchphrase': {'should_use': False},
+                    'voice_elements': {}
+                }
+            })
+    return schedule
+
+
+def build_messages(env: Environment,
+                   personality: Dict[str, Any],
+                   segment: Dict[str, Any],
+                   layout: str) -> List[Dict[str, str]]:
+    """Chat messages for one segment in the given layout"""
+    template = env.get_template(f"{segment['segment_type']}.jinja2")
+    if layout == "legacy":
+        prompt = template.render(personality=personality, persona_in_system=False, **segment['vars'])
+        return [{"role": "user", "content": prompt}]
+    prompt = template.render(personality=personality, persona_in_system=True, **segment['vars'])
+    return PromptLayout(system=build_persona_prompt(personality), user=prompt.strip()).to_messages()
+
+
+def flatten_messages(messages: List[Dict[str, str]]) -> str:
+    return "\n".join(f"<{m['role']}>{m['content']}" for m in messages)
+
+
+def shared_prefix_chars(a: str, b: str) -> int:
+    """Length of the common prefix of two strings"""
+    return len(os.path.commonprefix([a, b]))
+
+
+def prefix_share(prompts: List[str]) -> Dict[str, float]:
+    """Average shared prefix between consecutive prompts"""
+    if len(prompts) < 2:
+        return {'avg_shared_chars': 0.0, 'avg_shared_ratio': 0.0}
+    shared = [shared_prefix_chars(prompts[i - 1], prompts[i]) for i in range(1, len(prompts))]
+    ratios = [s / max(1, len(prompts[i + 1])) for i, s in enumerate(shared)]
+    return {
+        'avg_shared_chars': sum(shared) / len(shared),
+        'avg_shared_ratio': sum(ratios) / len(ratios)
+    }
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_benchmark(chat_fn: Optional[Callable[[List[Dict[str, str]]], Dict[str, Any]]],
+                  personality: Dict[str, Any],
+                  templates_dir: Optional[str] = None,
+                  hours: int = 24) -> Dict[str, Any]:
+    """
+    Run the prefix benchmark.
+
+    Args:
+        chat_fn: Callable(messages) -> /api/chat response dict (None = dry run)
+        personality: Character card
+        templates_dir: Segment templates (default: ./templates)
+        hours: Broadcast hours to replay
+
+    Returns:
+        Dict with per-layout summaries and the TTFT reduction
+    """
+    env = Environment(
+        loader=FileSystemLoader(templates_dir or str(Path(__file__).parent / "templates")),
+        trim_blocks=True,
+        lstrip_blocks=True
+    )
+    schedule = build_schedule(hours)
+    results: Dict[str, Any] = {'hours': hours, 'segments': len(schedule), 'layouts': {}}
+
+    for layout in LAYOUTS:
+        requests_ = [build_messages(env, personality, segment, layout) for segment in schedule]
+        summary = prefix_share([flatten_messages(m) for m in requests_])
+
+        if chat_fn is not None:
+            timings = [response_timings(chat_fn(messages)) for messages in requests_]
+            # The first request pays the cold model load for either layout
+            warm = timings[1:] or timings
+            ttft = [t['ttft_ms'] for t in warm]
+            summary.update({
+                'ttft_avg_ms': sum(ttft) / len(ttft),
+                'ttft_p50_ms': _percentile(ttft, 0.50),
+                'ttft_p95_ms': _percentile(ttft, 0.95),
+                'prompt_eval_avg_tokens': sum(t['prompt_eval_count'] for t in warm) / len(warm)
+            })
+        results['layouts'][layout] = summary
+
+    legacy = results['layouts']['legacy']
+    stable = results['layouts']['prefix_stable']
+    if 'ttft_avg_ms' in legacy and legacy['ttft_avg_ms'] > 0:
+        results['ttft_reduction_pct'] = (1 - stable['ttft_avg_ms'] / legacy['ttft_avg_ms']) * 100
+    return results
+
+
+def print_report(results: Dict[str, Any]) -> None:
+    """Print a human-readable benchmark report"""
+    print("\n" + "=" * 60)
+    print(f"Prompt Prefix Benchmark: {results['hours']}h, {results['segments']} segments")
+    print("=" * 60)
+    metrics = ['avg_shared_chars', 'avg_shared_ratio', 'ttft_avg_ms', 'ttft_p50_ms',
+               'ttft_p95_ms', 'prompt_eval_avg_tokens']
+    print(f"{'Metric':24} {'Legacy':>12} {'Prefix-stable':>14}")
+    for metric in metrics:
+        if metric in results['layouts']['legacy']:
+            print(f"{metric:24} {results['layouts']['legacy'][metric]:12.2f} "
+                  f"{results['layouts']['prefix_stable'][metric]:14.2f}")
+    if 'ttft_reduction_pct' in results:
+        print(f"\nTTFT reduction: {results['ttft_reduction_pct']:.1f}%")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark prefix-stable prompt layout (TTFT)')
+    parser.add_argument('--dj', type=str, default="Julie (2102, Appalachia)")
+    parser.add_argument('--model', type=str, default=None, help='Ollama model (default: from config)')
+    parser.add_argument('--hours', type=int, default=24)
+    parser.add_argument('--max-tokens', type=int, default=16,
+                        help='Tokens to generate per request (TTFT only needs a few)')
+    parser.add_argument('--dry-run', action='store_true', help='Only report shared-prefix stats')
+    parser.add_argument('--output', type=str, help='Write JSON results to this file')
+    args = parser.parse_args()
+
+    from tools.shared import project_config
+    from personality_loader import load_personality
+    from ollama_client import OllamaClient
+
+    personality = load_personality(args.dj)
+    chat_fn = None
+    if not args.dry_run:
+        client = OllamaClient(base_url=project_config.OLLAMA_URL.replace("/api/generate", ""))
+        model = args.model or project_config.LLM_MODEL
+
+        def chat_fn(messages: List[Dict[str, str]]) -> Dict[str, Any]:
+            return client.chat(messages=messages, model=model, temperature=0.8,
+                               max_tokens=args.max_tokens,
+                               keep_alive=project_config.OLLAMA_KEEP_ALIVE)
+
+    results = run_benchmark(chat_fn, personality, hours=args.hours)
+    print_report(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
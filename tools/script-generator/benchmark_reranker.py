@@ -0,0 +1,225 @@
+"""
+Reranker Benchmark Harness
+
+Compares raw retrieval order (top-k of query_for_dj) against reranked
+top-k for a fixed set of DJ queries and reports:
+- Rerank latency (avg / p95 ms over repeats)
+- Answer-relevance proxies for the top-k context:
+    entity_hit_rate   fraction of chunks mentioning an expected entity
+    region_match_rate fraction of chunks located in the DJ's region
+    mean_freshness    average freshness_score
+    quality_rate      fraction of chunks with chunk_quality rich/content
+
+Usage:
+    python benchmark_reranker.py --reranker features --candidates 10 --top-k 3
+    python benchmark_reranker.py --reranker cross-encoder --output rerank_results.json
+"""
+
+import sys
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from reranker import create_reranker, parse_dj_location, FeatureReranker
+
+
+# (dj_name, query, expected entity terms)
+BENCHMARK_CASES = [
+    {"dj_name": "Julie (2102, Appalachia)", "query": "Vault 76 Reclamation Day",
+     "entities": ["vault 76", "reclamation"]},
+    {"dj_name": "Julie (2102, Appalachia)", "query": "Flatwoods Responders",
+     "entities": ["flatwoods", "responders"]},
+    {"dj_name": "Julie (2102, Appalachia)", "query": "Scorched plague Appalachia",
+     "entities": ["scorched"]},
+    {"dj_name": "Mr. New Vegas (2281, Mojave)", "query": "Hoover Dam NCR Legion",
+     "entities": ["hoover dam", "ncr", "legion"]},
+    {"dj_name": "Mr. New Vegas (2281, Mojave)", "query": "Nuka-Cola Quantum",
+     "entities": ["nuka-cola", "nuka cola"]},
+]
+
+
+def results_to_chunks(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Convert a ChromaDB query result into chunk dicts"""
+    chunks = []
+    ids = results.get('ids', [[]])[0]
+    for i in range(len(ids)):
+        chunks.append({
+            'id': ids[i],
+            'text': results['documents'][0][i],
+            'metadata': (results['metadatas'][0][i] if results.get('metadatas') else None) or {},
+            'distance': results['distances'][0][i] if results.get('distances') else None
+        })
+    return chunks
+
+
+def relevance_proxies(chunks: List[Dict[str, Any]],
+                      entities: List[str],
+                      dj_region: Optional[str]) -> Dict[str, float]:
+    """
+    Compute answer-relevance proxies for a context selection.
+
+    Args:
+        chunks: Selected chunks
+        entities: Expected entity terms (lowercase)
+        dj_region: DJ region for region matching
+
+    Returns:
+        Dict of proxy metrics in [0, 1]
+    """
+    if not chunks:
+        return {'entity_hit_rate': 0.0, 'region_match_rate': 0.0,
+                'mean_freshness': 0.0, 'quality_rate': 0.0}
+
+    region_scorer = FeatureReranker(dj_region=dj_region)
+    n = len(chunks)
+    entity_hits = sum(
+        1 for c in chunks if any(e in c.get('text', '').lower() for e in entities)
+    )
+    region_hits = sum(1 for c in chunks if region_scorer.region_match(c['metadata']) == 1.0)
+    freshness = sum(float(c['metadata'].get('freshness_score', 1.0)) for c in chunks)
+    quality = sum(1 for c in chunks if c['metadata'].get('chunk_quality') in ('rich', 'content'))
+
+    return {
+        'entity_hit_rate': entity_hits / n,
+        'region_match_rate': region_hits / n,
+        'mean_freshness': freshness / n,
+        'quality_rate': quality / n
+    }
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_benchmark(query_fn,
+                  reranker,
+                  cases: Optional[List[Dict[str, Any]]] = None,
+                  candidates: int = 10,
+                  top_k: int = 3,
+                  repeats: int = 5) -> Dict[str, Any]:
+    """
+    Run the rerank benchmark.
+
+    Args:
+        query_fn: Callable(dj_name, query, n_results) -> ChromaDB result dict
+        reranker: Reranker with rerank(query, chunks, top_k, dj_region)
+        cases: Benchmark cases (default: BENCHMARK_CASES)
+        candidates: Chunks to over-retrieve
+        top_k: Chunks kept for the prompt
+        repeats: Rerank timing repeats per case
+
+    Returns:
+        Dict with per-case results and a summary
+    """
+    cases = cases or BENCHMARK_CASES
+    per_case = []
+    latencies_ms: List[float] = []
+
+    for case in cases:
+        dj_region = parse_dj_location(case['dj_name'])
+        entities = [e.lower() for e in case['entities']]
+
+        retrieval_start = time.perf_counter()
+        chunks = results_to_chunks(query_fn(case['dj_name'], case['query'], candidates))
+        retrieval_ms = (time.perf_counter() - retrieval_start) * 1000
+
+        case_latencies = []
+        reranked = chunks[:top_k]
+        for _ in range(max(1, repeats)):
+            start = time.perf_counter()
+            reranked = reranker.rerank(case['query'], chunks, top_k=top_k, dj_region=dj_region)
+            case_latencies.append((time.perf_counter() - start) * 1000)
+        latencies_ms.extend(case_latencies)
+
+        per_case.append({
+            'dj_name': case['dj_name'],
+            'query': case['query'],
+            'candidates_returned': len(chunks),
+            'retrieval_ms': round(retrieval_ms, 2),
+            'rerank_avg_ms': round(sum(case_latencies) / len(case_latencies), 3),
+            'baseline': relevance_proxies(chunks[:top_k], entities, dj_region),
+            'reranked': relevance_proxies(reranked, entities, dj_region),
+            'top_k_changed': [c['id'] for c in chunks[:top_k]] != [c['id'] for c in reranked]
+        })
+
+    def mean_of(key: str, metric: str) -> float:
+        return sum(c[key][metric] for c in per_case) / len(per_case) if per_case else 0.0
+
+    metrics = ['entity_hit_rate', 'region_match_rate', 'mean_freshness', 'quality_rate']
+    summary = {
+        'reranker': type(reranker).__name__,
+        'cases': len(per_case),
+        'candidates': candidates,
+        'top_k': top_k,
+        'rerank_avg_ms': round(sum(latencies_ms) / len(latencies_ms), 3) if latencies_ms else 0.0,
+        'rerank_p95_ms': round(_percentile(latencies_ms, 0.95), 3),
+        'baseline': {m: round(mean_of('baseline', m), 3) for m in metrics},
+        'reranked': {m: round(mean_of('reranked', m), 3) for m in metrics},
+        'cases_changed': sum(1 for c in per_case if c['top_k_changed'])
+    }
+
+    return {'summary': summary, 'cases': per_case}
+
+
+def print_report(results: Dict[str, Any]) -> None:
+    """Print a human-readable benchmark report"""
+    summary = results['summary']
+    print("\n" + "=" * 60)
+    print(f"Reranker Benchmark: {summary['reranker']}")
+    print("=" * 60)
+    print(f"Cases: {summary['cases']}  Candidates: {summary['candidates']}  Top-k: {summary['top_k']}")
+    print(f"Rerank latency: {summary['rerank_avg_ms']:.2f} ms avg, {summary['rerank_p95_ms']:.2f} ms p95")
+    print(f"Top-k changed in {summary['cases_changed']}/{summary['cases']} cases")
+    print(f"\n{'Metric':20} {'Baseline':>10} {'Reranked':>10}")
+    for metric, baseline in summary['baseline'].items():
+        print(f"{metric:20} {baseline:10.3f} {summary['reranked'][metric]:10.3f}")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark RAG reranking')
+    parser.add_argument('--chroma-db', type=str, default=None,
+                        help='ChromaDB directory (default: project chroma_db)')
+    parser.add_argument('--reranker', choices=['features', 'cross-encoder'], default='features')
+    parser.add_argument('--mode', choices=['vector', 'lexical', 'hybrid'], default='vector',
+                        help='Retrieval mode for candidates')
+    parser.add_argument('--candidates', type=int, default=10)
+    parser.add_argument('--top-k', type=int, default=3)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--output', type=str, help='Write JSON results to this file')
+    args = parser.parse_args()
+
+    from tools.shared import project_config
+    from tools.wiki_to_chromadb.chromadb_ingest import ChromaDBIngestor, query_for_dj
+
+    ingestor = ChromaDBIngestor(persist_directory=args.chroma_db or str(project_config.CHROMA_DB_PATH))
+
+    def query_fn(dj_name: str, query: str, n_results: int) -> Dict[str, Any]:
+        return query_for_dj(ingestor, dj_name, query, n_results=n_results, mode=args.mode)
+
+    results = run_benchmark(
+        query_fn,
+        create_reranker(args.reranker),
+        candidates=args.candidates,
+        top_k=args.top_k,
+        repeats=args.repeats
+    )
+    print_report(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
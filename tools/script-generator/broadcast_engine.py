@@ -11,11 +11,16 @@ Coordinates all Phase 1-4 modules into a complete broadcast workflow:
 PHASE 5: Integration & Polish
 """
 
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union, Callable
 from datetime import datetime
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import contextvars
 import json
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +28,19 @@ from session_memory import SessionMemory
 from world_state import WorldState
 from broadcast_scheduler import BroadcastScheduler, TimeOfDay
 from consistency_validator import ConsistencyValidator
-from generator import ScriptGenerator
+from generator import ScriptGenerator, GenerationCancelled
+from model_lifecycle import ModelLifecycleManager
+from ollama_governor import CircuitOpenError, get_governor
+from broadcast_runtime import BroadcastRuntime, ResourceLimits, run_sync
+from broadcast_planner import (
+    BroadcastPlanner, PlanCostModel, estimate_cost,
+    hour_to_time_of_day, build_context_query, generator_script_type as script_type_for,
+    simulated_weather_vars
+)
+from segment_plan import SegmentPlan, SegmentType
+from stage_timer import SegmentTrace, LatencyRecorder, use_trace, span
+from budget_scheduler import BudgetScheduler
+from tools.shared import project_config
 
 # LLM validation system (Phase 8 integration)
 try:
@@ -35,7 +52,7 @@ except ImportError:
 from content_types.weather import select_weather, get_weather_template_vars
 from content_types.gossip import GossipTracker, get_gossip_template_vars
 from content_types.news import select_news_category, get_news_template_vars
-from content_types.time_check import get_time_check_template_vars
+from content_types.time_check import get_time_check_template_vars, get_time_announcement, TIME_TEMPLATES
 
 # Weather simulation system (Phase 2 integration)
 try:
@@ -84,6 +101,35 @@ try:
 except ImportError:
     VARIETY_MANAGER_AVAILABLE = False
 
+# Predictive RAG prefetch
+try:
+    from rag_prefetcher import RAGPrefetcher
+    RAG_PREFETCH_AVAILABLE = True
+except ImportError:
+    RAG_PREFETCH_AVAILABLE = False
+
+
+def _new_candidate_stats() -> Dict[str, int]:
+    """Counters for parallel candidate races"""
+    return {'races': 0, 'launched': 0, 'checked': 0, 'cancelled': 0, 'won': 0}
+
+
+class _SegmentSink:
+    """Collects a sequence's final segments, or streams them to a callback"""
+    
+    def __init__(self, on_segment: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.on_segment = on_segment
+        self.segments: List[Dict[str, Any]] = []
+        self.count = 0
+    
+    def add(self, segment: Dict[str, Any]) -> None:
+        self.count += 1
+        if self.on_segment is None:
+            self.segments.append(segment)
+        else:
+            self.on_segment(segment)
+
+
 class BroadcastEngine:
     """
     Complete broadcast orchestration engine.
@@ -110,7 +156,16 @@ class BroadcastEngine:
                  max_session_memory: int = 10,
                  enable_story_system: bool = True,
                  checkpoint_dir: str = './checkpoints',
-                 checkpoint_interval: int = 1):
+                 checkpoint_interval: int = 1,
+                 rag_prefetch_hours: int = 0,
+                 stream_abort: bool = False,
+                 max_parallel_segments: int = 1,
+                 model_batch_size: int = 0,
+                 draft_model: Optional[str] = None,
+                 draft_quality_threshold: float = 0.05,
+                 segment_candidates: Optional[Dict[str, int]] = None,
+                 time_budget: Optional[float] = None,
+                 generator: Optional[ScriptGenerator] = None):
         """
         Initialize broadcast engine.
         
@@ -126,8 +181,40 @@ class BroadcastEngine:
             enable_story_system: Enable multi-temporal story system (Phase 7)
             checkpoint_dir: Directory for checkpoint files (Phase 1A)
             checkpoint_interval: Save checkpoint every N hours (Phase 1A)
+            rag_prefetch_hours: Warm the RAG cache this many hours ahead
+                in the background (0 = disabled)
+            stream_abort: Stream generation and cancel it at the first
+                critical violation (forbidden topic/faction, temporal)
+            max_parallel_segments: Segments generated concurrently by
+                generate_broadcast_sequence() (1 = sequential; match the
+                server's OLLAMA_NUM_PARALLEL)
+            model_batch_size: With LLM/hybrid validation, generate this many
+                segments with the generator model, then validate them
+                together with the validator model (0 = validate each
+                segment right away)
+            draft_model: Small model that drafts segments first; drafts
+                failing the rule-based checks are regenerated with the
+                primary model (None = primary model only)
+            draft_quality_threshold: Quality-issue rate tolerated in
+                accepted drafts
+            segment_candidates: Candidates generated in parallel per
+                segment type ('story' for story gossip), first valid one
+                wins (default: project_config.SEGMENT_CANDIDATES)
+            time_budget: Wall-clock seconds the run may take; validation,
+                output length and time checks are degraded as needed to
+                stay within it (see budget_scheduler; None = no budget)
+            generator: Shared ScriptGenerator (retrieval, embedding model,
+                Ollama pool) when several DJs run in one process; built
+                from templates_dir/chroma_db_dir/draft_model if None
         """
+        init_start = datetime.now()
         self.dj_name = dj_name
+        self.stream_abort = stream_abort
+        self.max_parallel_segments = max(1, max_parallel_segments)
+        self.segment_candidates = dict(
+            getattr(project_config, 'SEGMENT_CANDIDATES', {}) if segment_candidates is None else segment_candidates
+        )
+        self.runtime: Optional[BroadcastRuntime] = None  # Created by the first pipelined sequence
         self.enable_validation = enable_validation
         self.validation_mode = validation_mode
         self.enable_story_system = enable_story_system
@@ -141,11 +228,14 @@ class BroadcastEngine:
         if CHECKPOINT_AVAILABLE:
             self.checkpoint_manager = CheckpointManager(checkpoint_dir=checkpoint_dir)
         
-        # Initialize script generator
-        self.generator = ScriptGenerator(
+        # Initialize script generator (or share one across DJs)
+        self.generator = generator or ScriptGenerator(
             templates_dir=templates_dir,
-            chroma_db_dir=chroma_db_dir
+            chroma_db_dir=chroma_db_dir,
+            draft_model=draft_model,
+            draft_quality_threshold=draft_quality_threshold
         )
+        self.draft_model = draft_model
         
         # Initialize session components
         self.session_memory = SessionMemory(
@@ -169,7 +259,9 @@ class BroadcastEngine:
                 self.validator = ConsistencyValidator(personality)
             elif validation_mode == 'llm' and LLM_VALIDATION_AVAILABLE:
                 try:
-                    llm_config = llm_validation_config or {}
+                    llm_config = dict(llm_validation_config or {})
+                    # Share the generator's pooled Ollama connections
+                    llm_config.setdefault('ollama_client', self.generator.ollama)
                     self.validator = LLMValidator(**llm_config)
                 except ConnectionError:
                     print("⚠️  Ollama unavailable, falling back to rules-based validation")
@@ -177,12 +269,13 @@ class BroadcastEngine:
                     self.validation_mode = 'rules'
             elif validation_mode == 'hybrid' and LLM_VALIDATION_AVAILABLE:
                 try:
-                    llm_config = llm_validation_config or {}
+                    llm_config = dict(llm_validation_config or {})
                     # Extract HybridValidator-specific params
                     use_llm = llm_config.pop('use_llm', True)
                     use_rules = llm_config.pop('use_rules', True)
-                    # Remaining params go to LLMValidator
-                    llm_validator = LLMValidator(**llm_config) if llm_config else None
+                    # Remaining params go to LLMValidator (sharing the generator's Ollama pool)
+                    llm_config.setdefault('ollama_client', self.generator.ollama)
+                    llm_validator = LLMValidator(**llm_config)
                     self.validator = HybridValidator(
                         llm_validator=llm_validator,
                         use_llm=use_llm,
@@ -199,6 +292,28 @@ class BroadcastEngine:
                     self.validation_mode = 'rules'
                 self.validator = ConsistencyValidator(personality)
         
+        # Model lifecycle: generator and LLM validator models share the GPU.
+        # Swaps are only forced for model-batched windows; otherwise Ollama
+        # keeps both models resident when VRAM allows
+        self.generator_model = project_config.LLM_MODEL
+        self.model_batch_size = max(0, model_batch_size)
+        self.model_lifecycle: Optional[ModelLifecycleManager] = None
+        if self.model_batch_size > 0 and self._validator_model():
+            self.model_lifecycle = ModelLifecycleManager(
+                self.generator.ollama,
+                keep_alive=getattr(project_config, 'OLLAMA_KEEP_ALIVE', None)
+            )
+        
+        # Parallel candidates need a per-segment validator to pick a winner
+        # Races check candidates in worker threads: guards counters, the
+        # rules validator and the quality gate (never held across an LLM call)
+        self._state_lock = threading.Lock()
+        if any(count > 1 for count in self.segment_candidates.values()):
+            if not self.enable_validation:
+                print("⚠️  Segment candidates ignored: validation is disabled")
+            elif self.model_lifecycle:
+                print("⚠️  Segment candidates ignored: model batching defers LLM validation to each window")
+        
         # Initialize gossip tracker
         self.gossip_tracker = GossipTracker()
         
@@ -216,13 +331,18 @@ class BroadcastEngine:
         if VARIETY_MANAGER_AVAILABLE:
             self.variety_manager = VarietyManager()
         
+        # Weather calendar and story pools are loaded/generated on first use
+        # (or by warmup()), so short runs and resumes start quickly
+        self._startup_lock = threading.Lock()
+        self._weather_calendar_ready = False
+        self._story_pools_ready = False
+        
         # Weather simulation system (Phase 2 integration)
         self.weather_simulator: Optional[WeatherSimulator] = None
         self.region: Optional[Region] = None
         if WEATHER_SYSTEM_AVAILABLE:
             self.region = get_region_from_dj_name(dj_name)
             self.weather_simulator = WeatherSimulator()
-            self._initialize_weather_calendar()
         
         # Story system (Phase 7 integration)
         self.story_scheduler: Optional[StoryScheduler] = None
@@ -233,15 +353,42 @@ class BroadcastEngine:
             self.story_state = StoryState(persistence_path=story_state_path)
             self.story_scheduler = StoryScheduler(story_state=self.story_state)
             self.story_weaver = StoryWeaver(story_state=self.story_state)
-            
-            # Seed story pools if they're empty
-            self._seed_story_pools_if_empty()
+        
+        # Predictive RAG prefetch
+        self.rag_prefetch_hours = rag_prefetch_hours
+        self.rag_prefetcher: Optional[RAGPrefetcher] = None
+        if RAG_PREFETCH_AVAILABLE and rag_prefetch_hours > 0:
+            self.rag_prefetcher = RAGPrefetcher(
+                rag_cache=self.generator.rag_cache,
+                dj_context=self.generator.build_dj_context(dj_name),
+                scheduler=self.scheduler,
+                query_builder=self._build_context_query,
+                topic_resolver=self.generator._get_topic_for_content_type,
+                weather_lookup=self._get_current_weather_from_simulator,
+                num_chunks=self.generator.get_retrieval_size()
+            )
         
         # Broadcast metrics
         self.broadcast_start = datetime.now()
         self.segments_generated = 0
         self.validation_failures = 0
+        self.stream_aborts = 0
+        self.candidate_stats = _new_candidate_stats()
+        self.latency = LatencyRecorder()
         self.total_generation_time = 0.0
+        self.startup_time = (datetime.now() - init_start).total_seconds()
+        self.warmup_time: Optional[float] = None
+        
+        # Wall-clock budget (the clock starts now, warmup included)
+        self.budget: Optional[BudgetScheduler] = None
+        self._budget_rules_validator: Optional[ConsistencyValidator] = None  # Created when the budget drops LLM validation
+        if time_budget:
+            in_flight = 1
+            if self.max_parallel_segments > 1:
+                in_flight = self.max_parallel_segments + getattr(project_config, 'RUNTIME_LOOKAHEAD', 1)
+            self.budget = BudgetScheduler(time_budget, concurrency=in_flight)
+            if not (enable_validation and self._uses_llm_validator()):
+                self.budget.skip_step('rules_validation')
         
         # Print initialization summary
         print(f"\n🎙️  BroadcastEngine initialized for {dj_name}")
@@ -268,13 +415,61 @@ class BroadcastEngine:
             print(f"   Checkpointing: enabled (interval: {checkpoint_interval}h)")
         else:
             print(f"   Checkpointing: disabled")
+        if self.rag_prefetcher:
+            print(f"   RAG Prefetch: enabled ({rag_prefetch_hours}h look-ahead)")
+        if stream_abort:
+            print("   Stream Abort: enabled")
+        if self.max_parallel_segments > 1:
+            print(f"   Pipelined Generation: enabled ({self.max_parallel_segments} in flight)")
+        if self.model_lifecycle and self.model_batch_size > 0:
+            print(f"   Model Batching: enabled ({self.model_batch_size} segments per validation window)")
+        if self.budget:
+            print(f"   Time Budget: {time_budget / 3600:.1f}h (degrades: {', '.join(self.budget.ladder)})")
+        print(f"   Startup: {self.startup_time:.2f}s (ChromaDB, weather calendar and story pools load on first use)")
+    
+    def warmup(self) -> float:
+        """
+        Load everything that is otherwise initialized on first use.
+        
+        Opens ChromaDB and the embedding model, loads or generates the
+        weather calendar and seeds the story pools. Call before long runs so
+        the first segment is not slower than the rest.
+        
+        Returns:
+            Seconds spent warming up
+        """
+        start = datetime.now()
+        self.generator.warmup()
+        self._ensure_weather_calendar()
+        self._ensure_story_pools()
+        self.warmup_time = (datetime.now() - start).total_seconds()
+        print(f"🔥 Warmup complete in {self.warmup_time:.1f}s")
+        return self.warmup_time
+    
+    def _ensure_weather_calendar(self) -> None:
+        """Load or generate the weather calendar on first use"""
+        if self._weather_calendar_ready:
+            return
+        with self._startup_lock:
+            if not self._weather_calendar_ready:
+                self._initialize_weather_calendar()
+                self._weather_calendar_ready = True
+    
+    def _ensure_story_pools(self) -> None:
+        """Seed empty story pools on first use"""
+        if self._story_pools_ready:
+            return
+        with self._startup_lock:
+            if not self._story_pools_ready:
+                self._seed_story_pools_if_empty()
+                self._story_pools_ready = True
     
     def _initialize_weather_calendar(self) -> None:
         """
         Initialize or load weather calendar for DJ's region.
         
-        Called during broadcast engine initialization if weather system is available.
-        Checks if calendar exists in WorldState, generates if missing.
+        Called on first weather lookup (or by warmup()) if the weather system
+        is available. Checks if calendar exists in WorldState, generates if missing.
         """
         if not self.weather_simulator or not self.region:
             return
@@ -342,7 +537,10 @@ class BroadcastEngine:
         print("[Story System] Seeding story pools from ChromaDB...")
         
         # Create extractor with ChromaDB collection
-        extractor = StoryExtractor(chroma_collection=self.generator.rag.collection)
+        extractor = StoryExtractor(
+            chroma_collection=self.generator.rag.collection,
+            ollama_client=self.generator.ollama
+        )
         
         # Extract stories for each timeline (without timeline filter initially to see what we get)
         print("[Story System] DEBUG: Extracting stories without timeline filter...")
@@ -384,6 +582,7 @@ class BroadcastEngine:
         """
         if not self.weather_simulator or not self.region:
             return None
+        self._ensure_weather_calendar()
         
         # Check for manual override first
         region_name = self.region.value
@@ -566,6 +765,8 @@ class BroadcastEngine:
         # Emergency alerts need shelter/safety context
         context_query = f"{self.region.value} shelter locations emergency procedures safety {weather_state.weather_type}"
         
+        if self.model_lifecycle:
+            self.model_lifecycle.activate(self.generator_model)
         result = self.generator.generate_script(
             script_type='emergency_weather',
             dj_name=self.dj_name,
@@ -573,6 +774,7 @@ class BroadcastEngine:
             temperature=0.6,  # More focused for emergencies
             enable_validation_retry=self.enable_validation,
             enable_consistency_validation=self.enable_validation,
+            stream_abort=self.stream_abort,
             # Pass emergency-specific vars as **kwargs
             hour=current_hour,
             time_of_day=time_of_day.name.lower(),
@@ -662,6 +864,9 @@ class BroadcastEngine:
         self.broadcast_start = datetime.now()
         self.segments_generated = 0
         self.validation_failures = 0
+        self.stream_aborts = 0
+        self.candidate_stats = _new_candidate_stats()
+        self.latency = LatencyRecorder()
         self.total_generation_time = 0.0
         
         # Reset scheduler
@@ -696,110 +901,199 @@ class BroadcastEngine:
         Returns:
             Generated segment result with metadata (or skip metadata if all retries failed)
         """
-        if not RETRY_MANAGER_AVAILABLE or not self.enable_validation:
-            # Fallback: no retry logic if retry_manager not available or validation disabled
-            return self._generate_segment_once(current_hour, force_type, **kwargs)
+        try:
+            if not RETRY_MANAGER_AVAILABLE or not self.enable_validation:
+                # Fallback: no retry logic if retry_manager not available or validation disabled
+                return self._generate_segment_once(current_hour, force_type, **kwargs)
+            
+            return self._generate_with_retries(current_hour, force_type, **kwargs)
+        except CircuitOpenError as e:
+            return self._llm_unavailable_segment(current_hour, force_type, e)
+    
+    def _generate_with_retries(self,
+                               current_hour: int,
+                               force_type: Optional[str] = None,
+                               first_attempt: Optional[Dict[str, Any]] = None,
+                               **kwargs) -> Dict[str, Any]:
+        """
+        Phase 1C retry loop around _generate_segment_once().
         
+        Args:
+            current_hour: Current hour (0-23)
+            force_type: Force specific segment type (optional)
+            first_attempt: Already generated result to use as attempt #1
+                (pipelined mode); later attempts are generated here
+            **kwargs: Additional template variables
+        
+        Returns:
+            Generated segment result (or skip metadata if all retries failed)
+        """
         # Initialize retry manager for this segment
         retry_manager = RetryManager()
         attempt = 1
-        story_fallback_triggered = False  # Track if we've removed story_context
         
         while attempt <= MAX_RETRIES:
             print(f"\n🔄 Generation attempt #{attempt}/{MAX_RETRIES} (Hour: {current_hour})")
             
-            # FALLBACK: On 3rd attempt, if previous attempts had story incorporation failures,
-            # force removal of story context by setting force_type to 'gossip' (non-story)
-            segment_kwargs = kwargs.copy()
-            if attempt == 3 and not story_fallback_triggered:
-                # Check if previous attempts failed story incorporation
-                prev_errors = retry_manager.get_last_errors()
-                has_story_failure = any('story incorporation' in str(err).lower() for err in prev_errors)
-                
-                if has_story_failure and not force_type:
-                    print("⚠️  STORY FALLBACK: Forcing generic gossip (no story context)")
-                    story_fallback_triggered = True
-                    # Force gossip type to prevent story selection
-                    force_type = 'gossip'
+            force_type = self._story_fallback_type(retry_manager, attempt, force_type)
             
             # Generate segment
-            result = self._generate_segment_once(
-                current_hour, 
-                force_type, 
-                retry_manager=retry_manager,
-                attempt_number=attempt,
-                **segment_kwargs
-            )
-            
-            # Check if validation passed
-            validation_result = result.get('metadata', {}).get('validation')
-            is_valid = True
+            if attempt == 1 and first_attempt is not None:
+                result = first_attempt
+            else:
+                result = self._generate_segment_once(
+                    current_hour, 
+                    force_type, 
+                    retry_manager=retry_manager,
+                    attempt_number=attempt,
+                    **kwargs.copy()
+                )
             
-            if validation_result:
-                is_valid = validation_result.get('is_valid', True)
+            final = self._finish_attempt(retry_manager, attempt, result, current_hour)
+            if final is not None:
+                return final
             
-            # Extract validation errors (ensure all are strings)
-            validation_errors = []
-            if not is_valid and validation_result:
-                # Get errors from validation result
-                if 'violations' in validation_result:
-                    # Violations can be dicts or strings - extract messages
-                    for v in validation_result['violations']:
-                        if isinstance(v, dict):
-                            validation_errors.append(v.get('message', str(v)))
-                        else:
-                            validation_errors.append(str(v))
-                elif 'issues' in validation_result:
-                    # LLM validator format
-                    validation_errors = [
-                        issue['message'] for issue in validation_result['issues']
-                        if issue.get('severity') in ['critical', 'error']
-                    ]
+            attempt += 1
+        
+        # Should never reach here, but safety fallback
+        return self._generate_segment_once(current_hour, force_type, **kwargs)
+    
+    def _story_fallback_type(self,
+                             retry_manager: RetryManager,
+                             attempt: int,
+                             force_type: Optional[str]) -> Optional[str]:
+        """
+        Segment type for this attempt.
+        
+        FALLBACK: On 3rd attempt, if previous attempts had story incorporation
+        failures, force removal of story context by setting force_type to
+        'gossip' (non-story).
+        """
+        if attempt == 3 and not force_type:
+            # Check if previous attempts failed story incorporation
+            prev_errors = retry_manager.get_last_errors()
+            has_story_failure = any('story incorporation' in str(err).lower() for err in prev_errors)
             
-            # Record attempt
-            retry_manager.record_attempt(
-                attempt_number=attempt,
-                success=is_valid,
-                errors=validation_errors,
-                segment_data=result if is_valid else None
+            if has_story_failure:
+                print("⚠️  STORY FALLBACK: Forcing generic gossip (no story context)")
+                # Force gossip type to prevent story selection
+                return 'gossip'
+        return force_type
+    
+    def _finish_attempt(self,
+                        retry_manager: RetryManager,
+                        attempt: int,
+                        result: Dict[str, Any],
+                        current_hour: int) -> Optional[Dict[str, Any]]:
+        """
+        Record a generation attempt and decide what happens next.
+        
+        Returns:
+            The final segment (valid, or skip metadata once retries are
+            exhausted), or None if the segment should be retried
+        """
+        # Check if validation passed
+        validation_result = result.get('metadata', {}).get('validation')
+        is_valid = True
+        
+        if validation_result:
+            is_valid = validation_result.get('is_valid', True)
+        
+        # Extract validation errors (ensure all are strings)
+        validation_errors = []
+        if not is_valid and validation_result:
+            # Get errors from validation result
+            if 'violations' in validation_result:
+                # Violations can be dicts or strings - extract messages
+                for v in validation_result['violations']:
+                    if isinstance(v, dict):
+                        validation_errors.append(v.get('message', str(v)))
+                    else:
+                        validation_errors.append(str(v))
+            elif 'issues' in validation_result:
+                # LLM validator format
+                validation_errors = [
+                    issue['message'] for issue in validation_result['issues']
+                    if issue.get('severity') in ['critical', 'error']
+                ]
+        
+        # Record attempt
+        retry_manager.record_attempt(
+            attempt_number=attempt,
+            success=is_valid,
+            errors=validation_errors,
+            segment_data=result if is_valid else None
+        )
+        
+        if is_valid:
+            # Success! Add retry metadata and return
+            result['metadata']['retry'] = retry_manager.get_retry_metadata()
+            if attempt > 1:
+                print(f"✅ Validation passed on retry attempt #{attempt}")
+            return result
+        
+        # Validation failed
+        print(f"❌ Validation failed (attempt #{attempt})")
+        for error in validation_errors[:3]:  # Show first 3 errors
+            print(f"   - {error}")
+        
+        # Check if should retry (per-segment limit, then the shared retry budget)
+        skip_reason = None
+        if not retry_manager.should_retry(attempt):
+            # Max retries exceeded - skip this segment
+            print(f"⚠️  Max retries ({MAX_RETRIES}) exceeded. Skipping segment.")
+            skip_reason = "max_retries_exceeded"
+        elif not self._llm_retry_allowed():
+            print("⚠️  Retry budget exhausted or Ollama failing. Skipping segment.")
+            skip_reason = "retry_budget_exhausted"
+        
+        if skip_reason:
+            skip_metadata = create_skip_segment_metadata(
+                segment_type=result.get('segment_type', 'unknown'),
+                hour=current_hour,
+                retry_manager=retry_manager,
+                reason=skip_reason
             )
             
-            if is_valid:
-                # Success! Add retry metadata and return
-                result['metadata']['retry'] = retry_manager.get_retry_metadata()
-                if attempt > 1:
-                    print(f"✅ Validation passed on retry attempt #{attempt}")
-                return result
-            
-            # Validation failed
-            print(f"❌ Validation failed (attempt #{attempt})")
-            for error in validation_errors[:3]:  # Show first 3 errors
-                print(f"   - {error}")
-            
-            # Check if should retry
-            if not retry_manager.should_retry(attempt):
-                # Max retries exceeded - skip this segment
-                print(f"⚠️  Max retries ({MAX_RETRIES}) exceeded. Skipping segment.")
-                
-                skip_metadata = create_skip_segment_metadata(
-                    segment_type=result.get('segment_type', 'unknown'),
-                    hour=current_hour,
-                    retry_manager=retry_manager
-                )
-                
-                # Note: segments_generated already incremented by each _generate_segment_once call
-                # Don't increment again here
-                
-                return {
-                    'segment_type': result.get('segment_type', 'unknown'),
-                    'script': '',  # Empty script for skipped segment
-                    'metadata': skip_metadata
-                }
+            # Note: segments_generated already incremented by each _generate_segment_once call
+            # Don't increment again here
             
-            attempt += 1
+            return {
+                'segment_type': result.get('segment_type', 'unknown'),
+                'script': '',  # Empty script for skipped segment
+                'metadata': skip_metadata
+            }
         
-        # Should never reach here, but safety fallback
-        return self._generate_segment_once(current_hour, force_type, **kwargs)
+        return None
+    
+    def _llm_retry_allowed(self) -> bool:
+        """Ask the shared Ollama governor for a retry (always allowed without one)"""
+        governor = get_governor(getattr(self.generator, 'ollama', None))
+        return governor is None or governor.allow_retry()
+    
+    def _governor_statistics(self) -> Optional[Dict[str, Any]]:
+        """Shared Ollama governor statistics (None without a governor)"""
+        governor = get_governor(getattr(self.generator, 'ollama', None))
+        return governor.get_statistics() if governor else None
+    
+    def _llm_unavailable_segment(self,
+                                 current_hour: int,
+                                 segment_type: Optional[str],
+                                 error: Exception) -> Dict[str, Any]:
+        """Skipped segment while the Ollama circuit breaker is open"""
+        print(f"⛔ Skipping segment (hour {current_hour}): {error}")
+        return {
+            'segment_type': segment_type or 'unknown',
+            'script': '',
+            'metadata': {
+                'status': 'skipped',
+                'reason': 'llm_unavailable',
+                'segment_type': segment_type or 'unknown',
+                'hour': current_hour,
+                'error': str(error),
+                'timestamp': datetime.now().isoformat()
+            }
+        }
     
     def _generate_segment_once(self,
                               current_hour: int,
@@ -823,33 +1117,238 @@ class BroadcastEngine:
         Returns:
             Generated segment result with metadata
         """
+        job = self._prepare_segment(
+            current_hour,
+            force_type,
+            retry_manager=retry_manager,
+            attempt_number=attempt_number,
+            **kwargs
+        )
+        if 'segment_result' in job:
+            return job['segment_result']
+        return self._commit_generated(job, self._generate_job(job))
+    
+    def _generate_job(self, job: Dict[str, Any], max_candidates: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Generate phase of a prepared job: one generation, or a candidate
+        race when segment_candidates asks for several.
+        
+        Thread-safe (the runtime runs it in worker threads); pass the
+        outcome to _commit_generated() on the broadcast thread.
+        
+        Args:
+            job: Job from _prepare_segment()
+            max_candidates: LLM slots held for the job; caps the race
+                (None = no cap)
+        
+        Returns:
+            Result from _generate_prepared() or race from _race_candidates()
+        """
+        candidates = self._candidate_count(job)
+        if max_candidates is not None:
+            candidates = min(candidates, max(1, max_candidates))
+        if candidates > 1:
+            return self._race_candidates(job, candidates)
+        return self._generate_prepared(job)
+    
+    def _commit_generated(self,
+                          job: Dict[str, Any],
+                          generated: Dict[str, Any],
+                          defer_llm_validation: bool = False) -> Dict[str, Any]:
+        """Commit the outcome of _generate_job() (see _commit_segment())"""
+        if generated.get('race'):
+            return self._commit_race(generated)
+        return self._commit_segment(job, generated, defer_llm_validation)
+    
+    def _candidate_count(self, job: Dict[str, Any]) -> int:
+        """Parallel candidates for a prepared job (1 = single generation)"""
+        counts = self.segment_candidates
+        if not counts or not self.enable_validation:
+            return 1  # Nothing picks a winner
+        if self.model_lifecycle and self.model_batch_size > 0:
+            return 1  # LLM validation is deferred to the end of the model window
+        if self._degraded(job, 'templated_time_check'):
+            return 1
+        key = 'story' if job.get('story_context') else job['segment_type']
+        return max(1, int(counts.get(key, counts.get(job['segment_type'], 1))))
+    
+    def _race_candidates(self, job: Dict[str, Any], count: int) -> Dict[str, Any]:
+        """
+        Generate count candidates for one job in parallel; keep the first valid one.
+        
+        Candidates differ in temperature (project_config.CANDIDATE_TEMPERATURES)
+        and seed. Each is validated as soon as it finishes; once one passes,
+        the others are cancelled (streamed generations stop at the next
+        fragment). If none passes, the last one checked is kept, and once
+        committed the Phase 1C retry loop takes over, as for a single failed
+        generation. Nothing is recorded in engine state until _commit_race().
+        
+        Args:
+            job: Job from _prepare_segment()
+            count: Number of candidates
+        
+        Returns:
+            Race dict: winning (or last checked) candidate job, its result
+            and checks, and the race summary for metadata['candidates']
+        """
+        temperatures = getattr(project_config, 'CANDIDATE_TEMPERATURES', (0.8,))
+        seed_base = int(job['start_time'].timestamp() * 1000) % 1_000_000
+        cancel = threading.Event()
+        stats = self.candidate_stats
+        with self._state_lock:
+            stats['races'] += 1
+            stats['launched'] += count
+        print(f"🏁 Racing {count} candidates ({job['segment_type']}, hour {job['hour']})")
+        
+        start = time.perf_counter()
+        checked = 0
+        failed = 0
+        winner = None
+        last = None
+        error: Optional[Exception] = None
+        pool = ThreadPoolExecutor(max_workers=count, thread_name_prefix="candidate")
+        try:
+            futures = {}
+            for index in range(count):
+                candidate = dict(job, generation_options={
+                    **job.get('generation_options', {}),
+                    'temperature': temperatures[index % len(temperatures)],
+                    'seed': seed_base + index,
+                    'cancel_event': cancel
+                })
+                future = pool.submit(contextvars.copy_context().run, self._generate_prepared, candidate)
+                futures[future] = (index, candidate)
+            
+            for future in as_completed(futures):
+                index, candidate = futures[future]
+                try:
+                    result = future.result()
+                except GenerationCancelled:
+                    continue
+                except CircuitOpenError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Candidate {index + 1}/{count} failed: {e}")
+                    failed += 1
+                    error = e
+                    continue
+                
+                checked += 1
+                with use_trace(candidate.get('trace')):
+                    checks = self._check_result(candidate, result)
+                if self._passed_checks(result, checks):
+                    winner = (index, candidate, result, checks)
+                    break
+                last = (index, candidate, result, checks)
+        finally:
+            cancel.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+        
+        with self._state_lock:
+            stats['checked'] += checked
+            stats['cancelled'] += count - checked - failed  # Still running when a candidate won
+            stats['won'] += 1 if winner else 0
+        if winner is None and last is None:
+            raise error or RuntimeError("All candidates failed")
+        
+        index, candidate, result, checks = winner or last
+        seconds = time.perf_counter() - start
+        if winner:
+            print(f"🏆 Candidate {index + 1}/{count} won after {seconds:.1f}s ({checked} checked)")
+        return {
+            'race': True,
+            'job': candidate,
+            'result': result,
+            'checks': checks,
+            'summary': {
+                'launched': count,
+                'checked': checked,
+                'winner': index if winner else None,
+                'temperature': candidate['generation_options']['temperature'],
+                'seconds': seconds
+            }
+        }
+    
+    def _commit_race(self, race: Dict[str, Any]) -> Dict[str, Any]:
+        """Commit the kept candidate of _race_candidates() (see _commit_segment())"""
+        segment = self._commit_segment(race['job'], race['result'], checks=race['checks'])
+        segment['metadata']['candidates'] = race['summary']
+        return segment
+    
+    def _prepare_segment(self,
+                         current_hour: int,
+                         force_type: Optional[str] = None,
+                         retry_manager: Optional[RetryManager] = None,
+                         attempt_number: int = 1,
+                         reserve: bool = False,
+                         plan: Optional[SegmentPlan] = None,
+                         **kwargs) -> Dict[str, Any]:
+        """
+        Prepare phase: pick the segment and build its template variables.
+        
+        Reads (and advances) engine state - emergency weather, story beats,
+        scheduler, session context, variety hints - so it must run on the
+        broadcast thread, in segment order.
+        
+        Args:
+            current_hour: Current hour (0-23)
+            force_type: Force specific segment type (optional)
+            retry_manager: Optional retry manager for error feedback
+            attempt_number: Current attempt number (for retry prompts)
+            reserve: Mark the required segment done right away, so segments
+                prepared before this one is committed pick the next one
+            plan: Precompiled plan (plan_broadcast()); its segment type,
+                template vars and RAG query are used as-is unless
+                force_type asks for another type
+            **kwargs: Additional template variables
+        
+        Returns:
+            Job dict for _generate_prepared()/_commit_segment(), or a dict
+            with only 'segment_result' when an emergency alert was generated
+        """
         start_time = datetime.now()
+        trace = SegmentTrace(hour=current_hour, attempt=attempt_number)
+        if plan is not None and force_type not in (None, plan.segment_type.value):
+            plan = None  # Forced to another type (story fallback)
         
         # Phase 4: Check for emergency weather first (highest priority)
         if not force_type and self.weather_simulator and self.region:
             emergency_weather = self.check_for_emergency_weather(current_hour)
             if emergency_weather:
                 print(f"⚠️  EMERGENCY WEATHER DETECTED: {emergency_weather.weather_type}")
-                return self.generate_emergency_weather_alert(current_hour, emergency_weather)
+                return {
+                    'hour': current_hour,
+                    'segment_result': self.generate_emergency_weather_alert(current_hour, emergency_weather)
+                }
         
         # Phase 7: Get story beats for this broadcast
         story_beats = []
         story_context = ""
         has_story_available = False
         if self.story_scheduler and self.story_weaver:
-            story_beats = self.story_scheduler.get_story_beats_for_broadcast()
-            if story_beats:
-                woven_result = self.story_weaver.weave_beats(story_beats)
-                # Always extract the string from the dict, never pass the dict itself
-                story_context = woven_result.get('context_for_llm', '')
-                # Ensure it's actually a string
-                if not isinstance(story_context, str):
-                    story_context = str(story_context) if story_context else ""
-                has_story_available = True
-                print(f"📖 Story beats: {self.story_weaver.get_story_summary(story_beats)}")
+            with use_trace(trace), span('story.schedule') as story_span:
+                self._ensure_story_pools()
+                story_beats = self.story_scheduler.get_story_beats_for_broadcast()
+                if story_beats:
+                    woven_result = self.story_weaver.weave_beats(story_beats)
+                    # Always extract the string from the dict, never pass the dict itself
+                    story_context = woven_result.get('context_for_llm', '')
+                    # Ensure it's actually a string
+                    if not isinstance(story_context, str):
+                        story_context = str(story_context) if story_context else ""
+                    has_story_available = True
+                    print(f"📖 Story beats: {self.story_weaver.get_story_summary(story_beats)}")
+                story_span['beats'] = len(story_beats)
         
         # Determine segment type
-        if force_type:
+        if plan is not None:
+            segment_type = plan.segment_type.value
+            print(f"📋 Planned {segment_type} for hour {current_hour}")
+            # Story beats are only incorporated into gossip segments
+            if segment_type != 'gossip' and story_context:
+                story_context = ""
+                has_story_available = False
+        elif force_type:
             segment_type = force_type
         else:
             # Check for required time-based segments first (time check, news, weather)
@@ -873,38 +1372,26 @@ class BroadcastEngine:
 
         # Map scheduler alias to generator template name
         # Story segments use 'gossip' template but with story_context enrichment
-        generator_script_type = 'time' if segment_type == 'time_check' else segment_type
-        if segment_type == 'story':
-            generator_script_type = 'gossip'  # Use gossip template for stories
+        generator_script_type = script_type_for(segment_type)
         
         print(f"\n🎬 Generating {segment_type} segment (Hour: {current_hour})")
         
-        # Get time of day from hour
-        def hour_to_time_of_day(hour: int):
-            from broadcast_scheduler import TimeOfDay
-            if 6 <= hour < 10:
-                return TimeOfDay.MORNING
-            elif 10 <= hour < 14:
-                return TimeOfDay.MIDDAY
-            elif 14 <= hour < 18:
-                return TimeOfDay.AFTERNOON
-            elif 18 <= hour < 22:
-                return TimeOfDay.EVENING
-            else:
-                return TimeOfDay.NIGHT
-        
         time_of_day = hour_to_time_of_day(current_hour)
         
-        # Build template variables based on type
-        template_vars = self._build_template_vars(
-            generator_script_type,
-            current_hour,
-            time_of_day,
-            **kwargs
-        )
-        
-        # Build context query
-        context_query = self._build_context_query(generator_script_type, template_vars)
+        if plan is not None:
+            template_vars = self._plan_template_vars(plan, **kwargs)
+            context_query = plan.rag_query
+        else:
+            # Build template variables based on type
+            template_vars = self._build_template_vars(
+                generator_script_type,
+                current_hour,
+                time_of_day,
+                **kwargs
+            )
+            
+            # Build context query
+            context_query = self._build_context_query(generator_script_type, template_vars)
         
         # Add session context to template vars
         session_context = self.session_memory.get_context_for_prompt()
@@ -939,21 +1426,140 @@ class BroadcastEngine:
                 template_vars['retry_feedback'] = retry_feedback
                 print(f"🔄 Adding validation error feedback to prompt ({len(last_errors)} errors)")
         
+        if reserve and segment_type in ['time_check', 'news', 'weather', 'gossip']:
+            self.scheduler.mark_segment_done(segment_type, current_hour)
+        
+        trace.attrs.update(label=f"{current_hour:02d}:00 {segment_type}", segment_type=segment_type)
+        trace.add('prepare', trace.start, time.perf_counter() - trace.start)
+        job = {
+            'hour': current_hour,
+            'segment_type': segment_type,
+            'generator_script_type': generator_script_type,
+            'time_of_day': time_of_day,
+            'template_vars': template_vars,
+            'context_query': context_query,
+            'story_beats': story_beats,
+            'story_context': story_context,
+            'attempt_number': attempt_number,
+            'start_time': start_time,
+            'plan': plan,
+            'trace': trace
+        }
+        self._apply_budget(job)
+        return job
+    
+    def _apply_budget(self, job: Dict[str, Any]) -> None:
+        """Apply the time budget's active degradation steps to a prepared job"""
+        budget = self.budget
+        if budget is None:
+            return
+        degradations = []
+        for step in budget.active_steps():
+            if step == 'rules_validation' and self.enable_validation and self._uses_llm_validator():
+                degradations.append({'step': step, 'from': self.validation_mode, 'to': 'rules'})
+            elif step == 'short_output':
+                num_predict = getattr(project_config, 'BUDGET_NUM_PREDICT', 180)
+                job['generation_options'] = dict(job.get('generation_options', {}), num_predict=num_predict)
+                degradations.append({'step': step, 'num_predict': num_predict})
+            elif step == 'templated_time_check' and job['generator_script_type'] == 'time':
+                degradations.append({'step': step})
+        if degradations:
+            job['degradations'] = degradations
+    
+    @staticmethod
+    def _degraded(job: Dict[str, Any], step: str) -> bool:
+        """True if a budget degradation step was applied to the job"""
+        return any(entry['step'] == step for entry in job.get('degradations', ()))
+    
+    def _templated_time_check(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Time check from the content_types.time_check templates (no LLM call)"""
+        template_dj = next((name for name in TIME_TEMPLATES if self.dj_name.startswith(name)), self.dj_name)
+        with use_trace(job.get('trace')), span('template', templated=True):
+            script = get_time_announcement(
+                template_dj, job['hour'], job['template_vars'].get('minute', 0), include_location=True
+            )
+        return {
+            'script': script,
+            'metadata': {
+                'script_type': job['generator_script_type'],
+                'dj_name': self.dj_name,
+                'templated': True
+            }
+        }
+    
+    def _generate_prepared(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generate phase: RAG query, prompt build and LLM call for a prepared job.
+        
+        Only touches the script generator, so jobs can run on worker threads.
+        """
+        if self._degraded(job, 'templated_time_check'):
+            return self._templated_time_check(job)
+        if self.model_lifecycle:
+            self.model_lifecycle.activate(self.generator_model)
+        
         # Generate script (avoid duplicate dj_name in template vars)
-        safe_template_vars = {k: v for k, v in template_vars.items() if k != 'dj_name'}
-        result = self.generator.generate_script(
-            script_type=generator_script_type,
-            dj_name=self.dj_name,
-            context_query=context_query,
-            enable_validation_retry=self.enable_validation,
-            enable_consistency_validation=self.enable_validation,
-            **safe_template_vars
-        )
+        safe_template_vars = {k: v for k, v in job['template_vars'].items() if k != 'dj_name'}
+        safe_template_vars.update(job.get('generation_options', {}))
+        with use_trace(job.get('trace')), span('generate'):
+            return self.generator.generate_script(
+                script_type=job['generator_script_type'],
+                dj_name=self.dj_name,
+                context_query=job['context_query'],
+                enable_validation_retry=self.enable_validation,
+                enable_consistency_validation=self.enable_validation,
+                stream_abort=self.stream_abort,
+                **safe_template_vars
+            )
+    
+    def _check_result(self,
+                      job: Dict[str, Any],
+                      result: Dict[str, Any],
+                      defer_llm_validation: bool = False) -> Dict[str, Any]:
+        """
+        Validate a generated script (validation, quality gate, story incorporation).
+        
+        Does not record the script in engine state, so several candidates for
+        one job can be checked before one of them is committed.
+        
+        Args:
+            job: Job from _prepare_segment()
+            result: Result from _generate_prepared()
+            defer_llm_validation: See _commit_segment()
+        
+        Returns:
+            Dictionary with 'validation' (None if not validated),
+            'story_incorporation_score' and 'story_context'
+        """
+        current_hour = job['hour']
+        segment_type = job['segment_type']
+        template_vars = job['template_vars']
+        story_beats = job['story_beats']
+        story_context = job['story_context']
+        attempt_number = job['attempt_number']
         
         # Validate if enabled
         validation_result = None
         quality_gate_decision = None
-        if self.enable_validation and self.validator and result.get('script'):
+        stream_aborts = result.get('metadata', {}).get('stream_aborts', [])
+        with self._state_lock:
+            self.stream_aborts += len(stream_aborts)
+        if result.get('metadata', {}).get('stream_aborted'):
+            # Every attempt was cancelled mid-stream: the partial script is
+            # already known to be invalid, so skip the (LLM) validator
+            with self._state_lock:
+                self.validation_failures += 1
+            validation_result = {
+                'is_valid': False,
+                'violations': [
+                    {'message': abort['violation'], 'severity': 'critical', 'category': 'stream_abort'}
+                    for abort in stream_aborts[-1:]
+                ],
+                'mode': 'stream'
+            }
+            print(f"⚠️  Generation aborted mid-stream: {stream_aborts[-1]['violation']}")
+        elif (self.enable_validation and self.validator and result.get('script')
+              and not result.get('metadata', {}).get('templated')):
             # Build context for validation
             validation_context = self._build_validation_context(
                 template_vars=template_vars,
@@ -962,77 +1568,44 @@ class BroadcastEngine:
             )
             
             # Run validation (supports both old and new validators)
-            if isinstance(self.validator, (HybridValidator, LLMValidator)) if LLM_VALIDATION_AVAILABLE else False:
-                # New LLM validators return ValidationResult
-                from personality_loader import load_personality
-                personality = load_personality(self.dj_name)
-                val_result = self.validator.validate(
-                    script=result['script'],
-                    character_card=personality,
-                    context=validation_context
-                )
-                # Store full validation result including feedback
-                validation_result = {
-                    'is_valid': val_result.is_valid,
-                    'score': val_result.overall_score,
-                    'critical_count': len(val_result.get_critical_issues()),
-                    'warnings_count': len(val_result.get_warnings()),
-                    'suggestions_count': len(val_result.get_suggestions()),
-                    'mode': self.validation_mode,
-                    'feedback': val_result.llm_feedback,
-                    'issues': [
-                        {
-                            'severity': issue.severity.value,
-                            'category': issue.category,
-                            'message': issue.message,
-                            'suggestion': issue.suggestion,
-                            'confidence': issue.confidence
-                        }
-                        for issue in val_result.issues
-                    ]
-                }
-                is_valid = val_result.is_valid
-                
-                # Phase 2A: Run quality gate if available
-                if self.quality_gate and not is_valid:
-                    # Convert LLM validation issues to quality gate format
-                    violations = validation_result['issues']
-                    quality_gate_decision = self.quality_gate.evaluate(
-                        violations=violations,
-                        segment_metadata={'hour': current_hour, 'type': segment_type}
-                    )
-                    # Override is_valid based on quality gate
-                    is_valid = not self.quality_gate.should_abort(quality_gate_decision)
-                    validation_result['quality_gate'] = quality_gate_decision.value
-                    
+            if self._uses_llm_validator() and not self._degraded(job, 'rules_validation'):
+                if defer_llm_validation:
+                    # Validated together with the rest of the window
+                    job['deferred_validation'] = validation_context
+                    is_valid = True
+                else:
+                    with span('validate.llm', mode=self.validation_mode):
+                        validation_result, is_valid = self._run_llm_validation(
+                            result['script'], validation_context, current_hour, segment_type
+                        )
             else:
                 # Old ConsistencyValidator returns bool
                 # Pass story_context to validator if available
-                is_valid = self.validator.validate(result['script'], story_context=story_context)
-                violations = self.validator.get_violations() if hasattr(self.validator, 'get_violations') else []
-                validation_result = {
-                    'is_valid': is_valid,
-                    'violations': violations,
-                    'warnings': self.validator.get_warnings() if hasattr(self.validator, 'get_warnings') else [],
-                    'mode': 'rules'
-                }
-                
-                # Phase 2A: Run quality gate if available (rules-based validation)
-                if self.quality_gate and violations:
-                    quality_gate_decision = self.quality_gate.evaluate(
-                        violations=violations,
-                        segment_metadata={'hour': current_hour, 'type': segment_type}
-                    )
-                    # Override is_valid based on quality gate
-                    is_valid = not self.quality_gate.should_abort(quality_gate_decision)
-                    validation_result['quality_gate'] = quality_gate_decision.value
+                validator = self._rules_validator()
+                with self._state_lock:  # The validator keeps the last script's violations
+                    with span('validate.rules'):
+                        is_valid = validator.validate(result['script'], story_context=story_context)
+                    violations = validator.get_violations() if hasattr(validator, 'get_violations') else []
+                    validation_result = {
+                        'is_valid': is_valid,
+                        'violations': violations,
+                        'warnings': validator.get_warnings() if hasattr(validator, 'get_warnings') else [],
+                        'mode': 'rules'
+                    }
+                    
+                    # Phase 2A: Run quality gate if available (rules-based validation)
+                    if self.quality_gate and violations:
+                        with span('validate.quality_gate'):
+                            quality_gate_decision = self.quality_gate.evaluate(
+                                violations=violations,
+                                segment_metadata={'hour': current_hour, 'type': segment_type}
+                            )
+                        # Override is_valid based on quality gate
+                        is_valid = not self.quality_gate.should_abort(quality_gate_decision)
+                        validation_result['quality_gate'] = quality_gate_decision.value
             
             if not is_valid:
-                self.validation_failures += 1
-                issue_count = validation_result.get('critical_count', len(validation_result.get('violations', [])))
-                print(f"⚠️  Validation issues: {issue_count}")
-                if quality_gate_decision:
-                    print(f"🚦 Quality gate: {quality_gate_decision.value}")
+                self._report_validation_failure(validation_result)
         
         # Phase 7: Check story incorporation if story_context was provided
         story_incorporation_score = None
@@ -1050,11 +1623,12 @@ class BroadcastEngine:
             from consistency_validator import ConsistencyValidator
             
             # Create temporary validator to check story incorporation
-            temp_validator = ConsistencyValidator({"name": self.dj_name})
-            story_incorporation_score = temp_validator.get_story_incorporation_score(
-                result['script'], 
-                story_context
-            )
+            with span('validate.story'):
+                temp_validator = ConsistencyValidator({"name": self.dj_name})
+                story_incorporation_score = temp_validator.get_story_incorporation_score(
+                    result['script'], 
+                    story_context
+                )
             
             if story_incorporation_score < 0.5:
                 story_incorporation_failed = True
@@ -1096,6 +1670,55 @@ class BroadcastEngine:
                         # Just log success for now
                         logger.info(f"Story beat incorporated successfully: {beat.story_id} (Act {beat.act_number})")
         
+        return {
+            'validation': validation_result,
+            'story_incorporation_score': story_incorporation_score,
+            'story_context': story_context
+        }
+    
+    @staticmethod
+    def _passed_checks(result: Dict[str, Any], checks: Dict[str, Any]) -> bool:
+        """True if a checked result is usable (non-empty and not invalid)"""
+        validation_result = checks['validation']
+        return bool(result.get('script')) and (validation_result is None or validation_result.get('is_valid', True))
+    
+    def _commit_segment(self,
+                        job: Dict[str, Any],
+                        result: Dict[str, Any],
+                        defer_llm_validation: bool = False,
+                        checks: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Commit phase: validate a generated script and record it in engine state.
+        
+        Updates session memory, scheduler, gossip, variety and metrics, so
+        it must run on the broadcast thread, in segment order.
+        
+        Args:
+            job: Job from _prepare_segment()
+            result: Result from _generate_prepared()
+            defer_llm_validation: Only capture the LLM validation context
+                (job['deferred_validation']); _finish_deferred_validation()
+                runs the validator later
+            checks: Result of _check_result() if the script was already
+                validated (parallel candidates)
+        
+        Returns:
+            Generated segment result with metadata
+        """
+        current_hour = job['hour']
+        segment_type = job['segment_type']
+        time_of_day = job['time_of_day']
+        template_vars = job['template_vars']
+        start_time = job['start_time']
+        
+        trace = job.get('trace')
+        if checks is None:
+            with use_trace(trace):
+                checks = self._check_result(job, result, defer_llm_validation)
+        commit_start = time.perf_counter()
+        validation_result = checks['validation']
+        story_context = checks['story_context']
+        story_incorporation_score = checks['story_incorporation_score']
         # Update session memory (normalize segment type aliases)
         segment_type_recorded = 'time' if segment_type == 'time_check' else segment_type
         self.session_memory.add_script(
@@ -1171,10 +1794,141 @@ class BroadcastEngine:
         if story_incorporation_score is not None:
             segment_result['story_incorporation_score'] = story_incorporation_score
         
+        # Time budget: record degradations and re-plan with this attempt's cost
+        if job.get('degradations'):
+            segment_result['metadata']['degradations'] = job['degradations']
+        budget = self.budget
+        if budget is not None:
+            decision = budget.observe(
+                segment_type, generation_time, job['attempt_number'],
+                [entry['step'] for entry in job.get('degradations', ())]
+            )
+            if decision:
+                print(f"⏳ Budget: projected {decision['projected_seconds'] / 3600:.2f}h "
+                      f"vs {decision['budget_seconds'] / 3600:.2f}h budget - "
+                      f"{decision['action']} {decision['step']}")
+        
+        # Per-stage latency breakdown (see stage_timer)
+        if trace is not None:
+            trace.add('commit', commit_start, time.perf_counter() - commit_start)
+            trace.finish()
+            segment_result['metadata']['timings'] = trace.to_dict()
+            self.latency.add_trace(trace)
+        
         print(f"✅ Generated in {generation_time:.2f}s")
         
         return segment_result
     
+    def _rules_validator(self) -> ConsistencyValidator:
+        """Rule-based validator (a ConsistencyValidator when the budget drops LLM validation)"""
+        if not self._uses_llm_validator():
+            return self.validator
+        if self._budget_rules_validator is None:
+            from personality_loader import load_personality
+            self._budget_rules_validator = ConsistencyValidator(load_personality(self.dj_name))
+        return self._budget_rules_validator
+    
+    def _uses_llm_validator(self) -> bool:
+        """True if self.validator returns an LLM ValidationResult"""
+        return LLM_VALIDATION_AVAILABLE and isinstance(self.validator, (HybridValidator, LLMValidator))
+    
+    def _validator_model(self) -> Optional[str]:
+        """Ollama model used by the LLM validator (None = no LLM validation)"""
+        if not LLM_VALIDATION_AVAILABLE:
+            return None
+        if isinstance(self.validator, LLMValidator):
+            return self.validator.model
+        if isinstance(self.validator, HybridValidator) and self.validator.llm_validator:
+            return self.validator.llm_validator.model
+        return None
+    
+    def _run_llm_validation(self,
+                            script: str,
+                            validation_context: Dict[str, Any],
+                            current_hour: int,
+                            segment_type: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        Validate a script with the LLM/hybrid validator.
+        
+        Returns:
+            (validation_result dict, is_valid after the quality gate)
+        """
+        if self.model_lifecycle:
+            self.model_lifecycle.activate(self._validator_model())
+        
+        # New LLM validators return ValidationResult
+        from personality_loader import load_personality
+        personality = load_personality(self.dj_name)
+        val_result = self.validator.validate(
+            script=script,
+            character_card=personality,
+            context=validation_context
+        )
+        # Store full validation result including feedback
+        validation_result = {
+            'is_valid': val_result.is_valid,
+            'score': val_result.overall_score,
+            'critical_count': len(val_result.get_critical_issues()),
+            'warnings_count': len(val_result.get_warnings()),
+            'suggestions_count': len(val_result.get_suggestions()),
+            'mode': self.validation_mode,
+            'feedback': val_result.llm_feedback,
+            'issues': [
+                {
+                    'severity': issue.severity.value,
+                    'category': issue.category,
+                    'message': issue.message,
+                    'suggestion': issue.suggestion,
+                    'confidence': issue.confidence
+                }
+                for issue in val_result.issues
+            ]
+        }
+        is_valid = val_result.is_valid
+        
+        # Phase 2A: Run quality gate if available
+        if self.quality_gate and not is_valid:
+            # Convert LLM validation issues to quality gate format
+            violations = validation_result['issues']
+            with self._state_lock:
+                quality_gate_decision = self.quality_gate.evaluate(
+                    violations=violations,
+                    segment_metadata={'hour': current_hour, 'type': segment_type}
+                )
+                # Override is_valid based on quality gate
+                is_valid = not self.quality_gate.should_abort(quality_gate_decision)
+            validation_result['quality_gate'] = quality_gate_decision.value
+        
+        return validation_result, is_valid
+    
+    def _report_validation_failure(self, validation_result: Dict[str, Any]) -> None:
+        with self._state_lock:
+            self.validation_failures += 1
+        issue_count = validation_result.get('critical_count', len(validation_result.get('violations', [])))
+        print(f"⚠️  Validation issues: {issue_count}")
+        if validation_result.get('quality_gate'):
+            print(f"🚦 Quality gate: {validation_result['quality_gate']}")
+    
+    def _finish_deferred_validation(self, job: Dict[str, Any], segment: Dict[str, Any]) -> None:
+        """Run the LLM validation deferred by _commit_segment() and update the segment"""
+        validation_context = job.pop('deferred_validation', None)
+        if validation_context is None:
+            return
+        
+        with self.latency.span('validate.llm', mode=self.validation_mode, deferred=True):
+            validation_result, is_valid = self._run_llm_validation(
+                segment['script'], validation_context, job['hour'], job['segment_type']
+            )
+        # Keep a story incorporation failure recorded at commit time
+        story_result = segment['metadata'].get('validation')
+        if story_result:
+            validation_result['is_valid'] = False
+            validation_result.setdefault('violations', []).extend(story_result.get('violations', []))
+        segment['metadata']['validation'] = validation_result
+        
+        if not is_valid:
+            self._report_validation_failure(validation_result)
+    
     def _build_validation_context(self,
                                   template_vars: Dict[str, Any],
                                   segment_type: str,
@@ -1227,54 +1981,409 @@ class BroadcastEngine:
         
         return context
     
+    def plan_broadcast(self,
+                       start_hour: int,
+                       duration_hours: int,
+                       segments_per_hour: int = 2) -> List[SegmentPlan]:
+        """
+        Precompile a broadcast window (see broadcast_planner).
+
+        The plans follow this engine's schedule and simulated weather, and
+        can be passed to generate_broadcast_sequence(plans=...) or to
+        estimate_broadcast_cost().
+
+        Args:
+            start_hour: Starting hour (0-23)
+            duration_hours: Broadcast duration in hours
+            segments_per_hour: Segments to generate per hour
+
+        Returns:
+            SegmentPlans in broadcast order
+        """
+        weather_lookup = None
+        if self.weather_simulator and self.region:
+            weather_lookup = self._get_current_weather_from_simulator
+        planner = BroadcastPlanner(self.dj_name, live_scheduler=self.scheduler, weather_lookup=weather_lookup)
+        return planner.compile(start_hour, duration_hours, segments_per_hour)
+
+    def estimate_broadcast_cost(self,
+                                plans: List[SegmentPlan],
+                                cost_model: Optional[PlanCostModel] = None) -> Dict[str, Any]:
+        """
+        Estimate LLM calls, tokens and wall time for compiled plans.
+
+        Args:
+            plans: Plans from plan_broadcast()
+            cost_model: Cost assumptions (default: this engine's parallelism
+                and validation settings)
+
+        Returns:
+            Estimate dict (see broadcast_planner.estimate_cost())
+        """
+        if cost_model is None:
+            cost_model = PlanCostModel.for_settings(
+                llm_slots=self.max_parallel_segments,
+                enable_validation=self.enable_validation,
+                validation_mode=self.validation_mode
+            )
+        return estimate_cost(plans, cost_model)
+
     def generate_broadcast_sequence(self,
                                    start_hour: int,
                                    duration_hours: int,
-                                   segments_per_hour: int = 2) -> List[Dict[str, Any]]:
+                                   segments_per_hour: int = 2,
+                                   plans: Optional[List[SegmentPlan]] = None,
+                                   on_segment: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
         """
         Generate a complete broadcast sequence.
         
+        Synchronous wrapper around agenerate_broadcast_sequence().
+        Sequential generation runs on the calling thread, so Ctrl-C
+        interrupts it right away.
+        
+        Args:
+            start_hour: Starting hour (0-23)
+            duration_hours: Broadcast duration in hours
+            segments_per_hour: Segments to generate per hour
+            plans: Precompiled plans from plan_broadcast() to execute
+                (None = decide each segment as it is generated)
+            on_segment: Called with each final segment, in schedule order
+                (e.g. BroadcastWriter.write_segment); segments are then
+                not kept in memory
+        
+        Returns:
+            List of generated segments (empty with on_segment)
+        """
+        if self._uses_runtime():
+            return run_sync(self.agenerate_broadcast_sequence(
+                start_hour, duration_hours, segments_per_hour, plans, on_segment
+            ))
+        
+        slots, sink = self._begin_sequence(start_hour, duration_hours, segments_per_hour, plans, on_segment)
+        self._generate_sequence_sequential(slots, duration_hours, sink)
+        return self._finish_sequence(start_hour, duration_hours, sink)
+    
+    async def agenerate_broadcast_sequence(self,
+                                           start_hour: int,
+                                           duration_hours: int,
+                                           segments_per_hour: int = 2,
+                                           plans: Optional[List[SegmentPlan]] = None,
+                                           on_segment: Optional[Callable[[Dict[str, Any]], None]] = None
+                                           ) -> List[Dict[str, Any]]:
+        """
+        Generate a complete broadcast sequence (asyncio).
+        
+        Pipelined and model-batched sequences run on the BroadcastRuntime
+        task graph; sequential generation runs in a worker thread, so the
+        caller's event loop is never blocked. Cancelling the call stops the
+        worker after its current segment.
+        
         Args:
             start_hour: Starting hour (0-23)
             duration_hours: Broadcast duration in hours
             segments_per_hour: Segments to generate per hour
+            plans: Precompiled plans from plan_broadcast() to execute
+                (None = decide each segment as it is generated)
+            on_segment: Called with each final segment, in schedule order;
+                segments are then not kept in memory
         
         Returns:
-            List of generated segments
+            List of generated segments (empty with on_segment)
         """
+        slots, sink = self._begin_sequence(start_hour, duration_hours, segments_per_hour, plans, on_segment)
+        if self.model_lifecycle and self.model_batch_size > 0:
+            await self._generate_sequence_model_batched(slots, duration_hours, sink)
+        elif self.max_parallel_segments > 1:
+            await self._generate_sequence_pipelined(slots, duration_hours, sink)
+        else:
+            stop = threading.Event()
+            try:
+                await asyncio.to_thread(self._generate_sequence_sequential, slots, duration_hours, sink, stop)
+            except asyncio.CancelledError:
+                stop.set()  # The worker thread cannot be cancelled, only told to stop
+                raise
+        
+        return self._finish_sequence(start_hour, duration_hours, sink)
+    
+    def _uses_runtime(self) -> bool:
+        """True if sequences run on the BroadcastRuntime (pipelined or model-batched)"""
+        return bool(self.model_lifecycle and self.model_batch_size > 0) or self.max_parallel_segments > 1
+    
+    def _begin_sequence(self,
+                        start_hour: int,
+                        duration_hours: int,
+                        segments_per_hour: int,
+                        plans: Optional[List[SegmentPlan]],
+                        on_segment: Optional[Callable[[Dict[str, Any]], None]]
+                        ) -> Tuple[List[Tuple[int, int, int, Optional[SegmentPlan]]], '_SegmentSink']:
+        """Announce a sequence and lay out its slots"""
         print(f"\n📻 Generating {duration_hours}-hour broadcast sequence")
         print(f"   Start: {start_hour}:00")
         print(f"   Segments per hour: {segments_per_hour}")
+        if plans is not None:
+            print(f"   Precompiled plans: {len(plans)}")
+        
+        slots = self._sequence_slots(start_hour, duration_hours, segments_per_hour, plans)
+        if self.budget:
+            self.budget.add_segments(len(slots))
+        return slots, _SegmentSink(on_segment)
+    
+    def _finish_sequence(self, start_hour: int, duration_hours: int, sink: '_SegmentSink') -> List[Dict[str, Any]]:
+        """Final checkpoint and summary of a completed sequence"""
+        # Save final checkpoint
+        if self.checkpoint_manager:
+            final_hour = (start_hour + duration_hours - 1) % 24
+            self.save_checkpoint(final_hour, total_hours=duration_hours)
         
-        segments = []
+        print(f"\n✅ Broadcast sequence complete: {sink.count} segments")
         
-        for hour_offset in range(duration_hours):
-            current_hour = (start_hour + hour_offset) % 24
+        return sink.segments
+    
+    def _generate_sequence_sequential(self,
+                                      slots: List[Tuple[int, int, int, Optional[SegmentPlan]]],
+                                      duration_hours: int,
+                                      sink: '_SegmentSink',
+                                      stop: Optional[threading.Event] = None) -> None:
+        """One segment at a time (max_parallel_segments == 1); checks stop between segments"""
+        for hour_offset, current_hour, segment_num, plan in slots:
+            if stop is not None and stop.is_set():
+                return
+            if segment_num == 0:
+                self._start_hour(hour_offset, current_hour, duration_hours)
             
-            # Save checkpoint at interval (Phase 1A)
-            if (self.checkpoint_manager and 
-                hour_offset > 0 and 
-                hour_offset % self.checkpoint_interval == 0 and
-                hour_offset != self.last_checkpoint_hour):
-                self.save_checkpoint(current_hour, total_hours=duration_hours)
-                self.last_checkpoint_hour = hour_offset
+            # Generate story beats fresh for each segment
+            # This ensures proper story state tracking
+            if plan is None:
+                segment = self.generate_next_segment(current_hour)
+            else:
+                segment = self.generate_next_segment(current_hour, plan=plan)
+            sink.add(segment)
+    
+    def _start_hour(self, hour_offset: int, current_hour: int, duration_hours: int) -> None:
+        """Per-hour bookkeeping before the first segment of an hour"""
+        # Save checkpoint at interval (Phase 1A)
+        if self._checkpoint_due(hour_offset):
+            self.save_checkpoint(current_hour, total_hours=duration_hours)
+            self.last_checkpoint_hour = hour_offset
+        
+        print(f"\n⏰ Hour {current_hour}:00 (offset: {hour_offset}/{duration_hours})")
+        
+        # Warm the RAG cache for the hours after this one while we generate
+        self.prefetch_upcoming(current_hour, include_current=(hour_offset == 0))
+    
+    def _checkpoint_due(self, hour_offset: int) -> bool:
+        return bool(self.checkpoint_manager and
+                    hour_offset > 0 and
+                    hour_offset % self.checkpoint_interval == 0 and
+                    hour_offset != self.last_checkpoint_hour)
+    
+    async def _generate_sequence_pipelined(self,
+                                           slots: List[Tuple[int, int, int, Optional[SegmentPlan]]],
+                                           duration_hours: int,
+                                           sink: '_SegmentSink') -> None:
+        """
+        Pipelined generate_broadcast_sequence().
+        
+        Each segment is split into prepare (engine state reads), retrieve
+        (RAG cache warm-up), generate (prompt + LLM) and commit (validation
+        and state updates), see broadcast_runtime. Prepare and commit run in
+        segment order, so segment N+1 is prepared and retrieving - and up to
+        max_parallel_segments LLM calls are in flight - while segment N is
+        still generating.
+        
+        The order of prepare/commit steps only depends on the schedule,
+        never on which LLM call finishes first, so output order and engine
+        state are deterministic. Continuity context may lag by up to
+        max_parallel_segments - 1 segments. The pipeline is drained before
+        a checkpoint hour, and story-beat / emergency segments are not
+        overlapped with later segments (the next segment sees their script).
+        Retries after a failed validation run sequentially at commit time.
+        
+        Args:
+            slots: Slots from _sequence_slots()
+            duration_hours: Broadcast duration in hours
+            sink: Receives segments in schedule order, as they commit
+        """
+        use_retries = RETRY_MANAGER_AVAILABLE and self.enable_validation
+        await self._run_slots(slots, duration_hours, retry_on_commit=use_retries,
+                              on_commit=lambda job, segment: sink.add(segment))
+    
+    async def _generate_sequence_model_batched(self,
+                                               slots: List[Tuple[int, int, int, Optional[SegmentPlan]]],
+                                               duration_hours: int,
+                                               sink: '_SegmentSink') -> None:
+        """
+        Model-batched generate_broadcast_sequence().
+        
+        Works through the schedule in windows of model_batch_size segments:
+        generate the whole window with the generator model (pipelined when
+        max_parallel_segments > 1), swap once and LLM-validate the window,
+        then swap back only to regenerate the failures. A window costs two
+        model swaps per round instead of two per segment.
+        
+        Args:
+            slots: Slots from _sequence_slots()
+            duration_hours: Broadcast duration in hours
+            sink: Receives segments in schedule order, a window at a time
+        """
+        for window_start in range(0, len(slots), self.model_batch_size):
+            window = slots[window_start:window_start + self.model_batch_size]
+            print(f"\n📦 Model window: segments {window_start + 1}-{window_start + len(window)} of {len(slots)}")
+            committed = await self._run_slots(window, duration_hours, defer_llm_validation=True)
+            for segment in await asyncio.to_thread(self._validate_window, committed):
+                sink.add(segment)
+    
+    def _validate_window(self, committed: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Validate a window of committed segments and regenerate the failures.
+        
+        Each round validates every pending segment with the validator model,
+        then regenerates the ones that should be retried with the generator
+        model (Phase 1C retry rules, per segment).
+        
+        Args:
+            committed: (job, segment) pairs from _run_slots()
+        
+        Returns:
+            Final segments, in window order
+        """
+        use_retries = RETRY_MANAGER_AVAILABLE and self.enable_validation
+        entries = [
+            {
+                'job': job,
+                'segment': segment,
+                'retry_manager': RetryManager() if use_retries else None,
+                'attempt': 1,
+                'force_type': None
+            }
+            for job, segment in committed
+        ]
+        final: List[Optional[Dict[str, Any]]] = [None] * len(entries)
+        pending = list(range(len(entries)))
+        
+        while pending:
+            for index in pending:
+                self._finish_deferred_validation(entries[index]['job'], entries[index]['segment'])
             
-            print(f"\n⏰ Hour {current_hour}:00 (offset: {hour_offset}/{duration_hours})")
+            retry = []
+            for index in pending:
+                entry = entries[index]
+                if entry['retry_manager'] is None:
+                    final[index] = entry['segment']
+                    continue
+                outcome = self._finish_attempt(
+                    entry['retry_manager'], entry['attempt'], entry['segment'], entry['job']['hour']
+                )
+                if outcome is None:
+                    retry.append(index)
+                else:
+                    final[index] = outcome
             
-            for segment_num in range(segments_per_hour):
-                # Generate story beats fresh for each segment
-                # This ensures proper story state tracking
-                segment = self.generate_next_segment(current_hour)
-                segments.append(segment)
+            for index in retry:
+                entry = entries[index]
+                entry['attempt'] += 1
+                entry['force_type'] = self._story_fallback_type(
+                    entry['retry_manager'], entry['attempt'], entry['force_type']
+                )
+                print(f"\n🔄 Generation attempt #{entry['attempt']}/{MAX_RETRIES} (Hour: {entry['job']['hour']})")
+                job = self._prepare_segment(
+                    entry['job']['hour'],
+                    entry['force_type'],
+                    retry_manager=entry['retry_manager'],
+                    attempt_number=entry['attempt'],
+                    plan=entry['job'].get('plan')
+                )
+                entry['job'] = job
+                if 'segment_result' in job:
+                    entry['segment'] = job['segment_result']
+                    continue
+                try:
+                    entry['segment'] = self._commit_segment(
+                        job, self._generate_prepared(job), defer_llm_validation=True
+                    )
+                except CircuitOpenError as e:
+                    final[index] = self._llm_unavailable_segment(job['hour'], job.get('segment_type'), e)
+            pending = [index for index in retry if final[index] is None]
         
-        # Save final checkpoint
-        if self.checkpoint_manager:
-            final_hour = (start_hour + duration_hours - 1) % 24
-            self.save_checkpoint(final_hour, total_hours=duration_hours)
+        return final
+    
+    def _sequence_slots(self,
+                        start_hour: int,
+                        duration_hours: int,
+                        segments_per_hour: int,
+                        plans: Optional[List[SegmentPlan]] = None) -> List[Tuple[int, int, int, Optional[SegmentPlan]]]:
+        """(hour_offset, hour, segment_num, plan) for every segment of a sequence"""
+        if plans is not None:
+            return [(plan.hour_offset, plan.hour, plan.segment_num, plan) for plan in plans]
+        return [
+            (hour_offset, (start_hour + hour_offset) % 24, segment_num, None)
+            for hour_offset in range(duration_hours)
+            for segment_num in range(segments_per_hour)
+        ]
+    
+    async def _run_slots(self,
+                         slots: List[Tuple[int, int, int, Optional[SegmentPlan]]],
+                         duration_hours: int,
+                         retry_on_commit: bool = False,
+                         defer_llm_validation: bool = False,
+                         on_commit: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]] = None
+                         ) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Prepare, retrieve, generate and commit slots on the broadcast
+        runtime, with up to max_parallel_segments generations in flight
+        (see _generate_sequence_pipelined()).
         
-        print(f"\n✅ Broadcast sequence complete: {len(segments)} segments")
+        Args:
+            slots: Slots from _sequence_slots()
+            duration_hours: Sequence duration (for checkpoints)
+            retry_on_commit: Run the retry loop for each segment as it commits
+            defer_llm_validation: Leave LLM validation to the caller
+            on_commit: Called with (job, segment) as each segment commits
+                (the pairs are then not returned)
         
-        return segments
+        Returns:
+            (job, segment) pairs in slot order
+        """
+        return await self._get_runtime().run_slots(
+            slots, duration_hours,
+            retry_on_commit=retry_on_commit,
+            defer_llm_validation=defer_llm_validation,
+            on_commit=on_commit
+        )
+    
+    def _get_runtime(self) -> BroadcastRuntime:
+        """Broadcast runtime (created on first use, stage stats accumulate)"""
+        runtime = self.runtime
+        if runtime is None:
+            runtime = BroadcastRuntime(
+                self,
+                ResourceLimits(
+                    llm=self.max_parallel_segments,
+                    chroma=getattr(project_config, 'RUNTIME_CHROMA_CONCURRENCY', 2),
+                    disk=getattr(project_config, 'RUNTIME_DISK_CONCURRENCY', 1)
+                ),
+                lookahead=getattr(project_config, 'RUNTIME_LOOKAHEAD', 1)
+            )
+            self.runtime = runtime
+        return runtime
+    
+    def prefetch_upcoming(self, current_hour: int, include_current: bool = False) -> bool:
+        """
+        Start a background RAG prefetch for the upcoming hours.
+        
+        Args:
+            current_hour: Hour currently being generated (0-23)
+            include_current: Also warm queries for current_hour itself
+        
+        Returns:
+            True if a background prefetch run was started
+        """
+        if not self.rag_prefetcher:
+            return False
+        
+        if include_current:
+            return self.rag_prefetcher.start(current_hour, self.rag_prefetch_hours + 1)
+        return self.rag_prefetcher.start((current_hour + 1) % 24, self.rag_prefetch_hours)
     
     def end_broadcast(self, save_state: bool = True) -> Dict[str, Any]:
         """
@@ -1288,17 +2397,22 @@ class BroadcastEngine:
         """
         duration = datetime.now() - self.broadcast_start
         
+        if self.rag_prefetcher:
+            self.rag_prefetcher.stop(timeout=5.0)
+        
         # Save world state
         if save_state:
             self.world_state.update_broadcast_stats(
                 runtime_hours=duration.total_seconds() / 3600
             )
-            self.world_state.save()
+            with self.latency.span('state.save', store='world'):
+                self.world_state.save()
             
             # Save story state if enabled
             if self.story_state:
                 print("[Story System] Saving story state...")
-                self.story_state.save()
+                with self.latency.span('state.save', store='story'):
+                    self.story_state.save()
         
         stats = {
             'dj_name': self.dj_name,
@@ -1313,11 +2427,49 @@ class BroadcastEngine:
             'session_memory_size': len(self.session_memory.recent_scripts),
             'mentioned_topics': list(self.session_memory.mentioned_topics)
         }
+        if self.startup_time is not None:
+            stats['startup'] = {
+                'engine_init_seconds': self.startup_time,
+                'warmup_seconds': self.warmup_time
+            }
+        if self.rag_prefetcher:
+            stats['rag_prefetch'] = self.rag_prefetcher.get_statistics()
+        if self.runtime is not None:
+            stats['runtime'] = self.runtime.get_statistics()
+        if self.candidate_stats.get('races'):
+            stats['candidates'] = dict(self.candidate_stats)
+        stats['latency'] = self.latency.get_statistics()
+        if self.budget:
+            stats['budget'] = self.budget.get_statistics()
+        if self.model_lifecycle:
+            stats['model_lifecycle'] = self.model_lifecycle.get_statistics()
+        if self.draft_model:
+            stats['generation_tiers'] = self.generator.get_tier_statistics()
+        governor_stats = self._governor_statistics()
+        if governor_stats:
+            stats['ollama_governor'] = governor_stats
         
         print(f"\n⏹️  Broadcast ended")
         print(f"   Duration: {duration.total_seconds():.1f}s")
         print(f"   Segments: {self.segments_generated}")
         print(f"   Avg time: {stats['avg_generation_time']:.2f}s/segment")
+        if self.model_lifecycle:
+            lifecycle_stats = stats['model_lifecycle']
+            print(f"   Model swaps: {lifecycle_stats['swaps']} ({lifecycle_stats['swap_time']:.1f}s)")
+        if stats.get('generation_tiers'):
+            tiers = stats['generation_tiers']
+            print(f"   Drafts accepted: {tiers['draft']['pass_rate']:.1f}% "
+                  f"(draft {tiers['draft']['avg_latency']:.2f}s, "
+                  f"primary {tiers['primary']['avg_latency']:.2f}s avg)")
+        if governor_stats and (governor_stats['retries_denied'] or governor_stats['circuit_trips']):
+            print(f"   Ollama: {governor_stats['retries_denied']} retries denied, "
+                  f"circuit opened {governor_stats['circuit_trips']}x")
+        if stats.get('budget'):
+            budget_stats = stats['budget']
+            print(f"   Budget: {budget_stats['elapsed_seconds'] / 3600:.2f}h of "
+                  f"{budget_stats['budget_seconds'] / 3600:.2f}h, "
+                  f"{len(budget_stats['decisions'])} adjustments "
+                  f"(degraded: {', '.join(budget_stats['active_steps']) or 'none'})")
         
         if self.validation_failures > 0:
             print(f"   ⚠️  Validation issues: {self.validation_failures}")
@@ -1341,50 +2493,13 @@ class BroadcastEngine:
             if self.weather_simulator and self.region:
                 current_weather = self._get_current_weather_from_simulator(current_hour)
                 if current_weather:
-                    # Use simulated weather
-                    weather_vars = {
-                        'weather_type': current_weather.weather_type,
-                        'weather_description': current_weather.weather_type,
-                        'temperature': current_weather.temperature,
-                        'intensity': current_weather.intensity,
-                        'is_emergency': current_weather.is_emergency,
-                        'notable_event': current_weather.notable_event,
-                        'region': current_weather.region,
-                        'location': current_weather.region,
-                        'time_of_day': time_of_day.name.lower()
-                    }
-                    
-                    # Phase 3: Add weather continuity context
-                    weather_continuity = self.session_memory.get_weather_continuity_context(
-                        region=self.region.value,
-                        current_weather_dict=current_weather.to_dict()
-                    )
-                    weather_vars['weather_continuity'] = weather_continuity
-                    
-                    # Phase 3: Add notable recent weather events
-                    notable_events = self.world_state.get_notable_weather_events(
-                        region=self.region.value,
-                        days_back=30
-                    )
-                    if notable_events:
-                        # Convert to simple dicts for template
-                        notable_list = []
-                        for event in notable_events[:3]:  # Max 3 events
-                            notable_list.append({
-                                'weather_type': event.get('weather_type'),
-                                'date': event.get('started_at', 'recent'),
-                                'intensity': event.get('intensity', 'moderate')
-                            })
-                        weather_vars['notable_weather_events'] = notable_list
-                    
-                    # Get additional weather template vars (survival tips, etc.)
-                    additional_vars = get_weather_template_vars(
-                        current_weather.weather_type,
+                    # Use simulated weather (survival tips etc. included)
+                    base_vars.update(simulated_weather_vars(
+                        current_weather,
                         time_of_day.name.lower(),
                         current_hour
-                    )
-                    weather_vars.update(additional_vars)
-                    base_vars.update(weather_vars)
+                    ))
+                    base_vars.update(self._weather_continuity_vars(current_weather))
                     
                     # Log weather to history
                     self._log_weather_to_history(current_weather, current_hour)
@@ -1442,60 +2557,99 @@ class BroadcastEngine:
         
         return base_vars
     
-    def _build_context_query(self,
-                            segment_type: str,
-                            template_vars: Dict[str, Any]) -> str:
-        """Build RAG context query for segment type"""
-        # Extract location and year from DJ name
-        # Format: "DJ Name (YEAR, Location)"
-        import re
-        match = re.search(r'\((\d+),\s*([^)]+)\)', self.dj_name)
-        if match:
-            year = match.group(1)
-            location = match.group(2).strip()
-        else:
-            # Fallback to Appalachia if parsing fails
-            year = "2102"
-            location = "Appalachia West Virginia"
-        
-        base_query = f"{location} {year}"
-        
-        if segment_type == 'weather':
-            weather_type = template_vars.get('weather_type', 'general')
-            return f"{base_query} weather {weather_type} conditions survival"
+    def _weather_continuity_vars(self, current_weather: Any) -> Dict[str, Any]:
+        """Phase 3 weather continuity context and notable recent weather events"""
+        weather_vars = {
+            'weather_continuity': self.session_memory.get_weather_continuity_context(
+                region=self.region.value,
+                current_weather_dict=current_weather.to_dict()
+            )
+        }
         
-        elif segment_type == 'news':
-            category = template_vars.get('news_category', 'general')
-            return f"{base_query} news {category} events recent"
+        notable_events = self.world_state.get_notable_weather_events(
+            region=self.region.value,
+            days_back=30
+        )
+        if notable_events:
+            # Convert to simple dicts for template
+            weather_vars['notable_weather_events'] = [
+                {
+                    'weather_type': event.get('weather_type'),
+                    'date': event.get('started_at', 'recent'),
+                    'intensity': event.get('intensity', 'moderate')
+                }
+                for event in notable_events[:3]  # Max 3 events
+            ]
+        return weather_vars
+    
+    def _plan_template_vars(self, plan: SegmentPlan, **kwargs) -> Dict[str, Any]:
+        """Plan's template vars plus the state-dependent parts resolved now"""
+        template_vars = dict(plan.template_vars)
         
-        elif segment_type == 'gossip':
-            rumor_type = template_vars.get('rumor_type', 'rumors')
-            return f"{base_query} gossip {rumor_type} rumors stories"
+        if plan.segment_type == SegmentType.GOSSIP:
+            template_vars.update(get_gossip_template_vars(
+                self.gossip_tracker,
+                template_vars.get('rumor_type', 'wasteland rumors')
+            ))
         
-        elif segment_type == 'time':
-            # Use location-specific landmarks
-            if 'Mojave' in location:
-                return f"{base_query} New Vegas Strip casinos daily life"
-            elif 'Commonwealth' in location:
-                return f"{base_query} Diamond City settlement schedule"
-            else:
-                return f"{base_query} Vault 76 schedule daily life"
+        weather_state = plan.metadata.get('weather_state')
+        if weather_state and self.region:
+            from weather_simulator import WeatherState
+            current_weather = WeatherState.from_dict(weather_state)
+            template_vars.update(self._weather_continuity_vars(current_weather))
+            self._log_weather_to_history(current_weather, plan.hour)
         
-        return base_query
+        template_vars.update(kwargs)
+        return template_vars
+    
+    def _build_context_query(self,
+                            segment_type: str,
+                            template_vars: Dict[str, Any]) -> str:
+        """Build RAG context query for segment type"""
+        return build_context_query(segment_type, template_vars, self.dj_name)
     
     def get_broadcast_stats(self) -> Dict[str, Any]:
         """Get current broadcast statistics"""
         return {
             'segments_generated': self.segments_generated,
             'validation_failures': self.validation_failures,
+            'stream_aborts': self.stream_aborts,
+            'candidates': self.candidate_stats,
+            'max_parallel_segments': self.max_parallel_segments,
+            'model_lifecycle': (
+                self.model_lifecycle.get_statistics() if self.model_lifecycle else None
+            ),
+            'generation_tiers': (
+                self.generator.get_tier_statistics() if self.draft_model else None
+            ),
+            'ollama_governor': self._governor_statistics(),
             'avg_generation_time': (
                 self.total_generation_time / self.segments_generated
                 if self.segments_generated > 0 else 0
             ),
             'uptime_seconds': (datetime.now() - self.broadcast_start).total_seconds(),
-            'scheduler_status': self.scheduler.get_segments_status()
+            'scheduler_status': self.scheduler.get_segments_status(),
+            'rag_prefetch': (
+                self.rag_prefetcher.get_statistics() if self.rag_prefetcher else None
+            ),
+            'latency': self.latency.get_statistics(),
+            'budget': self.budget.get_statistics() if self.budget else None
         }
     
+    def export_trace(self, path: Union[str, Path]) -> Path:
+        """
+        Write recent segment stage spans as Chrome trace JSON.
+        
+        Open the file in chrome://tracing or https://ui.perfetto.dev.
+        
+        Args:
+            path: Output file
+        
+        Returns:
+            Path to the written file
+        """
+        return self.latency.export_chrome_trace(path)
+    
     # ==================== CHECKPOINT METHODS (Phase 1A) ====================
     
     def save_checkpoint(self, current_hour: int, total_hours: int = 0) -> Optional[Path]:
@@ -1540,12 +2694,13 @@ class BroadcastEngine:
                 }
             
             # Save checkpoint
-            checkpoint_path = self.checkpoint_manager.save_checkpoint(
-                broadcast_state=self.world_state.to_dict(),
-                story_state=self.story_state.to_dict() if self.story_state else {},
-                session_context=session_context,
-                metadata=metadata
-            )
+            with self.latency.span('checkpoint.write', hour=current_hour):
+                checkpoint_path = self.checkpoint_manager.save_checkpoint(
+                    broadcast_state=self.world_state.to_dict(),
+                    story_state=self.story_state.to_dict() if self.story_state else {},
+                    session_context=session_context,
+                    metadata=metadata
+                )
             
             print(f"💾 Checkpoint saved: {checkpoint_path.name}")
             return checkpoint_path
@@ -0,0 +1,299 @@
+"""
+Broadcast Farm - Several DJs generated concurrently in one process
+
+broadcast.py runs one DJ per process, and each BroadcastEngine builds its own
+ScriptGenerator: a ChromaDBIngestor with its own SentenceTransformer and
+Chroma client, plus its own Ollama connection pool. Five DJs meant five
+embedding-model loads.
+
+BroadcastFarm builds one ScriptGenerator and shares it across the DJs'
+engines:
+
+- one ChromaDBIngestor / embedding model and one RAG cache
+- one Ollama client (pool sized to the LLM slots, one governor)
+
+Everything else stays per DJ: world/story state files, session memory,
+scheduler, validator and output. Each DJ's broadcast sequence runs on its own
+thread, and the LLM slots are split between the DJs (max_parallel_segments),
+so aggregate segments/hour scales with the server's OLLAMA_NUM_PARALLEL.
+
+Each DJ's output is copied to a per-DJ log file (ThreadLogRouter), including
+output of the broadcast runtime's worker threads.
+"""
+
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Optional, List, TextIO
+import contextvars
+import re
+import sys
+import threading
+import time
+
+from broadcast_engine import BroadcastEngine
+from generator import ScriptGenerator
+from ollama_client import OllamaClient
+from completion_cache import default_completion_cache
+from ollama_governor import default_governor
+from tools.shared import project_config
+
+
+def dj_slug(dj_name: str) -> str:
+    """Filesystem-safe DJ name ("Julie (2102, Appalachia)" -> "Julie-2102-Appalachia")"""
+    return re.sub(r'[^A-Za-z0-9]+', '-', dj_name).strip('-')
+
+
+@dataclass
+class FarmResult:
+    """Outcome of one DJ's broadcast"""
+    dj_name: str
+    segments: List[Dict[str, Any]] = field(default_factory=list)
+    stats: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    log_file: Optional[Path] = None
+    resumed: bool = False
+    seconds: float = 0.0
+
+
+class ThreadLogRouter:
+    """
+    stdout wrapper that copies output of registered threads to a file.
+
+    The log file is held in a context variable, so asyncio tasks and
+    asyncio.to_thread() workers started by a registered thread log to the
+    same file. Output of other threads (e.g. RAG prefetch threads) goes to
+    the wrapped stream only.
+    """
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self._log_file: contextvars.ContextVar = contextvars.ContextVar('farm_log_file', default=None)
+        self._lock = threading.Lock()
+
+    def register(self, log_file: Path) -> None:
+        """Copy the current thread's output to log_file"""
+        self._log_file.set(log_file)
+
+    def unregister(self) -> None:
+        self._log_file.set(None)
+
+    def write(self, text: str) -> int:
+        log_file = self._log_file.get()
+        if log_file is not None:
+            with self._lock:
+                with open(log_file, 'a', encoding='utf-8') as f:
+                    f.write(text)
+        return self.stream.write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.stream, name)
+
+
+class BroadcastFarm:
+    """
+    Run several DJs' broadcast sequences over one shared ScriptGenerator.
+
+    Example:
+        farm = BroadcastFarm(["Julie (2102, Appalachia)", "Three Dog (2277, Capital Wasteland)"],
+                             engine_kwargs={'enable_story_system': True})
+        results = farm.run(start_hour=8, duration_hours=8, segments_per_hour=2)
+    """
+
+    def __init__(self,
+                 dj_names: List[str],
+                 engine_kwargs: Optional[Dict[str, Any]] = None,
+                 llm_slots: Optional[int] = None,
+                 state_dir: str = './broadcast_farm',
+                 log_dir: Optional[Path] = None,
+                 generator: Optional[ScriptGenerator] = None):
+        """
+        Initialize broadcast farm.
+
+        Args:
+            dj_names: Full DJ names (each runs its own broadcast)
+            engine_kwargs: BroadcastEngine options applied to every DJ
+                (world_state_path and max_parallel_segments are set per DJ;
+                model_batch_size is not supported)
+            llm_slots: Concurrent LLM requests across all DJs
+                (default: OLLAMA_NUM_PARALLEL)
+            state_dir: Per-DJ world/story state files go in state_dir/<dj>/
+            log_dir: Per-DJ log files go here (None = no per-DJ logs)
+            generator: Shared ScriptGenerator (built once if None)
+        """
+        if not dj_names:
+            raise ValueError("BroadcastFarm needs at least one DJ")
+        if (engine_kwargs or {}).get('model_batch_size', 0) > 0:
+            # Each DJ's engine would swap the shared server's models independently
+            raise ValueError("model_batch_size is not supported in farm mode")
+        self.dj_names = list(dict.fromkeys(dj_names))
+        self.engine_kwargs = dict(engine_kwargs or {})
+        self.llm_slots = max(1, llm_slots or getattr(project_config, 'OLLAMA_NUM_PARALLEL', 1))
+        self.state_dir = Path(state_dir)
+        self.log_dir = Path(log_dir) if log_dir is not None else None
+        self.generator = generator or self._build_generator()
+        self.engines: Dict[str, BroadcastEngine] = {}
+        self.wall_time = 0.0
+        self.results: Dict[str, FarmResult] = {}
+
+    def _build_generator(self) -> ScriptGenerator:
+        """One generator (retrieval, embeddings, Ollama pool) for all DJs"""
+        ollama = OllamaClient(
+            base_url=project_config.OLLAMA_URL.replace("/api/generate", ""),
+            pool_size=max(self.llm_slots, getattr(project_config, 'OLLAMA_POOL_SIZE', 4)),
+            completion_cache=default_completion_cache(project_config),
+            governor=default_governor(project_config)
+        )
+        return ScriptGenerator(
+            templates_dir=self.engine_kwargs.get('templates_dir'),
+            chroma_db_dir=self.engine_kwargs.get('chroma_db_dir'),
+            ollama_client=ollama,
+            draft_model=self.engine_kwargs.get('draft_model'),
+            draft_quality_threshold=self.engine_kwargs.get('draft_quality_threshold', 0.05)
+        )
+
+    def slots_per_dj(self) -> int:
+        """LLM slots given to each DJ's pipeline (at least one)"""
+        return max(1, self.llm_slots // len(self.dj_names))
+
+    def world_state_path(self, dj_name: str) -> Path:
+        """Isolated world state file (story state sits next to it)"""
+        return self.state_dir / dj_slug(dj_name) / "broadcast_state.json"
+
+    def create_engine(self, dj_name: str) -> BroadcastEngine:
+        """BroadcastEngine for one DJ sharing the farm's generator"""
+        state_path = self.world_state_path(dj_name)
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        kwargs = dict(self.engine_kwargs)
+        kwargs.update(
+            dj_name=dj_name,
+            world_state_path=str(state_path),
+            max_parallel_segments=self.slots_per_dj(),
+            generator=self.generator
+        )
+        engine = BroadcastEngine(**kwargs)
+        self.engines[dj_name] = engine
+        return engine
+
+    def run(self,
+            start_hour: int,
+            duration_hours: int,
+            segments_per_hour: int = 2,
+            save_state: bool = True,
+            resume: bool = False,
+            warmup: bool = False) -> Dict[str, FarmResult]:
+        """
+        Generate every DJ's broadcast concurrently.
+
+        A DJ that fails does not stop the others; its FarmResult carries
+        the error.
+
+        Args:
+            start_hour: Starting hour (0-23)
+            duration_hours: Hours to generate per DJ
+            segments_per_hour: Segments per hour
+            save_state: Persist each DJ's state at the end
+            resume: Continue each DJ from its latest checkpoint
+            warmup: Warm up each engine before its first segment
+
+        Returns:
+            Dict of DJ name -> FarmResult, in dj_names order
+        """
+        router: Optional[ThreadLogRouter] = None
+        original_stdout = sys.stdout
+        if self.log_dir is not None:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            router = ThreadLogRouter(original_stdout)
+            sys.stdout = router
+
+        print(f"\n🎛️  Broadcast farm: {len(self.dj_names)} DJs, "
+              f"{self.llm_slots} LLM slots ({self.slots_per_dj()} per DJ)")
+        started = time.time()
+        try:
+            with ThreadPoolExecutor(max_workers=len(self.dj_names),
+                                    thread_name_prefix="broadcast-farm") as pool:
+                futures = {
+                    dj_name: pool.submit(self._run_dj, dj_name, router, start_hour,
+                                         duration_hours, segments_per_hour, save_state, resume, warmup)
+                    for dj_name in self.dj_names
+                }
+                self.results = {dj_name: future.result() for dj_name, future in futures.items()}
+        finally:
+            sys.stdout = original_stdout
+        self.wall_time = time.time() - started
+
+        stats = self.get_statistics()
+        print(f"🎛️  Farm complete: {stats['total_segments']} segments in {self.wall_time:.1f}s "
+              f"({stats['segments_per_hour']:.0f} segments/hour)")
+        return self.results
+
+    def _run_dj(self,
+                dj_name: str,
+                router: Optional[ThreadLogRouter],
+                start_hour: int,
+                duration_hours: int,
+                segments_per_hour: int,
+                save_state: bool,
+                resume: bool,
+                warmup: bool) -> FarmResult:
+        """One DJ's full broadcast (runs on a farm worker thread)"""
+        result = FarmResult(dj_name=dj_name)
+        if router is not None:
+            result.log_file = self.log_dir / f"farm_{time.strftime('%Y%m%d_%H%M%S')}_{dj_slug(dj_name)}.log"
+            router.register(result.log_file)
+        started = time.time()
+        try:
+            engine = self.create_engine(dj_name)
+            if warmup:
+                engine.warmup()
+
+            remaining_hours = duration_hours
+            if resume and engine.resume_from_checkpoint(dj_name=dj_name):
+                result.resumed = True
+                remaining_hours -= engine.checkpoint_segments_completed // segments_per_hour
+                start_hour = (engine.checkpoint_resume_hour + 1) % 24
+            else:
+                engine.start_broadcast()
+
+            result.segments = engine.generate_broadcast_sequence(
+                start_hour=start_hour,
+                duration_hours=max(0, remaining_hours),
+                segments_per_hour=segments_per_hour
+            )
+            result.stats = engine.end_broadcast(save_state=save_state)
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+            print(f"❌ {dj_name}: {result.error}")
+        finally:
+            result.seconds = time.time() - started
+            if router is not None:
+                router.unregister()
+        return result
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get farm statistics.
+
+        Returns:
+            Dictionary with per-DJ segment counts and aggregate throughput
+        """
+        total = sum(len(result.segments) for result in self.results.values())
+        return {
+            'djs': len(self.dj_names),
+            'llm_slots': self.llm_slots,
+            'slots_per_dj': self.slots_per_dj(),
+            'total_segments': total,
+            'wall_time': self.wall_time,
+            'segments_per_hour': total / self.wall_time * 3600 if self.wall_time > 0 else 0.0,
+            'per_dj': {
+                dj_name: {
+                    'segments': len(result.segments),
+                    'seconds': result.seconds,
+                    'error': result.error
+                }
+                for dj_name, result in self.results.items()
+            }
+        }
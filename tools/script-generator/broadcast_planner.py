@@ -0,0 +1,307 @@
+"""
+Broadcast Planner - Precompiles a broadcast window into SegmentPlans
+
+BroadcastEngine decides each segment at generation time: scheduler lookup,
+time of day, weather, news category, template vars and RAG query. The
+planner resolves all of that up front for an N-hour window, using
+BroadcastSchedulerV2 for the schedule, so the engine only executes plans:
+
+    planner = BroadcastPlanner("Julie (2102, Appalachia)")
+    plans = planner.compile(start_hour=8, duration_hours=168, segments_per_hour=2)
+    print(estimate_cost(plans, PlanCostModel(llm_slots=4)))
+
+Only state that depends on earlier output is left to execution time:
+session context, story beats, gossip continuity, variety hints, weather
+continuity, retry feedback and emergency weather alerts.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple, Callable
+import re
+
+from broadcast_scheduler import TimeOfDay
+from broadcast_scheduler_v2 import BroadcastSchedulerV2
+from segment_plan import SegmentPlan
+from content_types.weather import select_weather, get_weather_template_vars
+from content_types.news import get_news_template_vars
+from content_types.time_check import get_time_check_template_vars
+
+# "DJ Name (YEAR, Location)"
+DJ_NAME_PATTERN = re.compile(r'\((\d+),\s*([^)]+)\)')
+
+DEFAULT_RUMOR_TYPE = 'wasteland rumors'
+
+
+def _time_of_day(hour: int) -> TimeOfDay:
+    if 6 <= hour < 10:
+        return TimeOfDay.MORNING
+    elif 10 <= hour < 14:
+        return TimeOfDay.MIDDAY
+    elif 14 <= hour < 18:
+        return TimeOfDay.AFTERNOON
+    elif 18 <= hour < 22:
+        return TimeOfDay.EVENING
+    return TimeOfDay.NIGHT
+
+
+_TIME_OF_DAY_BY_HOUR = tuple(_time_of_day(hour) for hour in range(24))
+
+
+def hour_to_time_of_day(hour: int) -> TimeOfDay:
+    """Time of day for an hour (0-23)"""
+    return _TIME_OF_DAY_BY_HOUR[hour % 24]
+
+
+@lru_cache(maxsize=None)
+def parse_dj_name(dj_name: str) -> Tuple[str, str, str]:
+    """
+    Split a full DJ name into (name, year, location).
+
+    Falls back to 2102 / Appalachia West Virginia if the name has no
+    "(YEAR, Location)" suffix.
+    """
+    name = dj_name.split('(')[0].strip()
+    match = DJ_NAME_PATTERN.search(dj_name)
+    if match:
+        return name, match.group(1), match.group(2).strip()
+    return name, "2102", "Appalachia West Virginia"
+
+
+def generator_script_type(segment_type: str) -> str:
+    """Template name for a scheduler segment type"""
+    if segment_type == 'time_check':
+        return 'time'
+    if segment_type == 'story':
+        return 'gossip'  # Stories use the gossip template with story context
+    return segment_type
+
+
+def build_context_query(script_type: str, template_vars: Dict[str, Any], dj_name: str) -> str:
+    """RAG context query for a segment (script_type is the template name)"""
+    _, year, location = parse_dj_name(dj_name)
+    base_query = f"{location} {year}"
+
+    if script_type == 'weather':
+        weather_type = template_vars.get('weather_type', 'general')
+        return f"{base_query} weather {weather_type} conditions survival"
+
+    elif script_type == 'news':
+        category = template_vars.get('news_category', 'general')
+        return f"{base_query} news {category} events recent"
+
+    elif script_type == 'gossip':
+        rumor_type = template_vars.get('rumor_type', 'rumors')
+        return f"{base_query} gossip {rumor_type} rumors stories"
+
+    elif script_type == 'time':
+        # Use location-specific landmarks
+        if 'Mojave' in location:
+            return f"{base_query} New Vegas Strip casinos daily life"
+        elif 'Commonwealth' in location:
+            return f"{base_query} Diamond City settlement schedule"
+        else:
+            return f"{base_query} Vault 76 schedule daily life"
+
+    return base_query
+
+
+def simulated_weather_vars(weather: Any, time_of_day: str, hour: int) -> Dict[str, Any]:
+    """Template vars for a simulated WeatherState (without continuity context)"""
+    weather_vars = {
+        'weather_type': weather.weather_type,
+        'weather_description': weather.weather_type,
+        'temperature': weather.temperature,
+        'intensity': weather.intensity,
+        'is_emergency': weather.is_emergency,
+        'notable_event': weather.notable_event,
+        'region': weather.region,
+        'location': weather.region,
+        'time_of_day': time_of_day
+    }
+    weather_vars.update(get_weather_template_vars(weather.weather_type, time_of_day, hour))
+    return weather_vars
+
+
+class BroadcastPlanner:
+    """
+    Compiles a broadcast window into SegmentPlans.
+
+    Example:
+        planner = BroadcastPlanner(dj_name, live_scheduler=engine.scheduler)
+        plans = planner.compile(start_hour=8, duration_hours=24, segments_per_hour=2)
+    """
+
+    def __init__(self,
+                 dj_name: str,
+                 live_scheduler: Optional[Any] = None,
+                 weather_lookup: Optional[Callable[[int], Optional[Any]]] = None):
+        """
+        Initialize planner.
+
+        Args:
+            dj_name: Full DJ name (e.g., "Julie (2102, Appalachia)")
+            live_scheduler: Scheduler whose NEWS_HOURS / WEATHER_HOURS the
+                plan follows (BroadcastSchedulerV2 defaults if None)
+            weather_lookup: hour -> simulated WeatherState (None = random
+                weather, as without the weather simulator)
+        """
+        self.dj_name = dj_name
+        self.weather_lookup = weather_lookup
+        self.scheduler = BroadcastSchedulerV2()
+        if live_scheduler is not None:
+            self.scheduler.NEWS_HOURS = set(live_scheduler.NEWS_HOURS)
+            self.scheduler.WEATHER_HOURS = set(live_scheduler.WEATHER_HOURS)
+
+        name, year, location = parse_dj_name(dj_name)
+        self.context = {
+            'dj_name': name,
+            'dj_year': int(year),
+            'dj_region': location,
+            'enable_stories': False  # Story beats are picked at execution time
+        }
+
+    def compile(self,
+                start_hour: int,
+                duration_hours: int,
+                segments_per_hour: int = 2) -> List[SegmentPlan]:
+        """
+        Plan every segment of a window.
+
+        The daily schedule repeats every 24 hours.
+
+        Args:
+            start_hour: Starting hour (0-23)
+            duration_hours: Window length in hours
+            segments_per_hour: Segments per hour
+
+        Returns:
+            SegmentPlans in broadcast order
+        """
+        self.scheduler.reset()
+        plans = []
+        for hour_offset in range(duration_hours):
+            hour = (start_hour + hour_offset) % 24
+            if hour_offset > 0 and hour_offset % 24 == 0:
+                self.scheduler.reset()
+            for segment_num in range(segments_per_hour):
+                plan = self.scheduler.get_next_segment_plan(hour, self.context)
+                self._resolve(plan, hour_offset, hour, segment_num)
+                plans.append(plan)
+        return plans
+
+    def _resolve(self, plan: SegmentPlan, hour_offset: int, hour: int, segment_num: int) -> None:
+        """Fill in the plan's template vars and RAG query"""
+        script_type = generator_script_type(plan.segment_type.value)
+        time_of_day = hour_to_time_of_day(hour).name.lower()
+        template_vars: Dict[str, Any] = {
+            'dj_name': self.dj_name,
+            'hour': hour,
+            'time_of_day': time_of_day
+        }
+
+        if script_type == 'weather':
+            weather = self.weather_lookup(hour) if self.weather_lookup else None
+            if weather:
+                template_vars.update(simulated_weather_vars(weather, time_of_day, hour))
+                plan.metadata['weather_state'] = weather.to_dict()
+            else:
+                template_vars.update(get_weather_template_vars(select_weather(), time_of_day, hour))
+        elif script_type == 'gossip':
+            template_vars['rumor_type'] = DEFAULT_RUMOR_TYPE
+        elif script_type == 'news':
+            template_vars.update(get_news_template_vars(
+                plan.metadata.get('category', 'general'),
+                region='Appalachia',
+                dj_name=self.dj_name
+            ))
+        elif script_type == 'time':
+            template_vars.update(get_time_check_template_vars(self.dj_name, hour, None))
+
+        plan.hour = hour
+        plan.hour_offset = hour_offset
+        plan.segment_num = segment_num
+        plan.template_vars = template_vars
+        plan.rag_query = build_context_query(script_type, template_vars, self.dj_name)
+        plan.metadata['generator_script_type'] = script_type
+
+
+@dataclass
+class PlanCostModel:
+    """Cost assumptions for estimate_cost()"""
+    prompt_tokens: int = 1500  # Persona + lore chunks + instructions
+    chars_per_token: float = 4.0
+    default_completion_chars: int = 500  # Plans without a max_length constraint
+    prefill_tokens_per_second: float = 1200.0
+    decode_tokens_per_second: float = 35.0
+    validation_calls_per_segment: float = 0.0  # 1.0 with LLM validation
+    validation_completion_tokens: int = 150
+    retry_rate: float = 0.1  # Extra generations per segment from retries
+    rag_seconds_per_query: float = 0.3
+    llm_slots: int = 1
+
+    @classmethod
+    def for_settings(cls,
+                     llm_slots: int = 1,
+                     enable_validation: bool = False,
+                     validation_mode: str = 'rules') -> 'PlanCostModel':
+        """Cost model for BroadcastEngine / CLI settings"""
+        llm_validation = enable_validation and validation_mode in ('llm', 'hybrid')
+        return cls(
+            llm_slots=max(1, llm_slots),
+            validation_calls_per_segment=1.0 if llm_validation else 0.0,
+            retry_rate=cls.retry_rate if enable_validation else 0.0
+        )
+
+
+def estimate_cost(plans: List[SegmentPlan], model: Optional[PlanCostModel] = None) -> Dict[str, Any]:
+    """
+    Estimate LLM calls, tokens and wall time for a compiled window.
+
+    Completion length per segment comes from the plan's max_length
+    constraint. Repeated RAG queries are counted once (RAG cache).
+
+    Args:
+        plans: Plans from BroadcastPlanner.compile()
+        model: Cost assumptions (defaults if None)
+
+    Returns:
+        Dictionary with segment counts, LLM calls, tokens and seconds
+    """
+    model = model or PlanCostModel()
+    by_type: Dict[str, int] = {}
+    completion_tokens = 0.0
+    for plan in plans:
+        by_type[plan.segment_type.value] = by_type.get(plan.segment_type.value, 0) + 1
+        completion_chars = plan.constraints.max_length or model.default_completion_chars
+        completion_tokens += completion_chars / model.chars_per_token
+
+    generation_calls = len(plans) * (1 + model.retry_rate)
+    validation_calls = generation_calls * model.validation_calls_per_segment
+    llm_calls = generation_calls + validation_calls
+    prompt_tokens = llm_calls * model.prompt_tokens
+    completion_tokens = (completion_tokens * (1 + model.retry_rate) +
+                         validation_calls * model.validation_completion_tokens)
+    llm_seconds = (prompt_tokens / model.prefill_tokens_per_second +
+                   completion_tokens / model.decode_tokens_per_second)
+
+    rag_queries = [plan.rag_query for plan in plans if plan.rag_query]
+    unique_queries = len(set(rag_queries))
+    rag_seconds = unique_queries * model.rag_seconds_per_query
+    wall_seconds = llm_seconds / max(1, model.llm_slots) + rag_seconds
+
+    return {
+        'segments': len(plans),
+        'hours': len({plan.hour_offset for plan in plans}),
+        'segments_by_type': by_type,
+        'llm_calls': round(llm_calls),
+        'prompt_tokens': round(prompt_tokens),
+        'completion_tokens': round(completion_tokens),
+        'rag_queries': len(rag_queries),
+        'unique_rag_queries': unique_queries,
+        'llm_seconds': llm_seconds,
+        'rag_seconds': rag_seconds,
+        'llm_slots': model.llm_slots,
+        'estimated_wall_seconds': wall_seconds,
+        'estimated_wall_hours': wall_seconds / 3600
+    }
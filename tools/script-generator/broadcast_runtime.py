@@ -0,0 +1,302 @@
+"""
+Broadcast Runtime - asyncio task graph for broadcast sequences
+
+Each segment runs as a chain of stages:
+
+    plan -> retrieve -> generate -> commit
+
+- plan: BroadcastEngine._prepare_segment() (scheduler, story beats,
+  template vars), on the event loop in schedule order
+- retrieve: warms the RAG cache with the segment's context query, so the
+  generate stage finds its lore context cached
+- generate: prompt render and LLM call (ScriptGenerator.generate_script),
+  or a race of parallel candidates (segment_candidates) that keeps the
+  first valid one; a race takes one llm slot per candidate, and races
+  only as many candidates as there are free slots
+- commit: validation, retries and session/world/story state updates, strictly
+  in schedule order
+
+Blocking work (Chroma, Ollama, validation, checkpoint I/O) runs in worker
+threads, so retrieval for later segments overlaps LLM calls for earlier ones.
+Each resource has its own concurrency limit:
+
+- llm: concurrent generate stages (match the server's OLLAMA_NUM_PARALLEL)
+- chroma: concurrent RAG queries
+- disk: checkpoint writes
+
+Commits (and the plans that read their results) never overlap, so output
+order and engine state are the same as with the threaded pipeline.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Tuple, Callable, Awaitable, TypeVar
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+
+from ollama_governor import CircuitOpenError
+from stage_timer import use_trace, span
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Pipeline stages, in order
+STAGES = ('plan', 'retrieve', 'generate', 'commit', 'checkpoint', 'write')
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Uses asyncio.run(), or a helper thread (with the caller's context
+    variables) when the calling thread already runs an event loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    result: Dict[str, Any] = {}
+
+    def runner() -> None:
+        try:
+            result['value'] = asyncio.run(coro)
+        except BaseException as e:
+            result['error'] = e
+
+    context = contextvars.copy_context()
+    thread = threading.Thread(target=context.run, args=(runner,), name="broadcast-runtime")
+    thread.start()
+    thread.join()
+    if 'error' in result:
+        raise result['error']
+    return result['value']
+
+
+def _plan_kwargs(plan: Any) -> Dict[str, Any]:
+    """plan=... for engine calls when a slot carries a precompiled plan"""
+    return {'plan': plan} if plan is not None else {}
+
+
+@dataclass
+class StageStats:
+    """Timing of one pipeline stage"""
+    count: int = 0
+    seconds: float = 0.0
+    active: int = 0
+    peak: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'seconds': self.seconds,
+            'avg_seconds': self.seconds / self.count if self.count > 0 else 0.0,
+            'peak_concurrency': self.peak,
+            'errors': self.errors
+        }
+
+
+@dataclass
+class ResourceLimits:
+    """Concurrency limit per resource"""
+    llm: int = 1
+    chroma: int = 2
+    disk: int = 1
+
+
+class BroadcastRuntime:
+    """
+    Runs BroadcastEngine slots as an asyncio task graph.
+
+    Example:
+        runtime = BroadcastRuntime(engine, ResourceLimits(llm=4))
+        committed = await runtime.run_slots(slots, duration_hours=8)
+    """
+
+    def __init__(self,
+                 engine: Any,
+                 limits: Optional[ResourceLimits] = None,
+                 lookahead: int = 1):
+        """
+        Initialize runtime.
+
+        Args:
+            engine: BroadcastEngine whose stages are run
+            limits: Per-resource concurrency (llm defaults to the engine's
+                max_parallel_segments)
+            lookahead: Segments planned and retrieving beyond the LLM slots
+        """
+        self.engine = engine
+        self.limits = limits or ResourceLimits(llm=max(1, getattr(engine, 'max_parallel_segments', 1)))
+        self.lookahead = max(0, lookahead)
+        self.stages: Dict[str, StageStats] = {stage: StageStats() for stage in STAGES}
+
+    @property
+    def max_in_flight(self) -> int:
+        """Segments planned but not yet committed"""
+        return self.limits.llm + self.lookahead
+
+    async def _stage(self,
+                     stage: str,
+                     semaphore: Optional[asyncio.Semaphore],
+                     func: Callable[..., T],
+                     *args: Any) -> T:
+        """Run a blocking stage function in a worker thread under its limit"""
+        stats = self.stages[stage]
+        if semaphore is not None:
+            await semaphore.acquire()
+        stats.active += 1
+        stats.peak = max(stats.peak, stats.active)
+        start = time.time()
+        try:
+            return await asyncio.to_thread(func, *args)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.active -= 1
+            stats.count += 1
+            stats.seconds += time.time() - start
+            if semaphore is not None:
+                semaphore.release()
+
+    def _retrieve(self, job: Dict[str, Any]) -> None:
+        """Warm the RAG cache for a planned segment (errors are non-fatal)"""
+        generator = self.engine.generator
+        try:
+            with use_trace(job.get('trace')), span('rag.prefetch'):
+                generator.rag_cache.prefetch(
+                    query=job['context_query'],
+                    dj_context=generator.build_dj_context(self.engine.dj_name),
+                    num_chunks=generator.get_retrieval_size(),
+                    topic=generator._get_topic_for_content_type(job['generator_script_type'])
+                )
+        except Exception as e:
+            logger.warning(f"Retrieve stage failed for '{job.get('context_query')}': {e}")
+
+    async def _produce(self,
+                       job: Dict[str, Any],
+                       chroma: asyncio.Semaphore,
+                       llm: asyncio.Semaphore) -> Dict[str, Any]:
+        """retrieve -> generate (or a candidate race) for one planned segment"""
+        await self._stage('retrieve', chroma, self._retrieve, job)
+        # One slot per candidate: wait for the first, take more only while free
+        wanted = self.engine._candidate_count(job)
+        await llm.acquire()
+        slots = 1
+        while slots < wanted and not llm.locked():
+            await llm.acquire()
+            slots += 1
+        try:
+            return await self._stage('generate', None, self.engine._generate_job, job, slots)
+        finally:
+            for _ in range(slots):
+                llm.release()
+
+    async def run_slots(self,
+                        slots: List[Tuple[int, int, int]],
+                        duration_hours: int,
+                        retry_on_commit: bool = False,
+                        defer_llm_validation: bool = False,
+                        on_commit: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]] = None
+                        ) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Plan, retrieve, generate and commit slots.
+
+        The plan of a segment that follows a story-beat or emergency segment
+        waits for that segment's commit, and the pipeline drains before a
+        checkpoint hour (see BroadcastEngine._generate_sequence_pipelined()).
+
+        Args:
+            slots: (hour_offset, hour, segment_num[, plan]) from _sequence_slots()
+            duration_hours: Sequence duration (for checkpoints)
+            retry_on_commit: Run the retry loop for each segment as it commits
+            defer_llm_validation: Leave LLM validation to the caller
+            on_commit: Called with (job, segment) as each segment commits,
+                as the disk-limited write stage; committed pairs are then
+                not kept
+
+        Returns:
+            (job, segment) pairs in slot order (empty with on_commit)
+        """
+        engine = self.engine
+        llm = asyncio.Semaphore(self.limits.llm)
+        chroma = asyncio.Semaphore(self.limits.chroma)
+        disk = asyncio.Semaphore(self.limits.disk)
+
+        committed: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+        in_flight: deque = deque()  # (job, task) in segment order
+        next_slot = 0
+
+        try:
+            while next_slot < len(slots) or in_flight:
+                # Plan ahead
+                while next_slot < len(slots) and len(in_flight) < self.max_in_flight:
+                    hour_offset, current_hour, segment_num = slots[next_slot][:3]
+                    plan = slots[next_slot][3] if len(slots[next_slot]) > 3 else None
+                    if in_flight and in_flight[-1][0].get('barrier'):
+                        break
+                    if segment_num == 0:
+                        if in_flight and engine._checkpoint_due(hour_offset):
+                            break  # Checkpoint only once earlier hours are committed
+                        await self._stage('checkpoint', disk, engine._start_hour,
+                                          hour_offset, current_hour, duration_hours)
+
+                    start = time.time()
+                    job = engine._prepare_segment(current_hour, reserve=True,
+                                                  **_plan_kwargs(plan))
+                    self.stages['plan'].count += 1
+                    self.stages['plan'].seconds += time.time() - start
+
+                    job['barrier'] = 'segment_result' in job or bool(job.get('story_context'))
+                    task = None
+                    if 'segment_result' not in job:
+                        task = asyncio.create_task(self._produce(job, chroma, llm))
+                    in_flight.append((job, task))
+                    next_slot += 1
+
+                # Commit the oldest segment
+                job, task = in_flight.popleft()
+                try:
+                    if task is None:
+                        segment = job['segment_result']
+                    else:
+                        segment = await self._stage('commit', None, engine._commit_generated,
+                                                    job, await task, defer_llm_validation)
+                    if retry_on_commit:
+                        segment = await self._stage('commit', None, lambda: engine._generate_with_retries(
+                            job['hour'], first_attempt=segment, **_plan_kwargs(job.get('plan'))))
+                except CircuitOpenError as e:
+                    segment = engine._llm_unavailable_segment(job['hour'], job.get('segment_type'), e)
+                if on_commit is None:
+                    committed.append((job, segment))
+                else:
+                    await self._stage('write', disk, on_commit, job, segment)
+        finally:
+            for _, task in in_flight:
+                if task is not None:
+                    task.cancel()
+
+        return committed
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get per-stage statistics.
+
+        Returns:
+            Dictionary with limits and count/time/peak concurrency per stage
+        """
+        return {
+            'limits': {
+                'llm': self.limits.llm,
+                'chroma': self.limits.chroma,
+                'disk': self.limits.disk,
+                'in_flight': self.max_in_flight
+            },
+            'stages': {stage: stats.to_dict() for stage, stats in self.stages.items()}
+        }
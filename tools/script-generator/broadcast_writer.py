@@ -0,0 +1,270 @@
+"""
+Broadcast Writer - streams committed segments to disk
+
+broadcast.py used to keep every segment in memory and write one JSON file at
+the end, so a crash lost the whole run. A BroadcastWriter appends each
+segment as soon as the engine commits it (after validation and retries) and
+writes the summary in finalize():
+
+- JsonlBroadcastWriter (.jsonl): one JSON record per line - a metadata
+  record, one record per segment, and a summary record on finalize
+- SqliteBroadcastWriter (.db / .sqlite): broadcasts and segments tables,
+  segments indexed on (dj, hour, segment_type); one file can hold many runs
+
+Usage:
+    with open_writer("output/broadcast_julie.jsonl", metadata) as writer:
+        engine.generate_broadcast_sequence(8, 168, on_segment=writer.write_segment)
+        writer.finalize(engine.end_broadcast())
+
+read_broadcast() loads either format back into the
+{'metadata', 'segments', 'stats'} document; a partial run (no summary yet,
+or a truncated last line) loads with stats None.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+import json
+import logging
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+JSONL_SUFFIXES = ('.jsonl',)
+SQLITE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+
+
+class BroadcastWriter:
+    """Base class: counts segments by type, serializes writes"""
+
+    def __init__(self, path: Union[str, Path], metadata: Dict[str, Any]):
+        """
+        Initialize writer.
+
+        Args:
+            path: Output file (parent directories are created)
+            metadata: Broadcast metadata (dj, duration_hours, ...)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.metadata = dict(metadata)
+        self.total_segments = 0
+        self.segments_by_type: Dict[str, int] = {}
+        self.finalized = False
+        self._lock = threading.Lock()
+
+    def write_segment(self, segment: Dict[str, Any]) -> None:
+        """Append a committed segment (thread-safe)"""
+        with self._lock:
+            self._write_segment(self.total_segments, segment)
+            self.total_segments += 1
+            segment_type = segment.get('segment_type', 'unknown')
+            self.segments_by_type[segment_type] = self.segments_by_type.get(segment_type, 0) + 1
+
+    def finalize(self, stats: Optional[Dict[str, Any]] = None) -> None:
+        """Write the summary and close the file"""
+        with self._lock:
+            if self.finalized:
+                return
+            self._write_summary({
+                'total_segments': self.total_segments,
+                'segments_by_type': dict(self.segments_by_type),
+                'finalized_at': datetime.now().isoformat(),
+                'stats': stats
+            })
+            self.finalized = True
+            self._close()
+
+    def close(self) -> None:
+        """Close without a summary (the output stays a usable partial run)"""
+        with self._lock:
+            self._close()
+
+    def __enter__(self) -> 'BroadcastWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _write_segment(self, index: int, segment: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def _write_summary(self, summary: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def _close(self) -> None:
+        raise NotImplementedError
+
+
+class JsonlBroadcastWriter(BroadcastWriter):
+    """One JSON record per line, flushed after every segment"""
+
+    def __init__(self, path: Union[str, Path], metadata: Dict[str, Any]):
+        super().__init__(path, metadata)
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._append({'record': 'metadata', 'metadata': self.metadata})
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+        self._file.flush()
+
+    def _write_segment(self, index: int, segment: Dict[str, Any]) -> None:
+        self._append({'record': 'segment', 'index': index, 'segment': segment})
+
+    def _write_summary(self, summary: Dict[str, Any]) -> None:
+        self._append({'record': 'summary', **summary})
+
+    def _close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+
+class SqliteBroadcastWriter(BroadcastWriter):
+    """SQLite tables, committed after every segment"""
+
+    def __init__(self, path: Union[str, Path], metadata: Dict[str, Any]):
+        super().__init__(path, metadata)
+        self._conn: Optional[sqlite3.Connection] = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        create_schema(self._conn)
+        cursor = self._conn.execute(
+            "INSERT INTO broadcasts (dj, started_at, metadata) VALUES (?, ?, ?)",
+            (self.metadata.get('dj'), datetime.now().isoformat(),
+             json.dumps(self.metadata, ensure_ascii=False, default=str))
+        )
+        self._conn.commit()
+        self.broadcast_id = cursor.lastrowid
+
+    def _write_segment(self, index: int, segment: Dict[str, Any]) -> None:
+        self._conn.execute(
+            "INSERT INTO segments (broadcast_id, idx, dj, hour, segment_type, script, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (self.broadcast_id, index, self.metadata.get('dj'),
+             segment.get('metadata', {}).get('hour'), segment.get('segment_type'),
+             segment.get('script', ''), json.dumps(segment, ensure_ascii=False, default=str))
+        )
+        self._conn.commit()
+
+    def _write_summary(self, summary: Dict[str, Any]) -> None:
+        self._conn.execute(
+            "UPDATE broadcasts SET finalized_at = ?, summary = ? WHERE id = ?",
+            (summary['finalized_at'], json.dumps(summary, ensure_ascii=False, default=str), self.broadcast_id)
+        )
+        self._conn.commit()
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def create_schema(conn: sqlite3.Connection) -> None:
+    """Create the broadcasts / segments tables if missing"""
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS broadcasts ("
+        " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+        " dj TEXT,"
+        " started_at TEXT NOT NULL,"
+        " finalized_at TEXT,"
+        " metadata TEXT NOT NULL,"
+        " summary TEXT)"
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS segments ("
+        " broadcast_id INTEGER NOT NULL REFERENCES broadcasts(id),"
+        " idx INTEGER NOT NULL,"
+        " dj TEXT,"
+        " hour INTEGER,"
+        " segment_type TEXT,"
+        " script TEXT NOT NULL,"
+        " data TEXT NOT NULL,"
+        " PRIMARY KEY (broadcast_id, idx))"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_segments_dj_hour_type ON segments (dj, hour, segment_type)")
+    conn.commit()
+
+
+def open_writer(path: Union[str, Path], metadata: Dict[str, Any]) -> BroadcastWriter:
+    """
+    Open a writer for the output file's format.
+
+    Args:
+        path: .jsonl, or .db / .sqlite / .sqlite3
+        metadata: Broadcast metadata
+
+    Raises:
+        ValueError: Unsupported file extension
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix in JSONL_SUFFIXES:
+        return JsonlBroadcastWriter(path, metadata)
+    if suffix in SQLITE_SUFFIXES:
+        return SqliteBroadcastWriter(path, metadata)
+    raise ValueError(f"Unsupported streaming output '{path}' (use .jsonl, .db or .sqlite)")
+
+
+def read_broadcast(path: Union[str, Path], broadcast_id: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Load streamed output as a broadcast document.
+
+    Args:
+        path: File written by a BroadcastWriter
+        broadcast_id: SQLite only - run to load (None = latest)
+
+    Returns:
+        {'metadata', 'segments', 'stats', 'finalized'}
+    """
+    path = Path(path)
+    if path.suffix.lower() in SQLITE_SUFFIXES:
+        return _read_sqlite(path, broadcast_id)
+
+    document: Dict[str, Any] = {'metadata': {}, 'segments': [], 'stats': None, 'finalized': False}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping unreadable line {line_number} in {path} (interrupted write?)")
+                continue
+            kind = record.get('record')
+            if kind == 'metadata':
+                document['metadata'] = record.get('metadata', {})
+            elif kind == 'segment':
+                document['segments'].append(record.get('segment'))
+            elif kind == 'summary':
+                document['stats'] = record.get('stats')
+                document['finalized'] = True
+    document['metadata']['total_segments'] = len(document['segments'])
+    return document
+
+
+def _read_sqlite(path: Path, broadcast_id: Optional[int]) -> Dict[str, Any]:
+    conn = sqlite3.connect(str(path))
+    try:
+        if broadcast_id is None:
+            row = conn.execute("SELECT id, metadata, summary FROM broadcasts ORDER BY id DESC LIMIT 1").fetchone()
+        else:
+            row = conn.execute("SELECT id, metadata, summary FROM broadcasts WHERE id = ?", (broadcast_id,)).fetchone()
+        if row is None:
+            raise ValueError(f"No broadcast found in {path}")
+        segments = [
+            json.loads(data)
+            for (data,) in conn.execute(
+                "SELECT data FROM segments WHERE broadcast_id = ? ORDER BY idx", (row[0],)
+            )
+        ]
+    finally:
+        conn.close()
+
+    summary = json.loads(row[2]) if row[2] else None
+    metadata = json.loads(row[1])
+    metadata['total_segments'] = len(segments)
+    return {
+        'metadata': metadata,
+        'segments': segments,
+        'stats': summary['stats'] if summary else None,
+        'finalized': summary is not None
+    }
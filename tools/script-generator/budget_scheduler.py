@@ -0,0 +1,239 @@
+"""
+Budget Scheduler - adaptive degradation under a wall-clock budget
+
+A long run (--days 7) can take far longer than expected when validation
+retries pile up. BudgetScheduler projects the finish time from what it has
+observed so far - seconds per attempt (moving average) and attempts per
+segment (retry rate), per segment type, divided by the parallelism actually
+achieved when segments are generated concurrently - and steps down a ladder
+of cheaper settings while the projection overshoots the budget:
+
+    1. rules_validation      hybrid/LLM validation -> rule-based checks only
+    2. short_output          lower num_predict (project_config.BUDGET_NUM_PREDICT)
+    3. templated_time_check  time checks from the content_types.time_check
+                             templates, without an LLM call
+
+Steps are taken back, last one first, once the projection is comfortably
+inside the budget again. A few segments must be observed between changes,
+so the estimates reflect the current level before the next decision.
+
+    budget = BudgetScheduler(6 * 3600)
+    budget.add_segments(96)
+    for each segment:
+        steps = budget.active_steps()   # applied by BroadcastEngine
+        ... generate ...
+        budget.observe('gossip', seconds, attempt, steps)
+"""
+
+from typing import Dict, Any, Optional, List, Tuple, Callable, Sequence
+import threading
+import time
+
+DEGRADATION_LADDER = ('rules_validation', 'short_output', 'templated_time_check')
+
+
+class BudgetScheduler:
+    """
+    Degrade generation settings to finish within a wall-clock budget.
+
+    Example:
+        budget = BudgetScheduler(budget_seconds=4 * 3600)
+        budget.add_segments(64)
+        budget.observe('news', 42.0, attempt=1)
+        budget.active_steps()  # e.g. ('rules_validation',)
+        budget.get_statistics()['projected_seconds']
+    """
+
+    def __init__(self,
+                 budget_seconds: float,
+                 ladder: Sequence[str] = DEGRADATION_LADDER,
+                 tolerance: float = 0.05,
+                 recovery_margin: float = 0.15,
+                 min_samples: int = 3,
+                 cooldown: int = 3,
+                 smoothing: float = 0.3,
+                 concurrency: int = 1,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize scheduler (the budget clock starts now).
+
+        Args:
+            budget_seconds: Wall-clock seconds the run may take
+            ladder: Degradation steps, cheapest quality loss first
+            tolerance: Degrade when the projection exceeds the budget by
+                more than this fraction
+            recovery_margin: Restore a step when the projection is this
+                fraction under the budget
+            min_samples: Segments observed before the first decision
+            cooldown: Segments observed between two decisions
+            smoothing: Weight of the newest sample in the per-type
+                seconds-per-attempt moving average
+            concurrency: Segments in flight at once (pipelined runs: LLM
+                slots plus look-ahead); caps the parallelism estimate
+            clock: Time source (monotonic seconds)
+        """
+        if budget_seconds <= 0:
+            raise ValueError(f"budget_seconds must be positive, got {budget_seconds}")
+        self.budget_seconds = float(budget_seconds)
+        self.ladder: Tuple[str, ...] = tuple(ladder)
+        self.tolerance = tolerance
+        self.recovery_margin = recovery_margin
+        self.min_samples = min_samples
+        self.cooldown = cooldown
+        self.smoothing = smoothing
+        self.concurrency = max(1, concurrency)
+        self._clock = clock
+        self.started = clock()
+
+        self.level = 0
+        self.planned = 0
+        self.completed = 0
+        self.decisions: List[Dict[str, Any]] = []
+        self.degraded_segments: Dict[str, int] = {}
+        self._types: Dict[str, Dict[str, float]] = {}  # type -> segments, attempts, seconds (EMA)
+        self._busy_seconds = 0.0  # Sum of observed attempt seconds
+        self._since_change = cooldown  # Only min_samples delays the first decision
+        self._lock = threading.Lock()
+
+    def add_segments(self, count: int) -> None:
+        """Announce segments still to be generated (e.g. a broadcast sequence)"""
+        with self._lock:
+            self.planned += max(0, count)
+
+    def skip_step(self, step: str) -> None:
+        """Remove a step that cannot apply (e.g. rules_validation without an LLM validator)"""
+        with self._lock:
+            active = self.ladder[:self.level]
+            self.ladder = tuple(s for s in self.ladder if s != step)
+            self.level = len([s for s in active if s != step])
+
+    def elapsed(self) -> float:
+        """Seconds since the budget clock started"""
+        return self._clock() - self.started
+
+    def active_steps(self) -> Tuple[str, ...]:
+        """Degradation steps currently in force"""
+        with self._lock:
+            return self.ladder[:self.level]
+
+    def _segment_cost(self, stats: Dict[str, float]) -> float:
+        """Expected seconds for one segment of a type, retries included"""
+        return stats['seconds'] * stats['attempts'] / max(1, stats['segments'])
+
+    def _parallelism(self) -> float:
+        """Segments in flight on average so far: attempt seconds per elapsed second (Little's law)"""
+        elapsed = self.elapsed()
+        if self.concurrency <= 1 or elapsed <= 0:
+            return 1.0
+        return min(float(self.concurrency), max(1.0, self._busy_seconds / elapsed))
+
+    def _projected_seconds(self) -> Optional[float]:
+        total_segments = sum(stats['segments'] for stats in self._types.values())
+        if not total_segments:
+            return None
+        # Remaining segments follow the type mix seen so far
+        mean_cost = sum(
+            stats['segments'] * self._segment_cost(stats) for stats in self._types.values()
+        ) / total_segments
+        remaining = max(0, self.planned - self.completed)
+        return self.elapsed() + remaining * mean_cost / self._parallelism()
+
+    def projected_seconds(self) -> Optional[float]:
+        """Projected total run time at the current level (None before the first segment)"""
+        with self._lock:
+            return self._projected_seconds()
+
+    def observe(self,
+                segment_type: str,
+                seconds: float,
+                attempt: int = 1,
+                steps: Sequence[str] = ()) -> Optional[Dict[str, Any]]:
+        """
+        Record a finished generation attempt and re-plan.
+
+        Args:
+            segment_type: Segment type of the attempt
+            seconds: Wall seconds the attempt took
+            attempt: Attempt number (1 = first attempt of a new segment)
+            steps: Degradation steps applied to the attempt
+
+        Returns:
+            The decision dict if the level changed, else None
+        """
+        with self._lock:
+            stats = self._types.get(segment_type)
+            if stats is None:
+                stats = self._types[segment_type] = {'segments': 0, 'attempts': 0, 'seconds': seconds}
+            else:
+                stats['seconds'] += self.smoothing * (seconds - stats['seconds'])
+            stats['attempts'] += 1
+            self._busy_seconds += seconds
+            if attempt <= 1:
+                stats['segments'] += 1
+                self.completed += 1
+                self._since_change += 1
+                for step in steps:
+                    self.degraded_segments[step] = self.degraded_segments.get(step, 0) + 1
+            return self._replan()
+
+    def _replan(self) -> Optional[Dict[str, Any]]:
+        if self.completed < self.min_samples or self._since_change < self.cooldown:
+            return None
+        projected = self._projected_seconds()
+        if projected is None:
+            return None
+
+        if projected > self.budget_seconds * (1 + self.tolerance) and self.level < len(self.ladder):
+            self.level += 1
+            action, step = 'degrade', self.ladder[self.level - 1]
+        elif projected < self.budget_seconds * (1 - self.recovery_margin) and self.level > 0:
+            self.level -= 1
+            action, step = 'restore', self.ladder[self.level]
+        else:
+            return None
+
+        self._since_change = 0
+        decision = {
+            'action': action,
+            'step': step,
+            'level': self.level,
+            'segment': self.completed,
+            'elapsed_seconds': round(self.elapsed(), 1),
+            'projected_seconds': round(projected, 1),
+            'budget_seconds': self.budget_seconds
+        }
+        self.decisions.append(decision)
+        return decision
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get budget statistics.
+
+        Returns:
+            Dictionary with budget, elapsed and projected seconds, active
+            steps, per-type costs and retry rates, and the decision log
+        """
+        with self._lock:
+            projected = self._projected_seconds()
+            return {
+                'budget_seconds': self.budget_seconds,
+                'elapsed_seconds': round(self.elapsed(), 1),
+                'projected_seconds': round(projected, 1) if projected is not None else None,
+                'planned_segments': self.planned,
+                'completed_segments': self.completed,
+                'level': self.level,
+                'parallelism': round(self._parallelism(), 2),
+                'active_steps': list(self.ladder[:self.level]),
+                'degraded_segments': dict(self.degraded_segments),
+                'by_type': {
+                    segment_type: {
+                        'segments': int(stats['segments']),
+                        'attempts': int(stats['attempts']),
+                        'retry_rate': round(stats['attempts'] / max(1, stats['segments']) - 1, 3),
+                        'seconds_per_attempt': round(stats['seconds'], 3),
+                        'seconds_per_segment': round(self._segment_cost(stats), 3)
+                    }
+                    for segment_type, stats in self._types.items()
+                },
+                'decisions': list(self.decisions)
+            }
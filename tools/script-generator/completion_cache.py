@@ -0,0 +1,187 @@
+"""
+Completion Cache - Persistent prompt→completion cache for deterministic LLM calls
+
+Validation, story act generation and regeneration runs often send
+byte-identical prompts with identical options. OllamaClient consults this
+cache before calling the server, so re-validating an existing broadcast or
+re-running story extraction does not re-hit the GPU.
+
+Entries are content-addressed: the key is a SHA-256 of the model, prompt and
+(canonical JSON) options. Storage is a single SQLite file, opened lazily on
+first use, safe to share between threads.
+
+Caching is opt-in per call (see should_cache()):
+- temperature == 0 calls are deterministic and always cacheable
+- other calls are cached only when the call site passes a cache_tag
+  (e.g. "llm_validation", "story_acts")
+"""
+
+from typing import Dict, Any, Optional, Union
+from pathlib import Path
+from datetime import datetime
+import hashlib
+import json
+import sqlite3
+import threading
+
+
+def completion_key(model: str, prompt: str, options: Optional[Dict[str, Any]] = None) -> str:
+    """Content hash of a generation request"""
+    canonical = json.dumps(
+        {'model': model, 'prompt': prompt, 'options': options or {}},
+        sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def should_cache(options: Optional[Dict[str, Any]], cache_tag: Optional[str] = None) -> bool:
+    """Opt-in policy: deterministic calls (temperature 0) or explicitly tagged ones"""
+    if cache_tag:
+        return True
+    return (options or {}).get('temperature') == 0
+
+
+class CompletionCache:
+    """
+    SQLite-backed completion cache.
+
+    Usage:
+        cache = CompletionCache("cache/llm_completions.sqlite")
+        text = cache.get(model, prompt, options)
+        if text is None:
+            text = call_llm(...)
+            cache.put(model, prompt, options, text, tag="llm_validation")
+    """
+
+    def __init__(self, db_path: Union[str, Path] = ":memory:"):
+        """
+        Initialize completion cache.
+
+        Args:
+            db_path: SQLite file (":memory:" for a process-local cache)
+        """
+        self.db_path = str(db_path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use"""
+        if self._conn is None:
+            if self.db_path != ":memory:":
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            if self.db_path != ":memory:":
+                conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS completions ("
+                " key TEXT PRIMARY KEY,"
+                " model TEXT NOT NULL,"
+                " tag TEXT,"
+                " completion TEXT NOT NULL,"
+                " created_at TEXT NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, model: str, prompt: str, options: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Return the cached completion, or None on a miss"""
+        key = completion_key(model, prompt, options)
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT completion FROM completions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def put(self,
+            model: str,
+            prompt: str,
+            options: Optional[Dict[str, Any]],
+            completion: str,
+            tag: Optional[str] = None) -> None:
+        """Store a completion (replaces an existing entry)"""
+        key = completion_key(model, prompt, options)
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO completions (key, model, tag, completion, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, model, tag, completion, datetime.now().isoformat())
+            )
+            conn.commit()
+            self.stores += 1
+
+    def clear(self, tag: Optional[str] = None) -> int:
+        """
+        Delete cached completions.
+
+        Args:
+            tag: Only delete entries with this tag (None = everything)
+
+        Returns:
+            Number of entries deleted
+        """
+        with self._lock:
+            conn = self._connection()
+            if tag is None:
+                cursor = conn.execute("DELETE FROM completions")
+            else:
+                cursor = conn.execute("DELETE FROM completions WHERE tag = ?", (tag,))
+            conn.commit()
+            return cursor.rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM completions").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        total = self.hits + self.misses
+        return {
+            'db_path': self.db_path,
+            'hits': self.hits,
+            'misses': self.misses,
+            'stores': self.stores,
+            'hit_rate': (self.hits / total * 100) if total > 0 else 0.0,
+            'entries': len(self)
+        }
+
+
+_shared_caches: Dict[str, CompletionCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def default_completion_cache(config: Any) -> Optional[CompletionCache]:
+    """
+    Process-wide cache at config.COMPLETION_CACHE_PATH.
+
+    Args:
+        config: The project_config module
+
+    Returns:
+        Shared CompletionCache, or None when config.COMPLETION_CACHE_ENABLED
+        is False
+    """
+    if not getattr(config, 'COMPLETION_CACHE_ENABLED', False):
+        return None
+    db_path = str(config.COMPLETION_CACHE_PATH)
+    with _shared_caches_lock:
+        if db_path not in _shared_caches:
+            _shared_caches[db_path] = CompletionCache(db_path)
+        return _shared_caches[db_path]
@@ -0,0 +1,296 @@
+"""
+Context Packer - Token-budgeted lore context for prompt templates
+
+Replaces the old "join top chunks, cut at 2000 chars" step in
+ScriptGenerator.generate_script. Retrieved chunks overlap (the chunker uses
+a 100-token overlap), and a blind character cut drops text mid-sentence
+while still sending arbitrary prompt sizes to Ollama.
+
+Packing stages:
+1. Split chunks into sentences and drop sentences already seen (dedupes
+   chunk overlap and near-duplicate chunks).
+2. Score each sentence by relevance to the RAG query (term overlap weighted
+   by rarity, with a small prior for higher-ranked chunks).
+3. Greedily keep the best sentences that fit the per-template token budget
+   (running count, one tokenizer call per sentence), then emit them in
+   original document order.
+
+Token counting uses the LLM's Hugging Face tokenizer when it is available
+locally (project_config.LLM_TOKENIZER) and falls back to a chars/4 estimate.
+"""
+
+from typing import Dict, Any, Optional, List, Callable
+from dataclasses import dataclass
+import logging
+import math
+import re
+
+logger = logging.getLogger(__name__)
+
+
+# Lore context token budgets per template (roughly the old 2000-char cap = ~500 tokens)
+TEMPLATE_TOKEN_BUDGETS = {
+    'weather': 350,
+    'news': 500,
+    'gossip': 450,
+    'time': 200,
+    'music_intro': 300,
+    'emergency_weather': 300,
+}
+DEFAULT_TOKEN_BUDGET = 500
+
+# Sentence boundary: end punctuation followed by whitespace and a capital/quote/digit
+SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+(?=["\'(A-Z0-9])')
+WORD_PATTERN = re.compile(r"[a-z0-9]+(?:['\-][a-z0-9]+)*")
+
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has",
+    "in", "is", "it", "its", "of", "on", "or", "that", "the", "to", "was",
+    "were", "with", "this", "which", "who",
+})
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count (~4 characters per token for Llama-family models)"""
+    if not text:
+        return 0
+    return max(1, math.ceil(len(text) / 4))
+
+
+def load_token_counter(tokenizer_name: Optional[str] = None) -> Callable[[str], int]:
+    """
+    Build a token counting function.
+
+    Args:
+        tokenizer_name: Hugging Face tokenizer id (loaded from the local cache only)
+
+    Returns:
+        Callable(text) -> token count; falls back to estimate_tokens
+    """
+    if not tokenizer_name:
+        return estimate_tokens
+
+    try:
+        from transformers import AutoTokenizer
+        tokenizer = AutoTokenizer.from_pretrained(tokenizer_name, local_files_only=True)
+    except Exception as e:
+        logger.info(f"Tokenizer '{tokenizer_name}' unavailable ({e}); using chars/4 estimate")
+        return estimate_tokens
+
+    def count_tokens(text: str) -> int:
+        return len(tokenizer.encode(text, add_special_tokens=False))
+
+    return count_tokens
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences (paragraph breaks are sentence breaks too)"""
+    sentences = []
+    for paragraph in text.split('\n'):
+        paragraph = paragraph.strip()
+        if paragraph:
+            sentences.extend(s.strip() for s in SENTENCE_SPLIT.split(paragraph) if s.strip())
+    return sentences
+
+
+def _terms(text: str) -> List[str]:
+    return [w for w in WORD_PATTERN.findall(text.lower()) if w not in STOPWORDS]
+
+
+def _normalize(sentence: str) -> str:
+    return ' '.join(WORD_PATTERN.findall(sentence.lower()))
+
+
+@dataclass
+class PackedContext:
+    """Result of packing retrieved chunks into a token budget"""
+    text: str
+    tokens_used: int
+    token_budget: int
+    chunks_considered: int
+    chunks_used: int
+    sentences_kept: int
+    sentences_dropped: int
+    duplicates_removed: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (without the packed text)"""
+        return {
+            'tokens_used': self.tokens_used,
+            'token_budget': self.token_budget,
+            'chunks_considered': self.chunks_considered,
+            'chunks_used': self.chunks_used,
+            'sentences_kept': self.sentences_kept,
+            'sentences_dropped': self.sentences_dropped,
+            'duplicates_removed': self.duplicates_removed
+        }
+
+
+class ContextPacker:
+    """
+    Packs retrieved RAG chunks into a per-template token budget.
+
+    Example:
+        packer = ContextPacker()
+        packed = packer.pack(documents, query="Appalachia 2102 weather", script_type="weather")
+        prompt = template.render(lore_context=packed.text, ...)
+    """
+
+    def __init__(self,
+                 token_budgets: Optional[Dict[str, int]] = None,
+                 default_budget: int = DEFAULT_TOKEN_BUDGET,
+                 token_counter: Optional[Callable[[str], int]] = None,
+                 tokenizer_name: Optional[str] = None,
+                 rank_prior: float = 0.15):
+        """
+        Initialize context packer.
+
+        Args:
+            token_budgets: Budget per script type (default: TEMPLATE_TOKEN_BUDGETS)
+            default_budget: Budget for script types not in token_budgets
+            token_counter: Callable(text) -> tokens (overrides tokenizer_name)
+            tokenizer_name: Hugging Face tokenizer id, loaded lazily on first use
+            rank_prior: Score bonus for sentences from higher-ranked chunks
+        """
+        self.token_budgets = dict(TEMPLATE_TOKEN_BUDGETS)
+        if token_budgets:
+            self.token_budgets.update(token_budgets)
+        self.default_budget = default_budget
+        self._token_counter = token_counter
+        self.tokenizer_name = tokenizer_name
+        self.rank_prior = rank_prior
+
+    @property
+    def token_counter(self) -> Callable[[str], int]:
+        """Token counting function (tokenizer loaded on first access)"""
+        if self._token_counter is None:
+            self._token_counter = load_token_counter(self.tokenizer_name)
+        return self._token_counter
+
+    def get_budget(self, script_type: Optional[str]) -> int:
+        """Token budget for a script type"""
+        return self.token_budgets.get(script_type, self.default_budget)
+
+    def pack(self,
+             documents: List[str],
+             query: str,
+             script_type: Optional[str] = None,
+             token_budget: Optional[int] = None) -> PackedContext:
+        """
+        Dedupe, score and pack documents into the token budget.
+
+        Args:
+            documents: Retrieved chunk texts, best first
+            query: RAG query used to retrieve them (drives relevance)
+            script_type: Template name (selects the budget)
+            token_budget: Explicit budget (overrides the template budget)
+
+        Returns:
+            PackedContext with text guaranteed to be within the budget
+        """
+        budget = token_budget if token_budget is not None else self.get_budget(script_type)
+        count = self.token_counter
+
+        # Stage 1: sentence split + dedupe across chunks
+        candidates = []  # (chunk_idx, sentence_idx, sentence)
+        seen = set()
+        duplicates = 0
+        for chunk_idx, doc in enumerate(documents):
+            for sentence_idx, sentence in enumerate(split_sentences(doc or '')):
+                key = _normalize(sentence)
+                if not key:
+                    continue
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
+                candidates.append((chunk_idx, sentence_idx, sentence))
+
+        if not candidates or budget <= 0:
+            return PackedContext('', 0, budget, len(documents), 0, 0, len(candidates), duplicates)
+
+        # Stage 2: relevance scoring (query-term overlap weighted by rarity)
+        query_terms = set(_terms(query))
+        doc_freq: Dict[str, int] = {}
+        sentence_terms = []
+        for _, _, sentence in candidates:
+            terms = set(_terms(sentence))
+            sentence_terms.append(terms)
+            for term in terms & query_terms:
+                doc_freq[term] = doc_freq.get(term, 0) + 1
+
+        n = len(candidates)
+        scored = []
+        for i, (chunk_idx, sentence_idx, sentence) in enumerate(candidates):
+            overlap = sentence_terms[i] & query_terms
+            relevance = sum(math.log(1.0 + n / doc_freq[t]) for t in overlap)
+            prior = self.rank_prior / (1 + chunk_idx) + self.rank_prior / (2 + sentence_idx)
+            scored.append((relevance + prior, i))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+
+        # Stage 3: greedy fill with a running token count (each sentence is
+        # counted once, plus one token for its separator), stopping once no
+        # sentence can fit the remaining budget
+        costs = [count(sentence) + 1 for _, _, sentence in candidates]
+        smallest = min(costs)
+        selected: List[int] = []  # Score order
+        tokens_used = 0
+        for _, i in scored:
+            if budget - tokens_used < smallest:
+                break
+            if tokens_used + costs[i] <= budget:
+                selected.append(i)
+                tokens_used += costs[i]
+
+        # Measure the assembled text; a tokenizer can merge across sentence
+        # joins, so drop the lowest-scored sentences until it fits exactly
+        text = self._assemble(candidates, sorted(selected))
+        tokens_used = count(text) if selected else 0
+        while tokens_used > budget:
+            selected.pop()
+            text = self._assemble(candidates, sorted(selected))
+            tokens_used = count(text) if selected else 0
+
+        # Nothing fit - keep a word-trimmed version of the single best sentence
+        if not selected:
+            text = self._trim_to_budget(candidates[scored[0][1]][2], budget)
+            tokens_used = count(text) if text else 0
+            selected_chunks = 1 if text else 0
+        else:
+            selected_chunks = len({candidates[i][0] for i in selected})
+
+        return PackedContext(
+            text=text,
+            tokens_used=tokens_used,
+            token_budget=budget,
+            chunks_considered=len(documents),
+            chunks_used=selected_chunks,
+            sentences_kept=len(selected) if selected else (1 if text else 0),
+            sentences_dropped=len(candidates) - (len(selected) if selected else (1 if text else 0)),
+            duplicates_removed=duplicates
+        )
+
+    @staticmethod
+    def _assemble(candidates: List[tuple], indices: List[int]) -> str:
+        """Join selected sentences in document order, chunks separated by blank lines"""
+        parts: List[str] = []
+        current_chunk = None
+        for i in indices:
+            chunk_idx, _, sentence = candidates[i]
+            if chunk_idx != current_chunk:
+                parts.append('\n\n' if parts else '')
+                current_chunk = chunk_idx
+            else:
+                parts.append(' ')
+            parts.append(sentence)
+        return ''.join(parts)
+
+    def _trim_to_budget(self, sentence: str, budget: int) -> str:
+        """Drop trailing words until the sentence fits the budget"""
+        words = sentence.split()
+        while words:
+            text = ' '.join(words) + '...'
+            if self.token_counter(text) <= budget:
+                return text
+            words = words[:-1]
+        return ''
@@ -7,6 +7,7 @@ Provides:
 - DJ-specific ChromaDB query filters based on temporal, spatial, and information access constraints
 - Confidence tier system for knowledge reliability
 - Narrative framing templates for character-authentic presentation
+- Compiled (normalised, simplified, hashable) filters via metadata_filter
 """
 
 from typing import Dict, Any, List, Optional, Tuple
@@ -14,6 +15,8 @@ from dataclasses import dataclass
 from enum import Enum
 import random
 
+from metadata_filter import Filter, compile_filter
+
 
 class ConfidenceTier(Enum):
     """Confidence levels for DJ knowledge"""
@@ -44,6 +47,9 @@ class DJKnowledgeProfile:
         self.time_period = time_period
         self.primary_location = primary_location
         self.region = region
+        
+        # Compiled filters keyed by compile_filter() arguments
+        self._compiled_filters: Dict[Tuple, Optional[Filter]] = {}
     
     def get_temporal_filter(self) -> Dict[str, Any]:
         """Get base temporal constraint for this DJ"""
@@ -183,6 +189,46 @@ class DJKnowledgeProfile:
             return filters[0]
         else:
             return {"$and": filters}
+    
+    def compile_filter(self,
+                       confidence_tier: str = "medium",
+                       min_freshness: Optional[float] = None,
+                       desired_tones: Optional[List[str]] = None,
+                       exclude_subjects: Optional[List[str]] = None,
+                       complexity_tier: Optional[str] = None) -> Optional[Filter]:
+        """
+        Get the compiled form of get_enhanced_filter().
+        
+        Built once per argument combination and reused. The result is
+        simplified (redundant clauses removed), hashable via cache_key, and
+        drives both ChromaDB (to_where) and local post-filtering (matches).
+        
+        Args:
+            confidence_tier: Base confidence level (high, medium, low)
+            min_freshness: Minimum freshness score (None = no filter)
+            desired_tones: List of acceptable tones (None = no filter)
+            exclude_subjects: List of subjects to exclude (None = no filter)
+            complexity_tier: Complexity level (None = no filter)
+        
+        Returns:
+            Simplified Filter, or None if nothing is filtered
+        """
+        key = (
+            confidence_tier,
+            min_freshness,
+            tuple(sorted(desired_tones)) if desired_tones else None,
+            tuple(sorted(exclude_subjects)) if exclude_subjects else None,
+            complexity_tier
+        )
+        if key not in self._compiled_filters:
+            self._compiled_filters[key] = compile_filter(self.get_enhanced_filter(
+                min_freshness=min_freshness,
+                desired_tones=desired_tones,
+                exclude_subjects=exclude_subjects,
+                complexity_tier=complexity_tier,
+                confidence_tier=confidence_tier
+            ))
+        return self._compiled_filters[key]
 
 
 class JulieProfile(DJKnowledgeProfile):
@@ -640,15 +686,15 @@ def query_with_confidence(
     """
     profile = get_dj_profile(dj_name)
     
-    # Get appropriate filter for confidence tier
-    if confidence_tier == ConfidenceTier.HIGH:
-        where_filter = profile.get_high_confidence_filter()
-    elif confidence_tier == ConfidenceTier.MEDIUM:
-        where_filter = profile.get_medium_confidence_filter()
-    elif confidence_tier == ConfidenceTier.LOW:
-        where_filter = profile.get_low_confidence_filter()
-    else:
+    # Get appropriate (compiled once, simplified) filter for confidence tier
+    if confidence_tier not in (ConfidenceTier.HIGH, ConfidenceTier.MEDIUM, ConfidenceTier.LOW):
         raise ValueError(f"Invalid confidence tier: {confidence_tier}")
+    compiled_filter = profile.compile_filter(confidence_tier.name.lower())
+    
+    # A contradictory filter can never match - skip the database round trip
+    if compiled_filter is not None and compiled_filter.is_never:
+        return []
+    where_filter = compiled_filter.to_where() if compiled_filter is not None else None
     
     # Execute query
     raw_results = ingestor.query(query_text, n_results=n_results, where=where_filter)
@@ -0,0 +1,150 @@
+"""
+Draft Tier - Speculative draft-then-verify generation
+
+Most segments pass validation on the first try, yet every one pays the full
+latency of the primary 8B model. With a draft model configured,
+ScriptGenerator first drafts the segment with a small local model and runs
+the rule-based checks on the draft:
+
+- ConsistencyValidator (temporal, forbidden topics/factions, tone)
+- required catchphrase present
+- minimum length
+
+The violations go through a ProgressiveQualityGate. A draft is rejected on
+any critical violation, or when it has quality issues and the running
+quality-issue rate of accepted drafts is above the gate's quality_threshold.
+Rejected drafts are regenerated with the primary model. DraftTier keeps
+per-tier pass rates and latency so the threshold can be tuned.
+"""
+
+from typing import Dict, Any, Optional, List
+import threading
+
+from consistency_validator import ValidationSeverity
+from quality_gate import ProgressiveQualityGate, QualityGateDecision
+
+
+# Drafts shorter than this are never accepted
+MIN_DRAFT_WORDS = 10
+
+
+class DraftTier:
+    """
+    Draft acceptance policy and per-tier statistics.
+
+    Example:
+        tier = DraftTier("llama3.2:3b", quality_threshold=0.05)
+        reason = tier.review(draft, violations, required_catchphrases=[...])
+        tier.record_draft(seconds, accepted=reason is None)
+    """
+
+    def __init__(self,
+                 draft_model: str,
+                 quality_threshold: float = 0.05,
+                 min_words: int = MIN_DRAFT_WORDS):
+        """
+        Initialize draft tier.
+
+        Args:
+            draft_model: Small Ollama model used for drafts
+            quality_threshold: Max rate of quality issues among accepted
+                drafts before drafts with quality issues are escalated
+            min_words: Reject drafts shorter than this
+        """
+        self.draft_model = draft_model
+        self.min_words = min_words
+        self.quality_gate = ProgressiveQualityGate(
+            critical_threshold=0,
+            quality_threshold=quality_threshold
+        )
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.draft_calls = 0
+        self.drafts_accepted = 0
+        self.draft_time = 0.0
+        self.primary_calls = 0
+        self.primary_time = 0.0
+        self.rejections: Dict[str, int] = {}
+
+    def review(self,
+               draft: str,
+               violations: List[Dict[str, Any]],
+               required_catchphrases: Optional[List[str]] = None) -> Optional[str]:
+        """
+        Decide whether a draft can ship.
+
+        Args:
+            draft: Draft script
+            violations: ConsistencyValidator violations for the draft
+            required_catchphrases: One of these must appear (None = no check)
+
+        Returns:
+            None if the draft is accepted, otherwise the rejection reason
+        """
+        if len(draft.split()) < self.min_words:
+            return "too_short"
+
+        if required_catchphrases:
+            draft_lower = draft.lower()
+            if not any(phrase.lower() in draft_lower for phrase in required_catchphrases):
+                return "missing_catchphrase"
+
+        with self._lock:
+            decision = self.quality_gate.evaluate(violations=violations)
+            if decision == QualityGateDecision.FAIL_CRITICAL:
+                return "critical_violation"
+
+            has_quality_issues = any(
+                v.get('severity') == ValidationSeverity.QUALITY for v in violations
+            )
+            if has_quality_issues:
+                quality_rate = self.quality_gate.get_statistics()['quality_rate']
+                if quality_rate > self.quality_gate.quality_threshold:
+                    return "quality_threshold"
+
+        return None
+
+    def record_draft(self, seconds: float, accepted: bool, reason: Optional[str] = None) -> None:
+        """Record a draft generation"""
+        with self._lock:
+            self.draft_calls += 1
+            self.draft_time += seconds
+            if accepted:
+                self.drafts_accepted += 1
+            elif reason:
+                self.rejections[reason] = self.rejections.get(reason, 0) + 1
+
+    def record_primary(self, seconds: float) -> None:
+        """Record a primary-model generation"""
+        with self._lock:
+            self.primary_calls += 1
+            self.primary_time += seconds
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get per-tier statistics.
+
+        Returns:
+            Dictionary with pass rates, latencies and rejection reasons
+        """
+        with self._lock:
+            total_time = self.draft_time + self.primary_time
+            return {
+                'draft_model': self.draft_model,
+                'quality_threshold': self.quality_gate.quality_threshold,
+                'draft': {
+                    'calls': self.draft_calls,
+                    'accepted': self.drafts_accepted,
+                    'pass_rate': (self.drafts_accepted / self.draft_calls * 100)
+                                 if self.draft_calls > 0 else 0.0,
+                    'avg_latency': self.draft_time / self.draft_calls if self.draft_calls > 0 else 0.0,
+                    'rejections': dict(self.rejections)
+                },
+                'primary': {
+                    'calls': self.primary_calls,
+                    'avg_latency': self.primary_time / self.primary_calls if self.primary_calls > 0 else 0.0
+                },
+                'total_llm_time': total_time,
+                'avg_seconds_per_segment': total_time / self.draft_calls if self.draft_calls > 0 else 0.0
+            }
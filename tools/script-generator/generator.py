@@ -16,11 +16,13 @@ All script generation operations are logged to 3 formats:
 
 import sys
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple, Union, Callable
 from datetime import datetime
 import json
 import random
 import re
+import threading
+import time
 
 # Add project root to path
 project_root = Path(__file__).resolve().parent.parent.parent
@@ -32,13 +34,18 @@ from logging_config import capture_output
 
 from jinja2 import Environment, FileSystemLoader, TemplateNotFound
 
-# Cross-package imports
-from tools.wiki_to_chromadb.chromadb_ingest import ChromaDBIngestor, query_for_dj
+# Cross-package imports (chromadb_ingest pulls in chromadb: imported on first use)
 from tools.shared import project_config
 
+if TYPE_CHECKING:
+    from tools.wiki_to_chromadb.chromadb_ingest import ChromaDBIngestor
+
 # Local imports (within script-generator)
 sys.path.insert(0, str(Path(__file__).parent))
-from ollama_client import OllamaClient
+from ollama_client import (
+    OllamaClient, AsyncOllamaClient, as_sync_client,
+    GenerationAborted, check_validators, extract_chat_text, response_timings
+)
 from personality_loader import load_personality, get_available_djs
 from session_memory import SessionMemory
 from world_state import WorldState
@@ -46,6 +53,18 @@ from broadcast_scheduler import BroadcastScheduler
 from consistency_validator import ConsistencyValidator
 from llm_validator import LLMValidator, HybridValidator, ValidationSeverity
 from rag_cache import RAGCache
+from context_packer import ContextPacker
+from completion_cache import default_completion_cache
+from ollama_governor import CircuitOpenError, default_governor, get_governor
+from prompt_layout import PromptLayout, build_persona_prompt
+from stream_validators import build_stream_validators
+from reranker import create_reranker, parse_dj_location
+from draft_tier import DraftTier
+from stage_timer import span, record
+
+
+class GenerationCancelled(RuntimeError):
+    """Generation stopped through cancel_event (e.g. another candidate won)"""
 
 
 class ScriptGenerator:
@@ -54,7 +73,14 @@ class ScriptGenerator:
     def __init__(self, 
                  templates_dir: Optional[str] = None,
                  chroma_db_dir: Optional[str] = None,
-                 ollama_url: Optional[str] = None):
+                 ollama_url: Optional[str] = None,
+                 retrieval_mode: str = "vector",
+                 reranker: Optional[str] = None,
+                 rerank_candidates: int = 10,
+                 ollama_client: Optional[Union[OllamaClient, AsyncOllamaClient]] = None,
+                 chat_api: Optional[bool] = None,
+                 draft_model: Optional[str] = None,
+                 draft_quality_threshold: float = 0.05):
         """
         Initialize script generator.
         
@@ -62,6 +88,17 @@ class ScriptGenerator:
             templates_dir: Path to Jinja2 templates (default: ./templates)
             chroma_db_dir: Path to ChromaDB (default: from relative path)
             ollama_url: Ollama server URL (default: from config)
+            retrieval_mode: RAG retrieval mode ('vector', 'lexical', 'hybrid')
+            reranker: Optional rerank stage ('features', 'cross-encoder', None)
+            rerank_candidates: Chunks to over-retrieve when reranking
+            ollama_client: Shared Ollama client, blocking or async (created from ollama_url if None)
+            chat_api: Send the static DJ persona as a stable /api/chat system
+                message so Ollama reuses its KV cache (default: from config)
+            draft_model: Small model that drafts each segment first; drafts
+                failing the rule-based checks are regenerated with the
+                primary model (None = primary model only)
+            draft_quality_threshold: Quality-issue rate tolerated in accepted
+                drafts (ProgressiveQualityGate quality_threshold)
         """
         # Setup paths
         self.script_dir = Path(__file__).parent
@@ -88,12 +125,41 @@ class ScriptGenerator:
             lstrip_blocks=True
         )
         
-        self.rag = ChromaDBIngestor(persist_directory=chroma_db_dir)
-        self.ollama = OllamaClient(base_url=ollama_url)
+        # ChromaDB (client, collection, embeddings) opens on first retrieval
+        self.chroma_db_dir = chroma_db_dir
+        self.ollama = as_sync_client(ollama_client) or OllamaClient(
+            base_url=ollama_url,
+            pool_size=getattr(project_config, 'OLLAMA_POOL_SIZE', 4),
+            completion_cache=default_completion_cache(project_config),
+            governor=default_governor(project_config)
+        )
         
         # PHASE 1 CHECKPOINT 1.2: Initialize RAG Cache
-        self.rag_cache = RAGCache(self.rag)
-        print(f"[OK] RAG Cache initialized (max_size={self.rag_cache.max_cache_size}, ttl={self.rag_cache.default_ttl}s)")
+        self.rag_cache = RAGCache(None, retrieval_mode=retrieval_mode,
+                                  ingestor_factory=self._open_chromadb)
+        print(f"[OK] RAG Cache initialized (max_size={self.rag_cache.max_cache_size}, ttl={self.rag_cache.default_ttl}s, mode={retrieval_mode})")
+        
+        # Optional rerank stage (over-retrieve, rerank, keep top context_chunks)
+        self.reranker = create_reranker(reranker)
+        self.rerank_candidates = rerank_candidates
+        if self.reranker:
+            print(f"[OK] Reranker enabled ({type(self.reranker).__name__}, {rerank_candidates} candidates)")
+        
+        # Prefix-stable prompts: persona in a stable system message, model kept loaded
+        self.chat_api = (getattr(project_config, 'OLLAMA_CHAT_API', False)
+                         if chat_api is None else chat_api)
+        self.keep_alive = getattr(project_config, 'OLLAMA_KEEP_ALIVE', None)
+        
+        # Speculative draft-then-verify tier
+        self.draft_tier: Optional[DraftTier] = None
+        if draft_model:
+            self.draft_tier = DraftTier(draft_model, quality_threshold=draft_quality_threshold)
+            print(f"[OK] Draft tier enabled ({draft_model}, quality threshold {draft_quality_threshold:.0%})")
+        
+        # Token-budgeted lore context (replaces the fixed 2000-char cut)
+        self.context_packer = ContextPacker(
+            tokenizer_name=getattr(project_config, 'LLM_TOKENIZER', None)
+        )
         
         # Check Ollama connection
         if not self.ollama.check_connection():
@@ -103,7 +169,6 @@ class ScriptGenerator:
             )
         
         print(f"[OK] Connected to Ollama")
-        print(f"[OK] ChromaDB loaded ({self.rag.get_collection_stats()['total_chunks']:,} chunks)")
         
         # PHASE 1: Session state management
         self.session_memory: Optional[SessionMemory] = None
@@ -116,11 +181,39 @@ class ScriptGenerator:
         
         # PHASE 2: Consistency validation
         self.consistency_validators: Dict[str, ConsistencyValidator] = {}  # {dj_name: validator}
+        # Validators keep per-call violations; generate_script() may run on several threads
+        self._consistency_lock = threading.Lock()
         
         # LLM-based validation (new)
         self.llm_validator: Optional[LLMValidator] = None
         self.hybrid_validator: Optional[HybridValidator] = None
     
+    @property
+    def rag(self) -> 'ChromaDBIngestor':
+        """ChromaDB ingestor (opened on first access)"""
+        return self.rag_cache.chromadb
+    
+    def _open_chromadb(self) -> 'ChromaDBIngestor':
+        """Open ChromaDB (called once, by the RAG cache)"""
+        from tools.wiki_to_chromadb.chromadb_ingest import ChromaDBIngestor
+        start = time.time()
+        rag = ChromaDBIngestor(persist_directory=self.chroma_db_dir)
+        print(f"[OK] ChromaDB loaded ({rag.get_collection_stats()['total_chunks']:,} chunks) "
+              f"in {time.time() - start:.1f}s")
+        return rag
+    
+    def warmup(self) -> float:
+        """
+        Open ChromaDB and load the embedding model (and BM25 index in
+        lexical/hybrid mode) ahead of the first segment.
+        
+        Returns:
+            Seconds spent warming up
+        """
+        start = time.time()
+        self.rag.query("warmup", n_results=1, mode=self.rag_cache.retrieval_mode)
+        return time.time() - start
+    
     def select_catchphrases(self,
                            personality: Dict,
                            script_type: str,
@@ -299,6 +392,42 @@ class ScriptGenerator:
         
         return topic_mapping.get(script_type)
     
+    def get_retrieval_size(self, n_results: int = 5) -> int:
+        """
+        Number of chunks actually requested from the RAG cache.
+        
+        Larger than n_results when a reranker is enabled (over-retrieval).
+        Used by the RAG prefetcher so warmed entries share cache keys.
+        """
+        if getattr(self, 'reranker', None):
+            return max(n_results, self.rerank_candidates)
+        return n_results
+    
+    def build_dj_context(self,
+                         dj_name: str,
+                         personality: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Build the DJ context used for RAG cache keys and filtering.
+        
+        Shared with the RAG prefetcher so warmed entries hit the same cache
+        keys as generate_script.
+        
+        Args:
+            dj_name: DJ query name (e.g., "Julie (2102, Appalachia)")
+            personality: Already-loaded personality (loaded if None)
+        
+        Returns:
+            Dict with 'name', 'year' and 'region'
+        """
+        if personality is None:
+            personality = load_personality(dj_name)
+        
+        return {
+            'name': dj_name,
+            'year': personality.get('year', 2102),
+            'region': personality.get('region', 'Unknown')
+        }
+    
     def get_natural_voice_elements(self,
                                    personality: Dict,
                                    script_type: str) -> Dict[str, Any]:
@@ -396,11 +525,17 @@ class ScriptGenerator:
                        top_p: float = 0.9,
                        n_results: int = 5,
                        context_chunks: int = 3,
+                       context_token_budget: Optional[int] = None,
                        enable_catchphrase_rotation: bool = True,
                        enable_natural_voice: bool = True,
                        enable_validation_retry: bool = True,
                        enable_consistency_validation: bool = True,
                        max_retries: int = 5,
+                       stream_validators: Optional[List[Callable[[str], Optional[str]]]] = None,
+                       stream_abort: bool = False,
+                       seed: Optional[int] = None,
+                       cancel_event: Optional[threading.Event] = None,
+                       num_predict: int = 300,
                        **template_vars) -> Dict[str, Any]:
         """
         Generate a script using RAG → Template → Ollama pipeline.
@@ -420,11 +555,20 @@ class ScriptGenerator:
             top_p: Top-p sampling (0.0-1.0)
             n_results: Number of RAG results to retrieve
             context_chunks: Number of top results to include in prompt
+            context_token_budget: Lore context token budget (default: per-template budget)
             enable_catchphrase_rotation: Use catchphrase system (Phase 2.6)
             enable_natural_voice: Use natural voice enhancements (Phase 2.6)
             enable_validation_retry: Retry if catchphrase missing (Phase 2.6)
             enable_consistency_validation: Validate against character constraints (Phase 2)
             max_retries: Maximum retry attempts
+            stream_validators: Incremental critical checks; the generation is
+                streamed and cancelled at the first violation
+            stream_abort: Build stream_validators from the DJ's character card
+            seed: Sampling seed (None = server default)
+            cancel_event: Stop as soon as this is set - the generation is
+                streamed and cancelled at the next fragment, and no retry
+                is made (raises GenerationCancelled)
+            num_predict: Maximum tokens to generate
             **template_vars: Additional template variables
         
         Returns:
@@ -447,6 +591,7 @@ class ScriptGenerator:
         Raises:
             ValueError: If DJ name or template is invalid
             RuntimeError: If generation fails after retries
+            GenerationCancelled: If cancel_event was set
         """
         print(f"\n{'='*80}")
         print(f"Generating {script_type.upper()} script for {dj_name}")
@@ -454,15 +599,19 @@ class ScriptGenerator:
         
         retry_count = 0
         last_error = None
+        stream_aborts: List[Dict[str, Any]] = []
         
         while retry_count <= max_retries:
             if retry_count > 0:
                 print(f"\n🔄 Retry attempt {retry_count}/{max_retries}...")
+            if cancel_event is not None and cancel_event.is_set():
+                raise GenerationCancelled("Generation cancelled")
             
             try:
                 # Step 1: Load personality
                 print(f"\n[1/5] Loading personality...")
-                personality = load_personality(dj_name)
+                with span('personality'):
+                    personality = load_personality(dj_name)
                 print(f"[OK] Loaded: {personality['name']}")
                 
                 # PHASE 2.6: Select catchphrases
@@ -490,40 +639,69 @@ class ScriptGenerator:
                 print(f"  Query: {context_query}")
                 
                 # Build DJ context for cache filtering
-                dj_context = {
-                    'name': dj_name,
-                    'year': personality.get('year', 2102),
-                    'region': personality.get('region', 'Unknown')
-                }
+                dj_context = self.build_dj_context(dj_name, personality)
                 
                 # Determine topic for cache indexing
                 topic = self._get_topic_for_content_type(script_type)
                 
                 # Query with cache (Phase 1)
-                rag_results = self.rag_cache.query_with_cache(
-                    query=context_query,
-                    dj_context=dj_context,
-                    num_chunks=n_results,
-                    topic=topic
-                )
+                with span('rag', topic=topic) as rag_span:
+                    misses_before = self.rag_cache.get_statistics().get('cache_misses')
+                    rag_results = self.rag_cache.query_with_cache(
+                        query=context_query,
+                        dj_context=dj_context,
+                        num_chunks=self.get_retrieval_size(n_results),
+                        topic=topic
+                    )
+                    cache_stats = self.rag_cache.get_statistics()
+                    rag_span['cache'] = 'miss' if cache_stats.get('cache_misses') != misses_before else 'hit'
                 
                 results_count = len(rag_results['documents'][0])
                 
                 # Log cache statistics (Phase 1)
-                cache_stats = self.rag_cache.get_statistics()
                 cache_info = "(cached)" if cache_stats['cache_hits'] > 0 else "(fresh)"
                 print(f"[OK] Retrieved {results_count} results {cache_info}")
                 print(f"      Cache: {cache_stats['hit_rate']:.1f}% hit rate, "
                       f"{cache_stats['cache_hits']} hits, {cache_stats['cache_misses']} misses")
                 
-                # Format context from top chunks
-                context_chunks_actual = min(context_chunks, results_count)
-                lore_context = "\n\n".join(rag_results['documents'][0][:context_chunks_actual])
+                # Optional rerank stage: reorder candidates, keep top context_chunks
+                documents = rag_results['documents'][0]
+                reranked = False
+                if getattr(self, 'reranker', None) and documents:
+                    candidates = [
+                        {
+                            'id': rag_results['ids'][0][i],
+                            'text': documents[i],
+                            'metadata': rag_results['metadatas'][0][i] or {},
+                            'distance': rag_results['distances'][0][i]
+                        }
+                        for i in range(len(documents))
+                    ]
+                    with span('rerank', candidates=len(candidates)):
+                        top = self.reranker.rerank(
+                            context_query,
+                            candidates,
+                            top_k=context_chunks,
+                            dj_region=parse_dj_location(dj_name)
+                        )
+                    documents = [chunk['text'] for chunk in top]
+                    reranked = True
+                    print(f"[OK] Reranked {len(candidates)} candidates -> top {len(documents)}")
                 
-                if len(lore_context) > 2000:
-                    lore_context = lore_context[:2000] + "..."
+                # Pack top chunks into the template's token budget
+                context_chunks_actual = min(context_chunks, len(documents))
+                with span('context_pack'):
+                    packed_context = self.context_packer.pack(
+                        documents=documents[:context_chunks_actual],
+                        query=context_query,
+                        script_type=script_type,
+                        token_budget=context_token_budget
+                    )
+                lore_context = packed_context.text
                 
-                print(f"  Using top {context_chunks_actual} chunks ({len(lore_context)} chars)")
+                print(f"  Using top {context_chunks_actual} chunks "
+                      f"({packed_context.tokens_used}/{packed_context.token_budget} tokens, "
+                      f"{packed_context.duplicates_removed} duplicate sentences removed)")
                 
                 # Step 3: Render template
                 print(f"\n[3/5] Rendering template...")
@@ -537,13 +715,20 @@ class ScriptGenerator:
                         f"Available: {', '.join(available)}"
                     )
                 
-                prompt = template.render(
-                    personality=personality,
-                    lore_context=lore_context,
-                    catchphrase=catchphrase_selection,  # NEW
-                    voice_elements=voice_elements,  # NEW
-                    **template_vars
-                )
+                # Canonical order: static persona (system message when using
+                # the chat API) -> session context -> dynamic content
+                with span('template', template=script_type):
+                    prompt = template.render(
+                        personality=personality,
+                        lore_context=lore_context,
+                        catchphrase=catchphrase_selection,  # NEW
+                        voice_elements=voice_elements,  # NEW
+                        persona_in_system=self.chat_api,
+                        **template_vars
+                    )
+                system_prompt = build_persona_prompt(personality) if self.chat_api else None
+                if system_prompt:
+                    prompt = prompt.strip()
                 
                 # PHASE 2.6: Add explicit catchphrase instruction on retry
                 if retry_count > 0 and enable_validation_retry and catchphrase_selection['should_use']:
@@ -567,16 +752,65 @@ class ScriptGenerator:
                 print(f"  Model: {model}")
                 print(f"  Temperature: {temperature}, Top-P: {top_p}")
                 
+                if stream_validators is None and stream_abort:
+                    stream_validators = build_stream_validators(personality)
+                if cancel_event is not None:
+                    stream_validators = list(stream_validators or []) + [
+                        lambda text: "cancelled" if cancel_event.is_set() else None
+                    ]
+                
+                options = {
+                    "temperature": temperature,
+                    "top_p": top_p,
+                    "num_predict": num_predict  # Limit output length
+                }
+                if seed is not None:
+                    options["seed"] = seed
+                
+                stream_aborted = False
+                draft_tier = getattr(self, 'draft_tier', None)
+                generation_tier = 'primary'
+                draft_rejection = None
                 try:
-                    script = self.ollama.generate(
-                        model=model,
-                        prompt=prompt,
-                        options={
-                            "temperature": temperature,
-                            "top_p": top_p,
-                            "num_predict": 300  # Limit output length
-                        }
-                    )
+                    script = None
+                    if draft_tier and retry_count == 0:
+                        required_catchphrases = None
+                        if enable_validation_retry and catchphrase_selection['should_use']:
+                            required_catchphrases = personality.get('catchphrases', [])[:3]
+                        with span('llm.draft') as draft_span:
+                            script, draft_rejection = self._generate_draft(
+                                dj_name, personality, prompt, options, system_prompt, required_catchphrases
+                            )
+                            draft_span['accepted'] = script is not None
+                        if script is not None:
+                            generation_tier = 'draft'
+                    
+                    if script is None:
+                        primary_start = time.perf_counter()
+                        with span('llm', model=model, attempt=retry_count):
+                            script = self._generate_text(
+                                model=model,
+                                prompt=prompt,
+                                options=options,
+                                validators=stream_validators,
+                                system=system_prompt
+                            )
+                        if draft_tier:
+                            draft_tier.record_primary(time.perf_counter() - primary_start)
+                except GenerationAborted as e:
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise GenerationCancelled("Generation cancelled") from e
+                    stream_aborts.append(e.to_dict())
+                    print(f"[ABORT] {e.violation} (after {e.fragments} fragments)")
+                    if self._may_retry(retry_count, max_retries):
+                        retry_count += 1
+                        last_error = str(e)
+                        continue  # Retry
+                    # Out of retries: keep the partial text for review
+                    script = e.partial_text
+                    stream_aborted = True
+                except CircuitOpenError:
+                    raise
                 except Exception as e:
                     print(f"❌ Generation failed: {e}")
                     raise RuntimeError(f"Ollama generation failed: {e}")
@@ -595,32 +829,29 @@ class ScriptGenerator:
                             print(f"[OK] Catchphrase validated: '{phrase[:30]}...'")
                             break
                     
-                    if not catchphrase_found and retry_count < max_retries:
+                    if not catchphrase_found and self._may_retry(retry_count, max_retries):
                         print(f"[WARN] No catchphrase detected, retrying...")
                         retry_count += 1
                         last_error = "Missing catchphrase"
                         continue  # Retry
                 
                 # PHASE 2: Consistency validation (temporal knowledge, forbidden topics, tone)
+                consistency_valid = False
+                violations: List[Any] = []
                 if enable_consistency_validation:
-                    if dj_name not in self.consistency_validators:
-                        self.consistency_validators[dj_name] = ConsistencyValidator(personality)
+                    consistency_valid, violations = self._check_consistency(dj_name, personality, script)
                     
-                    validator = self.consistency_validators[dj_name]
-                    is_valid = validator.validate(script)
-                    
-                    if is_valid:
+                    if consistency_valid:
                         print(f"[OK] Consistency validation passed")
                     else:
-                        violations = validator.get_violations()
-                        if retry_count < max_retries:
+                        if self._may_retry(retry_count, max_retries):
                             print(f"[WARN] Consistency violations detected ({len(violations)}), retrying...")
                             print(f"  Violations: {violations[0] if violations else 'Unknown'}")
                             retry_count += 1
                             last_error = f"Consistency violation: {violations[0] if violations else 'Unknown'}"
                             continue  # Retry
                         else:
-                            print(f"[WARN] Consistency violations after {max_retries} retries:")
+                            print(f"[WARN] Consistency violations after {retry_count} retries:")
                             for v in violations[:3]:
                                 print(f"  - {v}")
                             # Log but don't fail - log violations for review
@@ -639,14 +870,26 @@ class ScriptGenerator:
                         'rag_query': context_query,
                         'rag_results': results_count,
                         'context_chunks_used': context_chunks_actual,
+                        'context_packing': packed_context.to_dict(),
+                        'reranked': reranked,
+                        'prompt_layout': {
+                            'api': 'chat' if system_prompt else 'generate',
+                            'system_chars': len(system_prompt or ''),
+                            'user_chars': len(prompt)
+                        },
                         'temperature': temperature,
                         'top_p': top_p,
+                        'seed': seed,
                         'template_vars': template_vars,
                         'word_count': len(script.split()),
                         'retry_count': retry_count,
+                        'generation_tier': generation_tier,
+                        'draft_rejection': draft_rejection,
+                        'stream_aborts': stream_aborts,
+                        'stream_aborted': stream_aborted,
                         'catchphrase_used': catchphrase_selection.get('opening') if catchphrase_found else None,
-                        'consistency_validated': enable_consistency_validation and validator.validate(script),
-                        'consistency_violations': validator.get_violations() if enable_consistency_validation else []
+                        'consistency_validated': enable_consistency_validation and consistency_valid,
+                        'consistency_violations': violations
                     }
                 }
                 
@@ -657,15 +900,130 @@ class ScriptGenerator:
                 
                 return result
                 
+            except GenerationCancelled:
+                raise
             except Exception as e:
                 last_error = str(e)
-                if retry_count >= max_retries:
-                    raise  # Re-raise on final failure
+                if isinstance(e, CircuitOpenError) or not self._may_retry(retry_count, max_retries):
+                    raise  # Re-raise on final failure (or when Ollama is failing fast)
                 retry_count += 1
         
         # Should not reach here, but just in case
         raise RuntimeError(f"Generation failed after {max_retries} retries: {last_error}")
     
+    def _may_retry(self, retry_count: int, max_retries: int) -> bool:
+        """True if another attempt is allowed (local limit and the shared retry budget)"""
+        if retry_count >= max_retries:
+            return False
+        governor = get_governor(getattr(self, 'ollama', None))
+        return governor is None or governor.allow_retry()
+    
+    def _generate_draft(self,
+                        dj_name: str,
+                        personality: Dict[str, Any],
+                        prompt: str,
+                        options: Dict[str, Any],
+                        system: Optional[str],
+                        required_catchphrases: Optional[List[str]]) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Draft a script with the draft model and run the rule-based checks.
+        
+        Returns:
+            (draft, None) if the draft is accepted, else (None, rejection reason)
+        """
+        draft_model = self.draft_tier.draft_model
+        start = time.perf_counter()
+        try:
+            draft = self._generate_text(model=draft_model, prompt=prompt, options=options, system=system)
+        except Exception as e:
+            self.draft_tier.record_draft(time.perf_counter() - start, accepted=False, reason="draft_error")
+            print(f"[DRAFT] {draft_model} failed: {e}")
+            return None, "draft_error"
+        elapsed = time.perf_counter() - start
+        
+        _, violations = self._check_consistency(dj_name, personality, draft)
+        reason = self.draft_tier.review(draft, violations, required_catchphrases)
+        self.draft_tier.record_draft(elapsed, accepted=reason is None, reason=reason)
+        
+        if reason is None:
+            print(f"[DRAFT] Accepted {draft_model} draft ({elapsed:.2f}s)")
+            return draft, None
+        print(f"[DRAFT] Rejected ({reason}), regenerating with primary model")
+        return None, reason
+    
+    def get_tier_statistics(self) -> Optional[Dict[str, Any]]:
+        """Per-tier pass rates and latency (None without a draft model)"""
+        draft_tier = getattr(self, 'draft_tier', None)
+        return draft_tier.get_statistics() if draft_tier else None
+    
+    def _check_consistency(self,
+                           dj_name: str,
+                           personality: Dict[str, Any],
+                           script: str) -> Tuple[bool, List[Any]]:
+        """Validate against character constraints; returns (is_valid, violations)"""
+        with self._consistency_lock:
+            if dj_name not in self.consistency_validators:
+                self.consistency_validators[dj_name] = ConsistencyValidator(personality)
+            validator = self.consistency_validators[dj_name]
+            is_valid = validator.validate(script)
+            return is_valid, list(validator.get_violations())
+    
+    def _generate_text(self,
+                       model: str,
+                       prompt: str,
+                       options: Dict[str, Any],
+                       validators: Optional[List[Callable[[str], Optional[str]]]] = None,
+                       system: Optional[str] = None) -> str:
+        """
+        Generate text, streaming with early abort when validators are given.
+        
+        With a system message the persona goes first and unchanged on every
+        call (/api/chat, or the system field when streaming), so Ollama can
+        reuse the cached prompt prefix. Clients without chat() get the
+        flattened prompt.
+        
+        Clients without generate_streaming() fall back to a full generate()
+        followed by the same checks, so aborts behave identically (just
+        without the token savings).
+        
+        Raises:
+            GenerationAborted: If a validator reported a critical violation
+        """
+        if system is not None and not hasattr(self.ollama, 'chat'):
+            prompt = PromptLayout(system=system, user=prompt).flatten()
+            system = None
+        
+        if not validators:
+            if system is not None:
+                layout = PromptLayout(system=system, user=prompt)
+                response = self.ollama.chat(
+                    messages=layout.to_messages(), model=model,
+                    options=options, keep_alive=self.keep_alive
+                )
+                if isinstance(response, dict) and not response.get('cached'):
+                    # Server-side split of the 'llm' span (chat responses only)
+                    timings = response_timings(response)
+                    record('llm.prefill', timings['prompt_eval_ms'] / 1000,
+                           tokens=timings['prompt_eval_count'])
+                    record('llm.decode', timings['eval_ms'] / 1000, tokens=timings['eval_count'])
+                return extract_chat_text(response)
+            return self.ollama.generate(model=model, prompt=prompt, options=options)
+        
+        if hasattr(self.ollama, 'generate_streaming'):
+            stream_kwargs = {'system': system, 'keep_alive': self.keep_alive} if system is not None else {}
+            return self.ollama.generate_streaming(
+                model=model, prompt=prompt, options=options, validators=validators,
+                **stream_kwargs
+            )
+        
+        if system is not None:
+            prompt = PromptLayout(system=system, user=prompt).flatten()
+        script = self.ollama.generate(model=model, prompt=prompt, options=options)
+        violation = check_validators(script, validators, final=True)
+        if violation:
+            raise GenerationAborted(violation, script, 1)
+        return script
+    
     def save_script(self,
                     result: Dict[str, Any],
                     output_dir: Optional[Path] = None,
@@ -0,0 +1,320 @@
+"""
+Live Broadcast - continuous generation with a bounded look-ahead buffer
+
+broadcast.py normally generates a whole sequence and writes one JSON file at
+the end. LiveBroadcast instead keeps up to buffer_size ready segments ahead of
+what is on air, for a radio (ESP32) that pulls one segment at a time:
+
+- a producer thread calls BroadcastEngine.generate_next_segment() whenever
+  the buffer drops below low_watermark, and refills it to buffer_size
+- consumers take segments with next_segment() or over HTTP (GET /next)
+- the program clock advances one hour every segments_per_hour segments;
+  hourly checkpoints go through the engine's checkpoint manager, and the
+  scheduler starts a new day every 24 program hours
+
+The first segment is served as soon as it is generated. Memory stays bounded
+for any run length: only the buffer and a short aired history are kept.
+
+Endpoints (start_server()):
+    GET /next[?wait=SECONDS]  next segment (204 if none ready within wait)
+    GET /buffer               buffered segments (without scripts)
+    GET /status               statistics
+"""
+
+from collections import deque
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Optional, List
+from urllib.parse import urlparse, parse_qs
+import json
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8765
+
+
+class LiveBroadcast:
+    """
+    Continuous broadcast served from a bounded look-ahead buffer.
+
+    Example:
+        live = LiveBroadcast(engine, buffer_size=4, low_watermark=2)
+        live.start()
+        segment = live.next_segment(timeout=60)
+        live.stop()
+    """
+
+    def __init__(self,
+                 engine: Any,
+                 buffer_size: int = 4,
+                 low_watermark: int = 2,
+                 start_hour: Optional[int] = None,
+                 segments_per_hour: int = 2,
+                 retry_delay: float = 5.0,
+                 history_size: int = 20):
+        """
+        Initialize live broadcast.
+
+        Args:
+            engine: BroadcastEngine (broadcast already started or resumed)
+            buffer_size: Ready segments kept ahead of air (K)
+            low_watermark: Refill when fewer than this many are buffered
+            start_hour: First program hour (default: current wall-clock hour)
+            segments_per_hour: Segments per program hour
+            retry_delay: Seconds to wait after a failed or skipped segment
+            history_size: Aired segments remembered for get_statistics()
+        """
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+        self.engine = engine
+        self.buffer_size = buffer_size
+        self.low_watermark = max(1, min(low_watermark, buffer_size))
+        self.start_hour = datetime.now().hour if start_hour is None else start_hour
+        self.segments_per_hour = max(1, segments_per_hour)
+        self.retry_delay = retry_delay
+
+        self._buffer: deque = deque()
+        self._history: deque = deque(maxlen=history_size)
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._refilling = True
+        self._thread: Optional[threading.Thread] = None
+
+        self.slot = 0  # Next program slot to generate
+        self.produced = 0
+        self.aired = 0
+        self.skipped = 0
+        self.errors = 0
+        self.refills = 0
+        self.started_at: Optional[float] = None
+        self.first_segment_seconds: Optional[float] = None
+
+    @property
+    def program_hour(self) -> int:
+        """Hour (0-23) of the next segment to generate"""
+        return (self.start_hour + self.slot // self.segments_per_hour) % 24
+
+    def start(self) -> None:
+        """Start the producer thread"""
+        if self._thread is not None:
+            return
+        self.started_at = time.time()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._produce_loop, name="live-broadcast", daemon=True)
+        self._thread.start()
+
+    def stop(self, save_checkpoint: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Stop producing (the segment being generated is finished first).
+
+        Args:
+            save_checkpoint: Save an engine checkpoint at the last generated hour
+            timeout: Seconds to wait for the producer thread (None = no limit)
+        """
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if save_checkpoint and self.slot > 0:
+            last_hour = (self.start_hour + (self.slot - 1) // self.segments_per_hour) % 24
+            self.engine.save_checkpoint(last_hour, total_hours=0)
+
+    def next_segment(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Take the next segment off the buffer (it goes on air).
+
+        Args:
+            timeout: Seconds to wait for a segment (None = wait forever)
+
+        Returns:
+            Segment dict, or None if none was ready in time
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._buffer or self._stop.is_set(), timeout):
+                return None
+            if not self._buffer:
+                return None
+            segment = self._buffer.popleft()
+            self.aired += 1
+            self._history.append({
+                'sequence': segment['sequence'],
+                'segment_type': segment.get('segment_type'),
+                'program_hour': segment['program_hour'],
+                'aired_at': datetime.now().isoformat()
+            })
+            self._cond.notify_all()
+        return segment
+
+    def buffered(self) -> List[Dict[str, Any]]:
+        """Buffered segments' metadata (no scripts)"""
+        with self._cond:
+            return [
+                {
+                    'sequence': segment['sequence'],
+                    'segment_type': segment.get('segment_type'),
+                    'program_hour': segment['program_hour']
+                }
+                for segment in self._buffer
+            ]
+
+    def _needs_segment(self) -> bool:
+        """Refill below the low watermark, up to buffer_size (call with the lock held)"""
+        if len(self._buffer) >= self.buffer_size:
+            self._refilling = False
+        elif len(self._buffer) < self.low_watermark and not self._refilling:
+            self._refilling = True
+            self.refills += 1
+        return self._refilling
+
+    def _produce_loop(self) -> None:
+        while not self._stop.is_set():
+            with self._cond:
+                self._cond.wait_for(lambda: self._stop.is_set() or self._needs_segment())
+            if self._stop.is_set():
+                break
+
+            try:
+                segment = self._generate_slot()
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Live segment generation failed (hour {self.program_hour}): {e}")
+                self._stop.wait(self.retry_delay)
+                continue
+
+            if segment is None:
+                self._stop.wait(self.retry_delay)
+                continue
+
+            with self._cond:
+                self._buffer.append(segment)
+                self.produced += 1
+                if self.first_segment_seconds is None:
+                    self.first_segment_seconds = time.time() - self.started_at
+                self._cond.notify_all()
+
+    def _generate_slot(self) -> Optional[Dict[str, Any]]:
+        """Generate the next program slot (None if the segment was skipped)"""
+        hour_offset, segment_num = divmod(self.slot, self.segments_per_hour)
+        hour = self.program_hour
+        if segment_num == 0:
+            self._start_hour(hour_offset, hour)
+
+        segment = self.engine.generate_next_segment(hour)
+        sequence = self.slot
+        self.slot += 1
+
+        if not segment or not segment.get('script') or \
+                segment.get('metadata', {}).get('status') == 'skipped':
+            self.skipped += 1
+            print(f"⏭️  Live slot {sequence} (hour {hour}) skipped")
+            return None
+
+        segment = dict(segment)
+        segment['sequence'] = sequence
+        segment['program_hour'] = hour
+        segment['generated_at'] = datetime.now().isoformat()
+        return segment
+
+    def _start_hour(self, hour_offset: int, hour: int) -> None:
+        """Per-hour bookkeeping: new scheduler day, checkpoint, RAG prefetch"""
+        engine = self.engine
+        if hour_offset > 0 and hour_offset % 24 == 0:
+            engine.scheduler.reset()
+        if engine._checkpoint_due(hour_offset):
+            engine.save_checkpoint(hour, total_hours=0)
+            engine.last_checkpoint_hour = hour_offset
+        print(f"\n📡 Live hour {hour}:00 (offset: {hour_offset}, buffered: {len(self._buffer)}/{self.buffer_size})")
+        engine.prefetch_upcoming(hour, include_current=(hour_offset == 0))
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get live broadcast statistics.
+
+        Returns:
+            Dictionary with buffer depth, counters and recently aired segments
+        """
+        with self._cond:
+            depth = len(self._buffer)
+            history = list(self._history)
+        return {
+            'buffer_depth': depth,
+            'buffer_size': self.buffer_size,
+            'low_watermark': self.low_watermark,
+            'program_hour': self.program_hour,
+            'produced': self.produced,
+            'aired': self.aired,
+            'skipped': self.skipped,
+            'errors': self.errors,
+            'refills': self.refills,
+            'first_segment_seconds': self.first_segment_seconds,
+            'uptime_seconds': time.time() - self.started_at if self.started_at else 0.0,
+            'recently_aired': history
+        }
+
+
+def make_handler(live: LiveBroadcast) -> type:
+    """HTTP request handler class serving a live broadcast"""
+
+    class LiveHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+        def _send_json(self, status: int, body: Any) -> None:
+            data = json.dumps(body, default=str).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            path = url.path.rstrip("/")
+            if path == "/next":
+                try:
+                    wait = float(parse_qs(url.query).get("wait", ["0"])[0])
+                except ValueError:
+                    self._send_json(400, {"error": "wait must be a number"})
+                    return
+                segment = live.next_segment(timeout=max(0.0, wait))
+                if segment is None:
+                    self.send_response(204)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                else:
+                    self._send_json(200, segment)
+            elif path == "/buffer":
+                self._send_json(200, live.buffered())
+            elif path == "/status":
+                self._send_json(200, live.get_statistics())
+            else:
+                self._send_json(404, {"error": "not found"})
+
+    return LiveHandler
+
+
+def start_server(live: LiveBroadcast,
+                 host: str = "127.0.0.1",
+                 port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """
+    Serve a live broadcast over HTTP on a background thread.
+
+    Args:
+        live: Live broadcast to expose
+        host: Bind address
+        port: Port (0 = pick a free one; see server.server_address)
+
+    Returns:
+        The running server (call shutdown() to stop it)
+    """
+    server = ThreadingHTTPServer((host, port), make_handler(live))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="live-broadcast-http", daemon=True).start()
+    return server
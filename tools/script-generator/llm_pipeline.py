@@ -23,7 +23,7 @@ from pathlib import Path
 # Add shared tools to path
 project_root = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(project_root / "tools" / "shared"))
-from project_config import LLM_MODEL
+from project_config import LLM_MODEL, OLLAMA_KEEP_ALIVE
 
 # Integration with Phase 1 (RAG Cache) and Phase 2 (Scheduler)
 from rag_cache import RAGCache
@@ -161,7 +161,8 @@ class LLMPipeline:
                 ],
                 model=LLM_MODEL,
                 temperature=0.8,
-                max_tokens=500
+                max_tokens=500,
+                keep_alive=OLLAMA_KEEP_ALIVE
             )
             
             script = response.get('message', {}).get('content', '').strip()
@@ -282,25 +283,27 @@ class LLMPipeline:
         if not lore_context:
             lore_context = "(No specific lore context provided)"
         
-        # Assemble complete prompt
+        # Assemble in canonical order so consecutive calls share a long
+        # prefix (Ollama KV-cache reuse): static persona, then the
+        # semi-static constraints, then per-segment content type and lore
         prompt = f"""You are {dj_name}, a Fallout radio DJ broadcasting from {region}.
 
-STRICT CONSTRAINTS - FOLLOW EXACTLY:
-{constraint_text}
-
 PERSONALITY & TONE:
 - Your tone is: {tone}
 - Stay in character as {dj_name}
 - Be engaging and entertaining
 
-LORE CONTEXT (Use as reference):
-{lore_context}
+STRICT CONSTRAINTS - FOLLOW EXACTLY:
+{constraint_text}
+Do NOT violate any forbidden topics, dates, or factions.
+Keep the script under the maximum length specified.
 
 CONTENT TYPE: {template}
 
+LORE CONTEXT (Use as reference):
+{lore_context}
+
 Generate a compelling {template} segment that follows ALL constraints above.
-Do NOT violate any forbidden topics, dates, or factions.
-Keep the script under the maximum length specified.
 """
         return prompt
     
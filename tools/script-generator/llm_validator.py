@@ -8,15 +8,62 @@ Design Philosophy:
 - LLMs are better at understanding context, nuance, and natural language quality
 - Rule-based validators catch hard constraints (dates, factions, locations)
 - Hybrid approach provides best of both worlds
+
+JSON mode (json_mode=True) asks Ollama for schema-constrained output
+(format=VALIDATION_SCHEMA) with a compact response format and a short
+num_predict, so replies are small and always parse; free-text heuristics are
+only used when the server ignores the format.
 """
 
 import json
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union
 from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum
 
-from ollama_client import OllamaClient
+from ollama_client import (
+    OllamaClient, AsyncOllamaClient, as_sync_client, cache_tag_kwargs, format_kwargs
+)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Compact JSON schema for validator replies (Ollama structured outputs)
+VALIDATION_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "is_valid": {"type": "boolean"},
+        "overall_score": {"type": "number"},
+        "issues": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "severity": {"type": "string", "enum": ["critical", "warning", "suggestion"]},
+                    "category": {"type": "string"},
+                    "message": {"type": "string"}
+                },
+                "required": ["severity", "category", "message"]
+            }
+        },
+        "feedback": {"type": "string"}
+    },
+    "required": ["is_valid", "overall_score", "issues"]
+}
+
+# Token budget for a JSON-mode reply (compact schema, no evidence quotes)
+JSON_MODE_NUM_PREDICT = 256
+
+
+def loads_json(text: str) -> Any:
+    """Parse JSON with orjson when installed (falls back to json)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
 
 
 class ValidationSeverity(str, Enum):
@@ -108,27 +155,35 @@ class LLMValidator:
     
     def __init__(
         self, 
-        ollama_client: Optional[OllamaClient] = None,
+        ollama_client: Optional[Union[OllamaClient, AsyncOllamaClient]] = None,
         model: str = "dolphin-llama3",  # Validation model
         temperature: float = 0.1,  # Low temp for consistent validation
         templates_dir: Optional[Path] = None,
-        validate_connection: bool = True
+        validate_connection: bool = True,
+        cache_tag: Optional[str] = "llm_validation",
+        json_mode: bool = False,
+        json_num_predict: int = JSON_MODE_NUM_PREDICT
     ):
         """
         Initialize LLM validator.
         
         Args:
-            ollama_client: Ollama client instance (creates new if None)
+            ollama_client: Ollama client instance, blocking or async (creates new if None)
             model: Model to use for validation
             temperature: Temperature for validation (low = more consistent)
             templates_dir: Directory containing validation prompt templates
             validate_connection: Whether to validate Ollama connection on init
+            cache_tag: Completion cache tag, so re-validating an unchanged
+                script reuses the verdict (None = no caching unless temperature 0)
+            json_mode: Request schema-constrained JSON (format=VALIDATION_SCHEMA)
+                with a compact response format
+            json_num_predict: Max tokens for a JSON-mode reply
         
         Raises:
             ConnectionError: If validate_connection=True and Ollama unavailable
         """
         try:
-            self.ollama = ollama_client or OllamaClient()
+            self.ollama = as_sync_client(ollama_client) or OllamaClient()
             
             # Optionally verify Ollama is accessible
             if validate_connection:
@@ -144,10 +199,18 @@ class LLMValidator:
                     "Make sure Ollama is running with: ollama serve"
                 ) from e
             # If not validating, store client anyway for later use
-            self.ollama = ollama_client or OllamaClient()
+            self.ollama = as_sync_client(ollama_client) or OllamaClient()
         
         self.model = model
         self.temperature = temperature
+        self.cache_tag = cache_tag
+        self.json_mode = json_mode
+        self.json_num_predict = json_num_predict
+        
+        # JSON-mode statistics
+        self.json_responses = 0        # Parsed as-is
+        self.json_fallback_parses = 0  # Parsed after extracting the {...} object
+        self.json_parse_failures = 0   # Not parseable either way
         
         # Load validation prompt templates
         if templates_dir is None:
@@ -184,19 +247,28 @@ class LLMValidator:
             script, character_card, context, validation_aspects
         )
         
+        options = {
+            "temperature": self.temperature,
+            "top_p": 0.9
+        }
+        json_mode = getattr(self, 'json_mode', False)
+        if json_mode:
+            options["num_predict"] = self.json_num_predict
+        
         try:
             # Get LLM validation response
             response = self.ollama.generate(
                 model=self.model,
                 prompt=prompt,
-                options={
-                    "temperature": self.temperature,
-                    "top_p": 0.9
-                },
-                timeout=120  # Validation can take longer
+                options=options,
+                timeout=120,  # Validation can take longer
+                **cache_tag_kwargs(self.ollama, self.cache_tag),
+                **format_kwargs(self.ollama, VALIDATION_SCHEMA if json_mode else None)
             )
             
             # Parse LLM response into validation result
+            if json_mode:
+                return self._parse_json_response(response, script)
             result = self._parse_validation_response(response, script)
             
             return result
@@ -423,6 +495,10 @@ class LLMValidator:
                     prompt_parts.append(line)
                 prompt_parts.append("")
         
+        if getattr(self, 'json_mode', False):
+            prompt_parts.extend(self._compact_response_format())
+            return "\n".join(prompt_parts)
+        
         prompt_parts.extend([
             "",
             "═══ RESPONSE FORMAT ═══",
@@ -455,6 +531,114 @@ class LLMValidator:
         
         return "\n".join(prompt_parts)
     
+    def _compact_response_format(self) -> List[str]:
+        """Response instructions for JSON mode (matches VALIDATION_SCHEMA)"""
+        return [
+            "",
+            "═══ RESPONSE FORMAT ═══",
+            "Respond with JSON only:",
+            '{"is_valid": true, "overall_score": 0.85, '
+            '"issues": [{"severity": "critical|warning|suggestion", '
+            '"category": "temporal|character|tone|lore|continuity|quality", '
+            '"message": "short description"}], '
+            '"feedback": "one sentence"}',
+            "",
+            "RULES:",
+            "• Keep messages under 20 words; empty issues array if the script is fine",
+            "• Temporal, forbidden knowledge and character guideline violations are critical",
+            "</validation_instructions>"
+        ]
+    
+    def _result_from_data(self, data: Dict[str, Any], script: str) -> ValidationResult:
+        """Build a ValidationResult from a parsed validator reply"""
+        issues = []
+        for issue_data in data.get("issues") or []:
+            if not isinstance(issue_data, dict):
+                continue
+            try:
+                severity = ValidationSeverity(issue_data.get("severity", "warning"))
+            except ValueError:
+                severity = ValidationSeverity.WARNING
+            
+            issues.append(ValidationIssue(
+                severity=severity,
+                category=issue_data.get("category", "unknown"),
+                message=issue_data.get("message", ""),
+                suggestion=issue_data.get("suggestion"),
+                source="llm",
+                confidence=issue_data.get("confidence", 1.0)
+            ))
+        
+        return ValidationResult(
+            is_valid=data.get("is_valid", True),
+            script=script,
+            issues=issues,
+            llm_feedback=data.get("feedback"),
+            overall_score=data.get("overall_score")
+        )
+    
+    def _parse_json_response(self, response: str, script: str) -> ValidationResult:
+        """
+        Parse a JSON-mode reply.
+        
+        Schema-constrained replies parse directly. If the server ignored the
+        format, fall back to the lenient parser; an unparseable reply becomes a
+        warning rather than a critical issue, so it never forces a regeneration.
+        """
+        try:
+            data = loads_json(response)
+            if not isinstance(data, dict):
+                raise ValueError("Validator reply is not a JSON object")
+            self.json_responses += 1
+            return self._result_from_data(data, script)
+        except ValueError:
+            pass
+        
+        json_start = response.find("{")
+        json_end = response.rfind("}") + 1
+        if json_start != -1 and json_end > json_start:
+            try:
+                data = loads_json(response[json_start:json_end])
+                if isinstance(data, dict):
+                    self.json_fallback_parses += 1
+                    return self._result_from_data(data, script)
+            except ValueError:
+                pass
+        
+        self.json_parse_failures += 1
+        return ValidationResult(
+            is_valid=True,
+            script=script,
+            issues=[
+                ValidationIssue(
+                    severity=ValidationSeverity.WARNING,
+                    category="system",
+                    message="LLM validator reply was not valid JSON (ignored)",
+                    source="llm",
+                    confidence=0.0
+                )
+            ],
+            llm_feedback=response
+        )
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get JSON-mode statistics.
+        
+        Returns:
+            Dictionary with replies parsed directly, parsed by the lenient
+            fallback, and not parseable at all
+        """
+        parsed = self.json_responses + self.json_fallback_parses
+        total = parsed + self.json_parse_failures
+        return {
+            'json_mode': self.json_mode,
+            'json_responses': self.json_responses,
+            'json_fallback_parses': self.json_fallback_parses,
+            'json_parse_failures': self.json_parse_failures,
+            'json_parse_rate': (parsed / total * 100) if total > 0 else 0.0
+        }
+    
     def _parse_validation_response(
         self, 
         response: str, 
@@ -475,36 +659,9 @@ class LLMValidator:
                 raise ValueError("No JSON found in response")
             
             json_str = response[json_start:json_end]
-            data = json.loads(json_str)
+            data = loads_json(json_str)
             
-            # Parse issues
-            issues = []
-            for issue_data in data.get("issues", []):
-                try:
-                    severity = ValidationSeverity(issue_data.get("severity", "warning"))
-                except ValueError:
-                    severity = ValidationSeverity.WARNING
-                
-                issue = ValidationIssue(
-                    severity=severity,
-                    category=issue_data.get("category", "unknown"),
-                    message=issue_data.get("message", ""),
-                    suggestion=issue_data.get("suggestion"),
-                    source="llm",
-                    confidence=issue_data.get("confidence", 1.0)
-                )
-                issues.append(issue)
-            
-            # Create result
-            result = ValidationResult(
-                is_valid=data.get("is_valid", True),
-                script=script,
-                issues=issues,
-                llm_feedback=data.get("feedback"),
-                overall_score=data.get("overall_score")
-            )
-            
-            return result
+            return self._result_from_data(data, script)
             
         except (json.JSONDecodeError, ValueError) as e:
             # Log JSON parsing failure for debugging
@@ -0,0 +1,476 @@
+"""
+Metadata Filter Algebra
+
+Typed, hashable metadata filters shared by DJ knowledge profiles, ChromaDB
+where-clauses and local post-filtering in RAGCache.
+
+DJKnowledgeProfile builds its filters as nested dicts on every call and
+they were sent to ChromaDB unchanged, including redundant clauses. This
+module parses those dicts (or builds filters directly) into nodes that:
+- normalise (flatten nested And/Or, sort children, dedupe)
+- simplify (tightest bound per field, In/Eq intersection, contradictions)
+- hash (stable cache_key for result caches and precomputed result sets)
+- compile back to a ChromaDB where-clause (to_where)
+- evaluate locally against chunk metadata (matches)
+
+Example:
+    f = And(Lte("year_max", 2102), Or(Eq("location", "Appalachia"), Eq("knowledge_tier", "common")))
+    collection.query(..., where=f.to_where())
+    [c for c in chunks if f.matches(c['metadata'])]
+"""
+
+from typing import Dict, Any, Optional, List, Tuple, Union
+from functools import lru_cache
+import hashlib
+import json
+
+
+class Filter:
+    """Base class for filter nodes (immutable, hashable, comparable)"""
+
+    __slots__ = ()
+
+    def key(self) -> Tuple:
+        """Canonical tuple used for equality, hashing and ordering"""
+        raise NotImplementedError
+
+    def to_where(self) -> Optional[Dict[str, Any]]:
+        """Compile to a ChromaDB where-clause (None = no filter)"""
+        raise NotImplementedError
+
+    def matches(self, metadata: Dict[str, Any]) -> bool:
+        """Evaluate the filter against a chunk's metadata dict"""
+        raise NotImplementedError
+
+    def simplify(self) -> "Filter":
+        """Return an equivalent, normalised filter"""
+        return self
+
+    @property
+    def is_always(self) -> bool:
+        """True if the filter matches everything"""
+        return False
+
+    @property
+    def is_never(self) -> bool:
+        """True if the filter can never match"""
+        return False
+
+    @property
+    def cache_key(self) -> str:
+        """Stable hash of the simplified filter"""
+        canonical = json.dumps(_jsonable(self.simplify().key()), separators=(',', ':'))
+        return hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:16]
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Filter) and self.key() == other.key()
+
+    def __hash__(self) -> int:
+        return hash(self.key())
+
+    def __lt__(self, other: "Filter") -> bool:
+        return _sort_key(self) < _sort_key(other)
+
+    def __and__(self, other: "Filter") -> "Filter":
+        return And(self, other)
+
+    def __or__(self, other: "Filter") -> "Filter":
+        return Or(self, other)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}{self.key()[1:]}"
+
+
+# ============================================================================
+# Field comparisons
+# ============================================================================
+
+class Compare(Filter):
+    """Single-field comparison (field <op> value)"""
+
+    __slots__ = ('field', 'value')
+    OP = ''
+
+    def __init__(self, field: str, value: Any):
+        self.field = field
+        self.value = value
+
+    def key(self) -> Tuple:
+        return (self.OP, self.field, self.value)
+
+    def to_where(self) -> Dict[str, Any]:
+        if self.OP == '$eq':
+            return {self.field: self.value}
+        return {self.field: {self.OP: self.value}}
+
+    def matches(self, metadata: Dict[str, Any]) -> bool:
+        if self.field not in metadata:
+            return self.OP == '$ne'
+        try:
+            return self._compare(metadata[self.field])
+        except TypeError:
+            return False
+
+    def _compare(self, actual: Any) -> bool:
+        raise NotImplementedError
+
+
+class Eq(Compare):
+    OP = '$eq'
+
+    def _compare(self, actual: Any) -> bool:
+        return actual == self.value
+
+
+class Ne(Compare):
+    OP = '$ne'
+
+    def _compare(self, actual: Any) -> bool:
+        return actual != self.value
+
+
+class Lt(Compare):
+    OP = '$lt'
+
+    def _compare(self, actual: Any) -> bool:
+        return actual < self.value
+
+
+class Lte(Compare):
+    OP = '$lte'
+
+    def _compare(self, actual: Any) -> bool:
+        return actual <= self.value
+
+
+class Gt(Compare):
+    OP = '$gt'
+
+    def _compare(self, actual: Any) -> bool:
+        return actual > self.value
+
+
+class Gte(Compare):
+    OP = '$gte'
+
+    def _compare(self, actual: Any) -> bool:
+        return actual >= self.value
+
+
+class In(Filter):
+    """Field value is one of values"""
+
+    __slots__ = ('field', 'values')
+    OP = '$in'
+
+    def __init__(self, field: str, values):
+        self.field = field
+        self.values = tuple(sorted(set(values), key=_value_sort_key))
+
+    def key(self) -> Tuple:
+        return (self.OP, self.field, self.values)
+
+    def to_where(self) -> Dict[str, Any]:
+        return {self.field: {self.OP: list(self.values)}}
+
+    def matches(self, metadata: Dict[str, Any]) -> bool:
+        if self.field not in metadata:
+            return False
+        return metadata[self.field] in self.values
+
+    def simplify(self) -> Filter:
+        if not self.values:
+            return Or()
+        if len(self.values) == 1:
+            return Eq(self.field, self.values[0])
+        return self
+
+
+class Nin(In):
+    """Field value is none of values (missing fields match)"""
+
+    __slots__ = ()
+    OP = '$nin'
+
+    def matches(self, metadata: Dict[str, Any]) -> bool:
+        if self.field not in metadata:
+            return True
+        return metadata[self.field] not in self.values
+
+    def simplify(self) -> Filter:
+        if not self.values:
+            return And()
+        if len(self.values) == 1:
+            return Ne(self.field, self.values[0])
+        return self
+
+
+COMPARE_OPS = {cls.OP: cls for cls in (Eq, Ne, Lt, Lte, Gt, Gte)}
+SET_OPS = {'$in': In, '$nin': Nin}
+
+
+# ============================================================================
+# Boolean combinators
+# ============================================================================
+
+class _Combinator(Filter):
+    __slots__ = ('children',)
+    OP = ''
+
+    def __init__(self, *children: Filter):
+        if len(children) == 1 and isinstance(children[0], (list, tuple)):
+            children = tuple(children[0])
+        self.children: Tuple[Filter, ...] = tuple(children)
+
+    def key(self) -> Tuple:
+        return (self.OP,) + tuple(child.key() for child in self.children)
+
+    def to_where(self) -> Optional[Dict[str, Any]]:
+        node = self.simplify()
+        if node.is_always:
+            return None
+        if node.is_never:
+            raise ValueError("Filter can never match; check is_never before querying")
+        if not isinstance(node, _Combinator):
+            return node.to_where()
+        return {node.OP: [child.to_where() for child in node.children]}
+
+    def _flattened(self) -> List[Filter]:
+        """Simplified children with same-type combinators inlined"""
+        flat: List[Filter] = []
+        for child in self.children:
+            child = child.simplify()
+            if type(child) is type(self):
+                flat.extend(child.children)
+            else:
+                flat.append(child)
+        return flat
+
+
+class And(_Combinator):
+    """All children must match (And() matches everything)"""
+
+    __slots__ = ()
+    OP = '$and'
+
+    @property
+    def is_always(self) -> bool:
+        return not self.children
+
+    def matches(self, metadata: Dict[str, Any]) -> bool:
+        return all(child.matches(metadata) for child in self.children)
+
+    def simplify(self) -> Filter:
+        children = self._flattened()
+        if any(child.is_never for child in children):
+            return Or()
+        children = [child for child in children if not child.is_always]
+
+        children = _merge_conjunction(children)
+        if children is None:
+            return Or()
+
+        children = sorted(set(children))
+        if len(children) == 1:
+            return children[0]
+        return And(*children)
+
+
+class Or(_Combinator):
+    """At least one child must match (Or() matches nothing)"""
+
+    __slots__ = ()
+    OP = '$or'
+
+    @property
+    def is_never(self) -> bool:
+        return not self.children
+
+    def matches(self, metadata: Dict[str, Any]) -> bool:
+        return any(child.matches(metadata) for child in self.children)
+
+    def simplify(self) -> Filter:
+        children = self._flattened()
+        if any(child.is_always for child in children):
+            return And()
+        children = [child for child in children if not child.is_never]
+
+        # Eq/In on the same field collapse into one In
+        members: Dict[str, set] = {}
+        others: List[Filter] = []
+        for child in children:
+            if isinstance(child, Eq):
+                members.setdefault(child.field, set()).add(child.value)
+            elif type(child) is In:
+                members.setdefault(child.field, set()).update(child.values)
+            else:
+                others.append(child)
+        for field, values in members.items():
+            others.append(In(field, values).simplify())
+
+        children = sorted(set(others))
+        if len(children) == 1:
+            return children[0]
+        return Or(*children)
+
+
+def _merge_conjunction(children: List[Filter]) -> Optional[List[Filter]]:
+    """
+    Merge same-field constraints inside an And.
+
+    Returns:
+        Merged children, or None if the constraints contradict each other
+    """
+    upper: Dict[str, Compare] = {}
+    lower: Dict[str, Compare] = {}
+    allowed: Dict[str, set] = {}
+    excluded: Dict[str, set] = {}
+    others: List[Filter] = []
+
+    for child in children:
+        if isinstance(child, (Lt, Lte)):
+            current = upper.get(child.field)
+            if current is None or _tighter_upper(child, current):
+                upper[child.field] = child
+        elif isinstance(child, (Gt, Gte)):
+            current = lower.get(child.field)
+            if current is None or _tighter_lower(child, current):
+                lower[child.field] = child
+        elif isinstance(child, Eq) or type(child) is In:
+            values = {child.value} if isinstance(child, Eq) else set(child.values)
+            allowed[child.field] = allowed[child.field] & values if child.field in allowed else values
+        elif isinstance(child, Ne) or type(child) is Nin:
+            values = {child.value} if isinstance(child, Ne) else set(child.values)
+            excluded.setdefault(child.field, set()).update(values)
+        else:
+            others.append(child)
+
+    merged: List[Filter] = list(others)
+    for field, values in allowed.items():
+        values = {
+            v for v in values
+            if v not in excluded.get(field, ())
+            and all(_safe_match(bound, field, v) for bound in (upper.get(field), lower.get(field)))
+        }
+        if not values:
+            return None
+        # The value set already satisfies the other constraints on this field
+        merged.append(In(field, values).simplify())
+        upper.pop(field, None)
+        lower.pop(field, None)
+        excluded.pop(field, None)
+
+    for field in set(upper) & set(lower):
+        high, low = upper[field], lower[field]
+        try:
+            if low.value > high.value or (low.value == high.value and (
+                    isinstance(low, Gt) or isinstance(high, Lt))):
+                return None
+        except TypeError:
+            pass
+
+    merged.extend(upper.values())
+    merged.extend(lower.values())
+    merged.extend(Nin(field, values).simplify() for field, values in excluded.items())
+    return merged
+
+
+def _tighter_upper(a: Compare, b: Compare) -> bool:
+    try:
+        return a.value < b.value or (a.value == b.value and isinstance(a, Lt))
+    except TypeError:
+        return False
+
+
+def _tighter_lower(a: Compare, b: Compare) -> bool:
+    try:
+        return a.value > b.value or (a.value == b.value and isinstance(a, Gt))
+    except TypeError:
+        return False
+
+
+def _safe_match(bound: Optional[Compare], field: str, value: Any) -> bool:
+    return bound is None or bound.matches({field: value})
+
+
+def _value_sort_key(value: Any) -> Tuple[str, str]:
+    return (type(value).__name__, repr(value))
+
+
+def _sort_key(node: Filter) -> str:
+    return json.dumps(_jsonable(node.key()), sort_keys=True)
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return [_jsonable(v) for v in value]
+    return value
+
+
+# ============================================================================
+# Parsing / compilation
+# ============================================================================
+
+def parse_filter(where: Optional[Dict[str, Any]]) -> Filter:
+    """
+    Parse a ChromaDB where-clause dict into filter nodes.
+
+    Args:
+        where: Dict like {"$and": [{"year_max": {"$lte": 2102}}, ...]} or None
+
+    Returns:
+        Filter tree (not simplified)
+
+    Raises:
+        ValueError: On unknown operators or malformed clauses
+    """
+    if not where:
+        return And()
+    if not isinstance(where, dict):
+        raise ValueError(f"Filter clause must be a dict, got {type(where).__name__}")
+
+    nodes: List[Filter] = []
+    for field, condition in where.items():
+        if field in ('$and', '$or'):
+            if not isinstance(condition, list):
+                raise ValueError(f"{field} expects a list of clauses")
+            children = [parse_filter(clause) for clause in condition]
+            nodes.append(And(*children) if field == '$and' else Or(*children))
+        elif field.startswith('$'):
+            raise ValueError(f"Unknown logical operator: {field}")
+        elif isinstance(condition, dict):
+            for op, value in condition.items():
+                if op in COMPARE_OPS:
+                    nodes.append(COMPARE_OPS[op](field, value))
+                elif op in SET_OPS:
+                    nodes.append(SET_OPS[op](field, value))
+                else:
+                    raise ValueError(f"Unknown operator {op} for field '{field}'")
+        else:
+            nodes.append(Eq(field, condition))
+
+    return nodes[0] if len(nodes) == 1 else And(*nodes)
+
+
+@lru_cache(maxsize=256)
+def _compile_canonical(canonical_where: str) -> Filter:
+    return parse_filter(json.loads(canonical_where)).simplify()
+
+
+def compile_filter(where: Union[None, Dict[str, Any], Filter]) -> Optional[Filter]:
+    """
+    Parse and simplify a filter once (memoised on the canonical dict).
+
+    Args:
+        where: ChromaDB where dict, Filter node or None
+
+    Returns:
+        Simplified Filter, or None if there is nothing to filter on
+    """
+    if where is None:
+        return None
+    if isinstance(where, Filter):
+        node = where.simplify()
+    else:
+        node = _compile_canonical(json.dumps(where, sort_keys=True))
+    return None if node.is_always else node
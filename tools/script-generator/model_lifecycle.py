@@ -0,0 +1,116 @@
+"""
+Model Lifecycle Manager - Track and schedule Ollama model swaps
+
+Hybrid validation uses two models: LLM_MODEL for generation and
+LLM_VALIDATOR_MODEL for validation. On a 6GB GPU only one fits, so
+alternating between them per segment makes Ollama evict and reload a model
+on every call, and load time ends up dominating the run.
+
+ModelLifecycleManager is the single place that switches models: activate()
+unloads the previous model (keep_alive=0) and loads the next one, timing
+the swap. BroadcastEngine only uses it with model_batch_size=K: it
+generates K segments, then validates all K, so a window costs two swaps
+instead of 2*K. Swaps happen between windows, never while generations are
+in flight. Without batching, residency is left to Ollama.
+"""
+
+from typing import Dict, Any, Optional, Union
+import threading
+import time
+
+
+class ModelLifecycleManager:
+    """
+    Keeps track of the loaded Ollama model and counts swaps.
+
+    Example:
+        lifecycle = ModelLifecycleManager(generator.ollama)
+        lifecycle.activate("fluffy/l3-8b-stheno-v3.2")   # first load
+        ...generate...
+        lifecycle.activate("dolphin-llama3")             # swap
+        ...validate...
+        print(lifecycle.get_statistics()['swaps'])
+    """
+
+    def __init__(self,
+                 ollama_client: Any,
+                 keep_alive: Optional[Union[str, int]] = None,
+                 unload_previous: bool = True):
+        """
+        Initialize lifecycle manager.
+
+        Args:
+            ollama_client: Client with load_model()/unload_model() (optional
+                methods; missing ones are skipped)
+            keep_alive: keep_alive passed when loading a model
+            unload_previous: Unload the previous model before loading the
+                next one (frees VRAM first on single-model GPUs)
+        """
+        self.ollama = ollama_client
+        self.keep_alive = keep_alive
+        self.unload_previous = unload_previous
+        self.current_model: Optional[str] = None
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.loads = 0
+        self.swaps = 0
+        self.swap_time = 0.0
+        self.activations: Dict[str, int] = {}
+
+    def activate(self, model: Optional[str]) -> bool:
+        """
+        Make model the loaded one.
+
+        Args:
+            model: Model about to be used (None is ignored)
+
+        Returns:
+            True if the model had to be (re)loaded
+        """
+        if not model:
+            return False
+
+        with self._lock:
+            self.activations[model] = self.activations.get(model, 0) + 1
+            if model == self.current_model:
+                return False
+
+            start = time.perf_counter()
+            previous = self.current_model
+            if previous and self.unload_previous and hasattr(self.ollama, 'unload_model'):
+                self.ollama.unload_model(previous)
+            if hasattr(self.ollama, 'load_model'):
+                self.ollama.load_model(model, keep_alive=self.keep_alive)
+            elapsed = time.perf_counter() - start
+
+            self.current_model = model
+            self.loads += 1
+            if previous:
+                self.swaps += 1
+                self.swap_time += elapsed
+                print(f"🔁 Model swap: {previous} -> {model} ({elapsed:.2f}s)")
+            return True
+
+    def release(self) -> None:
+        """Unload the current model (e.g. before TTS)"""
+        with self._lock:
+            if self.current_model and hasattr(self.ollama, 'unload_model'):
+                self.ollama.unload_model(self.current_model)
+            self.current_model = None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get swap statistics.
+
+        Returns:
+            Dictionary with load/swap counters and swap time
+        """
+        return {
+            'current_model': self.current_model,
+            'loads': self.loads,
+            'swaps': self.swaps,
+            'swap_time': self.swap_time,
+            'avg_swap_time': self.swap_time / self.swaps if self.swaps > 0 else 0.0,
+            'activations': dict(self.activations)
+        }
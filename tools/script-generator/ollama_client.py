@@ -2,32 +2,376 @@
 Ollama API Client
 
 Lightweight wrapper for Ollama HTTP API with VRAM management support.
+
+- OllamaClient: blocking client on a pooled keep-alive requests.Session
+- AsyncOllamaClient: asyncio client on httpx.AsyncClient with the same
+  retry/backoff semantics and error types (optional, requires httpx)
+- as_sync_client / as_async_client: adapt either client to the calling
+  style, so components accept whichever client they are given
+
+Both clients can sit behind a CompletionCache: deterministic
+(temperature 0) or explicitly tagged generate() calls are answered from disk
+when the identical request has been seen before.
+
+With an OllamaGovernor attached, request timeouts adapt to observed latency,
+retries draw on a shared retry budget and a circuit breaker fails requests
+fast while the server is down (see ollama_governor).
+
+generate() accepts Ollama's structured-output `format` ("json" or a JSON
+schema dict); the server then constrains decoding to valid JSON.
 """
 
+import asyncio
+import inspect
+import json
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Coroutine, Callable, Iterator, AsyncIterator, List, Union
+
+from completion_cache import CompletionCache, should_cache
+from ollama_governor import OllamaGovernor
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+
+# Connections kept alive per client (matches a typical OLLAMA_NUM_PARALLEL)
+DEFAULT_POOL_SIZE = 4
+
+
+def build_generate_payload(model: str,
+                           prompt: str,
+                           options: Optional[Dict[str, Any]] = None,
+                           system: Optional[str] = None,
+                           keep_alive: Optional[Union[str, int]] = None,
+                           format: Optional[Union[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """Build a non-streaming /api/generate payload"""
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "stream": False,
+        "options": options or {}
+    }
+    if system is not None:
+        payload["system"] = system
+    if keep_alive is not None:
+        payload["keep_alive"] = keep_alive
+    if format is not None:
+        payload["format"] = format
+    return payload
+
+
+def cache_options(options: Optional[Dict[str, Any]],
+                  format: Optional[Union[str, Dict[str, Any]]] = None) -> Optional[Dict[str, Any]]:
+    """Options used as completion cache key (includes the output format)"""
+    if format is None:
+        return options
+    return {**(options or {}), "format": format}
+
+
+def build_chat_payload(model: str,
+                       messages: List[Dict[str, str]],
+                       options: Optional[Dict[str, Any]] = None,
+                       keep_alive: Optional[Union[str, int]] = None) -> Dict[str, Any]:
+    """Build a non-streaming /api/chat payload"""
+    payload = {
+        "model": model,
+        "messages": messages,
+        "stream": False,
+        "options": options or {}
+    }
+    if keep_alive is not None:
+        payload["keep_alive"] = keep_alive
+    return payload
+
+
+def chat_options(temperature: float,
+                 max_tokens: int,
+                 options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Merge chat() shorthand arguments with explicit options (options win)"""
+    return {"temperature": temperature, "num_predict": max_tokens, **(options or {})}
+
+
+def extract_chat_text(result: Dict[str, Any]) -> str:
+    """
+    Extract the assistant message from an /api/chat response.
+    
+    Raises:
+        RuntimeError: If the response is empty
+    """
+    generated_text = (result.get('message') or {}).get('content', '').strip()
+    if not generated_text:
+        raise RuntimeError("Ollama returned empty response")
+    return generated_text
+
+
+def cached_chat_response(model: str, content: str) -> Dict[str, Any]:
+    """/api/chat-shaped response for a completion served from the cache"""
+    return {
+        "model": model,
+        "message": {"role": "assistant", "content": content},
+        "done": True,
+        "cached": True
+    }
+
+
+def response_timings(result: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Server-side timings of a non-streaming response (milliseconds).
+    
+    ttft_ms (time to first token) is model load plus prompt evaluation;
+    prompt_eval_count drops when Ollama reuses a cached prompt prefix.
+    """
+    load_ms = result.get('load_duration', 0) / 1e6
+    prompt_eval_ms = result.get('prompt_eval_duration', 0) / 1e6
+    return {
+        'load_ms': load_ms,
+        'prompt_eval_ms': prompt_eval_ms,
+        'prompt_eval_count': result.get('prompt_eval_count', 0),
+        'eval_ms': result.get('eval_duration', 0) / 1e6,
+        'eval_count': result.get('eval_count', 0),
+        'ttft_ms': load_ms + prompt_eval_ms,
+        'total_ms': result.get('total_duration', 0) / 1e6
+    }
+
+
+def extract_response_text(result: Dict[str, Any]) -> str:
+    """
+    Extract generated text from an /api/generate response.
+    
+    Raises:
+        RuntimeError: If the response is empty
+    """
+    generated_text = result.get('response', '').strip()
+    if not generated_text:
+        raise RuntimeError("Ollama returned empty response")
+    return generated_text
+
+
+def retry_delay(attempt: int) -> int:
+    """Exponential backoff delay (seconds) after a failed attempt"""
+    return 2 ** attempt
+
+
+def connection_error_message(base_url: str) -> str:
+    return (f"Cannot connect to Ollama at {base_url}. "
+            "Is Ollama running? Start with: ollama serve")
+
+
+def exhausted_error_message(max_retries: int, last_error: Optional[Exception]) -> str:
+    return (f"Ollama generation failed after {max_retries} attempts. "
+            f"Last error: {last_error}")
+
+
+# A resident model reports a few milliseconds of load_duration
+MODEL_LOAD_SECONDS = 0.5
+
+
+class AttemptTimeout:
+    """
+    Request timeout for the attempts of one request.
+    
+    Adapted to observed latency when the client has a governor. After a
+    timeout the remaining attempts use the caller's full timeout: the
+    request may need a model load or a longer output than the samples.
+    """
+    
+    def __init__(self, client: Any, model: str, prompt_chars: int, timeout: float, payload: Dict[str, Any]):
+        governor = getattr(client, 'governor', None)
+        self.full = timeout
+        self.num_predict = (payload.get('options') or {}).get('num_predict')
+        self.current = timeout
+        if governor is not None:
+            self.current = governor.timeout_for(model, prompt_chars, timeout, self.num_predict)
+    
+    @property
+    def adapted(self) -> bool:
+        """True while shorter than the caller's timeout"""
+        return self.current < self.full
+    
+    def expire(self) -> None:
+        """An attempt timed out: fall back to the caller's timeout"""
+        self.current = self.full
+
+
+def loaded_model(result: Any) -> bool:
+    """True if a response includes a model load (not a representative latency)"""
+    return isinstance(result, dict) and result.get('load_duration', 0) / 1e9 >= MODEL_LOAD_SECONDS
+
+
+def record_attempt_success(governor: Optional[OllamaGovernor],
+                           result: Any,
+                           model: Optional[str],
+                           prompt_chars: int,
+                           seconds: float,
+                           timeout: Optional[AttemptTimeout]) -> None:
+    """Record a successful attempt; its latency only if no model was loaded"""
+    if governor is None:
+        return
+    if loaded_model(result):
+        governor.record_success()
+    else:
+        governor.record_success(model, prompt_chars, seconds, timeout.num_predict if timeout else None)
+
+
+def record_timeout(governor: Optional[OllamaGovernor], timeout: Optional[AttemptTimeout]) -> None:
+    """
+    Record a timed-out attempt and lengthen the timeout for the next one.
+    
+    Only a timeout at the caller's full timeout counts against the circuit
+    breaker; a shortened adaptive timeout says nothing about the server.
+    """
+    if governor is not None and not (timeout and timeout.adapted):
+        governor.record_failure()
+    if timeout is not None:
+        timeout.expire()
+
+
+def may_retry(governor: Optional[OllamaGovernor]) -> bool:
+    """True if a retry is allowed (always without a governor)"""
+    if governor is None or governor.allow_retry():
+        return True
+    print("⚠️ Retry budget exhausted or circuit open, not retrying")
+    return False
+
+
+def record_http_error(governor: Optional[OllamaGovernor], status_code: int) -> None:
+    """Server errors (5xx) count as failures; client errors mean the server is up"""
+    if governor is None:
+        return
+    if status_code >= 500:
+        governor.record_failure()
+    else:
+        governor.record_success()
+
+
+# Incremental validator: text generated so far -> violation message or None
+StreamValidator = Callable[[str], Optional[str]]
+
+
+class GenerationAborted(RuntimeError):
+    """Streaming generation cancelled by an incremental validator"""
+    
+    def __init__(self, violation: str, partial_text: str, fragments: int):
+        super().__init__(f"Generation aborted: {violation}")
+        self.violation = violation
+        self.partial_text = partial_text
+        self.fragments = fragments
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (for segment metadata)"""
+        return {
+            'violation': self.violation,
+            'fragments': self.fragments,
+            'chars': len(self.partial_text)
+        }
+
+
+def check_validators(text: str,
+                     validators: List[StreamValidator],
+                     final: bool = False) -> Optional[str]:
+    """
+    Return the first violation reported for text, or None.
+    
+    final=True marks the text as complete, so incremental checks also see
+    the last word (mid-stream it may still be partial).
+    """
+    if final:
+        text += "\n"
+    for validator in validators:
+        violation = validator(text)
+        if violation:
+            return violation
+    return None
+
+
+def consume_stream(fragments: Iterator[str], validators: List[StreamValidator]) -> str:
+    """
+    Accumulate a fragment stream, checking validators after every fragment.
+    
+    Raises:
+        GenerationAborted: On the first violation (the stream is closed)
+        RuntimeError: If the stream produced no text
+    """
+    text = ''
+    count = 0
+    try:
+        for fragment in fragments:
+            text += fragment
+            count += 1
+            violation = check_validators(text, validators)
+            if violation:
+                raise GenerationAborted(violation, text, count)
+    finally:
+        close = getattr(fragments, 'close', None)
+        if close:
+            close()
+    violation = check_validators(text, validators, final=True)
+    if violation:
+        raise GenerationAborted(violation, text, count)
+    return extract_response_text({'response': text})
 
 
 class OllamaClient:
-    """Client for Ollama local LLM API"""
+    """Client for Ollama local LLM API (pooled keep-alive connections)"""
     
-    def __init__(self, base_url: str = "http://localhost:11434"):
+    def __init__(self,
+                 base_url: str = "http://localhost:11434",
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 session: Optional[requests.Session] = None,
+                 completion_cache: Optional[CompletionCache] = None,
+                 governor: Optional[OllamaGovernor] = None):
         """
         Initialize Ollama client.
         
         Args:
             base_url: Ollama server URL (default: http://localhost:11434)
+            pool_size: Max keep-alive connections kept in the pool
+            session: Existing requests.Session to share (created if None)
+            completion_cache: Cache for deterministic/tagged calls (None = off)
+            governor: Adaptive timeouts, retry budget and circuit breaker
+                (None = fixed timeouts and retries)
         """
         self.base_url = base_url
         self.generate_url = f"{base_url}/api/generate"
+        self.chat_url = f"{base_url}/api/chat"
+        self.pool_size = pool_size
+        self.session = session or self._create_session(pool_size)
+        self.completion_cache = completion_cache
+        self.governor = governor
+    
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        """Session with a connection pool sized for concurrent requests"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
+    def close(self) -> None:
+        """Close pooled connections"""
+        self.session.close()
+    
+    def __enter__(self) -> "OllamaClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def generate(self, 
                  model: str, 
                  prompt: str, 
                  options: Optional[Dict[str, Any]] = None,
                  max_retries: int = 3,
-                 timeout: int = 60) -> str:
+                 timeout: int = 60,
+                 cache_tag: Optional[str] = None,
+                 format: Optional[Union[str, Dict[str, Any]]] = None) -> str:
         """
         Generate text using Ollama.
         
@@ -37,6 +381,9 @@ class OllamaClient:
             options: Generation options (temperature, top_p, etc.)
             max_retries: Maximum retry attempts
             timeout: Request timeout in seconds
+            cache_tag: Opt this call into the completion cache even when
+                temperature > 0 (temperature 0 calls are always cacheable)
+            format: Structured output: "json" or a JSON schema dict
         
         Returns:
             Generated text
@@ -45,66 +392,299 @@ class OllamaClient:
             ConnectionError: If Ollama server is unreachable
             RuntimeError: If generation fails after retries
         """
-        payload = {
-            "model": model,
-            "prompt": prompt,
-            "stream": False,
-            "options": options or {}
-        }
+        use_cache = self.completion_cache is not None and should_cache(options, cache_tag)
+        key_options = cache_options(options, format)
+        if use_cache:
+            cached = self.completion_cache.get(model, prompt, key_options)
+            if cached is not None:
+                return cached
+        
+        text = self._generate(model, prompt, options, max_retries, timeout, format)
+        
+        if use_cache:
+            self.completion_cache.put(model, prompt, key_options, text, tag=cache_tag)
+        return text
+    
+    def _generate(self,
+                  model: str,
+                  prompt: str,
+                  options: Optional[Dict[str, Any]],
+                  max_retries: int,
+                  timeout: int,
+                  format: Optional[Union[str, Dict[str, Any]]] = None) -> str:
+        """Uncached generate() request"""
+        payload = build_generate_payload(model, prompt, options, format=format)
+        attempt_timeout = AttemptTimeout(self, model, len(prompt), timeout, payload)
+        
+        def attempt() -> Dict[str, Any]:
+            response = self.session.post(
+                self.generate_url, 
+                json=payload,
+                timeout=attempt_timeout.current
+            )
+            response.raise_for_status()
+            result = response.json()
+            extract_response_text(result)  # Raises on empty response (retried)
+            return result
+        
+        result = self._with_retries(attempt, max_retries, model, len(prompt), attempt_timeout)
+        return extract_response_text(result)
+    
+    def generate_stream(self,
+                        model: str,
+                        prompt: str,
+                        options: Optional[Dict[str, Any]] = None,
+                        timeout: int = 60,
+                        system: Optional[str] = None,
+                        keep_alive: Optional[Union[str, int]] = None) -> Iterator[str]:
+        """
+        Stream generated text fragments as Ollama produces them.
+        
+        Closing the iterator early (break / close()) drops the connection,
+        which makes Ollama stop generating.
         
+        Args:
+            model: Model name
+            prompt: Text prompt
+            options: Generation options (temperature, top_p, etc.)
+            timeout: Connect/read timeout in seconds (per chunk)
+            system: System message (kept separate so its prefix is cached)
+            keep_alive: How long Ollama keeps the model loaded afterwards
+        
+        Yields:
+            Text fragments (tokens)
+        
+        Raises:
+            ConnectionError: If Ollama server is unreachable
+            RuntimeError: On HTTP errors or an error reported mid-stream
+        """
+        payload = build_generate_payload(model, prompt, options, system, keep_alive)
+        payload["stream"] = True
+        
+        try:
+            response = self.session.post(
+                self.generate_url,
+                json=payload,
+                timeout=timeout,
+                stream=True
+            )
+            response.raise_for_status()
+        except requests.exceptions.ConnectionError as e:
+            raise ConnectionError(connection_error_message(self.base_url)) from e
+        except requests.exceptions.HTTPError as e:
+            raise RuntimeError(
+                f"Ollama HTTP error: {e.response.status_code} - {e.response.text}"
+            ) from e
+        
+        try:
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                if data.get('error'):
+                    raise RuntimeError(f"Ollama stream error: {data['error']}")
+                fragment = data.get('response', '')
+                if fragment:
+                    yield fragment
+                if data.get('done'):
+                    break
+        finally:
+            response.close()
+    
+    def generate_streaming(self,
+                           model: str,
+                           prompt: str,
+                           options: Optional[Dict[str, Any]] = None,
+                           validators: Optional[List[StreamValidator]] = None,
+                           max_retries: int = 3,
+                           timeout: int = 60,
+                           system: Optional[str] = None,
+                           keep_alive: Optional[Union[str, int]] = None) -> str:
+        """
+        Generate with streaming and cancel early on a critical violation.
+        
+        After every fragment each validator is called with the text so far;
+        the first non-None result cancels the request and raises
+        GenerationAborted. Transport errors retry like generate().
+        
+        Args:
+            model: Model name
+            prompt: Text prompt
+            options: Generation options (temperature, top_p, etc.)
+            validators: Callables(text_so_far) -> violation message or None
+            max_retries: Maximum retry attempts (transport errors only)
+            timeout: Request timeout in seconds
+            system: System message (see generate_stream)
+            keep_alive: How long Ollama keeps the model loaded afterwards
+        
+        Returns:
+            Generated text
+        
+        Raises:
+            GenerationAborted: If a validator reported a violation
+            ConnectionError: If Ollama server is unreachable
+            RuntimeError: If generation fails after retries
+        """
+        def attempt() -> str:
+            return consume_stream(
+                self.generate_stream(model, prompt, options, timeout=timeout,
+                                     system=system, keep_alive=keep_alive),
+                validators or []
+            )
+        
+        return self._with_retries(attempt, max_retries, model, len(prompt))
+    
+    def chat(self,
+             messages: List[Dict[str, str]],
+             model: str,
+             temperature: float = 0.8,
+             max_tokens: int = 500,
+             options: Optional[Dict[str, Any]] = None,
+             keep_alive: Optional[Union[str, int]] = None,
+             max_retries: int = 3,
+             timeout: int = 60,
+             cache_tag: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Chat completion via /api/chat.
+        
+        Keep the system message (and any leading messages) byte-identical
+        across calls: Ollama then reuses the cached KV prefix and only
+        evaluates the new tail of the prompt.
+        
+        Args:
+            messages: [{'role': 'system'|'user'|'assistant', 'content': str}, ...]
+            model: Model name
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate (num_predict)
+            options: Extra generation options (override the shorthands)
+            keep_alive: How long Ollama keeps the model loaded (e.g. "30m")
+            max_retries: Maximum retry attempts
+            timeout: Request timeout in seconds
+            cache_tag: Opt this call into the completion cache (see generate)
+        
+        Returns:
+            Ollama response dict ({'message': {'role', 'content'}, timings...})
+        
+        Raises:
+            ConnectionError: If Ollama server is unreachable
+            RuntimeError: If generation fails after retries
+        """
+        options = chat_options(temperature, max_tokens, options)
+        cache_prompt = json.dumps(messages, sort_keys=True, ensure_ascii=False)
+        use_cache = self.completion_cache is not None and should_cache(options, cache_tag)
+        if use_cache:
+            cached = self.completion_cache.get(model, cache_prompt, options)
+            if cached is not None:
+                return cached_chat_response(model, cached)
+        
+        payload = build_chat_payload(model, messages, options, keep_alive)
+        prompt_chars = sum(len(m.get('content', '')) for m in messages)
+        attempt_timeout = AttemptTimeout(self, model, prompt_chars, timeout, payload)
+        
+        def attempt() -> Dict[str, Any]:
+            response = self.session.post(
+                self.chat_url,
+                json=payload,
+                timeout=attempt_timeout.current
+            )
+            response.raise_for_status()
+            result = response.json()
+            extract_chat_text(result)  # Raises on empty response (retried)
+            return result
+        
+        result = self._with_retries(attempt, max_retries, model, prompt_chars, attempt_timeout)
+        
+        if use_cache:
+            self.completion_cache.put(model, cache_prompt, options,
+                                      extract_chat_text(result), tag=cache_tag)
+        return result
+    
+    def _with_retries(self,
+                      attempt: Callable[[], Any],
+                      max_retries: int,
+                      model: Optional[str] = None,
+                      prompt_chars: int = 0,
+                      timeout: Optional[AttemptTimeout] = None) -> Any:
+        """
+        Run one request attempt with the shared retry policy.
+        
+        Connection errors and HTTP errors fail immediately; timeouts and
+        other errors retry with exponential backoff. With a governor, every
+        attempt passes the circuit breaker, successful latencies are recorded
+        for adaptive timeouts and retries draw on the shared retry budget.
+        After a timeout, attempts use the caller's full timeout (see
+        AttemptTimeout).
+        """
+        governor = getattr(self, 'governor', None)
+        if governor:
+            governor.start_request()
         last_error = None
-        for attempt in range(max_retries):
+        attempts = 0
+        for attempt_number in range(max_retries):
+            ticket = governor.before_attempt() if governor else 0
+            attempts += 1
+            start = time.perf_counter()
             try:
-                response = requests.post(
-                    self.generate_url, 
-                    json=payload,
-                    timeout=timeout
-                )
-                response.raise_for_status()
-                
-                result = response.json()
-                generated_text = result.get('response', '').strip()
-                
-                if not generated_text:
-                    raise RuntimeError("Ollama returned empty response")
-                
-                return generated_text
+                result = attempt()
+                record_attempt_success(governor, result, model, prompt_chars,
+                                       time.perf_counter() - start, timeout)
+                return result
                 
             except requests.exceptions.ConnectionError as e:
-                raise ConnectionError(
-                    f"Cannot connect to Ollama at {self.base_url}. "
-                    "Is Ollama running? Start with: ollama serve"
-                ) from e
+                if governor:
+                    governor.record_failure()
+                raise ConnectionError(connection_error_message(self.base_url)) from e
                 
             except requests.exceptions.Timeout as e:
                 last_error = e
-                if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff
-                    print(f"⚠️ Timeout on attempt {attempt + 1}/{max_retries}. "
+                record_timeout(governor, timeout)
+                if attempt_number < max_retries - 1:
+                    if not may_retry(governor):
+                        break
+                    wait_time = retry_delay(attempt_number)  # Exponential backoff
+                    print(f"⚠️ Timeout on attempt {attempt_number + 1}/{max_retries}. "
                           f"Retrying in {wait_time}s...")
                     time.sleep(wait_time)
                 continue
                 
             except requests.exceptions.HTTPError as e:
+                record_http_error(governor, e.response.status_code)
                 # Don't retry HTTP errors (bad model, etc.)
                 raise RuntimeError(
                     f"Ollama HTTP error: {e.response.status_code} - {e.response.text}"
                 ) from e
+            
+            except GenerationAborted:
+                # Validator aborts are final (the server itself was fine)
+                if governor:
+                    governor.record_success()
+                raise
+            
+            except ConnectionError:
+                # Mapped connection errors are final
+                if governor:
+                    governor.record_failure()
+                raise
                 
             except Exception as e:
                 last_error = e
-                if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt
-                    print(f"⚠️ Error on attempt {attempt + 1}/{max_retries}: {e}. "
+                if governor:
+                    governor.record_failure()
+                if attempt_number < max_retries - 1:
+                    if not may_retry(governor):
+                        break
+                    wait_time = retry_delay(attempt_number)
+                    print(f"⚠️ Error on attempt {attempt_number + 1}/{max_retries}: {e}. "
                           f"Retrying in {wait_time}s...")
                     time.sleep(wait_time)
                 continue
+            
+            finally:
+                if governor:
+                    governor.end_attempt(ticket)
         
         # All retries exhausted
-        raise RuntimeError(
-            f"Ollama generation failed after {max_retries} attempts. "
-            f"Last error: {last_error}"
-        )
+        raise RuntimeError(exhausted_error_message(attempts, last_error))
     
     def unload_model(self, model: str) -> bool:
         """
@@ -127,7 +707,7 @@ class OllamaClient:
                 "keep_alive": 0
             }
             
-            response = requests.post(
+            response = self.session.post(
                 self.generate_url,
                 json=payload,
                 timeout=10
@@ -139,6 +719,34 @@ class OllamaClient:
             print(f"⚠️ Warning: Failed to unload model {model}: {e}")
             return False
     
+    def load_model(self, model: str, keep_alive: Optional[Union[str, int]] = None) -> bool:
+        """
+        Load model into VRAM without generating (empty prompt).
+        
+        Args:
+            model: Model name to load
+            keep_alive: How long Ollama keeps it loaded (None = server default)
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            payload: Dict[str, Any] = {"model": model, "prompt": ""}
+            if keep_alive is not None:
+                payload["keep_alive"] = keep_alive
+            
+            response = self.session.post(
+                self.generate_url,
+                json=payload,
+                timeout=120  # Cold loads of an 8B model can take a while
+            )
+            response.raise_for_status()
+            return True
+            
+        except Exception as e:
+            print(f"⚠️ Warning: Failed to load model {model}: {e}")
+            return False
+    
     def check_connection(self, model: str = None) -> bool:
         """
         Check if Ollama server is reachable and optionally test a model.
@@ -151,8 +759,8 @@ class OllamaClient:
         """
         try:
             if model:
-                # Test with minimal prompt
-                response = self.generate(
+                # Test with minimal prompt (never served from the cache)
+                response = self._generate(
                     model=model,
                     prompt="Reply with just 'OK'",
                     options={"temperature": 0},
@@ -162,13 +770,536 @@ class OllamaClient:
                 return len(response) > 0
             else:
                 # Just check server
-                response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+                response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
                 return response.status_code == 200
                 
         except Exception:
             return False
 
 
+class AsyncOllamaClient:
+    """
+    Asyncio client for Ollama on a pooled httpx.AsyncClient.
+    
+    Same retry/backoff semantics and error types as OllamaClient:
+    connection failures raise ConnectionError immediately, HTTP errors raise
+    RuntimeError without retry, timeouts and other errors retry with
+    exponential backoff.
+    """
+    
+    def __init__(self,
+                 base_url: str = "http://localhost:11434",
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 client: Optional["httpx.AsyncClient"] = None,
+                 completion_cache: Optional[CompletionCache] = None,
+                 governor: Optional[OllamaGovernor] = None):
+        """
+        Initialize async Ollama client.
+        
+        Args:
+            base_url: Ollama server URL (default: http://localhost:11434)
+            pool_size: Max keep-alive connections kept in the pool
+            client: Existing httpx.AsyncClient to share (created if None)
+            completion_cache: Cache for deterministic/tagged calls (None = off)
+            governor: Adaptive timeouts, retry budget and circuit breaker
+        
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx is required for AsyncOllamaClient (pip install httpx)")
+        
+        self.base_url = base_url
+        self.generate_url = f"{base_url}/api/generate"
+        self.chat_url = f"{base_url}/api/chat"
+        self.pool_size = pool_size
+        self.client = client or httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=pool_size,
+                                max_keepalive_connections=pool_size)
+        )
+        self.completion_cache = completion_cache
+        self.governor = governor
+    
+    async def aclose(self) -> None:
+        """Close pooled connections"""
+        await self.client.aclose()
+    
+    async def __aenter__(self) -> "AsyncOllamaClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def generate(self,
+                       model: str,
+                       prompt: str,
+                       options: Optional[Dict[str, Any]] = None,
+                       max_retries: int = 3,
+                       timeout: int = 60,
+                       cache_tag: Optional[str] = None,
+                       format: Optional[Union[str, Dict[str, Any]]] = None) -> str:
+        """
+        Generate text using Ollama.
+        
+        Args:
+            model: Model name (e.g., "fluffy/l3-8b-stheno-v3.2")
+            prompt: Text prompt
+            options: Generation options (temperature, top_p, etc.)
+            max_retries: Maximum retry attempts
+            timeout: Request timeout in seconds
+            cache_tag: Opt this call into the completion cache (see OllamaClient)
+            format: Structured output: "json" or a JSON schema dict
+        
+        Returns:
+            Generated text
+        
+        Raises:
+            ConnectionError: If Ollama server is unreachable
+            RuntimeError: If generation fails after retries
+        """
+        use_cache = self.completion_cache is not None and should_cache(options, cache_tag)
+        key_options = cache_options(options, format)
+        if use_cache:
+            cached = self.completion_cache.get(model, prompt, key_options)
+            if cached is not None:
+                return cached
+        
+        text = await self._generate(model, prompt, options, max_retries, timeout, format)
+        
+        if use_cache:
+            self.completion_cache.put(model, prompt, key_options, text, tag=cache_tag)
+        return text
+    
+    async def _generate(self,
+                        model: str,
+                        prompt: str,
+                        options: Optional[Dict[str, Any]],
+                        max_retries: int,
+                        timeout: int,
+                        format: Optional[Union[str, Dict[str, Any]]] = None) -> str:
+        """Uncached generate() request"""
+        payload = build_generate_payload(model, prompt, options, format=format)
+        attempt_timeout = AttemptTimeout(self, model, len(prompt), timeout, payload)
+        
+        async def attempt() -> Dict[str, Any]:
+            response = await self.client.post(
+                self.generate_url,
+                json=payload,
+                timeout=attempt_timeout.current
+            )
+            response.raise_for_status()
+            result = response.json()
+            extract_response_text(result)
+            return result
+        
+        result = await self._with_retries(attempt, max_retries, model, len(prompt), attempt_timeout)
+        return extract_response_text(result)
+    
+    async def generate_stream(self,
+                              model: str,
+                              prompt: str,
+                              options: Optional[Dict[str, Any]] = None,
+                              timeout: int = 60,
+                              system: Optional[str] = None,
+                              keep_alive: Optional[Union[str, int]] = None) -> AsyncIterator[str]:
+        """
+        Stream generated text fragments (see OllamaClient.generate_stream).
+        
+        Closing the iterator early (aclose()) drops the connection, which
+        makes Ollama stop generating.
+        """
+        payload = build_generate_payload(model, prompt, options, system, keep_alive)
+        payload["stream"] = True
+        
+        try:
+            async with self.client.stream("POST", self.generate_url,
+                                          json=payload, timeout=timeout) as response:
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    data = json.loads(line)
+                    if data.get('error'):
+                        raise RuntimeError(f"Ollama stream error: {data['error']}")
+                    fragment = data.get('response', '')
+                    if fragment:
+                        yield fragment
+                    if data.get('done'):
+                        break
+        except httpx.ConnectError as e:
+            raise ConnectionError(connection_error_message(self.base_url)) from e
+        except httpx.HTTPStatusError as e:
+            raise RuntimeError(
+                f"Ollama HTTP error: {e.response.status_code} - {e.response.text}"
+            ) from e
+    
+    async def generate_streaming(self,
+                                 model: str,
+                                 prompt: str,
+                                 options: Optional[Dict[str, Any]] = None,
+                                 validators: Optional[List[StreamValidator]] = None,
+                                 max_retries: int = 3,
+                                 timeout: int = 60,
+                                 system: Optional[str] = None,
+                                 keep_alive: Optional[Union[str, int]] = None) -> str:
+        """
+        Generate with streaming and cancel early on a critical violation.
+        
+        See OllamaClient.generate_streaming().
+        """
+        validators = validators or []
+        
+        async def attempt() -> str:
+            stream = self.generate_stream(model, prompt, options, timeout=timeout,
+                                          system=system, keep_alive=keep_alive)
+            text = ''
+            count = 0
+            try:
+                async for fragment in stream:
+                    text += fragment
+                    count += 1
+                    violation = check_validators(text, validators)
+                    if violation:
+                        raise GenerationAborted(violation, text, count)
+            finally:
+                await stream.aclose()
+            violation = check_validators(text, validators, final=True)
+            if violation:
+                raise GenerationAborted(violation, text, count)
+            return extract_response_text({'response': text})
+        
+        return await self._with_retries(attempt, max_retries, model, len(prompt))
+    
+    async def chat(self,
+                   messages: List[Dict[str, str]],
+                   model: str,
+                   temperature: float = 0.8,
+                   max_tokens: int = 500,
+                   options: Optional[Dict[str, Any]] = None,
+                   keep_alive: Optional[Union[str, int]] = None,
+                   max_retries: int = 3,
+                   timeout: int = 60,
+                   cache_tag: Optional[str] = None) -> Dict[str, Any]:
+        """Chat completion via /api/chat (see OllamaClient.chat)"""
+        options = chat_options(temperature, max_tokens, options)
+        cache_prompt = json.dumps(messages, sort_keys=True, ensure_ascii=False)
+        use_cache = self.completion_cache is not None and should_cache(options, cache_tag)
+        if use_cache:
+            cached = self.completion_cache.get(model, cache_prompt, options)
+            if cached is not None:
+                return cached_chat_response(model, cached)
+        
+        payload = build_chat_payload(model, messages, options, keep_alive)
+        prompt_chars = sum(len(m.get('content', '')) for m in messages)
+        attempt_timeout = AttemptTimeout(self, model, prompt_chars, timeout, payload)
+        
+        async def attempt() -> Dict[str, Any]:
+            response = await self.client.post(
+                self.chat_url,
+                json=payload,
+                timeout=attempt_timeout.current
+            )
+            response.raise_for_status()
+            result = response.json()
+            extract_chat_text(result)
+            return result
+        
+        result = await self._with_retries(attempt, max_retries, model, prompt_chars, attempt_timeout)
+        
+        if use_cache:
+            self.completion_cache.put(model, cache_prompt, options,
+                                      extract_chat_text(result), tag=cache_tag)
+        return result
+    
+    async def _with_retries(self,
+                            attempt: Callable[[], Coroutine[Any, Any, Any]],
+                            max_retries: int,
+                            model: Optional[str] = None,
+                            prompt_chars: int = 0,
+                            timeout: Optional[AttemptTimeout] = None) -> Any:
+        """Run one request attempt with the shared retry policy (see OllamaClient)"""
+        governor = getattr(self, 'governor', None)
+        if governor:
+            governor.start_request()
+        last_error = None
+        attempts = 0
+        for attempt_number in range(max_retries):
+            ticket = governor.before_attempt() if governor else 0
+            attempts += 1
+            start = time.perf_counter()
+            try:
+                result = await attempt()
+                record_attempt_success(governor, result, model, prompt_chars,
+                                       time.perf_counter() - start, timeout)
+                return result
+                
+            except httpx.ConnectError as e:
+                if governor:
+                    governor.record_failure()
+                raise ConnectionError(connection_error_message(self.base_url)) from e
+                
+            except httpx.TimeoutException as e:
+                last_error = e
+                record_timeout(governor, timeout)
+                if attempt_number < max_retries - 1:
+                    if not may_retry(governor):
+                        break
+                    wait_time = retry_delay(attempt_number)
+                    print(f"⚠️ Timeout on attempt {attempt_number + 1}/{max_retries}. "
+                          f"Retrying in {wait_time}s...")
+                    await asyncio.sleep(wait_time)
+                continue
+                
+            except httpx.HTTPStatusError as e:
+                record_http_error(governor, e.response.status_code)
+                # Don't retry HTTP errors (bad model, etc.)
+                raise RuntimeError(
+                    f"Ollama HTTP error: {e.response.status_code} - {e.response.text}"
+                ) from e
+            
+            except GenerationAborted:
+                if governor:
+                    governor.record_success()
+                raise
+            
+            except ConnectionError:
+                if governor:
+                    governor.record_failure()
+                raise
+                
+            except Exception as e:
+                last_error = e
+                if governor:
+                    governor.record_failure()
+                if attempt_number < max_retries - 1:
+                    if not may_retry(governor):
+                        break
+                    wait_time = retry_delay(attempt_number)
+                    print(f"⚠️ Error on attempt {attempt_number + 1}/{max_retries}: {e}. "
+                          f"Retrying in {wait_time}s...")
+                    await asyncio.sleep(wait_time)
+                continue
+            
+            finally:
+                if governor:
+                    governor.end_attempt(ticket)
+        
+        raise RuntimeError(exhausted_error_message(attempts, last_error))
+    
+    async def unload_model(self, model: str) -> bool:
+        """Unload model from VRAM immediately (keep_alive=0)"""
+        try:
+            response = await self.client.post(
+                self.generate_url,
+                json={"model": model, "prompt": "", "keep_alive": 0},
+                timeout=10
+            )
+            response.raise_for_status()
+            return True
+        except Exception as e:
+            print(f"⚠️ Warning: Failed to unload model {model}: {e}")
+            return False
+    
+    async def load_model(self, model: str, keep_alive: Optional[Union[str, int]] = None) -> bool:
+        """Load model into VRAM without generating (empty prompt)"""
+        payload: Dict[str, Any] = {"model": model, "prompt": ""}
+        if keep_alive is not None:
+            payload["keep_alive"] = keep_alive
+        try:
+            response = await self.client.post(self.generate_url, json=payload, timeout=120)
+            response.raise_for_status()
+            return True
+        except Exception as e:
+            print(f"⚠️ Warning: Failed to load model {model}: {e}")
+            return False
+    
+    async def check_connection(self, model: str = None) -> bool:
+        """Check if Ollama server is reachable and optionally test a model"""
+        try:
+            if model:
+                response = await self._generate(
+                    model=model,
+                    prompt="Reply with just 'OK'",
+                    options={"temperature": 0},
+                    max_retries=1,
+                    timeout=30
+                )
+                return len(response) > 0
+            response = await self.client.get(f"{self.base_url}/api/tags", timeout=5)
+            return response.status_code == 200
+        except Exception:
+            return False
+
+
+# ============================================================================
+# Client adapters (accept either a blocking or an async client)
+# ============================================================================
+
+def _generate_accepts(client: Any, name: str) -> bool:
+    """True if client.generate() takes the keyword argument name"""
+    try:
+        params = inspect.signature(client.generate).parameters
+    except (TypeError, ValueError, AttributeError):
+        return False
+    return name in params or any(
+        p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()
+    )
+
+
+def cache_tag_kwargs(client: Any, cache_tag: Optional[str]) -> Dict[str, Any]:
+    """
+    generate() kwargs opting a call into the completion cache.
+    
+    Empty when no tag is given or client.generate() does not accept
+    cache_tag (test doubles, third-party clients).
+    """
+    if not cache_tag:
+        return {}
+    return {'cache_tag': cache_tag} if _generate_accepts(client, 'cache_tag') else {}
+
+
+def format_kwargs(client: Any, format: Optional[Union[str, Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    generate() kwargs requesting structured (JSON) output.
+    
+    Empty when no format is given or client.generate() does not accept
+    format; callers must still parse defensively.
+    """
+    if format is None:
+        return {}
+    return {'format': format} if _generate_accepts(client, 'format') else {}
+
+
+def is_async_client(client: Any) -> bool:
+    """True if client.generate is a coroutine function"""
+    return inspect.iscoroutinefunction(getattr(client, 'generate', None))
+
+
+class BlockingOllamaClient:
+    """
+    Blocking facade over an async client.
+    
+    Coroutines run on a private event loop thread, so this also works when
+    called from code that is itself running inside an event loop.
+    """
+    
+    def __init__(self, async_client: Any):
+        self.async_client = async_client
+        self.base_url = getattr(async_client, 'base_url', None)
+        self.generate_url = getattr(async_client, 'generate_url', None)
+        self.governor = getattr(async_client, 'governor', None)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+    
+    def _run(self, coro: Coroutine) -> Any:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever,
+                                 name="ollama-client-loop", daemon=True).start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+    
+    def generate(self, model: str, prompt: str,
+                 options: Optional[Dict[str, Any]] = None,
+                 max_retries: int = 3, timeout: int = 60,
+                 cache_tag: Optional[str] = None,
+                 format: Optional[Union[str, Dict[str, Any]]] = None) -> str:
+        return self._run(self.async_client.generate(
+            model=model, prompt=prompt, options=options,
+            max_retries=max_retries, timeout=timeout,
+            **cache_tag_kwargs(self.async_client, cache_tag),
+            **format_kwargs(self.async_client, format)))
+    
+    def generate_streaming(self, model: str, prompt: str,
+                           options: Optional[Dict[str, Any]] = None,
+                           validators: Optional[List[StreamValidator]] = None,
+                           max_retries: int = 3, timeout: int = 60,
+                           **kwargs) -> str:
+        return self._run(self.async_client.generate_streaming(
+            model=model, prompt=prompt, options=options, validators=validators,
+            max_retries=max_retries, timeout=timeout, **kwargs))
+    
+    def chat(self, messages: List[Dict[str, str]], model: str, **kwargs) -> Dict[str, Any]:
+        return self._run(self.async_client.chat(messages=messages, model=model, **kwargs))
+    
+    def unload_model(self, model: str) -> bool:
+        return self._run(self.async_client.unload_model(model))
+    
+    def load_model(self, model: str, keep_alive: Optional[Union[str, int]] = None) -> bool:
+        return self._run(self.async_client.load_model(model, keep_alive))
+    
+    def check_connection(self, model: str = None) -> bool:
+        return self._run(self.async_client.check_connection(model))
+    
+    def close(self) -> None:
+        """Close the async client and stop the private loop"""
+        if self._loop is None:
+            return
+        if hasattr(self.async_client, 'aclose'):
+            self._run(self.async_client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop = None
+
+
+class ThreadedAsyncOllamaClient:
+    """Async facade over a blocking client (calls run in worker threads)"""
+    
+    def __init__(self, client: Any):
+        self.client = client
+        self.base_url = getattr(client, 'base_url', None)
+        self.generate_url = getattr(client, 'generate_url', None)
+        self.governor = getattr(client, 'governor', None)
+    
+    async def generate(self, model: str, prompt: str,
+                       options: Optional[Dict[str, Any]] = None,
+                       max_retries: int = 3, timeout: int = 60,
+                       cache_tag: Optional[str] = None,
+                       format: Optional[Union[str, Dict[str, Any]]] = None) -> str:
+        return await asyncio.to_thread(
+            self.client.generate, model=model, prompt=prompt, options=options,
+            max_retries=max_retries, timeout=timeout,
+            **cache_tag_kwargs(self.client, cache_tag),
+            **format_kwargs(self.client, format))
+    
+    async def generate_streaming(self, model: str, prompt: str,
+                                 options: Optional[Dict[str, Any]] = None,
+                                 validators: Optional[List[StreamValidator]] = None,
+                                 max_retries: int = 3, timeout: int = 60,
+                                 **kwargs) -> str:
+        return await asyncio.to_thread(
+            self.client.generate_streaming, model=model, prompt=prompt,
+            options=options, validators=validators,
+            max_retries=max_retries, timeout=timeout, **kwargs)
+    
+    async def chat(self, messages: List[Dict[str, str]], model: str, **kwargs) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.client.chat, messages=messages, model=model, **kwargs)
+    
+    async def unload_model(self, model: str) -> bool:
+        return await asyncio.to_thread(self.client.unload_model, model)
+    
+    async def load_model(self, model: str, keep_alive: Optional[Union[str, int]] = None) -> bool:
+        return await asyncio.to_thread(self.client.load_model, model, keep_alive)
+    
+    async def check_connection(self, model: str = None) -> bool:
+        return await asyncio.to_thread(self.client.check_connection, model)
+
+
+def as_sync_client(client: Any) -> Any:
+    """Return a blocking client for either client type (None passes through)"""
+    if client is not None and is_async_client(client):
+        return BlockingOllamaClient(client)
+    return client
+
+
+def as_async_client(client: Any) -> Any:
+    """Return an async client for either client type (None passes through)"""
+    if client is not None and not is_async_client(client):
+        return ThreadedAsyncOllamaClient(client)
+    return client
+
+
 if __name__ == "__main__":
     # Test script
     print("Testing Ollama connection...")
@@ -0,0 +1,391 @@
+"""
+Ollama Governor - Adaptive timeouts, shared retry budget and circuit breaker
+
+Retries are stacked three deep: OllamaClient retries each request up to 3
+times (60s timeout, 120s for validation), ScriptGenerator.generate_script
+regenerates up to 5 times, and BroadcastEngine retries failed validation on
+top. Against a slow or wedged Ollama server one segment can spend many
+minutes timing out.
+
+OllamaGovernor is shared by all of these layers (attach it to the client;
+the generator and engine find it with get_governor()):
+
+- LatencyTracker: rolling latencies per (model, prompt-size bucket,
+  num_predict); the request timeout is a high percentile of what the server
+  actually needs (times a headroom factor), capped by the caller's timeout.
+  OllamaClient does not sample responses that loaded the model, and retries
+  a timed-out request with the caller's full timeout
+- RetryBudget: every request deposits a fraction of a retry token, every
+  retry (at any layer) withdraws one, so retries stay a bounded share of
+  traffic instead of multiplying
+- CircuitBreaker: after N consecutive failures further requests fail fast
+  with CircuitOpenError until a probe request succeeds
+"""
+
+from collections import deque
+from typing import Dict, Any, Optional, Tuple, Callable, Deque
+import threading
+import time
+
+
+# Prompt-size buckets (characters); latency grows with prompt length
+PROMPT_BUCKETS = (1000, 4000, 16000)
+
+
+class CircuitOpenError(ConnectionError):
+    """Ollama requests are failing fast while the circuit breaker is open"""
+
+
+def prompt_bucket(prompt_chars: int) -> int:
+    """Index of the prompt-size bucket"""
+    for i, limit in enumerate(PROMPT_BUCKETS):
+        if prompt_chars < limit:
+            return i
+    return len(PROMPT_BUCKETS)
+
+
+def prompt_bucket_label(bucket: int) -> str:
+    """Readable label of a prompt-size bucket"""
+    if bucket < len(PROMPT_BUCKETS):
+        return f"<{PROMPT_BUCKETS[bucket]}"
+    return f">={PROMPT_BUCKETS[-1]}"
+
+
+def percentile(values: Any, pct: float) -> float:
+    """Nearest-rank percentile (0.0 for no values)"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class LatencyTracker:
+    """Rolling request latencies per model, prompt-size bucket and num_predict"""
+
+    def __init__(self,
+                 window: int = 50,
+                 min_samples: int = 5,
+                 pct: float = 0.95,
+                 headroom: float = 2.0,
+                 min_timeout: float = 10.0):
+        """
+        Initialize latency tracker.
+
+        Args:
+            window: Latencies kept per bucket
+            min_samples: Samples needed before timeouts adapt
+            pct: Percentile the timeout is based on
+            headroom: Timeout = percentile latency * headroom
+            min_timeout: Never time out faster than this (seconds)
+        """
+        self.window = window
+        self.min_samples = min_samples
+        self.pct = pct
+        self.headroom = headroom
+        self.min_timeout = min_timeout
+        self._samples: Dict[Tuple[str, int, Optional[int]], Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self,
+               model: str,
+               prompt_chars: int,
+               seconds: float,
+               num_predict: Optional[int] = None) -> None:
+        """Record a successful request (output cap num_predict, None = server default)"""
+        key = (model, prompt_bucket(prompt_chars), num_predict)
+        with self._lock:
+            if key not in self._samples:
+                self._samples[key] = deque(maxlen=self.window)
+            self._samples[key].append(seconds)
+
+    def timeout_for(self,
+                    model: str,
+                    prompt_chars: int,
+                    default: float,
+                    num_predict: Optional[int] = None) -> float:
+        """
+        Timeout for a request.
+
+        Args:
+            model: Model name
+            prompt_chars: Prompt length in characters
+            default: Caller's timeout (used until enough samples; also the cap)
+            num_predict: Output token cap of the request (None = server default)
+
+        Returns:
+            Timeout in seconds
+        """
+        with self._lock:
+            samples = list(self._samples.get((model, prompt_bucket(prompt_chars), num_predict), ()))
+        if len(samples) < self.min_samples:
+            return default
+        return min(default, max(self.min_timeout, percentile(samples, self.pct) * self.headroom))
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Per-bucket sample counts, p50/p95 and current timeout"""
+        with self._lock:
+            buckets = {key: list(values) for key, values in self._samples.items()}
+        return {
+            f"{model}|{prompt_bucket_label(bucket)}" + (f"|n{num_predict}" if num_predict is not None else ""): {
+                'samples': len(values),
+                'p50': percentile(values, 0.50),
+                'p95': percentile(values, 0.95),
+                'timeout': max(self.min_timeout, percentile(values, self.pct) * self.headroom)
+            }
+            for (model, bucket, num_predict), values in buckets.items()
+        }
+
+
+class RetryBudget:
+    """Token bucket limiting retries to a share of requests"""
+
+    def __init__(self, ratio: float = 0.2, reserve: float = 10.0):
+        """
+        Initialize retry budget.
+
+        Args:
+            ratio: Retry tokens deposited per request (0.2 = 20% retries)
+            reserve: Bucket size (retries available in a burst)
+        """
+        self.ratio = ratio
+        self.reserve = reserve
+        self.balance = reserve
+        self.granted = 0
+        self.denied = 0
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """Deposit for one request"""
+        with self._lock:
+            self.balance = min(self.reserve, self.balance + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Withdraw one retry; False when the budget is exhausted"""
+        with self._lock:
+            if self.balance >= 1.0:
+                self.balance -= 1.0
+                self.granted += 1
+                return True
+            self.denied += 1
+            return False
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (closed -> open -> half_open)"""
+
+    def __init__(self,
+                 failure_threshold: int = 5,
+                 reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds before a probe request is let through
+                (also the age at which an unanswered probe is given up)
+            clock: Time source (injectable for tests)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+        self._probe_id = 0
+        self._lock = threading.Lock()
+
+    def admit(self) -> Optional[int]:
+        """
+        Admit a request.
+
+        Returns:
+            None if rejected, 0 while closed, or the probe id of a
+            half-open probe (pass it to release_probe() when it ends)
+        """
+        with self._lock:
+            if self.state == "closed":
+                return 0
+            now = self.clock()
+            if self.state == "open" and now - self.opened_at >= self.reset_timeout:
+                self.state = "half_open"
+                self._probe_in_flight = False
+            if self.state == "half_open" and self._probe_in_flight and now - self._probe_started >= self.reset_timeout:
+                self._probe_in_flight = False  # Probe never reported back
+            if self.state == "half_open" and not self._probe_in_flight:
+                self._probe_in_flight = True
+                self._probe_started = now
+                self._probe_id += 1
+                return self._probe_id
+            return None
+
+    def allow_request(self) -> bool:
+        """True if a request may go to the server now"""
+        return self.admit() is not None
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed"""
+        with self._lock:
+            if self.state == "open":
+                return max(0.0, self.reset_timeout - (self.clock() - self.opened_at))
+            if self.state == "half_open" and self._probe_in_flight:
+                return max(0.0, self.reset_timeout - (self.clock() - self._probe_started))
+            return 0.0
+
+    def release_probe(self, probe_id: int) -> None:
+        """Let another probe through if probe_id ended without a result (e.g. cancelled)"""
+        with self._lock:
+            if probe_id and probe_id == self._probe_id:
+                self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = "closed"
+            self.consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+                if self.state != "open":
+                    self.trips += 1
+                    print(f"⛔ Ollama circuit open after {self.consecutive_failures} consecutive failures")
+                self.state = "open"
+                self.opened_at = self.clock()
+            self._probe_in_flight = False
+
+
+class OllamaGovernor:
+    """
+    Timeouts, retry budget and circuit breaker shared by every retry layer.
+
+    Example:
+        governor = OllamaGovernor()
+        client = OllamaClient(governor=governor)
+        ...
+        if governor.allow_retry():
+            ...regenerate...
+    """
+
+    def __init__(self,
+                 latency_tracker: Optional[LatencyTracker] = None,
+                 retry_budget: Optional[RetryBudget] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None):
+        self.latency_tracker = latency_tracker or LatencyTracker()
+        self.retry_budget = retry_budget or RetryBudget()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.requests = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def timeout_for(self,
+                    model: str,
+                    prompt_chars: int,
+                    default: float,
+                    num_predict: Optional[int] = None) -> float:
+        """Adaptive timeout for a request (see LatencyTracker)"""
+        return self.latency_tracker.timeout_for(model, prompt_chars, default, num_predict)
+
+    def start_request(self) -> None:
+        """Count a logical request (deposits into the retry budget)"""
+        with self._lock:
+            self.requests += 1
+        self.retry_budget.record_request()
+
+    def before_attempt(self) -> int:
+        """
+        Gate one attempt on the circuit breaker.
+
+        Returns:
+            Admission ticket for end_attempt() (non-zero for a half-open probe)
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        ticket = self.circuit_breaker.admit()
+        if ticket is None:
+            with self._lock:
+                self.rejected += 1
+            raise CircuitOpenError(
+                f"Ollama circuit open ({self.circuit_breaker.consecutive_failures} consecutive "
+                f"failures); next probe in {self.circuit_breaker.retry_in():.0f}s"
+            )
+        return ticket
+
+    def record_success(self,
+                       model: Optional[str] = None,
+                       prompt_chars: int = 0,
+                       seconds: Optional[float] = None,
+                       num_predict: Optional[int] = None) -> None:
+        """Record a successful attempt (latency is optional)"""
+        self.circuit_breaker.record_success()
+        if model is not None and seconds is not None:
+            self.latency_tracker.record(model, prompt_chars, seconds, num_predict)
+
+    def record_failure(self) -> None:
+        """Record a failed attempt (timeout, server or transport error)"""
+        self.circuit_breaker.record_failure()
+
+    def end_attempt(self, ticket: int) -> None:
+        """
+        Close an attempt admitted by before_attempt(), however it ended.
+
+        A probe that was neither recorded as a success nor a failure
+        (cancelled, interrupted) is released, so the next request probes.
+        """
+        self.circuit_breaker.release_probe(ticket)
+
+    def allow_retry(self) -> bool:
+        """
+        Ask for a retry at any layer.
+
+        Returns:
+            False if the circuit is open or the retry budget is exhausted
+        """
+        if self.circuit_breaker.state == "open":
+            return False
+        return self.retry_budget.try_spend()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get governor statistics.
+
+        Returns:
+            Dictionary with breaker state, budget usage and latency buckets
+        """
+        return {
+            'requests': self.requests,
+            'rejected': self.rejected,
+            'circuit_state': self.circuit_breaker.state,
+            'circuit_trips': self.circuit_breaker.trips,
+            'retries_granted': self.retry_budget.granted,
+            'retries_denied': self.retry_budget.denied,
+            'retry_balance': self.retry_budget.balance,
+            'latency': self.latency_tracker.get_statistics()
+        }
+
+
+def get_governor(client: Any) -> Optional[OllamaGovernor]:
+    """The governor attached to an Ollama client (None if there is none)"""
+    governor = getattr(client, 'governor', None)
+    return governor if isinstance(governor, OllamaGovernor) else None
+
+
+def default_governor(config: Any) -> Optional[OllamaGovernor]:
+    """
+    New governor when config.OLLAMA_ADAPTIVE_TIMEOUTS is set.
+
+    Args:
+        config: The project_config module
+
+    Returns:
+        OllamaGovernor, or None when adaptive timeouts are disabled
+    """
+    if not getattr(config, 'OLLAMA_ADAPTIVE_TIMEOUTS', False):
+        return None
+    return OllamaGovernor()
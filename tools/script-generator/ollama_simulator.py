@@ -0,0 +1,598 @@
+"""
+Ollama Simulator - Latency-model LLM backend for offline load testing
+
+MockOllamaClient answers instantly (or after a fixed delay), which says
+nothing about how a broadcast behaves against a real GPU. OllamaSimulator
+models the costs that dominate a real Ollama server:
+
+- prefill: prompt tokens / prefill rate (a prompt prefix shared with the
+  model's previous request is not re-evaluated, like Ollama's KV cache)
+- decode: output tokens / decode rate, slowed down by concurrent requests
+- model swaps: one model loaded at a time; switching waits for in-flight
+  requests and pays the model's load time
+- limited concurrent slots (OLLAMA_NUM_PARALLEL); extra requests queue
+- failure (HTTP 500) and timeout injection
+
+It speaks the /api/generate and /api/chat protocol (streaming and not) and
+is exposed two ways:
+
+    client = simulated_client(OllamaSimulator(time_scale=0.01))   # in-process
+    server = start_server(OllamaSimulator(), port=11435)          # HTTP stand-in
+
+The in-process client is a real OllamaClient on a SimulatedSession, so
+retries, caching and payload building run unchanged. All simulated durations
+(and client timeouts) are multiplied by time_scale before sleeping, so CI
+runs can compress a GPU hour into seconds while keeping the ratios.
+
+Usage:
+    python ollama_simulator.py --port 11435 --time-scale 0.1
+    python broadcast.py ...   (with OLLAMA_URL pointing at the simulator)
+"""
+
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Optional, Iterator, List, Callable, Tuple
+
+import requests
+
+from ollama_client import OllamaClient, DEFAULT_POOL_SIZE
+from context_packer import estimate_tokens
+
+
+SIMULATOR_URL = "http://ollama-simulator"
+
+# Sentences used to pad default responses to the requested length
+FILLER_SENTENCES = [
+    "Good evening, Appalachia, and welcome back to the radio.",
+    "The skies over the hills are calm tonight, so stay safe out there.",
+    "Folks down by the river say the water is running clear again.",
+    "Keep your lanterns lit and your neighbors close.",
+    "Here is a little something to keep you company on the road.",
+]
+
+# Reply used when a request asks for structured (JSON) output
+DEFAULT_JSON_REPLY = {"is_valid": True, "overall_score": 0.9, "issues": [], "feedback": "Looks good."}
+
+
+@dataclass
+class LatencyProfile:
+    """Per-model latency parameters (simulated seconds)"""
+    prefill_tokens_per_second: float = 1200.0
+    decode_tokens_per_second: float = 35.0
+    load_seconds: float = 4.0
+    unload_seconds: float = 0.5
+    # Decode slowdown per additional concurrent request (batching overhead)
+    concurrency_penalty: float = 0.15
+
+
+class SimulatedHTTPError(Exception):
+    """Injected server-side failure"""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+
+
+def default_responder(model: str, prompt: str, payload: Dict[str, Any], tokens: int) -> str:
+    """DJ-style filler text of about `tokens` tokens (JSON when a format is requested)"""
+    if payload.get("format") is not None:
+        return json.dumps(DEFAULT_JSON_REPLY)
+    words: List[str] = []
+    i = 0
+    while estimate_tokens(" ".join(words)) < tokens:
+        words.extend(FILLER_SENTENCES[i % len(FILLER_SENTENCES)].split())
+        i += 1
+    return " ".join(words)
+
+
+class OllamaSimulator:
+    """
+    Latency-model stand-in for an Ollama server.
+
+    Example:
+        sim = OllamaSimulator(slots=2, time_scale=0.01, failure_rate=0.05)
+        client = simulated_client(sim)
+        client.generate("fluffy/l3-8b-stheno-v3.2", "Hello")
+        print(sim.get_statistics()['avg_queue_wait'])
+    """
+
+    def __init__(self,
+                 profile: Optional[LatencyProfile] = None,
+                 model_profiles: Optional[Dict[str, LatencyProfile]] = None,
+                 slots: int = DEFAULT_POOL_SIZE,
+                 response_tokens: int = 120,
+                 failure_rate: float = 0.0,
+                 timeout_rate: float = 0.0,
+                 hang_seconds: float = 600.0,
+                 time_scale: float = 1.0,
+                 prefix_cache: bool = True,
+                 responder: Optional[Callable[[str, str, Dict[str, Any], int], str]] = None,
+                 seed: Optional[int] = None):
+        """
+        Initialize simulator.
+
+        Args:
+            profile: Latency profile for models without their own profile
+            model_profiles: Per-model profiles (e.g. a faster draft model)
+            slots: Concurrent requests served at once (OLLAMA_NUM_PARALLEL)
+            response_tokens: Default response length (capped by num_predict)
+            failure_rate: Probability a request fails with HTTP 500
+            timeout_rate: Probability a request hangs (client times out)
+            hang_seconds: How long a hung request stalls when the client
+                sets no timeout
+            time_scale: Real seconds slept per simulated second
+            prefix_cache: Skip prefill for the prefix shared with the
+                model's previous prompt
+            responder: Callable(model, prompt, payload, tokens) -> text
+            seed: Seed for failure/timeout injection
+        """
+        self.profile = profile or LatencyProfile()
+        self.model_profiles = dict(model_profiles or {})
+        self.slots = max(1, slots)
+        self.response_tokens = response_tokens
+        self.failure_rate = failure_rate
+        self.timeout_rate = timeout_rate
+        self.hang_seconds = hang_seconds
+        self.time_scale = time_scale
+        self.prefix_cache = prefix_cache
+        self.responder = responder or default_responder
+        self._random = random.Random(seed)
+
+        self._condition = threading.Condition()
+        self.loaded_model: Optional[str] = None
+        self.active = 0
+        self._last_prompt: Dict[str, str] = {}
+
+        # Statistics (simulated seconds)
+        self.requests = 0
+        self.completed = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.swaps = 0
+        self.swap_time = 0.0
+        self.queue_wait = 0.0
+        self.prefill_tokens = 0
+        self.cached_prefix_tokens = 0
+        self.decode_tokens = 0
+        self.busy_time = 0.0
+        self.max_active = 0
+        self.requests_by_model: Dict[str, int] = {}
+
+    def profile_for(self, model: str) -> LatencyProfile:
+        """Latency profile of a model"""
+        return self.model_profiles.get(model, self.profile)
+
+    def _sleep(self, simulated_seconds: float) -> None:
+        if simulated_seconds > 0 and self.time_scale > 0:
+            time.sleep(simulated_seconds * self.time_scale)
+
+    def _roll(self, rate: float) -> bool:
+        if rate <= 0:
+            return False
+        with self._condition:
+            return self._random.random() < rate
+
+    def _acquire(self, model: str) -> float:
+        """Wait for a free slot (swapping models if needed); returns load seconds"""
+        start = time.perf_counter()
+        with self._condition:
+            while self.active >= self.slots or (
+                    self.loaded_model not in (None, model) and self.active > 0):
+                self._condition.wait()
+
+            load_seconds = 0.0
+            if self.loaded_model != model:
+                load_seconds = self.profile_for(model).load_seconds
+                if self.loaded_model is not None:
+                    load_seconds += self.profile_for(self.loaded_model).unload_seconds
+                    self.swaps += 1
+                    self.swap_time += load_seconds
+                # Nothing else runs while a model is loading
+                self._sleep(load_seconds)
+                self.loaded_model = model
+
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            waited = time.perf_counter() - start - load_seconds * self.time_scale
+            if self.time_scale > 0:
+                self.queue_wait += max(0.0, waited) / self.time_scale
+            return load_seconds
+
+    def _release(self) -> None:
+        with self._condition:
+            self.active -= 1
+            self._condition.notify_all()
+
+    def _prefill_tokens(self, model: str, prompt: str) -> Tuple[int, int]:
+        """(tokens to evaluate, tokens reused from the cached prefix)"""
+        total = estimate_tokens(prompt)
+        cached = 0
+        with self._condition:
+            if self.prefix_cache and model in self._last_prompt:
+                shared = os.path.commonprefix([self._last_prompt[model], prompt])
+                cached = min(total, estimate_tokens(shared)) if shared else 0
+            self._last_prompt[model] = prompt
+        return total - cached, cached
+
+    def _load_request(self, model: str, keep_alive: Any) -> Dict[str, Any]:
+        """Empty-prompt request: load the model, or unload it with keep_alive=0"""
+        with self._condition:
+            if keep_alive == 0 or keep_alive == "0":
+                while self.active > 0 and self.loaded_model == model:
+                    self._condition.wait()
+                if self.loaded_model == model:
+                    self._sleep(self.profile_for(model).unload_seconds)
+                    self.loaded_model = None
+                return {"model": model, "response": "", "done": True, "done_reason": "unload"}
+
+        load_seconds = self._acquire(model)
+        self._release()
+        return {"model": model, "response": "", "done": True, "done_reason": "load",
+                "load_duration": int(load_seconds * 1e9)}
+
+    def events(self,
+               path: str,
+               payload: Dict[str, Any],
+               timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Run one request, yielding response chunks as they are produced.
+
+        Decode time is slept per token, so closing the iterator early stops
+        the simulated generation and frees its slot.
+
+        Args:
+            path: "/api/generate" or "/api/chat"
+            payload: Request body
+            timeout: Client timeout (simulated seconds; None = no timeout)
+
+        Yields:
+            Streaming chunks; the last one has done=True and server timings
+
+        Raises:
+            SimulatedHTTPError: On an injected failure
+            requests.exceptions.Timeout: If the request outlives timeout
+        """
+        model = payload.get("model", "")
+        chat = path.endswith("/api/chat")
+        if chat:
+            prompt = "\n".join(m.get("content", "") for m in payload.get("messages") or [])
+        else:
+            prompt = (payload.get("system") or "") + payload.get("prompt", "")
+
+        if not chat and not prompt:
+            yield self._load_request(model, payload.get("keep_alive"))
+            return
+
+        with self._condition:
+            self.requests += 1
+            self.requests_by_model[model] = self.requests_by_model.get(model, 0) + 1
+
+        hang = self._roll(self.timeout_rate)
+        fail = not hang and self._roll(self.failure_rate)
+
+        profile = self.profile_for(model)
+        load_seconds = self._acquire(model)
+        try:
+            evaluated, cached = self._prefill_tokens(model, prompt)
+            prefill_seconds = evaluated / profile.prefill_tokens_per_second
+
+            options = payload.get("options") or {}
+            tokens = self.response_tokens
+            if options.get("num_predict"):
+                tokens = min(tokens, int(options["num_predict"]))
+            text = self.responder(model, prompt, payload, tokens)
+            fragments = [word + " " for word in text.split(" ")]
+            fragments[-1] = fragments[-1].rstrip(" ")
+
+            with self._condition:
+                concurrent = self.active
+            decode_rate = profile.decode_tokens_per_second / (
+                1 + profile.concurrency_penalty * (concurrent - 1))
+            output_tokens = estimate_tokens(text)
+            decode_seconds = output_tokens / decode_rate
+
+            if hang or (timeout is not None and load_seconds + prefill_seconds + decode_seconds > timeout):
+                with self._condition:
+                    self.timeouts += 1
+                self._sleep(max(0.0, (timeout if timeout is not None else self.hang_seconds) - load_seconds))
+                if timeout is not None:
+                    raise requests.exceptions.Timeout(
+                        f"Simulated request exceeded {timeout}s (model {model})")
+
+            self._sleep(prefill_seconds)
+            if fail:
+                with self._condition:
+                    self.failures += 1
+                raise SimulatedHTTPError(500, "simulated failure: model runner has unexpectedly stopped")
+
+            per_fragment = decode_seconds / len(fragments)
+            for fragment in fragments:
+                self._sleep(per_fragment)
+                if chat:
+                    yield {"model": model, "message": {"role": "assistant", "content": fragment},
+                           "done": False}
+                else:
+                    yield {"model": model, "response": fragment, "done": False}
+
+            with self._condition:
+                self.completed += 1
+                self.prefill_tokens += evaluated
+                self.cached_prefix_tokens += cached
+                self.decode_tokens += output_tokens
+                self.busy_time += load_seconds + prefill_seconds + decode_seconds
+
+            final = {
+                "model": model,
+                "done": True,
+                "done_reason": "stop",
+                "load_duration": int(load_seconds * 1e9),
+                "prompt_eval_count": evaluated,
+                "prompt_eval_duration": int(prefill_seconds * 1e9),
+                "eval_count": output_tokens,
+                "eval_duration": int(decode_seconds * 1e9),
+                "total_duration": int((load_seconds + prefill_seconds + decode_seconds) * 1e9)
+            }
+            if chat:
+                final["message"] = {"role": "assistant", "content": ""}
+            else:
+                final["response"] = ""
+            yield final
+        finally:
+            self._release()
+
+    def handle(self,
+               path: str,
+               payload: Dict[str, Any],
+               timeout: Optional[float] = None) -> Tuple[int, Dict[str, Any]]:
+        """
+        Run a non-streaming request.
+
+        Returns:
+            (HTTP status, response body)
+
+        Raises:
+            requests.exceptions.Timeout: If the request outlives timeout
+        """
+        text = ""
+        final: Dict[str, Any] = {}
+        try:
+            for chunk in self.events(path, payload, timeout):
+                if chunk.get("done"):
+                    final = chunk
+                elif "message" in chunk:
+                    text += chunk["message"]["content"]
+                else:
+                    text += chunk.get("response", "")
+        except SimulatedHTTPError as e:
+            return e.status_code, {"error": e.message}
+
+        if "message" in final:
+            final["message"] = {"role": "assistant", "content": text}
+        else:
+            final["response"] = text
+        return 200, final
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get simulator statistics (durations in simulated seconds).
+
+        Returns:
+            Dictionary with request, token, swap and queueing counters
+        """
+        with self._condition:
+            return {
+                'requests': self.requests,
+                'completed': self.completed,
+                'failures': self.failures,
+                'timeouts': self.timeouts,
+                'requests_by_model': dict(self.requests_by_model),
+                'loaded_model': self.loaded_model,
+                'swaps': self.swaps,
+                'swap_time': self.swap_time,
+                'queue_wait': self.queue_wait,
+                'avg_queue_wait': self.queue_wait / self.requests if self.requests > 0 else 0.0,
+                'prefill_tokens': self.prefill_tokens,
+                'cached_prefix_tokens': self.cached_prefix_tokens,
+                'decode_tokens': self.decode_tokens,
+                'busy_time': self.busy_time,
+                'max_active': self.max_active,
+                'slots': self.slots
+            }
+
+
+class SimulatedResponse:
+    """Just enough of requests.Response for OllamaClient"""
+
+    def __init__(self,
+                 status_code: int,
+                 body: Optional[Dict[str, Any]] = None,
+                 chunks: Optional[Iterator[Dict[str, Any]]] = None):
+        self.status_code = status_code
+        self._body = body or {}
+        self._chunks = chunks
+
+    @property
+    def text(self) -> str:
+        return json.dumps(self._body)
+
+    def json(self) -> Dict[str, Any]:
+        return self._body
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Server Error", response=self)
+
+    def iter_lines(self) -> Iterator[bytes]:
+        try:
+            for chunk in self._chunks or iter(()):
+                yield json.dumps(chunk).encode("utf-8")
+        except SimulatedHTTPError as e:
+            yield json.dumps({"error": e.message}).encode("utf-8")
+
+    def close(self) -> None:
+        close = getattr(self._chunks, 'close', None)
+        if close:
+            close()
+
+
+class SimulatedSession:
+    """requests.Session stand-in routing OllamaClient calls to a simulator"""
+
+    def __init__(self, simulator: OllamaSimulator):
+        self.simulator = simulator
+
+    def post(self,
+             url: str,
+             json: Optional[Dict[str, Any]] = None,
+             timeout: Optional[float] = None,
+             stream: bool = False,
+             **kwargs) -> SimulatedResponse:
+        payload = json or {}
+        path = "/api/chat" if url.endswith("/api/chat") else "/api/generate"
+        if stream:
+            return SimulatedResponse(200, chunks=self.simulator.events(path, payload, timeout))
+        status, body = self.simulator.handle(path, payload, timeout)
+        return SimulatedResponse(status, body)
+
+    def get(self, url: str, timeout: Optional[float] = None, **kwargs) -> SimulatedResponse:
+        models = [{"name": name} for name in self.simulator.requests_by_model]
+        return SimulatedResponse(200, {"models": models})
+
+    def close(self) -> None:
+        pass
+
+
+def simulated_client(simulator: Optional[OllamaSimulator] = None, **client_kwargs) -> OllamaClient:
+    """OllamaClient backed in-process by a simulator"""
+    simulator = simulator or OllamaSimulator()
+    return OllamaClient(base_url=SIMULATOR_URL, session=SimulatedSession(simulator), **client_kwargs)
+
+
+def make_handler(simulator: OllamaSimulator) -> type:
+    """HTTP request handler class serving a simulator"""
+
+    class SimulatorHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+        def _send_json(self, status: int, body: Dict[str, Any]) -> None:
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self) -> None:
+            if self.path.rstrip("/") == "/api/tags":
+                models = [{"name": name} for name in simulator.requests_by_model]
+                self._send_json(200, {"models": models})
+            else:
+                self._send_json(404, {"error": "not found"})
+
+        def do_POST(self) -> None:
+            if self.path not in ("/api/generate", "/api/chat"):
+                self._send_json(404, {"error": "not found"})
+                return
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+
+            if not payload.get("stream", True) or not (payload.get("prompt") or payload.get("messages")):
+                status, body = simulator.handle(self.path, payload)
+                self._send_json(status, body)
+                return
+
+            # Streaming: newline-delimited JSON chunks
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            chunks = simulator.events(self.path, payload)
+            try:
+                try:
+                    for chunk in chunks:
+                        self._write_chunk(json.dumps(chunk) + "\n")
+                except SimulatedHTTPError as e:
+                    self._write_chunk(json.dumps({"error": e.message}) + "\n")
+                self.wfile.write(b"0\r\n\r\n")
+            except (BrokenPipeError, ConnectionResetError):
+                # Client hung up (e.g. stream validator abort)
+                chunks.close()
+
+        def _write_chunk(self, text: str) -> None:
+            data = text.encode("utf-8")
+            self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+            self.wfile.flush()
+
+    return SimulatorHandler
+
+
+def start_server(simulator: OllamaSimulator,
+                 host: str = "127.0.0.1",
+                 port: int = 11435) -> ThreadingHTTPServer:
+    """
+    Serve a simulator over HTTP on a background thread.
+
+    Args:
+        simulator: Simulator to expose
+        host: Bind address
+        port: Port (0 = pick a free one; see server.server_address)
+
+    Returns:
+        The running server (call shutdown() to stop it)
+    """
+    server = ThreadingHTTPServer((host, port), make_handler(simulator))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="ollama-simulator", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Latency-model Ollama stand-in for offline load tests')
+    parser.add_argument('--host', type=str, default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=11435)
+    parser.add_argument('--slots', type=int, default=DEFAULT_POOL_SIZE, help='Concurrent requests')
+    parser.add_argument('--prefill-rate', type=float, default=1200.0, help='Prompt tokens/second')
+    parser.add_argument('--decode-rate', type=float, default=35.0, help='Output tokens/second')
+    parser.add_argument('--load-seconds', type=float, default=4.0, help='Model load time')
+    parser.add_argument('--response-tokens', type=int, default=120)
+    parser.add_argument('--failure-rate', type=float, default=0.0)
+    parser.add_argument('--timeout-rate', type=float, default=0.0)
+    parser.add_argument('--time-scale', type=float, default=1.0,
+                        help='Real seconds per simulated second (e.g. 0.1 = 10x faster)')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    simulator = OllamaSimulator(
+        profile=LatencyProfile(prefill_tokens_per_second=args.prefill_rate,
+                               decode_tokens_per_second=args.decode_rate,
+                               load_seconds=args.load_seconds),
+        slots=args.slots,
+        response_tokens=args.response_tokens,
+        failure_rate=args.failure_rate,
+        timeout_rate=args.timeout_rate,
+        time_scale=args.time_scale,
+        seed=args.seed
+    )
+    server = start_server(simulator, args.host, args.port)
+    print(f"🧪 Ollama simulator on http://{args.host}:{server.server_address[1]} "
+          f"({args.slots} slots, time scale {args.time_scale})")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print(json.dumps(simulator.get_statistics(), indent=2))
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
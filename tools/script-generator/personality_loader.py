@@ -34,6 +34,7 @@ def load_personality(dj_name: str, project_root: Optional[Path] = None) -> Dict:
         {
             "name": str,
             "role": str,
+            "radio_station": str,
             "tone": str,
             "voice": {...},
             "catchphrases": [...],
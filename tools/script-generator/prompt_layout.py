@@ -0,0 +1,86 @@
+"""
+Prompt Layout - Prefix-stable prompt assembly for Ollama KV-cache reuse
+
+Ollama keeps the KV cache of the previous request per loaded model and only
+evaluates the part of a new prompt after the longest shared prefix. The
+segment templates used to open with a per-template persona header and
+interleave per-segment variables, so consecutive requests shared little
+prefix.
+
+Prompts are now assembled in a canonical order:
+
+1. Static DJ persona (system message, byte-identical for every segment)
+2. Semi-static session context (continuity, variety hints)
+3. Dynamic content (catchphrase/voice picks, story beats, weather, RAG lore,
+   task instructions)
+
+The persona is built here; templates rendered with persona_in_system=True
+skip their own persona header and start with the session block.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Any, List
+
+
+def build_persona_prompt(personality: Dict[str, Any]) -> str:
+    """
+    Static persona block for the system message.
+
+    Only depends on the character card, so it is identical for every
+    segment of a DJ (and therefore a cacheable prompt prefix).
+
+    Args:
+        personality: Character card (name, radio_station, system_prompt,
+            tone, do, dont, catchphrases)
+
+    Returns:
+        System message text
+    """
+    name = personality.get('name', 'DJ')
+    station = personality.get('radio_station')
+    lines = [f"You are {name}, the DJ for {station}." if station else f"You are {name}, a radio DJ."]
+
+    if personality.get('system_prompt'):
+        lines += ["", "CHARACTER:", personality['system_prompt'].strip()]
+
+    if personality.get('tone'):
+        lines += ["", f"TONE: {personality['tone']}"]
+
+    if personality.get('do'):
+        lines += ["", "SPEAKING STYLE:"]
+        lines += [f"- {guideline}" for guideline in personality['do']]
+
+    if personality.get('dont'):
+        lines += ["", "AVOID:"]
+        lines += [f"- {restriction}" for restriction in personality['dont']]
+
+    if personality.get('catchphrases'):
+        lines += ["", "SIGNATURE CATCHPHRASES:"]
+        lines += [f'- "{phrase}"' for phrase in personality['catchphrases']]
+
+    return "\n".join(lines)
+
+
+@dataclass
+class PromptLayout:
+    """A prompt split into a stable system message and a per-segment user message"""
+    system: str
+    user: str
+
+    def to_messages(self) -> List[Dict[str, str]]:
+        """Messages for /api/chat"""
+        return [
+            {"role": "system", "content": self.system},
+            {"role": "user", "content": self.user}
+        ]
+
+    def flatten(self) -> str:
+        """Single prompt for clients without chat support"""
+        return f"{self.system}\n\n{self.user}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (for segment metadata)"""
+        return {
+            'system_chars': len(self.system),
+            'user_chars': len(self.user)
+        }
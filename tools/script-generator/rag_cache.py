@@ -16,13 +16,16 @@ Performance targets:
 - DJ temporal/spatial filters applied correctly
 """
 
-from typing import Dict, Any, Optional, List, Tuple, Set
+from typing import Dict, Any, Optional, List, Tuple, Set, Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import hashlib
 import json
+import threading
 from collections import OrderedDict
 
+from metadata_filter import compile_filter
+
 
 @dataclass
 class CachedQuery:
@@ -34,6 +37,7 @@ class CachedQuery:
     ttl_seconds: int
     cache_key: str
     hit_count: int = 0
+    prefetched: bool = False
     
     def is_expired(self) -> bool:
         """Check if cache entry has expired"""
@@ -49,7 +53,8 @@ class CachedQuery:
             'timestamp': self.timestamp.isoformat(),
             'ttl_seconds': self.ttl_seconds,
             'cache_key': self.cache_key,
-            'hit_count': self.hit_count
+            'hit_count': self.hit_count,
+            'prefetched': self.prefetched
         }
 
 
@@ -61,6 +66,8 @@ class CacheStatistics:
     cache_misses: int = 0
     expired_entries: int = 0
     evictions: int = 0
+    prefetched_entries: int = 0
+    prefetch_hits: int = 0
     
     @property
     def hit_rate(self) -> float:
@@ -77,6 +84,8 @@ class CacheStatistics:
             'cache_misses': self.cache_misses,
             'expired_entries': self.expired_entries,
             'evictions': self.evictions,
+            'prefetched_entries': self.prefetched_entries,
+            'prefetch_hits': self.prefetch_hits,
             'hit_rate': self.hit_rate
         }
 
@@ -92,20 +101,29 @@ class RAGCache:
                  chromadb_ingestor,
                  max_cache_size: int = 100,
                  default_ttl: int = 1800,  # 30 minutes
-                 enable_semantic_matching: bool = True):
+                 enable_semantic_matching: bool = True,
+                 retrieval_mode: str = "vector",
+                 ingestor_factory: Optional[Callable[[], Any]] = None):
         """
         Initialize RAG cache.
         
         Args:
-            chromadb_ingestor: ChromaDBIngestor instance for queries
+            chromadb_ingestor: ChromaDBIngestor instance for queries (None with
+                ingestor_factory: opened on the first query)
             max_cache_size: Maximum number of cached queries (LRU eviction)
             default_ttl: Default time-to-live for cache entries (seconds)
             enable_semantic_matching: Enable semantic similarity for cache hits
+            retrieval_mode: ChromaDB retrieval mode ('vector', 'lexical', 'hybrid')
+            ingestor_factory: Callable returning the ChromaDBIngestor, called
+                on first use when chromadb_ingestor is None
         """
-        self.chromadb = chromadb_ingestor
+        self._chromadb = chromadb_ingestor
+        self._ingestor_factory = ingestor_factory
+        self._ingestor_lock = threading.Lock()
         self.max_cache_size = max_cache_size
         self.default_ttl = default_ttl
         self.enable_semantic_matching = enable_semantic_matching
+        self.retrieval_mode = retrieval_mode
         
         # Cache storage (OrderedDict for LRU)
         self.cache: OrderedDict[str, CachedQuery] = OrderedDict()
@@ -115,6 +133,22 @@ class RAGCache:
         
         # Topic-based cache keys for targeted invalidation
         self.topic_index: Dict[str, Set[str]] = {}
+        
+        # Guards cache/topic_index when a background prefetcher is running
+        self._lock = threading.RLock()
+    
+    @property
+    def chromadb(self):
+        """ChromaDB ingestor (opened by ingestor_factory on first access)"""
+        if self._chromadb is None and self._ingestor_factory is not None:
+            with self._ingestor_lock:
+                if self._chromadb is None:
+                    self._chromadb = self._ingestor_factory()
+        return self._chromadb
+    
+    @chromadb.setter
+    def chromadb(self, ingestor) -> None:
+        self._chromadb = ingestor
     
     def _generate_cache_key(self, 
                            query: str, 
@@ -182,6 +216,11 @@ class RAGCache:
         """
         Apply DJ-specific filters to chunks (temporal/spatial constraints).
         
+        dj_context may carry a 'metadata_filter' (ChromaDB where dict or a
+        metadata_filter.Filter, e.g. DJKnowledgeProfile.compile_filter()).
+        It is compiled once per distinct filter and evaluated locally, so
+        cached results can be re-filtered without another ChromaDB query.
+        
         Args:
             chunks: Raw chunks from cache/DB
             dj_context: DJ context with filters
@@ -194,6 +233,10 @@ class RAGCache:
         dj_year = dj_context.get('year', 9999)
         dj_region = dj_context.get('region', None)
         forbidden_topics = dj_context.get('forbidden_topics', [])
+        metadata_filter = compile_filter(dj_context.get('metadata_filter'))
+        
+        if metadata_filter is not None and metadata_filter.is_never:
+            return []
         
         for chunk in chunks:
             metadata = chunk.get('metadata', {})
@@ -203,6 +246,10 @@ class RAGCache:
             if chunk_year > dj_year:
                 continue
             
+            # Compiled metadata filter (same semantics as the ChromaDB where-clause)
+            if metadata_filter is not None and not metadata_filter.matches(metadata or {}):
+                continue
+            
             # Spatial filter: Prefer DJ's region (but don't exclude others completely)
             # This is handled in ranking/scoring, not hard filtering
             
@@ -287,64 +334,135 @@ class RAGCache:
         Returns:
             List of relevant chunks (filtered for DJ)
         """
-        self.stats.total_queries += 1
-        
-        # Cleanup expired entries periodically
-        if self.stats.total_queries % 10 == 0:
-            self._cleanup_expired()
-        
-        # Generate cache key
-        if cache_key_override:
-            cache_key = cache_key_override
-        else:
-            cache_key = self._generate_cache_key(query, dj_context, num_chunks)
-        
-        # Check cache
-        if cache_key in self.cache:
-            entry = self.cache[cache_key]
+        with self._lock:
+            self.stats.total_queries += 1
             
-            # Check expiration
-            if not entry.is_expired():
-                # Cache hit!
-                self.stats.cache_hits += 1
-                entry.hit_count += 1
-                
-                # Move to end (LRU)
-                self.cache.move_to_end(cache_key)
-                
-                # Apply DJ filters and return
-                filtered_chunks = self._apply_dj_filters(entry.results, dj_context)
-                return self._chunks_to_chromadb_format(filtered_chunks)
+            # Cleanup expired entries periodically
+            if self.stats.total_queries % 10 == 0:
+                self._cleanup_expired()
+            
+            # Generate cache key
+            if cache_key_override:
+                cache_key = cache_key_override
             else:
-                # Expired entry
-                del self.cache[cache_key]
-                self.stats.expired_entries += 1
-        
-        # Check semantic similarity with existing cache (if enabled)
-        if self.enable_semantic_matching:
-            for key, entry in self.cache.items():
-                if self._is_semantically_similar(query, entry.query):
-                    # Semantic match found
-                    self.stats.cache_hits += 1
-                    entry.hit_count += 1
+                cache_key = self._generate_cache_key(query, dj_context, num_chunks)
+            
+            # Check cache
+            if cache_key in self.cache:
+                entry = self.cache[cache_key]
+                
+                # Check expiration
+                if not entry.is_expired():
+                    # Cache hit!
+                    self._record_hit(entry)
                     
                     # Move to end (LRU)
-                    self.cache.move_to_end(key)
+                    self.cache.move_to_end(cache_key)
                     
                     # Apply DJ filters and return
                     filtered_chunks = self._apply_dj_filters(entry.results, dj_context)
                     return self._chunks_to_chromadb_format(filtered_chunks)
+                else:
+                    # Expired entry
+                    del self.cache[cache_key]
+                    self.stats.expired_entries += 1
+            
+            # Check semantic similarity with existing cache (if enabled)
+            if self.enable_semantic_matching:
+                for key, entry in self.cache.items():
+                    if self._is_semantically_similar(query, entry.query):
+                        # Semantic match found
+                        self._record_hit(entry)
+                        
+                        # Move to end (LRU)
+                        self.cache.move_to_end(key)
+                        
+                        # Apply DJ filters and return
+                        filtered_chunks = self._apply_dj_filters(entry.results, dj_context)
+                        return self._chunks_to_chromadb_format(filtered_chunks)
+            
+            # Cache miss - query ChromaDB
+            self.stats.cache_misses += 1
+            
+            chunks = self._fetch_chunks(query, dj_context, num_chunks)
+            self._store_entry(cache_key, query, chunks, dj_context, ttl, topic)
+            
+            # Apply DJ filters and return
+            filtered_chunks = self._apply_dj_filters(chunks, dj_context)
+            return self._chunks_to_chromadb_format(filtered_chunks)
+    
+    def prefetch(self,
+                 query: str,
+                 dj_context: Dict[str, Any],
+                 num_chunks: int = 5,
+                 ttl: Optional[int] = None,
+                 topic: Optional[str] = None) -> bool:
+        """
+        Warm the cache for a query expected to be asked soon.
         
-        # Cache miss - query ChromaDB
-        self.stats.cache_misses += 1
+        Unlike query_with_cache this does not count towards hit/miss
+        statistics, and the ChromaDB round-trip happens outside the cache
+        lock so foreground queries are not blocked by a background warmer.
         
+        Args:
+            query: Search query string (must match the future foreground query)
+            dj_context: DJ context used for the cache key
+            num_chunks: Number of chunks the foreground query will request
+            ttl: Custom TTL for this entry (seconds), None = use default
+            topic: Optional topic tag for cache invalidation
+            
+        Returns:
+            True if a new entry was stored, False if already cached
+        """
+        cache_key = self._generate_cache_key(query, dj_context, num_chunks)
+        
+        with self._lock:
+            entry = self.cache.get(cache_key)
+            if entry is not None and not entry.is_expired():
+                return False
+        
+        chunks = self._fetch_chunks(query, dj_context, num_chunks)
+        
+        with self._lock:
+            # A foreground query may have filled the slot while we were fetching
+            entry = self.cache.get(cache_key)
+            if entry is not None and not entry.is_expired():
+                return False
+            
+            self._store_entry(cache_key, query, chunks, dj_context, ttl, topic, prefetched=True)
+            self.stats.prefetched_entries += 1
+            return True
+    
+    def _record_hit(self, entry: CachedQuery) -> None:
+        """Update hit counters for a cache entry"""
+        self.stats.cache_hits += 1
+        if entry.prefetched and entry.hit_count == 0:
+            self.stats.prefetch_hits += 1
+        entry.hit_count += 1
+    
+    def _fetch_chunks(self,
+                      query: str,
+                      dj_context: Dict[str, Any],
+                      num_chunks: int) -> List[Dict[str, Any]]:
+        """
+        Run the DJ-filtered ChromaDB query and convert results to chunk dicts.
+        
+        Args:
+            query: Search query string
+            dj_context: DJ context (name used for DJ query filters)
+            num_chunks: Number of chunks to request
+            
+        Returns:
+            List of unfiltered chunk dicts
+        """
         # Query database
         from tools.wiki_to_chromadb.chromadb_ingest import query_for_dj
         results = query_for_dj(
             ingestor=self.chromadb,
             query_text=query,
             dj_name=dj_context.get('name', 'Unknown'),
-            n_results=num_chunks
+            n_results=num_chunks,
+            mode=self.retrieval_mode
         )
         
         # Convert results to list of dicts
@@ -359,8 +477,18 @@ class RAGCache:
                 }
                 chunks.append(chunk)
         
-        # Store in cache
-        if len(self.cache) >= self.max_cache_size:
+        return chunks
+    
+    def _store_entry(self,
+                     cache_key: str,
+                     query: str,
+                     chunks: List[Dict[str, Any]],
+                     dj_context: Dict[str, Any],
+                     ttl: Optional[int],
+                     topic: Optional[str],
+                     prefetched: bool = False) -> None:
+        """Store chunks in the cache, evicting LRU entries and indexing topic"""
+        if cache_key not in self.cache and len(self.cache) >= self.max_cache_size:
             self._evict_lru()
         
         entry = CachedQuery(
@@ -369,7 +497,8 @@ class RAGCache:
             dj_context=dj_context,
             timestamp=datetime.now(),
             ttl_seconds=ttl if ttl is not None else self.default_ttl,
-            cache_key=cache_key
+            cache_key=cache_key,
+            prefetched=prefetched
         )
         
         self.cache[cache_key] = entry
@@ -379,10 +508,6 @@ class RAGCache:
             if topic not in self.topic_index:
                 self.topic_index[topic] = set()
             self.topic_index[topic].add(cache_key)
-        
-        # Apply DJ filters and return
-        filtered_chunks = self._apply_dj_filters(chunks, dj_context)
-        return self._chunks_to_chromadb_format(filtered_chunks)
     
     def get_cached_chunks_for_topic(self, topic: str) -> Optional[List[Dict[str, Any]]]:
         """
@@ -417,17 +542,18 @@ class RAGCache:
             topic: If provided, only clear entries with this topic tag.
                    If None, clear entire cache.
         """
-        if topic is None:
-            # Clear all
-            self.cache.clear()
-            self.topic_index.clear()
-        else:
-            # Clear topic-specific entries
-            if topic in self.topic_index:
-                for cache_key in list(self.topic_index[topic]):
-                    if cache_key in self.cache:
-                        del self.cache[cache_key]
-                del self.topic_index[topic]
+        with self._lock:
+            if topic is None:
+                # Clear all
+                self.cache.clear()
+                self.topic_index.clear()
+            else:
+                # Clear topic-specific entries
+                if topic in self.topic_index:
+                    for cache_key in list(self.topic_index[topic]):
+                        if cache_key in self.cache:
+                            del self.cache[cache_key]
+                    del self.topic_index[topic]
     
     def get_statistics(self) -> Dict[str, Any]:
         """
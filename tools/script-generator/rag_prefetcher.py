@@ -0,0 +1,334 @@
+"""
+RAG Prefetcher - Predictive cache warming for upcoming broadcast hours
+
+The broadcast schedule is largely deterministic: every hour opens with a
+time check, weather/news land on fixed hours, and gossip fills the rest.
+The weather calendar tells us which weather type each upcoming hour will
+have. That means most RAG queries for the next few hours are known before
+the segments are generated.
+
+RAGPrefetcher walks the next N hours of the scheduler (BroadcastScheduler
+or BroadcastSchedulerV2 - both expose WEATHER_HOURS / NEWS_HOURS), builds
+the same context queries BroadcastEngine will issue, and warms RAGCache
+with them on a background thread so generation hits the cache instead of
+ChromaDB.
+
+Part of Phase 1 (RAG Cache) performance work.
+"""
+
+from typing import Dict, Any, Optional, List, Callable
+from dataclasses import dataclass
+from datetime import datetime
+import threading
+import logging
+
+from content_types.news import NEWS_CATEGORIES
+
+logger = logging.getLogger(__name__)
+
+
+# Default rumor type used by BroadcastEngine when none is supplied
+DEFAULT_RUMOR_TYPE = 'wasteland rumors'
+
+
+@dataclass
+class PrefetchTarget:
+    """A single predicted RAG query for an upcoming hour"""
+    hour: int
+    segment_type: str
+    query: str
+    topic: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            'hour': self.hour,
+            'segment_type': self.segment_type,
+            'query': self.query,
+            'topic': self.topic
+        }
+
+
+class RAGPrefetcher:
+    """
+    Predicts upcoming RAG queries and warms RAGCache in the background.
+
+    Example:
+        prefetcher = RAGPrefetcher(
+            rag_cache=generator.rag_cache,
+            dj_context=generator.build_dj_context(dj_name),
+            scheduler=engine.scheduler,
+            query_builder=engine._build_context_query,
+            topic_resolver=generator._get_topic_for_content_type,
+            weather_lookup=engine._get_current_weather_from_simulator
+        )
+        prefetcher.start(start_hour=7, hours_ahead=3)
+    """
+
+    def __init__(self,
+                 rag_cache,
+                 dj_context: Dict[str, Any],
+                 scheduler,
+                 query_builder: Callable[[str, Dict[str, Any]], str],
+                 topic_resolver: Optional[Callable[[str], Optional[str]]] = None,
+                 weather_lookup: Optional[Callable[[int], Optional[Any]]] = None,
+                 num_chunks: int = 5,
+                 ttl: Optional[int] = None,
+                 max_queries: int = 32,
+                 news_categories: Optional[List[str]] = None):
+        """
+        Initialize prefetcher.
+
+        Args:
+            rag_cache: RAGCache instance to warm
+            dj_context: DJ context dict (must match the one used by ScriptGenerator)
+            scheduler: BroadcastScheduler or BroadcastSchedulerV2
+            query_builder: Callable(segment_type, template_vars) -> query string
+            topic_resolver: Callable(segment_type) -> cache topic (optional)
+            weather_lookup: Callable(hour) -> WeatherState or None (optional)
+            num_chunks: Chunks per query (must match generator n_results)
+            ttl: TTL for warmed entries (None = cache default)
+            max_queries: Upper bound on queries issued per prefetch run
+            news_categories: Candidate news categories (default: all)
+        """
+        self.rag_cache = rag_cache
+        self.dj_context = dj_context
+        self.scheduler = scheduler
+        self.query_builder = query_builder
+        self.topic_resolver = topic_resolver
+        self.weather_lookup = weather_lookup
+        self.num_chunks = num_chunks
+        self.ttl = ttl
+        self.max_queries = max_queries
+        self.news_categories = list(news_categories) if news_categories else list(NEWS_CATEGORIES)
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+        # Statistics
+        self.runs = 0
+        self.queries_planned = 0
+        self.queries_warmed = 0
+        self.queries_skipped = 0
+        self.errors = 0
+        self.total_prefetch_time = 0.0
+
+    def predict_segment_types(self, hour: int) -> List[str]:
+        """
+        Predict the generator script types expected for an hour.
+
+        Mirrors the fixed schedule shared by both scheduler versions:
+        time check every hour, weather/news on their fixed hours, gossip
+        as filler.
+
+        Args:
+            hour: Hour (0-23)
+
+        Returns:
+            List of generator script types ('time', 'weather', 'news', 'gossip')
+        """
+        segment_types = ['time']
+
+        if hour in getattr(self.scheduler, 'WEATHER_HOURS', set()):
+            segment_types.append('weather')
+
+        if hour in getattr(self.scheduler, 'NEWS_HOURS', set()):
+            segment_types.append('news')
+
+        if getattr(self.scheduler, 'GOSSIP_REQUIRED', True):
+            segment_types.append('gossip')
+
+        return segment_types
+
+    def _template_vars_for(self, segment_type: str, hour: int) -> List[Dict[str, Any]]:
+        """
+        Build the template variable sets a segment could be generated with.
+
+        Returns an empty list when the query cannot be predicted (e.g. weather
+        with no calendar entry, where the engine falls back to a random pick).
+        """
+        if segment_type == 'weather':
+            if not self.weather_lookup:
+                return []
+            weather = self.weather_lookup(hour)
+            if weather is None:
+                return []
+            return [{'weather_type': weather.weather_type}]
+
+        if segment_type == 'news':
+            return [{'news_category': category} for category in self.news_categories]
+
+        if segment_type == 'gossip':
+            return [{'rumor_type': DEFAULT_RUMOR_TYPE}]
+
+        return [{}]
+
+    def plan(self, start_hour: int, hours_ahead: int) -> List[PrefetchTarget]:
+        """
+        Build the list of queries expected over the next hours.
+
+        Queries are de-duplicated (the time check query is the same every
+        hour) and capped at max_queries, nearest hours first.
+
+        Args:
+            start_hour: First hour to plan (0-23)
+            hours_ahead: Number of hours to walk
+
+        Returns:
+            Ordered list of PrefetchTarget
+        """
+        targets: List[PrefetchTarget] = []
+        seen_queries = set()
+
+        for offset in range(hours_ahead):
+            hour = (start_hour + offset) % 24
+
+            for segment_type in self.predict_segment_types(hour):
+                for template_vars in self._template_vars_for(segment_type, hour):
+                    query = self.query_builder(segment_type, template_vars)
+                    if query in seen_queries:
+                        continue
+                    seen_queries.add(query)
+
+                    topic = self.topic_resolver(segment_type) if self.topic_resolver else None
+                    targets.append(PrefetchTarget(
+                        hour=hour,
+                        segment_type=segment_type,
+                        query=query,
+                        topic=topic
+                    ))
+
+                    if len(targets) >= self.max_queries:
+                        return targets
+
+        return targets
+
+    def prefetch(self, start_hour: int, hours_ahead: int) -> Dict[str, Any]:
+        """
+        Plan and warm the cache synchronously.
+
+        Errors on individual queries are logged and counted, never raised -
+        prefetching must not break a broadcast.
+
+        Args:
+            start_hour: First hour to prefetch (0-23)
+            hours_ahead: Number of hours to walk
+
+        Returns:
+            Summary dict for this run
+        """
+        start_time = datetime.now()
+        targets = self.plan(start_hour, hours_ahead)
+        warmed = 0
+        skipped = 0
+        errors = 0
+
+        for target in targets:
+            if self._stop_event.is_set():
+                break
+            try:
+                stored = self.rag_cache.prefetch(
+                    query=target.query,
+                    dj_context=self.dj_context,
+                    num_chunks=self.num_chunks,
+                    ttl=self.ttl,
+                    topic=target.topic
+                )
+                if stored:
+                    warmed += 1
+                else:
+                    skipped += 1
+            except Exception as e:
+                errors += 1
+                logger.warning(f"RAG prefetch failed for '{target.query}': {e}")
+
+        elapsed = (datetime.now() - start_time).total_seconds()
+
+        self.runs += 1
+        self.queries_planned += len(targets)
+        self.queries_warmed += warmed
+        self.queries_skipped += skipped
+        self.errors += errors
+        self.total_prefetch_time += elapsed
+
+        logger.info(
+            f"RAG prefetch hours {start_hour}+{hours_ahead}: "
+            f"{warmed} warmed, {skipped} already cached, {errors} errors ({elapsed:.2f}s)"
+        )
+
+        return {
+            'start_hour': start_hour,
+            'hours_ahead': hours_ahead,
+            'planned': len(targets),
+            'warmed': warmed,
+            'skipped': skipped,
+            'errors': errors,
+            'elapsed_seconds': elapsed
+        }
+
+    def start(self, start_hour: int, hours_ahead: int) -> bool:
+        """
+        Run prefetch on a background daemon thread.
+
+        Only one run is active at a time; a request while a run is in
+        flight is ignored (the running pass already covers most of the
+        window).
+
+        Args:
+            start_hour: First hour to prefetch (0-23)
+            hours_ahead: Number of hours to walk
+
+        Returns:
+            True if a new background run was started
+        """
+        if self.is_running():
+            return False
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self.prefetch,
+            args=(start_hour, hours_ahead),
+            name="rag-prefetch",
+            daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def is_running(self) -> bool:
+        """Check whether a background run is in flight"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the background run to finish.
+
+        Args:
+            timeout: Seconds to wait (None = forever)
+
+        Returns:
+            True if no run is in flight after waiting
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return not self.is_running()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Ask the background run to stop after its current query"""
+        self._stop_event.set()
+        self.wait(timeout)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get prefetch statistics.
+
+        Returns:
+            Dictionary with prefetch counters
+        """
+        return {
+            'runs': self.runs,
+            'queries_planned': self.queries_planned,
+            'queries_warmed': self.queries_warmed,
+            'queries_skipped': self.queries_skipped,
+            'errors': self.errors,
+            'total_prefetch_time': self.total_prefetch_time
+        }
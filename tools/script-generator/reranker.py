@@ -0,0 +1,283 @@
+"""
+Reranker - Optional rerank stage between RAG retrieval and context packing
+
+query_for_dj returns raw ANN neighbours and generate_script keeps the top
+few. Reranking a slightly larger candidate set with cheap signals puts
+better chunks into the prompt, which means fewer validation failures and
+fewer regeneration retries.
+
+Two rerankers share the same interface (rerank(query, chunks, top_k)):
+- FeatureReranker: no model, scores retrieval similarity plus chunk
+  metadata (freshness_score, knowledge_tier, chunk_quality, region match)
+- CrossEncoderReranker: small CPU cross-encoder from sentence-transformers,
+  optionally blended with the feature score
+
+Chunks are the dicts RAGCache works with:
+    {'id': str, 'text': str, 'metadata': dict, 'distance': float}
+"""
+
+from typing import Dict, Any, Optional, List, Tuple
+from dataclasses import dataclass
+import importlib.util
+import math
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Checked without importing: sentence_transformers pulls in torch, which
+# costs seconds of startup even when no cross-encoder is used
+CROSS_ENCODER_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+
+
+# Metadata value -> score in [0, 1]
+KNOWLEDGE_TIER_SCORES = {
+    'common': 1.0,
+    'regional': 0.8,
+    'restricted': 0.4,
+    'classified': 0.2,
+}
+
+CHUNK_QUALITY_SCORES = {
+    'rich': 1.0,
+    'content': 0.8,
+    'reference': 0.4,
+    'stub': 0.1,
+}
+
+# Neutral score for chunks missing a metadata field
+UNKNOWN_FEATURE_SCORE = 0.5
+
+DEFAULT_CROSS_ENCODER = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+
+
+@dataclass
+class RerankWeights:
+    """Relative weights of the feature scorer signals"""
+    similarity: float = 0.5
+    freshness: float = 0.15
+    knowledge_tier: float = 0.1
+    chunk_quality: float = 0.15
+    region: float = 0.1
+
+    def to_dict(self) -> Dict[str, float]:
+        """Convert to dictionary"""
+        return {
+            'similarity': self.similarity,
+            'freshness': self.freshness,
+            'knowledge_tier': self.knowledge_tier,
+            'chunk_quality': self.chunk_quality,
+            'region': self.region
+        }
+
+
+def parse_dj_location(dj_name: str) -> Optional[str]:
+    """
+    Extract the location from a DJ name like "Julie (2102, Appalachia)".
+
+    Returns:
+        Location string or None if the name has no "(YEAR, Location)" suffix
+    """
+    match = re.search(r'\((\d+),\s*([^)]+)\)', dj_name or '')
+    return match.group(2).strip() if match else None
+
+
+class FeatureReranker:
+    """
+    Cheap feature-based reranker.
+
+    score = w_sim * similarity + w_fresh * freshness_score
+          + w_tier * tier_score + w_quality * quality_score
+          + w_region * region_match
+    """
+
+    def __init__(self,
+                 dj_region: Optional[str] = None,
+                 weights: Optional[RerankWeights] = None):
+        """
+        Initialize feature reranker.
+
+        Args:
+            dj_region: DJ's home location (e.g. "Appalachia") for region match
+            weights: Signal weights (default: RerankWeights())
+        """
+        self.dj_region = dj_region
+        self.weights = weights or RerankWeights()
+
+    @classmethod
+    def for_dj(cls, dj_name: str, weights: Optional[RerankWeights] = None) -> "FeatureReranker":
+        """Build a reranker for a DJ name like "Julie (2102, Appalachia)" """
+        return cls(dj_region=parse_dj_location(dj_name), weights=weights)
+
+    @staticmethod
+    def similarity(chunk: Dict[str, Any]) -> float:
+        """Retrieval similarity in [0, 1] from cosine distance (neutral if unknown)"""
+        distance = chunk.get('distance')
+        if distance is None:
+            return UNKNOWN_FEATURE_SCORE
+        return max(0.0, min(1.0, 1.0 - float(distance)))
+
+    def region_match(self, metadata: Dict[str, Any], dj_region: Optional[str] = None) -> float:
+        """1.0 if the chunk location matches the DJ region, 0.0 if it differs"""
+        dj_region = dj_region or self.dj_region
+        if not dj_region:
+            return UNKNOWN_FEATURE_SCORE
+        location = str(metadata.get('location') or '').lower()
+        if not location or location == 'general':
+            return UNKNOWN_FEATURE_SCORE
+        region = dj_region.lower()
+        return 1.0 if (region in location or location in region) else 0.0
+
+    def feature_scores(self, chunk: Dict[str, Any],
+                       dj_region: Optional[str] = None) -> Dict[str, float]:
+        """
+        Compute the individual signals for a chunk.
+
+        Args:
+            chunk: Chunk dict
+            dj_region: Region override (default: the reranker's dj_region)
+
+        Returns:
+            Dict of signal name -> score in [0, 1]
+        """
+        metadata = chunk.get('metadata') or {}
+        freshness = metadata.get('freshness_score')
+        return {
+            'similarity': self.similarity(chunk),
+            'freshness': float(freshness) if freshness is not None else UNKNOWN_FEATURE_SCORE,
+            'knowledge_tier': KNOWLEDGE_TIER_SCORES.get(
+                metadata.get('knowledge_tier'), UNKNOWN_FEATURE_SCORE),
+            'chunk_quality': CHUNK_QUALITY_SCORES.get(
+                metadata.get('chunk_quality'), UNKNOWN_FEATURE_SCORE),
+            'region': self.region_match(metadata, dj_region),
+        }
+
+    def score(self, query: str, chunk: Dict[str, Any],
+              dj_region: Optional[str] = None) -> float:
+        """Weighted feature score for a chunk"""
+        weights = self.weights.to_dict()
+        features = self.feature_scores(chunk, dj_region)
+        return sum(weights[name] * value for name, value in features.items())
+
+    def score_all(self, query: str, chunks: List[Dict[str, Any]],
+                  dj_region: Optional[str] = None) -> List[float]:
+        """Score a list of chunks"""
+        return [self.score(query, chunk, dj_region) for chunk in chunks]
+
+    def rerank(self,
+               query: str,
+               chunks: List[Dict[str, Any]],
+               top_k: Optional[int] = None,
+               dj_region: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Rerank chunks and keep the best top_k.
+
+        Ties keep retrieval order. Each returned chunk gets a 'rerank_score'.
+
+        Args:
+            query: Retrieval query
+            chunks: Candidate chunks (retrieval order)
+            top_k: Number of chunks to keep (None = all)
+            dj_region: Region override (one reranker can serve several DJs)
+
+        Returns:
+            Reranked chunks (copies, input list is not modified)
+        """
+        scores = self.score_all(query, chunks, dj_region)
+        ranked: List[Tuple[int, float]] = sorted(
+            enumerate(scores), key=lambda item: (-item[1], item[0])
+        )
+        if top_k is not None:
+            ranked = ranked[:top_k]
+        return [{**chunks[i], 'rerank_score': score} for i, score in ranked]
+
+
+class CrossEncoderReranker(FeatureReranker):
+    """
+    Cross-encoder reranker (small CPU model), blended with feature signals.
+
+    The cross-encoder replaces the retrieval similarity signal; metadata
+    signals keep their weights. The model is loaded on first use.
+    """
+
+    def __init__(self,
+                 model_name: str = DEFAULT_CROSS_ENCODER,
+                 dj_region: Optional[str] = None,
+                 weights: Optional[RerankWeights] = None,
+                 device: str = "cpu"):
+        """
+        Initialize cross-encoder reranker.
+
+        Args:
+            model_name: sentence-transformers CrossEncoder model
+            dj_region: DJ's home location for region match
+            weights: Signal weights ('similarity' weights the cross-encoder)
+            device: Torch device
+
+        Raises:
+            ImportError: If sentence-transformers is not installed
+        """
+        if not CROSS_ENCODER_AVAILABLE:
+            raise ImportError("sentence-transformers is required for CrossEncoderReranker")
+        super().__init__(dj_region=dj_region, weights=weights)
+        self.model_name = model_name
+        self.device = device
+        self._model = None
+
+    @property
+    def model(self):
+        """Lazily loaded CrossEncoder"""
+        if self._model is None:
+            from sentence_transformers import CrossEncoder
+            self._model = CrossEncoder(self.model_name, device=self.device)
+        return self._model
+
+    def score_all(self, query: str, chunks: List[Dict[str, Any]],
+                  dj_region: Optional[str] = None) -> List[float]:
+        """Score chunks with one batched cross-encoder call"""
+        if not chunks:
+            return []
+
+        logits = self.model.predict([(query, chunk.get('text', '')) for chunk in chunks])
+        # Squash logits to [0, 1] so they blend with the metadata signals
+        relevance = [1.0 / (1.0 + math.exp(-float(x))) for x in logits]
+
+        weights = self.weights.to_dict()
+        scores = []
+        for chunk, rel in zip(chunks, relevance):
+            features = self.feature_scores(chunk, dj_region)
+            features['similarity'] = rel
+            scores.append(sum(weights[name] * value for name, value in features.items()))
+        return scores
+
+
+def create_reranker(kind: Optional[str],
+                    dj_name: Optional[str] = None,
+                    weights: Optional[RerankWeights] = None) -> Optional[FeatureReranker]:
+    """
+    Build a reranker by name.
+
+    Args:
+        kind: 'features', 'cross-encoder' or None/'none' (disabled)
+        dj_name: DJ name for region matching
+        weights: Optional signal weights
+
+    Returns:
+        Reranker instance or None; falls back to FeatureReranker if the
+        cross-encoder is unavailable
+    """
+    if not kind or kind == 'none':
+        return None
+
+    dj_region = parse_dj_location(dj_name) if dj_name else None
+
+    if kind == 'cross-encoder':
+        if CROSS_ENCODER_AVAILABLE:
+            return CrossEncoderReranker(dj_region=dj_region, weights=weights)
+        logger.warning("Cross-encoder unavailable, using feature reranker")
+        return FeatureReranker(dj_region=dj_region, weights=weights)
+
+    if kind == 'features':
+        return FeatureReranker(dj_region=dj_region, weights=weights)
+
+    raise ValueError(f"Unknown reranker: {kind}. Available: features, cross-encoder, none")
@@ -245,7 +245,8 @@ def should_skip_segment(retry_count: int) -> bool:
 def create_skip_segment_metadata(
     segment_type: str,
     hour: int,
-    retry_manager: RetryManager
+    retry_manager: RetryManager,
+    reason: str = "max_retries_exceeded"
 ) -> Dict[str, Any]:
     """
     Create metadata for a skipped segment.
@@ -254,13 +255,15 @@ def create_skip_segment_metadata(
         segment_type: Type of segment that failed
         hour: Hour of the failed segment
         retry_manager: RetryManager with attempt history
+        reason: Why the segment was skipped ("max_retries_exceeded",
+            "retry_budget_exhausted", "llm_unavailable")
     
     Returns:
         Dict with skip metadata
     """
     return {
         "status": "skipped",
-        "reason": "max_retries_exceeded",
+        "reason": reason,
         "segment_type": segment_type,
         "hour": hour,
         "max_retries": MAX_RETRIES,
@@ -136,6 +136,8 @@ class SegmentPlan:
     
     Returned by BroadcastScheduler.get_next_segment_plan() and used
     by the generation pipeline to create content with proper constraints.
+    BroadcastPlanner fills in the slot position, resolved template vars
+    and RAG query when it precompiles a broadcast window.
     """
     
     # Core segment information
@@ -151,6 +153,13 @@ class SegmentPlan:
     # Context for this specific segment
     context: Dict[str, Any] = field(default_factory=dict)
     
+    # Precompiled execution data (BroadcastPlanner)
+    hour: Optional[int] = None
+    hour_offset: Optional[int] = None
+    segment_num: Optional[int] = None
+    template_vars: Dict[str, Any] = field(default_factory=dict)
+    rag_query: Optional[str] = None
+    
     def __str__(self) -> str:
         """String representation for logging."""
         return (
@@ -166,7 +175,12 @@ class SegmentPlan:
             'priority': self.priority.name,
             'constraints': self.constraints.to_dict(),
             'metadata': self.metadata,
-            'context': self.context
+            'context': self.context,
+            'hour': self.hour,
+            'hour_offset': self.hour_offset,
+            'segment_num': self.segment_num,
+            'template_vars': self.template_vars,
+            'rag_query': self.rag_query
         }
     
     def get_rag_topic(self) -> Optional[str]:
@@ -0,0 +1,264 @@
+"""
+Stage Timer - per-segment latency spans and p50/p95 breakdowns
+
+A SegmentTrace collects timed spans for one segment. Code anywhere below
+the engine records into the active trace without passing it around:
+
+    trace = SegmentTrace()
+    with use_trace(trace):
+        with span('rag', cache='hit'):
+            ...
+    trace.to_dict()  # {'total_seconds', 'stages': {name: seconds}, 'spans': [...]}
+
+Spans outside an active trace are not recorded, so instrumented code costs
+next to nothing when nobody is listening. The active trace lives in a
+contextvar: asyncio.to_thread() and copy_context() workers (pipelined
+runtime, candidate races) record into the segment that started them.
+
+LatencyRecorder aggregates finished traces (and engine-level spans such as
+checkpoint writes) into per-stage p50/p95 and keeps a bounded window of
+recent events for to_chrome_trace() (chrome://tracing, Perfetto).
+"""
+
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Iterator, Union
+import json
+import os
+import threading
+import time
+
+# Wall clock origin for trace timestamps (perf_counter has no epoch)
+_EPOCH_OFFSET = time.time() - time.perf_counter()
+
+_current_trace: ContextVar[Optional['SegmentTrace']] = ContextVar('segment_trace', default=None)
+
+
+class SegmentTrace:
+    """Timed spans of one segment (thread-safe)"""
+
+    def __init__(self, **attrs):
+        self.attrs = dict(attrs)
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.spans: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, start: float, seconds: float, **attrs) -> None:
+        """Record a span (start is a perf_counter() value)"""
+        with self._lock:
+            self.spans.append({
+                'stage': stage,
+                'start': start,
+                'seconds': seconds,
+                'thread': threading.get_ident(),
+                'attrs': attrs
+            })
+
+    def finish(self) -> None:
+        if self.end is None:
+            self.end = time.perf_counter()
+
+    def stage_seconds(self) -> Dict[str, float]:
+        """Total seconds per stage (repeated stages are summed)"""
+        totals: Dict[str, float] = {}
+        with self._lock:
+            for entry in self.spans:
+                totals[entry['stage']] = totals.get(entry['stage'], 0.0) + entry['seconds']
+        return totals
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary for segment metadata"""
+        end = self.end if self.end is not None else time.perf_counter()
+        with self._lock:
+            spans = [
+                {
+                    'stage': entry['stage'],
+                    'offset': round(entry['start'] - self.start, 4),
+                    'seconds': round(entry['seconds'], 4),
+                    **({'attrs': entry['attrs']} if entry['attrs'] else {})
+                }
+                for entry in self.spans
+            ]
+        return {
+            'total_seconds': round(end - self.start, 4),
+            'stages': {stage: round(seconds, 4) for stage, seconds in self.stage_seconds().items()},
+            'spans': spans
+        }
+
+
+def current_trace() -> Optional[SegmentTrace]:
+    """The active trace (None outside a segment)"""
+    return _current_trace.get()
+
+
+@contextmanager
+def use_trace(trace: Optional[SegmentTrace]) -> Iterator[Optional[SegmentTrace]]:
+    """Make trace the active trace for this context (None = leave as is)"""
+    if trace is None:
+        yield _current_trace.get()
+        return
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+@contextmanager
+def span(stage: str, **attrs) -> Iterator[Dict[str, Any]]:
+    """
+    Time a block into the active trace.
+
+    Yields the span's attrs dict, so attributes known only at the end
+    (e.g. cache hit/miss) can be added inside the block.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield attrs
+        return
+    start = time.perf_counter()
+    try:
+        yield attrs
+    finally:
+        trace.add(stage, start, time.perf_counter() - start, **attrs)
+
+
+def record(stage: str, seconds: float, **attrs) -> None:
+    """Record a duration measured elsewhere (e.g. server-side LLM timings) ending now"""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add(stage, time.perf_counter() - seconds, seconds, **attrs)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+class LatencyRecorder:
+    """
+    Per-stage latency aggregates and a bounded event window.
+
+    Example:
+        recorder = LatencyRecorder()
+        recorder.add_trace(trace)
+        with recorder.span('checkpoint.write'):
+            save()
+        recorder.get_statistics()['stages']['rag']['p95']
+        recorder.export_chrome_trace('output/trace.json')
+    """
+
+    def __init__(self, max_samples: int = 2000, max_events: int = 20000):
+        """
+        Initialize recorder.
+
+        Args:
+            max_samples: Recent durations kept per stage for percentiles
+            max_events: Recent spans kept for Chrome trace export
+        """
+        self.max_samples = max_samples
+        self._samples: Dict[str, deque] = {}
+        self._totals: Dict[str, List[float]] = {}  # stage -> [count, seconds]
+        self._events: deque = deque(maxlen=max_events)
+        self._lock = threading.Lock()
+        self.segments = 0
+
+    def _add(self, stage: str, start: float, seconds: float, thread: int,
+             attrs: Dict[str, Any], segment: Optional[str] = None) -> None:
+        samples = self._samples.get(stage)
+        if samples is None:
+            samples = self._samples[stage] = deque(maxlen=self.max_samples)
+            self._totals[stage] = [0, 0.0]
+        samples.append(seconds)
+        self._totals[stage][0] += 1
+        self._totals[stage][1] += seconds
+        event_args = dict(attrs)
+        if segment:
+            event_args['segment'] = segment
+        self._events.append((stage, start, seconds, thread, event_args))
+
+    def add_trace(self, trace: SegmentTrace) -> None:
+        """Aggregate a finished segment trace"""
+        trace.finish()
+        label = trace.attrs.get('label')
+        with self._lock:
+            self.segments += 1
+            self._add('segment', trace.start, trace.end - trace.start, threading.get_ident(),
+                      dict(trace.attrs), label)
+            for entry in list(trace.spans):
+                self._add(entry['stage'], entry['start'], entry['seconds'], entry['thread'],
+                          entry['attrs'], label)
+
+    def add(self, stage: str, seconds: float, **attrs) -> None:
+        """Record an engine-level duration ending now"""
+        with self._lock:
+            self._add(stage, time.perf_counter() - seconds, seconds, threading.get_ident(), attrs)
+
+    @contextmanager
+    def span(self, stage: str, **attrs) -> Iterator[Dict[str, Any]]:
+        """Time an engine-level block (checkpoint writes, state saves)"""
+        start = time.perf_counter()
+        try:
+            yield attrs
+        finally:
+            seconds = time.perf_counter() - start
+            with self._lock:
+                self._add(stage, start, seconds, threading.get_ident(), attrs)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get per-stage latency statistics.
+
+        Returns:
+            Dictionary with segment count and count/total/mean/p50/p95/max per stage
+        """
+        with self._lock:
+            stages = {}
+            for stage, samples in self._samples.items():
+                ordered = sorted(samples)
+                count, total = self._totals[stage]
+                stages[stage] = {
+                    'count': count,
+                    'total_seconds': round(total, 3),
+                    'mean': round(total / count, 4) if count else 0.0,
+                    'p50': round(percentile(ordered, 0.50), 4),
+                    'p95': round(percentile(ordered, 0.95), 4),
+                    'max': round(ordered[-1], 4) if ordered else 0.0
+                }
+            return {'segments': self.segments, 'stages': stages}
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Recent spans in Chrome trace event format (complete 'X' events)"""
+        pid = os.getpid()
+        with self._lock:
+            events = list(self._events)
+        return {
+            'traceEvents': [
+                {
+                    'name': stage,
+                    'cat': stage.split('.')[0],
+                    'ph': 'X',
+                    'ts': round((start + _EPOCH_OFFSET) * 1e6),
+                    'dur': round(seconds * 1e6),
+                    'pid': pid,
+                    'tid': thread,
+                    'args': args
+                }
+                for stage, start, seconds, thread, args in events
+            ],
+            'displayTimeUnit': 'ms'
+        }
+
+    def export_chrome_trace(self, path: Union[str, Path]) -> Path:
+        """Write to_chrome_trace() as JSON; returns the path"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f, default=str)
+        return path
@@ -7,7 +7,7 @@ Identifies quests, events, and narrative arcs from wiki content.
 Uses metadata filtering and semantic analysis to find coherent narratives.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from collections import defaultdict
 import re
 import sys
@@ -25,7 +25,8 @@ WIKI_DIR = os.path.abspath(os.path.join(TOOLS_DIR, "wiki_to_chromadb"))
 if WIKI_DIR not in sys.path:
     sys.path.insert(0, WIKI_DIR)
 
-from ollama_client import OllamaClient
+from ollama_client import OllamaClient, AsyncOllamaClient, as_sync_client, cache_tag_kwargs
+from completion_cache import default_completion_cache
 from shared import project_config
 
 try:
@@ -122,22 +123,28 @@ class StoryExtractor:
         r".*\(item\)$",
     ]
 
-    def __init__(self, chroma_collection=None, ollama_client: Optional[OllamaClient] = None):
+    def __init__(self,
+                 chroma_collection=None,
+                 ollama_client: Optional[Union[OllamaClient, AsyncOllamaClient]] = None):
         """
         Initialize story extractor.
 
         Args:
             chroma_collection: ChromaDB collection to query (optional for testing)
-            ollama_client: OllamaClient instance (optional, will create if None)
+            ollama_client: OllamaClient or AsyncOllamaClient (optional, will create if None)
         """
         self.collection = chroma_collection
-        self.ollama = ollama_client
+        self.ollama = as_sync_client(ollama_client)
         self.narrative_scorer = NarrativeWeightScorer()
 
         if self.ollama is None:
             try:
                 ollama_url = project_config.OLLAMA_URL.replace("/api/generate", "")
-                self.ollama = OllamaClient(base_url=ollama_url)
+                self.ollama = OllamaClient(
+                    base_url=ollama_url,
+                    pool_size=getattr(project_config, 'OLLAMA_POOL_SIZE', 4),
+                    completion_cache=default_completion_cache(project_config)
+                )
             except Exception as exc:  # fallback gracefully
                 print(f"[WARN] Failed to initialize Ollama client: {exc}")
                 self.ollama = None
@@ -470,6 +477,8 @@ Generate acts now:"""
                 prompt=prompt,
                 options={"temperature": 0.7, "top_p": 0.9, "num_predict": 1000},
                 timeout=30,
+                # Re-running extraction over the same chunks reuses the acts
+                **cache_tag_kwargs(self.ollama, "story_acts"),
             )
             acts = self._parse_llm_acts(response, chunks)
             if acts and len(acts) == 5:
@@ -0,0 +1,150 @@
+"""
+Stream Validators - Incremental critical checks for streaming generation
+
+OllamaClient.generate_streaming() calls each validator with the text
+generated so far and cancels the request as soon as one reports a critical
+violation. A failed attempt then costs the tokens up to the violation
+instead of the full num_predict budget.
+
+Only critical checks belong here: the same forbidden topic/faction and
+temporal rules as ConsistencyValidator._check_forbidden_knowledge /
+_check_temporal_violations, plus the ValidationRules anachronism keywords.
+Quality and tone checks still run on the finished script.
+
+Validators only look at "settled" text (up to the last word boundary) so a
+partially streamed word ("app" of "Appalachia", "210" of "2105") never
+triggers a false abort.
+"""
+
+from typing import Dict, Any, Optional, List, Iterable
+import re
+
+from validation_rules import ValidationRules
+
+
+# Trailing partial word (not yet followed by a boundary)
+_UNSETTLED_TAIL = re.compile(r'\w+\Z')
+
+
+def settled_text(text: str) -> str:
+    """Text up to the last word boundary (the trailing partial word is dropped)"""
+    return _UNSETTLED_TAIL.sub('', text)
+
+
+class IncrementalCheck:
+    """
+    Base class for incremental validators.
+
+    Subclasses implement find_violation(settled) on settled text. Instances
+    are callables: check(text_so_far) -> violation message or None.
+    """
+
+    category = "lore"
+
+    def __call__(self, text: str) -> Optional[str]:
+        return self.find_violation(settled_text(text))
+
+    def find_violation(self, text: str) -> Optional[str]:
+        raise NotImplementedError
+
+
+class ForbiddenTermsCheck(IncrementalCheck):
+    """Abort on any forbidden term (case-insensitive)"""
+
+    def __init__(self,
+                 terms: Iterable[str],
+                 label: str = "Forbidden knowledge",
+                 word_boundary: bool = True,
+                 category: str = "lore"):
+        """
+        Args:
+            terms: Terms to reject
+            label: Message prefix for violations
+            word_boundary: Match whole words only (False = substring match)
+            category: Violation category
+        """
+        self.terms = [t for t in terms if t]
+        self.label = label
+        self.category = category
+        alternatives = '|'.join(re.escape(t) for t in sorted(self.terms, key=len, reverse=True))
+        if not alternatives:
+            self.pattern = None
+        elif word_boundary:
+            self.pattern = re.compile(r'\b(?:' + alternatives + r')\b', re.IGNORECASE)
+        else:
+            self.pattern = re.compile(alternatives, re.IGNORECASE)
+
+    def find_violation(self, text: str) -> Optional[str]:
+        if self.pattern is None:
+            return None
+        match = self.pattern.search(text)
+        if match:
+            return f"{self.label}: '{match.group(0)}'"
+        return None
+
+
+class TemporalCheck(IncrementalCheck):
+    """Abort on a year after the DJ's knowledge cutoff"""
+
+    category = "temporal"
+
+    # Same pattern as ConsistencyValidator._check_temporal_violations
+    YEAR_PATTERN = re.compile(r'(2\d{3})')
+
+    def __init__(self, max_year: int, dj_name: str = "DJ"):
+        self.max_year = max_year
+        self.dj_name = dj_name
+
+    def find_violation(self, text: str) -> Optional[str]:
+        for match in self.YEAR_PATTERN.finditer(text):
+            year = int(match.group(1))
+            if year > self.max_year:
+                return (f"Temporal violation: {self.dj_name} references year {year} "
+                        f"but only knows up to {self.max_year}")
+        return None
+
+
+def build_stream_validators(character_card: Dict[str, Any],
+                            rules: Optional[ValidationRules] = None,
+                            include_anachronisms: bool = True) -> List[IncrementalCheck]:
+    """
+    Build the incremental critical checks for a DJ.
+
+    Args:
+        character_card: DJ personality (uses knowledge_constraints)
+        rules: ValidationRules providing anachronism keywords
+        include_anachronisms: Abort on modern-technology anachronisms
+
+    Returns:
+        List of validators for OllamaClient.generate_streaming()
+    """
+    name = character_card.get('name', 'DJ')
+    constraints = character_card.get('knowledge_constraints', {}) or {}
+    validators: List[IncrementalCheck] = []
+
+    # ConsistencyValidator matches topics as substrings and factions as whole words
+    if constraints.get('forbidden_topics'):
+        validators.append(ForbiddenTermsCheck(
+            constraints['forbidden_topics'],
+            label=f"Forbidden knowledge: {name} references",
+            word_boundary=False
+        ))
+    if constraints.get('forbidden_factions'):
+        validators.append(ForbiddenTermsCheck(
+            constraints['forbidden_factions'],
+            label=f"Forbidden knowledge: {name} mentions"
+        ))
+
+    cutoff = constraints.get('temporal_cutoff_year')
+    if cutoff:
+        validators.append(TemporalCheck(int(cutoff), dj_name=name))
+
+    if include_anachronisms:
+        rules = rules or ValidationRules()
+        validators.append(ForbiddenTermsCheck(
+            rules.anachronism_keywords,
+            label="Anachronistic term",
+            category="temporal"
+        ))
+
+    return validators
@@ -138,7 +138,8 @@ class TestWeatherSystemIntegration:
                     enable_story_system=False
                 )
                 
-                # Calendar should be created - check if weather_calendars dict has data
+                # Calendar is created on first use - check if weather_calendars dict has data
+                engine1._ensure_weather_calendar()
                 assert len(engine1.world_state.weather_calendars) > 0
                 
                 # Create new engine - should load existing calendar
@@ -150,6 +151,7 @@ class TestWeatherSystemIntegration:
                 )
                 
                 # Calendar should have been loaded from saved state
+                engine2._ensure_weather_calendar()
                 assert len(engine2.world_state.weather_calendars) > 0
 
 
@@ -507,7 +509,8 @@ class TestBroadcastEngineWeatherSystemAdvanced:
                         enable_story_system=False
                     )
                     
-                    # Verify calendar was generated
+                    # Verify calendar was generated on first use
+                    engine._ensure_weather_calendar()
                     mock_simulator.generate_yearly_calendar.assert_called_once()
                     assert len(engine.world_state.weather_calendars) > 0
     
@@ -546,6 +549,7 @@ class TestBroadcastEngineWeatherSystemAdvanced:
                     )
                     
                     # Verify calendar was NOT regenerated (loaded from file)
+                    engine._ensure_weather_calendar()
                     mock_simulator.generate_yearly_calendar.assert_not_called()
                     assert 'Appalachia' in engine.world_state.weather_calendars
     
@@ -789,7 +793,8 @@ class TestBroadcastEngineStorySystemAdvanced:
                     enable_story_system=True
                 )
                 
-                # Verify extractor was called (pools were empty)
+                # Verify extractor was called on first use (pools were empty)
+                engine._ensure_story_pools()
                 mock_extractor.extract_stories.assert_called()
     
     def test_seed_story_pools_if_empty_skips_when_populated(self, tmp_path):
@@ -814,6 +819,7 @@ class TestBroadcastEngineStorySystemAdvanced:
                     )
                     
                     # Verify extractor was NOT called (pools already populated)
+                    engine._ensure_story_pools()
                     mock_extractor.extract_stories.assert_not_called()
     
     def test_story_system_disabled_skips_seeding(self, tmp_path):
@@ -12,9 +12,16 @@ project_root = Path(__file__).resolve().parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "tools" / "script-generator"))
 
+import broadcast_freshness
 from broadcast_freshness import BroadcastFreshnessTracker
 
 
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Relative database paths resolve under tmp_path, not the repository"""
+    monkeypatch.chdir(tmp_path)
+
+
 class TestFreshnessCalculation:
     """Test freshness score calculation"""
     
@@ -115,8 +122,9 @@ class TestFreshContentFilter:
 class TestTrackerInitialization:
     """Test tracker initialization"""
     
-    def test_init_with_default_path(self):
+    def test_init_with_default_path(self, tmp_path, monkeypatch):
         """Test initialization with default path"""
+        monkeypatch.setattr(broadcast_freshness, 'DEFAULT_CHROMA_DB_PATH', tmp_path / "chroma_db")
         tracker = BroadcastFreshnessTracker()
         assert tracker.chroma_db_path is not None
         assert tracker.FULL_DECAY_HOURS == 168.0
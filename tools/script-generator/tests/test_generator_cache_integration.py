@@ -19,7 +19,7 @@ class TestGeneratorCacheIntegration:
     @pytest.fixture
     def mock_dependencies(self):
         """Mock all external dependencies"""
-        with patch('generator.ChromaDBIngestor') as mock_chromadb, \
+        with patch('tools.wiki_to_chromadb.chromadb_ingest.ChromaDBIngestor') as mock_chromadb, \
              patch('generator.OllamaClient') as mock_ollama, \
              patch('generator.FileSystemLoader'):
             
@@ -22,6 +22,7 @@ import time
 
 from validation_rules import ValidationRules
 from segment_plan import ValidationConstraints
+from completion_cache import CompletionCache
 
 
 @dataclass
@@ -59,15 +60,21 @@ class ValidationEngine:
     - Configurable validation modes
     """
     
-    def __init__(self, ollama_client=None):
+    # Model used for LLM quality validation
+    LLM_MODEL = 'llama2'
+    
+    def __init__(self, ollama_client=None, completion_cache: Optional[CompletionCache] = None):
         """
         Initialize validation engine.
         
         Args:
             ollama_client: Optional Ollama client for LLM validation
+            completion_cache: Optional cache so re-validating an unchanged
+                script does not call the LLM again
         """
         self.rules = ValidationRules()
         self.ollama = ollama_client
+        self.completion_cache = completion_cache
         
         # Metrics tracking
         self.metrics = {
@@ -362,15 +369,23 @@ ISSUES: [List of issues, or "None"]
 """
         
         try:
-            # Call LLM for quality validation
-            response = self.ollama.generate(
-                model='llama2',
-                prompt=validation_prompt,
-                stream=False
-            )
+            response_text = None
+            if self.completion_cache:
+                response_text = self.completion_cache.get(self.LLM_MODEL, validation_prompt)
+            
+            if response_text is None:
+                # Call LLM for quality validation
+                response = self.ollama.generate(
+                    model=self.LLM_MODEL,
+                    prompt=validation_prompt,
+                    stream=False
+                )
+                response_text = response.get('response', '')
+                if self.completion_cache and response_text:
+                    self.completion_cache.put(self.LLM_MODEL, validation_prompt, None,
+                                              response_text, tag="validation_engine")
             
             # Parse response
-            response_text = response.get('response', '')
             quality_score = self._parse_quality_score(response_text)
             issues = self._parse_issues(response_text)
             
@@ -107,6 +107,30 @@ class ScriptStorage:
             logger.error(f"Error reading file {filepath}: {e}")
             return ""
     
+    def _read_broadcast_file(self, broadcast_file: Path) -> dict:
+        """Read a broadcast JSON file, or a streamed JSONL file, as a broadcast document."""
+        if broadcast_file.suffix != ".jsonl":
+            with open(broadcast_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        
+        # JSONL records: metadata, one per segment, summary (missing for partial runs)
+        broadcast = {"metadata": {}, "segments": [], "stats": {}}
+        with open(broadcast_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Truncated line from an interrupted write
+                if not isinstance(record, dict):
+                    continue
+                if record.get("record") == "metadata":
+                    broadcast["metadata"] = record.get("metadata", {})
+                elif record.get("record") == "segment":
+                    broadcast["segments"].append(record.get("segment"))
+                elif record.get("record") == "summary":
+                    broadcast["stats"] = record.get("stats") or {}
+        return broadcast
+    
     def _load_broadcast_scripts(self) -> List[Script]:
         """Load and extract scripts from broadcast JSON files."""
         scripts = []
@@ -119,11 +143,11 @@ class ScriptStorage:
         
         logger.info(f"Loading broadcast scripts from: {broadcast_dir}")
         
-        # Load all broadcast_*.json files
-        for broadcast_file in broadcast_dir.glob("broadcast_*.json"):
+        # Load all broadcast_*.json files, plus streamed .jsonl runs (may still be in progress)
+        broadcast_files = list(broadcast_dir.glob("broadcast_*.json")) + list(broadcast_dir.glob("broadcast_*.jsonl"))
+        for broadcast_file in broadcast_files:
             try:
-                with open(broadcast_file, 'r', encoding='utf-8') as f:
-                    broadcast = json.load(f)
+                broadcast = self._read_broadcast_file(broadcast_file)
                 
                 # Validate structure
                 if not isinstance(broadcast, dict):
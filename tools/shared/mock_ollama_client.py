@@ -59,6 +59,7 @@ class MockOllamaClient:
         self.call_count = 0
         self.call_history: List[Dict[str, Any]] = []
         self.unloaded_models: List[str] = []
+        self.loaded_models: List[str] = []
     
     def generate(
         self,
@@ -66,7 +67,8 @@ class MockOllamaClient:
         prompt: str,
         options: Optional[Dict[str, Any]] = None,
         max_retries: int = 3,
-        timeout: int = 60
+        timeout: int = 60,
+        format: Optional[Any] = None
     ) -> str:
         """
         Mock generate method.
@@ -94,6 +96,7 @@ class MockOllamaClient:
             "model": model,
             "prompt": prompt,
             "options": options or {},
+            "format": format,
             "timestamp": time.time()
         }
         self.call_history.append(call_info)
@@ -227,6 +230,11 @@ class MockOllamaClient:
         self.unloaded_models.append(model)
         return True
     
+    def load_model(self, model: str, keep_alive: Optional[Any] = None) -> bool:
+        """Mock load model"""
+        self.loaded_models.append(model)
+        return True
+    
     def check_connection(self, model: str = None) -> bool:
         """Mock check connection"""
         if self.connection_error:
@@ -244,6 +252,7 @@ class MockOllamaClient:
         self.call_count = 0
         self.call_history = []
         self.unloaded_models = []
+        self.loaded_models = []
     
     def get_call_log(self) -> List[Dict[str, Any]]:
         """Get full call history log"""
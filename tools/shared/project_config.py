@@ -14,10 +14,25 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 LLM_MODEL = "fluffy/l3-8b-stheno-v3.2"  # Script generation model
 LLM_VALIDATOR_MODEL = "dolphin-llama3"  # Validation model
 LLM_BACKUP_MODEL = "hermes3"  # Backup model if primary unavailable
+LLM_DRAFT_MODEL = "llama3.2:3b"  # Small model for speculative drafts (draft-then-verify)
 OLLAMA_URL = "http://localhost:11434/api/generate"
+OLLAMA_NUM_PARALLEL = 4  # Concurrent requests the Ollama server runs per model (its OLLAMA_NUM_PARALLEL)
+OLLAMA_POOL_SIZE = OLLAMA_NUM_PARALLEL  # Keep-alive connections per Ollama client
+OLLAMA_CHAT_API = True  # Persona as a stable /api/chat system message (KV prefix reuse)
+OLLAMA_KEEP_ALIVE = "30m"  # Keep the model (and its prompt cache) loaded between segments
+OLLAMA_ADAPTIVE_TIMEOUTS = False  # p95-based timeouts, shared retry budget and circuit breaker (ollama_governor; opt-in)
+RUNTIME_CHROMA_CONCURRENCY = 2  # Concurrent RAG retrievals in the broadcast runtime
+RUNTIME_DISK_CONCURRENCY = 1  # Concurrent checkpoint writes in the broadcast runtime
+RUNTIME_LOOKAHEAD = 1  # Segments planned/retrieving beyond the LLM slots
+SEGMENT_CANDIDATES = {}  # Parallel candidates per segment type, first valid wins (e.g. {'story': 3}; 1 = sequential retries)
+CANDIDATE_TEMPERATURES = (0.8, 0.95, 0.7, 1.05)  # Temperature of candidate 1, 2, ... (cycled)
+BUDGET_NUM_PREDICT = 180  # Output token cap once a --budget run degrades to shorter segments (normal: 300)
+LLM_TOKENIZER = "NousResearch/Meta-Llama-3-8B"  # HF tokenizer for LLM_MODEL (used if cached locally)
 
 # Database Paths
 CHROMA_DB_PATH = PROJECT_ROOT / "chroma_db"
+COMPLETION_CACHE_PATH = PROJECT_ROOT / "cache" / "llm_completions.sqlite"
+COMPLETION_CACHE_ENABLED = True  # Reuse deterministic (temperature 0) / tagged LLM completions
 
 # Content Source Paths
 LORE_PATH = PROJECT_ROOT / "lore" / "fallout_wiki_complete.xml"
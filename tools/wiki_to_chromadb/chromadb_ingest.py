@@ -12,11 +12,11 @@ All ingestion operations are logged to 3 formats:
 
 from typing import List, Dict, Optional, Any, Union, cast
 import sys
+import threading
 from pathlib import Path
 import chromadb
 from chromadb.utils import embedding_functions
 from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
-from sentence_transformers import SentenceTransformer
 from tqdm import tqdm
 
 # Add shared tools to path for logging
@@ -32,6 +32,16 @@ except ImportError:
     Chunk = None  # type: ignore
     ChunkMetadata = None  # type: ignore
 
+# Lexical BM25 index for hybrid retrieval
+try:
+    from tools.wiki_to_chromadb.lexical_index import LexicalIndex, reciprocal_rank_fusion
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from lexical_index import LexicalIndex, reciprocal_rank_fusion
+
+# Retrieval modes accepted by ChromaDBIngestor.query / query_for_dj
+QUERY_MODES = ("vector", "lexical", "hybrid")
+
 
 class OptimizedSentenceTransformerEF(EmbeddingFunction[Documents]):
     """
@@ -51,6 +61,9 @@ class OptimizedSentenceTransformerEF(EmbeddingFunction[Documents]):
             device: Device to use (cuda/cpu)
             batch_size: Batch size for encoding (higher = faster on GPU)
         """
+        # Imported here: sentence_transformers pulls in torch (seconds of
+        # import time) and is only needed when a collection is created
+        from sentence_transformers import SentenceTransformer
         self.model = SentenceTransformer(model_name, device=device)
         self.batch_size = batch_size
     
@@ -79,7 +92,8 @@ class ChromaDBIngestor:
     def __init__(self, persist_directory: str = "./chroma_db",
                  collection_name: str = "fallout_wiki",
                  embedding_batch_size: int = 128,
-                 clear_on_init: bool = False):
+                 clear_on_init: bool = False,
+                 enable_lexical_index: bool = True):
         """
         Initialize ChromaDB client and collection.
         
@@ -88,10 +102,15 @@ class ChromaDBIngestor:
             collection_name: Name of the collection
             embedding_batch_size: Batch size for embedding generation (default: 128)
             clear_on_init: Delete existing collection before initialization (fresh start)
+            enable_lexical_index: Maintain a BM25 index beside the DB during ingest
         """
         self.persist_directory = persist_directory
         self.collection_name = collection_name
         self.embedding_batch_size = embedding_batch_size
+        self.enable_lexical_index = enable_lexical_index
+        self.lexical_index_path = Path(persist_directory) / f"{collection_name}.bm25.json.gz"
+        self._lexical_index: Optional[LexicalIndex] = None
+        self._lexical_lock = threading.Lock()
         
         # Initialize client with persistent backend
         self.client = chromadb.PersistentClient(path=persist_directory)
@@ -103,6 +122,8 @@ class ChromaDBIngestor:
                 print(f"[CLEAR] Deleted existing collection '{collection_name}' for fresh start")
             except:
                 pass  # Collection didn't exist, that's fine
+            if self.lexical_index_path.exists():
+                self.lexical_index_path.unlink()
         
         # Try to get existing collection first (for reading existing databases)
         try:
@@ -128,7 +149,7 @@ class ChromaDBIngestor:
             print(f"Created new collection '{collection_name}' with optimized embeddings")
     
     def ingest_chunks(self, chunks: Union[List[Dict[str, Any]], List['Chunk']], batch_size: int = 500,
-                     show_progress: bool = True) -> int:
+                     show_progress: bool = True, save_lexical_index: bool = True) -> int:
         """
         Ingest chunks into ChromaDB in batches.
         
@@ -138,6 +159,8 @@ class ChromaDBIngestor:
             chunks: List of chunk dicts OR Pydantic Chunk objects
             batch_size: Number of chunks per batch (default 500)
             show_progress: Show progress bar
+            save_lexical_index: Persist the BM25 index after ingest (disable when
+                calling repeatedly and call save_lexical_index() once at the end)
         
         Returns:
             Number of chunks successfully ingested
@@ -159,6 +182,9 @@ class ChromaDBIngestor:
         # Filter out chunks without text
         valid_chunks = [c for c in chunks if c.get('text', '').strip()]
         
+        if valid_chunks and self.enable_lexical_index:
+            self._ensure_lexical_index(show_progress)
+        
         if show_progress:
             iterator = tqdm(range(0, len(valid_chunks), batch_size),
                           desc="Ingesting chunks",
@@ -217,16 +243,81 @@ class ChromaDBIngestor:
                     ids=ids
                 )
                 
+                # Keep the BM25 index in step with the collection
+                if self.enable_lexical_index:
+                    self.lexical_index.add_documents(ids, documents)
+                
                 total_ingested += len(batch)
                 
             except Exception as e:
                 print(f"\nWarning: Failed to ingest batch at index {i}: {e}")
                 continue
         
+        if save_lexical_index and self.enable_lexical_index:
+            self.save_lexical_index()
+        
         return total_ingested
     
+    @property
+    def lexical_index(self) -> LexicalIndex:
+        """BM25 index for this collection, loaded lazily from disk"""
+        if self._lexical_index is None:
+            with self._lexical_lock:
+                if self._lexical_index is None:
+                    self._lexical_index = LexicalIndex.load_or_create(self.lexical_index_path)
+        return self._lexical_index
+    
+    def _ensure_lexical_index(self, show_progress: bool = True) -> None:
+        """
+        Rebuild the BM25 index from the whole collection when its file is
+        missing and the in-memory index does not cover the collection
+        (existing DB ingested before the lexical index, or file deleted).
+        """
+        if self.lexical_index_path.exists():
+            return
+        existing = self.collection.count()
+        if existing and len(self.lexical_index) < existing:
+            print(f"[BM25] No lexical index for {existing:,} existing chunks, rebuilding")
+            self.build_lexical_index(show_progress=show_progress)
+    
+    def save_lexical_index(self) -> None:
+        """Persist the BM25 index beside the ChromaDB data if it changed"""
+        if self._lexical_index is not None and self._lexical_index.dirty:
+            self._lexical_index.save(self.lexical_index_path)
+    
+    def build_lexical_index(self, page_size: int = 5000, show_progress: bool = True) -> int:
+        """
+        (Re)build the BM25 index from documents already in the collection.
+        
+        Used for databases ingested before the lexical index existed.
+        
+        Args:
+            page_size: Documents fetched per collection.get() call
+            show_progress: Show progress bar
+        
+        Returns:
+            Number of documents indexed
+        """
+        index = LexicalIndex()
+        total = self.collection.count()
+        offsets = range(0, total, page_size)
+        if show_progress:
+            offsets = tqdm(offsets, desc="Building BM25 index", unit="page")
+        
+        for offset in offsets:
+            page = self.collection.get(limit=page_size, offset=offset, include=["documents"])
+            index.add_documents(page["ids"], page["documents"] or [])
+        
+        with self._lexical_lock:
+            self._lexical_index = index
+        index.save(self.lexical_index_path)
+        return len(index)
+    
     def query(self, query_text: str, n_results: int = 10,
-             where: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+             where: Optional[Dict[str, Any]] = None,
+             mode: str = "vector",
+             candidate_multiplier: int = 4,
+             rrf_k: int = 60) -> Dict[str, Any]:
         """
         Query the collection.
         
@@ -234,10 +325,21 @@ class ChromaDBIngestor:
             query_text: Query string
             n_results: Number of results to return
             where: Metadata filter (ChromaDB where clause)
+            mode: 'vector' (dense only), 'lexical' (BM25 only) or 'hybrid' (RRF of both)
+            candidate_multiplier: Candidates per ranking = n_results * multiplier (lexical/hybrid)
+            rrf_k: Reciprocal rank fusion constant (hybrid)
         
         Returns:
             Query results dict
         """
+        if mode not in QUERY_MODES:
+            raise ValueError(f"Unknown query mode: {mode}. Available: {list(QUERY_MODES)}")
+        
+        if mode != "vector":
+            return self._query_with_lexical(
+                query_text, n_results, where, mode, candidate_multiplier, rrf_k
+            )
+        
         result = self.collection.query(
             query_texts=[query_text],
             n_results=n_results,
@@ -245,6 +347,70 @@ class ChromaDBIngestor:
         )
         return cast(Dict[str, Any], result)
     
+    def _query_with_lexical(self, query_text: str, n_results: int,
+                            where: Optional[Dict[str, Any]], mode: str,
+                            candidate_multiplier: int, rrf_k: int) -> Dict[str, Any]:
+        """
+        Lexical or hybrid (BM25 + vector, RRF-fused) query.
+        
+        BM25 candidates are passed through collection.get(ids=..., where=...)
+        so DJ metadata filters apply to both rankings. Falls back to a plain
+        vector query when the lexical index is empty.
+        
+        Returns:
+            Query results dict in ChromaDB format; 'distances' carries the
+            vector distance where known (None for lexical-only hits) and
+            'scores' carries the fused/BM25 score.
+        """
+        if len(self.lexical_index) == 0:
+            print("[WARN] Lexical index is empty - falling back to vector query")
+            return self.query(query_text, n_results=n_results, where=where)
+        
+        n_candidates = max(n_results, n_results * candidate_multiplier)
+        
+        # Lexical ranking, restricted to documents passing the metadata filter
+        lexical_hits = self.lexical_index.search(query_text, top_k=n_candidates)
+        lexical_ids = [doc_id for doc_id, _ in lexical_hits]
+        documents: Dict[str, str] = {}
+        metadatas: Dict[str, Dict[str, Any]] = {}
+        if lexical_ids:
+            fetched = self.collection.get(
+                ids=lexical_ids,
+                where=where,
+                include=["documents", "metadatas"]
+            )
+            for doc_id, doc, meta in zip(fetched["ids"], fetched["documents"], fetched["metadatas"]):
+                documents[doc_id] = doc
+                metadatas[doc_id] = meta
+            lexical_ids = [doc_id for doc_id in lexical_ids if doc_id in documents]
+        
+        if mode == "lexical":
+            bm25_scores = dict(lexical_hits)
+            ranked = [(doc_id, bm25_scores[doc_id]) for doc_id in lexical_ids[:n_results]]
+            distances: Dict[str, Optional[float]] = {}
+        else:
+            vector = self.collection.query(
+                query_texts=[query_text],
+                n_results=n_candidates,
+                where=where
+            )
+            vector_ids = vector["ids"][0]
+            distances = {}
+            for idx, doc_id in enumerate(vector_ids):
+                documents[doc_id] = vector["documents"][0][idx]
+                metadatas[doc_id] = vector["metadatas"][0][idx]
+                distances[doc_id] = vector["distances"][0][idx] if vector.get("distances") else None
+            ranked = reciprocal_rank_fusion([lexical_ids, vector_ids], k=rrf_k)[:n_results]
+        
+        ids = [doc_id for doc_id, _ in ranked]
+        return {
+            "ids": [ids],
+            "documents": [[documents[doc_id] for doc_id in ids]],
+            "metadatas": [[metadatas[doc_id] for doc_id in ids]],
+            "distances": [[distances.get(doc_id) for doc_id in ids]],
+            "scores": [[score for _, score in ranked]],
+        }
+    
     def query_chunks(self, query_text: str, n_results: int = 10,
                     where: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
@@ -283,6 +449,9 @@ class ChromaDBIngestor:
     def delete_collection(self):
         """Delete the collection (use with caution!)"""
         self.client.delete_collection(name=self.collection_name)
+        self._lexical_index = None
+        if self.lexical_index_path.exists():
+            self.lexical_index_path.unlink()
         print(f"Deleted collection: {self.collection_name}")
 
 
@@ -339,7 +508,8 @@ DJ_QUERY_FILTERS = {
 
 
 def query_for_dj(ingestor: ChromaDBIngestor, dj_name: str,
-                query_text: str, n_results: int = 10) -> Dict[str, Any]:
+                query_text: str, n_results: int = 10,
+                mode: str = "vector") -> Dict[str, Any]:
     """
     Query ChromaDB with DJ-specific filtering.
     
@@ -348,6 +518,7 @@ def query_for_dj(ingestor: ChromaDBIngestor, dj_name: str,
         dj_name: DJ name (must match DJ_QUERY_FILTERS keys)
         query_text: Query string
         n_results: Number of results
+        mode: Retrieval mode ('vector', 'lexical' or 'hybrid')
     
     Returns:
         Query results
@@ -356,7 +527,7 @@ def query_for_dj(ingestor: ChromaDBIngestor, dj_name: str,
         raise ValueError(f"Unknown DJ: {dj_name}. Available: {list(DJ_QUERY_FILTERS.keys())}")
     
     where_filter = DJ_QUERY_FILTERS[dj_name]
-    return ingestor.query(query_text, n_results=n_results, where=where_filter)
+    return ingestor.query(query_text, n_results=n_results, where=where_filter, mode=mode)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,253 @@
+"""
+Lexical (BM25) inverted index stored beside the ChromaDB collection.
+
+Dense MiniLM retrieval ranks exact entity names ("Vault 76", "Flatwoods",
+"Nuka-Cola") poorly. This module keeps a compact BM25 index over chunk text
+so ChromaDBIngestor can fuse lexical and vector rankings with reciprocal
+rank fusion (RRF).
+
+Storage format (gzip-compressed JSON):
+    {
+        "version": 1,
+        "doc_ids": [...],          # Chroma ids, position = internal doc index
+        "doc_lens": [...],         # token count per doc
+        "postings": {term: [[doc_index, term_frequency], ...]}
+    }
+"""
+
+from typing import Dict, List, Optional, Tuple, Iterable
+from collections import Counter
+from pathlib import Path
+import gzip
+import json
+import math
+import os
+import re
+import tempfile
+
+
+INDEX_VERSION = 1
+
+# Words, numbers and hyphen/apostrophe compounds ("nuka-cola", "vault-tec")
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:['\-][a-z0-9]+)*")
+
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has",
+    "he", "in", "is", "it", "its", "of", "on", "or", "that", "the", "to",
+    "was", "were", "will", "with", "this", "they", "their", "which", "who",
+})
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Tokenize text for BM25.
+
+    Lowercases, drops stopwords, and emits both the full compound and its
+    parts for hyphenated tokens so "Nuka-Cola" matches "nuka cola" queries.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        List of tokens
+    """
+    tokens = []
+    for match in TOKEN_PATTERN.findall(text.lower()):
+        if match in STOPWORDS:
+            continue
+        tokens.append(match)
+        if '-' in match:
+            tokens.extend(part for part in match.split('-') if part and part not in STOPWORDS)
+    return tokens
+
+
+def reciprocal_rank_fusion(rankings: Iterable[List[str]], k: int = 60) -> List[Tuple[str, float]]:
+    """
+    Fuse several ranked id lists with reciprocal rank fusion.
+
+    score(d) = sum over rankings of 1 / (k + rank(d)), rank starting at 1.
+
+    Args:
+        rankings: Ranked lists of document ids (best first)
+        k: RRF damping constant (60 is the standard choice)
+
+    Returns:
+        List of (doc_id, score) sorted by descending score
+    """
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, start=1):
+            scores[doc_id] = scores.get(doc_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+class LexicalIndex:
+    """
+    Compact in-memory BM25 inverted index with gzip JSON persistence.
+
+    Documents are appended incrementally during ingest; IDF is computed at
+    query time so no rebuild is needed after adding documents.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Initialize an empty index.
+
+        Args:
+            k1: BM25 term frequency saturation
+            b: BM25 length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self.doc_ids: List[str] = []
+        self.doc_lens: List[int] = []
+        self.postings: Dict[str, List[List[int]]] = {}
+        self._id_to_index: Dict[str, int] = {}
+        self._total_len = 0
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._id_to_index
+
+    @property
+    def avg_doc_len(self) -> float:
+        """Average document length in tokens"""
+        return self._total_len / len(self.doc_ids) if self.doc_ids else 0.0
+
+    def add_documents(self, doc_ids: List[str], texts: List[str]) -> int:
+        """
+        Add documents to the index.
+
+        Ids already present are skipped (ChromaDB add() keeps the first copy
+        of a duplicate id as well).
+
+        Args:
+            doc_ids: ChromaDB ids
+            texts: Document texts (same order as doc_ids)
+
+        Returns:
+            Number of documents added
+        """
+        added = 0
+        for doc_id, text in zip(doc_ids, texts):
+            if doc_id in self._id_to_index:
+                continue
+
+            doc_index = len(self.doc_ids)
+            tokens = tokenize(text)
+            self.doc_ids.append(doc_id)
+            self.doc_lens.append(len(tokens))
+            self._id_to_index[doc_id] = doc_index
+            self._total_len += len(tokens)
+
+            for term, tf in Counter(tokens).items():
+                self.postings.setdefault(term, []).append([doc_index, tf])
+
+            added += 1
+
+        if added:
+            self.dirty = True
+        return added
+
+    def search(self, query: str, top_k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Rank documents for a query with BM25.
+
+        Args:
+            query: Query text
+            top_k: Number of results
+
+        Returns:
+            List of (doc_id, score) sorted by descending score
+        """
+        if not self.doc_ids:
+            return []
+
+        n_docs = len(self.doc_ids)
+        avg_len = self.avg_doc_len or 1.0
+        scores: Dict[int, float] = {}
+
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+
+            df = len(postings)
+            idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+
+            for doc_index, tf in postings:
+                length_norm = 1.0 - self.b + self.b * self.doc_lens[doc_index] / avg_len
+                score = idf * (tf * (self.k1 + 1.0)) / (tf + self.k1 * length_norm)
+                scores[doc_index] = scores.get(doc_index, 0.0) + score
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_k]
+        return [(self.doc_ids[doc_index], score) for doc_index, score in ranked]
+
+    def save(self, path: Path) -> None:
+        """
+        Persist the index atomically (temp file + rename).
+
+        Args:
+            path: Destination file (.json.gz)
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        data = {
+            "version": INDEX_VERSION,
+            "k1": self.k1,
+            "b": self.b,
+            "doc_ids": self.doc_ids,
+            "doc_lens": self.doc_lens,
+            "postings": self.postings,
+        }
+
+        fd, temp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                f.write(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> "LexicalIndex":
+        """
+        Load an index saved with save().
+
+        Args:
+            path: Index file (.json.gz)
+
+        Returns:
+            LexicalIndex instance
+
+        Raises:
+            ValueError: If the file has an unsupported version
+        """
+        with gzip.open(path, "rb") as f:
+            data = json.loads(f.read().decode("utf-8"))
+
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported lexical index version: {data.get('version')}")
+
+        index = cls(k1=data.get("k1", 1.5), b=data.get("b", 0.75))
+        index.doc_ids = data["doc_ids"]
+        index.doc_lens = data["doc_lens"]
+        index.postings = data["postings"]
+        index._id_to_index = {doc_id: i for i, doc_id in enumerate(index.doc_ids)}
+        index._total_len = sum(index.doc_lens)
+        return index
+
+    @classmethod
+    def load_or_create(cls, path: Optional[Path]) -> "LexicalIndex":
+        """Load the index at path if it exists, otherwise return an empty one"""
+        if path is not None and Path(path).exists():
+            return cls.load(path)
+        return cls()
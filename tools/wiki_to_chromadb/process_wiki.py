@@ -212,7 +212,8 @@ class WikiProcessor:
                     ingested = self.ingestor.ingest_chunks(
                         chunk_buffer,
                         batch_size=batch_size,
-                        show_progress=False
+                        show_progress=False,
+                        save_lexical_index=False
                     )
                     self.stats['chunks_ingested'] += ingested
                     logger.info(f"Successfully ingested {ingested} chunks")
@@ -235,6 +236,12 @@ class WikiProcessor:
             except Exception as e:
                 logger.error(f"Failed to ingest final batch: {e}")
         
+        # Persist the BM25 index built alongside the collection (hybrid retrieval)
+        try:
+            self.ingestor.save_lexical_index()
+        except Exception as e:
+            logger.error(f"Failed to save lexical index: {e}")
+        
         self.stats['end_time'] = time.time()
         
         # Calculate elapsed time
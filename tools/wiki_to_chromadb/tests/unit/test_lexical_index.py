@@ -0,0 +1,192 @@
+"""
+Tests for the BM25 lexical index and hybrid (BM25 + vector) retrieval
+"""
+
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.wiki_to_chromadb.lexical_index import (
+    LexicalIndex,
+    tokenize,
+    reciprocal_rank_fusion
+)
+from tools.wiki_to_chromadb import chromadb_ingest
+from tools.wiki_to_chromadb.chromadb_ingest import ChromaDBIngestor, query_for_dj
+
+
+DOCS = {
+    "vault76": "Vault 76 opened on Reclamation Day in 2102.",
+    "flatwoods": "Flatwoods is a small town near Vault 76 with a church.",
+    "nuka": "Nuka-Cola Quantum was a popular pre-war drink.",
+    "scorched": "The Scorched plague spread across Appalachia.",
+}
+
+
+class TestTokenize:
+    """Test lexical tokenization"""
+
+    def test_lowercases_and_drops_stopwords(self):
+        assert tokenize("The Vault and THE Overseer") == ["vault", "overseer"]
+
+    def test_hyphenated_compounds_emit_parts(self):
+        assert tokenize("Nuka-Cola") == ["nuka-cola", "nuka", "cola"]
+
+
+class TestReciprocalRankFusion:
+    """Test RRF fusion"""
+
+    def test_documents_in_both_rankings_win(self):
+        fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "a", "d"]], k=60)
+        ids = [doc_id for doc_id, _ in fused]
+
+        assert ids[0] == "a"
+        assert ids[1] == "c"
+        assert set(ids) == {"a", "b", "c", "d"}
+
+
+class TestLexicalIndex:
+    """Test BM25 index behaviour"""
+
+    @pytest.fixture
+    def index(self):
+        index = LexicalIndex()
+        index.add_documents(list(DOCS.keys()), list(DOCS.values()))
+        return index
+
+    def test_entity_query_ranks_exact_match_first(self, index):
+        results = index.search("Flatwoods", top_k=3)
+        assert results[0][0] == "flatwoods"
+        assert len(results) == 1
+
+    def test_hyphen_variant_matches(self, index):
+        assert index.search("nuka cola", top_k=1)[0][0] == "nuka"
+
+    def test_duplicate_ids_are_skipped(self, index):
+        assert index.add_documents(["vault76"], ["something else"]) == 0
+        assert len(index) == len(DOCS)
+
+    def test_save_and_load_roundtrip(self, index, tmp_path):
+        path = tmp_path / "fallout_wiki.bm25.json.gz"
+        index.save(path)
+
+        loaded = LexicalIndex.load(path)
+
+        assert len(loaded) == len(index)
+        assert not index.dirty
+        assert loaded.search("Vault 76", top_k=2) == index.search("Vault 76", top_k=2)
+
+    def test_load_or_create_missing_file(self, tmp_path):
+        assert len(LexicalIndex.load_or_create(tmp_path / "missing.json.gz")) == 0
+
+
+class TestHybridQuery:
+    """Test ChromaDBIngestor hybrid/lexical query modes with a fake collection"""
+
+    @pytest.fixture
+    def ingestor(self, tmp_path):
+        collection = Mock()
+
+        def fake_get(ids=None, where=None, include=None, **kwargs):
+            kept = [i for i in ids if i != "scorched"] if where else list(ids)
+            return {
+                "ids": kept,
+                "documents": [DOCS[i] for i in kept],
+                "metadatas": [{"wiki_title": i} for i in kept],
+            }
+
+        collection.get.side_effect = fake_get
+        collection.query.return_value = {
+            "ids": [["scorched", "vault76"]],
+            "documents": [[DOCS["scorched"], DOCS["vault76"]]],
+            "metadatas": [[{"wiki_title": "scorched"}, {"wiki_title": "vault76"}]],
+            "distances": [[0.2, 0.4]],
+        }
+
+        client = Mock()
+        client.get_collection.return_value = collection
+        with patch.object(chromadb_ingest.chromadb, "PersistentClient", return_value=client):
+            ingestor = ChromaDBIngestor(persist_directory=str(tmp_path))
+
+        ingestor.lexical_index.add_documents(list(DOCS.keys()), list(DOCS.values()))
+        return ingestor
+
+    def test_hybrid_fuses_lexical_and_vector(self, ingestor):
+        results = ingestor.query("Flatwoods Vault 76", n_results=3, mode="hybrid")
+        ids = results["ids"][0]
+
+        # vault76 appears in both rankings so it is fused to the top
+        assert ids[0] == "vault76"
+        assert "flatwoods" in ids
+        assert results["distances"][0][ids.index("vault76")] == 0.4
+        assert results["distances"][0][ids.index("flatwoods")] is None
+        assert len(results["scores"][0]) == len(ids)
+
+    def test_lexical_candidates_respect_where_filter(self, ingestor):
+        results = ingestor.query("Scorched Appalachia", n_results=3, mode="lexical",
+                                 where={"year_max": {"$lte": 2102}})
+        assert "scorched" not in results["ids"][0]
+
+    def test_unknown_mode_raises(self, ingestor):
+        with pytest.raises(ValueError):
+            ingestor.query("Vault 76", mode="sparse")
+
+    def test_empty_index_falls_back_to_vector(self, ingestor):
+        ingestor._lexical_index = LexicalIndex()
+        results = ingestor.query("Vault 76", n_results=2, mode="hybrid")
+        assert results["ids"][0] == ["scorched", "vault76"]
+
+    def test_query_for_dj_passes_mode(self, ingestor):
+        results = query_for_dj(ingestor, "Julie (2102, Appalachia)", "Flatwoods",
+                               n_results=2, mode="hybrid")
+        assert "flatwoods" in results["ids"][0]
+        where = ingestor.collection.query.call_args.kwargs["where"]
+        assert where == chromadb_ingest.DJ_QUERY_FILTERS["Julie (2102, Appalachia)"]
+
+    def test_query_for_dj_vector_mode(self, ingestor):
+        query_for_dj(ingestor, "Julie (2102, Appalachia)", "Flatwoods", n_results=2)
+        assert ingestor.collection.query.call_args.kwargs["n_results"] == 2
+
+
+class TestIngestLexicalIndex:
+    """Test the BM25 index when ingesting into an existing collection"""
+
+    @pytest.fixture
+    def ingestor(self, tmp_path):
+        collection = Mock()
+        stored = dict(list(DOCS.items())[:2])
+
+        def fake_add(documents=None, metadatas=None, ids=None):
+            stored.update(zip(ids, documents))
+
+        collection.count.side_effect = lambda: len(stored)
+        collection.add.side_effect = fake_add
+        collection.get.side_effect = lambda limit=None, offset=0, include=None: {
+            "ids": list(stored)[offset:offset + limit],
+            "documents": list(stored.values())[offset:offset + limit],
+        }
+
+        client = Mock()
+        client.get_collection.return_value = collection
+        with patch.object(chromadb_ingest.chromadb, "PersistentClient", return_value=client):
+            return ChromaDBIngestor(persist_directory=str(tmp_path))
+
+    def test_missing_index_is_rebuilt_from_collection(self, ingestor):
+        chunk = {"text": DOCS["nuka"], "wiki_title": "Nuka", "section": "Intro", "chunk_index": 0}
+        ingestor.ingest_chunks([chunk], show_progress=False)
+
+        assert len(ingestor.lexical_index) == 3
+        assert "vault76" in ingestor.lexical_index
+        assert ingestor.lexical_index_path.exists()
+
+    def test_existing_index_file_is_kept(self, ingestor):
+        LexicalIndex().save(ingestor.lexical_index_path)
+        chunk = {"text": DOCS["nuka"], "wiki_title": "Nuka", "section": "Intro", "chunk_index": 0}
+        ingestor.ingest_chunks([chunk], show_progress=False)
+
+        assert len(ingestor.lexical_index) == 1
@@ -8,6 +8,12 @@ from pathlib import Path
 from tools.wiki_to_chromadb.phase6_metadata_audit import MetadataAuditor
 
 
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Relative database paths resolve under tmp_path, not the repository"""
+    monkeypatch.chdir(tmp_path)
+
+
 class TestMetadataAuditor:
     """Test metadata auditor functionality"""
     
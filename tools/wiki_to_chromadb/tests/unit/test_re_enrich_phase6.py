@@ -8,6 +8,12 @@ from pathlib import Path
 from tools.wiki_to_chromadb.re_enrich_phase6 import Phase6DatabaseReEnricher
 
 
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Relative database paths resolve under tmp_path, not the repository"""
+    monkeypatch.chdir(tmp_path)
+
+
 class TestPhase6ReEnricher:
     """Test Phase 6 re-enrichment functionality"""
     